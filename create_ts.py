@@ -24,11 +24,7 @@ from po_generator.config import (
     TS_OUTPUT_DIR,
     TS_TEMPLATE_FILE,
 )
-from po_generator.utils import (
-    load_dn_data,
-    load_pmt_data,
-    get_value,
-)
+from po_generator.utils import get_value
 from po_generator.ts_generator import create_ts_xlwings
 from po_generator.cli_common import validate_output_path, generate_output_filename
 from po_generator.logging_config import setup_logging
@@ -383,16 +379,8 @@ def main() -> int:
     # 로깅 설정
     setup_logging(verbose=args.verbose)
 
-    # 데이터 로드
-    print("NOAH_SO_PO_DN.xlsx 로딩 중...")
-    try:
-        df_dn = load_dn_data()
-        df_pmt = load_pmt_data()
-    except FileNotFoundError as e:
-        print(f"[오류] {e}")
-        return 1
-
-    # 대화형 모드: 여러 줄 입력 받기
+    # 대화형 모드: 여러 줄 입력 받기 (입력하는 동안 백그라운드에서 데이터 로드)
+    service = DocumentService(prewarm='ts' if args.interactive else None)
     if args.interactive:
         print("\nDN_ID를 입력하세요 (한 줄에 하나씩, 빈 줄 입력 시 완료):")
         doc_ids = []
@@ -412,6 +400,15 @@ def main() -> int:
         print(f"\n{len(doc_ids)}개 ID 입력됨")
         args.doc_ids = doc_ids
 
+    # 데이터 로드
+    print("NOAH_SO_PO_DN.xlsx 로딩 중...")
+    try:
+        df_dn = service.finder.load_dn_data()
+        df_pmt = service.finder.load_pmt_data()
+    except FileNotFoundError as e:
+        print(f"[오류] {e}")
+        return 1
+
     # 인자 없으면 도움말 + 사용 가능한 ID 출력
     if not args.doc_ids:
         parser.print_help()
@@ -23,6 +23,7 @@ import streamlit as st
 
 from po_generator.config import DB_FILE
 from po_generator.db_schema import ensure_so_change_ack_table, get_sync_metadata
+from po_generator.sync_metrics import SLOWDOWN_WINDOW, is_slowdown, phase_totals
 
 logger = logging.getLogger(__name__)
 
@@ -80,6 +81,18 @@ def _conn():
     return sqlite3.connect(str(DB_FILE)) if DB_FILE.exists() else None
 
 
+def _numeric(df: pd.DataFrame, *cols: str) -> pd.DataFrame:
+    """수량/금액/Line item 컬럼을 숫자 dtype으로 보장.
+
+    동기화 DB는 이 컬럼들을 REAL/INTEGER로 저장하므로 SQL에서 CAST하지 않습니다.
+    숫자로 해석할 수 없는 셀(예: 'TBD')이 텍스트로 남은 경우에만 NaN으로 변환.
+    """
+    for c in cols:
+        if c in df.columns and df[c].dtype == object:
+            df[c] = pd.to_numeric(df[c], errors="coerce")
+    return df
+
+
 # ═══════════════════════════════════════════════════════════════
 # 로더 에러 수집 — session_state 기반 (캐시 히트 시에도 유지)
 # ═══════════════════════════════════════════════════════════════
@@ -118,9 +131,9 @@ def load_so() -> pd.DataFrame:
                    [Customer name] AS customer_name,
                    [Item name]     AS item_name,
                    [OS name]       AS os_name,
-                   CAST([Line item] AS INTEGER) AS line_item,
-                   CAST([Item qty] AS REAL)     AS qty,
-                   CAST([Sales amount] AS REAL) AS amount_krw,
+                   [Line item] AS line_item,
+                   [Item qty] AS qty,
+                   [Sales amount] AS amount_krw,
                    Period  AS period,
                    [Model code] AS model_code,
                    Sector  AS sector,
@@ -138,9 +151,9 @@ def load_so() -> pd.DataFrame:
               AND Period IS NOT NULL AND TRIM(Period) != ''
             UNION ALL
             SELECT SO_ID, [Customer name], [Item name], [OS name],
-                   CAST([Line item] AS INTEGER),
-                   CAST([Item qty] AS REAL),
-                   CAST([Sales amount KRW] AS REAL),
+                   [Line item],
+                   [Item qty],
+                   [Sales amount KRW],
                    Period, [Model code], Sector,
                    [Expected delivery date],
                    [Requested delivery date],
@@ -161,6 +174,7 @@ def load_so() -> pd.DataFrame:
         return pd.DataFrame()
     finally:
         conn.close()
+    _numeric(df, "line_item", "qty", "amount_krw")
     df["delivery_date"] = pd.to_datetime(df["delivery_date"], errors="coerce")
     df["requested_date"] = pd.to_datetime(df["requested_date"], errors="coerce")
     df.loc[df["requested_date"].dt.year <= 1900, "requested_date"] = pd.NaT
@@ -181,20 +195,20 @@ def load_dn() -> pd.DataFrame:
     try:
         df = pd.read_sql_query("""
             SELECT DN_ID, SO_ID,
-                   CAST([Line item] AS INTEGER) AS line_item,
-                   CAST(Qty AS REAL)            AS qty,
-                   CAST([Total Sales] AS REAL)  AS amount_krw,
+                   [Line item] AS line_item,
+                   Qty AS qty,
+                   [Total Sales] AS amount_krw,
                    [출고일] AS dispatch_date, '국내' AS market
             FROM dn_domestic
-            WHERE [출고일] IS NOT NULL AND TRIM(COALESCE([출고일], '')) != ''
+            WHERE [출고일] IS NOT NULL
             UNION ALL
             SELECT DN_ID, SO_ID,
-                   CAST([Line item] AS INTEGER),
-                   CAST(Qty AS REAL),
-                   CAST([Total Sales KRW] AS REAL),
+                   [Line item],
+                   Qty,
+                   [Total Sales KRW],
                    [선적일], '해외'
             FROM dn_export
-            WHERE [선적일] IS NOT NULL AND TRIM(COALESCE([선적일], '')) != ''
+            WHERE [선적일] IS NOT NULL
         """, conn)
     except Exception as e:
         logger.warning("데이터 로드 실패: %s", e)
@@ -202,6 +216,7 @@ def load_dn() -> pd.DataFrame:
         return pd.DataFrame()
     finally:
         conn.close()
+    _numeric(df, "line_item", "qty", "amount_krw")
     df["dispatch_date"] = pd.to_datetime(df["dispatch_date"], errors="coerce")
     df["dispatch_month"] = df["dispatch_date"].dt.strftime("%Y-%m")
     return df
@@ -218,8 +233,8 @@ def load_dn_export_shipping() -> pd.DataFrame:
             SELECT DN_ID, SO_ID,
                    [Customer name] AS customer_name,
                    [Item] AS item_name,
-                   CAST(Qty AS REAL) AS qty,
-                   CAST([Total Sales KRW] AS REAL) AS amount_krw,
+                   Qty AS qty,
+                   [Total Sales KRW] AS amount_krw,
                    [출고일]       AS factory_date,
                    [공장 픽업일]   AS pickup_date,
                    [선적 예정일]   AS expected_ship_date,
@@ -227,7 +242,7 @@ def load_dn_export_shipping() -> pd.DataFrame:
                    [B/L]          AS bl_no,
                    [운송 업체]     AS carrier
             FROM dn_export
-            WHERE [출고일] IS NOT NULL AND TRIM(COALESCE([출고일], '')) != ''
+            WHERE [출고일] IS NOT NULL
         """, conn)
     except Exception as e:
         logger.warning("데이터 로드 실패: %s", e)
@@ -235,6 +250,7 @@ def load_dn_export_shipping() -> pd.DataFrame:
         return pd.DataFrame()
     finally:
         conn.close()
+    _numeric(df, "qty", "amount_krw")
     for c in ("factory_date", "pickup_date", "expected_ship_date", "ship_date"):
         df[c] = pd.to_datetime(df[c], errors="coerce")
     return df
@@ -276,8 +292,8 @@ def load_po_detail() -> pd.DataFrame:
     try:
         df = pd.read_sql_query("""
             SELECT p.SO_ID,
-                   SUM(CAST(p.[Item qty] AS REAL))  AS po_qty,
-                   SUM(CAST(p.[Total ICO] AS REAL))  AS po_total_ico,
+                   SUM(p.[Item qty]) AS po_qty,
+                   SUM(p.[Total ICO]) AS po_total_ico,
                    GROUP_CONCAT(DISTINCT COALESCE(p.Status, '')) AS po_statuses,
                    GROUP_CONCAT(DISTINCT p.PO_ID) AS po_ids,
                    (SELECT GROUP_CONCAT(DISTINCT o.PO_ID)
@@ -292,8 +308,8 @@ def load_po_detail() -> pd.DataFrame:
             GROUP BY p.SO_ID
             UNION ALL
             SELECT p.SO_ID,
-                   SUM(CAST(p.[Item qty] AS REAL))  AS po_qty,
-                   SUM(CAST(p.[Total ICO] AS REAL))  AS po_total_ico,
+                   SUM(p.[Item qty]) AS po_qty,
+                   SUM(p.[Total ICO]) AS po_total_ico,
                    GROUP_CONCAT(DISTINCT COALESCE(p.Status, '')) AS po_statuses,
                    GROUP_CONCAT(DISTINCT p.PO_ID) AS po_ids,
                    (SELECT GROUP_CONCAT(DISTINCT o.PO_ID)
@@ -333,12 +349,12 @@ def load_po_sent_pending() -> pd.DataFrame:
         df = pd.read_sql_query("""
             SELECT SO_ID,
                    PO_ID,
-                   CAST([Line item] AS INTEGER) AS line_item,
+                   [Line item] AS line_item,
                    COALESCE([Item name], '') AS item_name,
                    COALESCE([공장 발주 날짜], '') AS order_date,
                    COALESCE([공장 EXW date], '') AS factory_exw,
-                   CAST([Item qty] AS REAL) AS po_qty,
-                   CAST([Total ICO] AS REAL) AS po_total_ico,
+                   [Item qty] AS po_qty,
+                   [Total ICO] AS po_total_ico,
                    COALESCE([NOAH O.C No.], '') AS noah_oc,
                    '국내' AS market
             FROM po_domestic
@@ -346,12 +362,12 @@ def load_po_sent_pending() -> pd.DataFrame:
             UNION ALL
             SELECT SO_ID,
                    PO_ID,
-                   CAST([Line item] AS INTEGER) AS line_item,
+                   [Line item] AS line_item,
                    COALESCE([Item name], '') AS item_name,
                    COALESCE([공장 발주 날짜], '') AS order_date,
                    COALESCE([공장 EXW date], '') AS factory_exw,
-                   CAST([Item qty] AS REAL) AS po_qty,
-                   CAST([Total ICO] AS REAL) AS po_total_ico,
+                   [Item qty] AS po_qty,
+                   [Total ICO] AS po_total_ico,
                    COALESCE([NOAH O.C No.], '') AS noah_oc,
                    '해외' AS market
             FROM po_export
@@ -364,6 +380,7 @@ def load_po_sent_pending() -> pd.DataFrame:
     finally:
         conn.close()
     if not df.empty:
+        _numeric(df, "line_item")
         df["po_qty"] = pd.to_numeric(df["po_qty"], errors="coerce").fillna(0)
         df["po_total_ico"] = pd.to_numeric(df["po_total_ico"], errors="coerce").fillna(0)
         df["order_date"] = pd.to_datetime(df["order_date"], errors="coerce")
@@ -380,10 +397,10 @@ def load_po_exw_pending() -> pd.DataFrame:
     try:
         df = pd.read_sql_query("""
             SELECT SO_ID, PO_ID,
-                   CAST([Line item] AS INTEGER) AS line_item,
+                   [Line item] AS line_item,
                    COALESCE([Item name], '') AS item_name,
-                   CAST([Item qty] AS REAL) AS po_qty,
-                   CAST([Total ICO] AS REAL) AS po_total_ico,
+                   [Item qty] AS po_qty,
+                   [Total ICO] AS po_total_ico,
                    COALESCE([공장 발주 날짜], '') AS order_date,
                    COALESCE([공장 EXW date], '') AS factory_exw,
                    COALESCE(Status, '') AS po_status,
@@ -395,10 +412,10 @@ def load_po_exw_pending() -> pd.DataFrame:
               AND COALESCE(Status, '') != 'Cancelled'
             UNION ALL
             SELECT SO_ID, PO_ID,
-                   CAST([Line item] AS INTEGER),
+                   [Line item],
                    COALESCE([Item name], ''),
-                   CAST([Item qty] AS REAL),
-                   CAST([Total ICO] AS REAL),
+                   [Item qty],
+                   [Total ICO],
                    COALESCE([공장 발주 날짜], ''),
                    COALESCE([공장 EXW date], ''),
                    COALESCE(Status, ''),
@@ -416,6 +433,7 @@ def load_po_exw_pending() -> pd.DataFrame:
     finally:
         conn.close()
     if not df.empty:
+        _numeric(df, "line_item")
         df["po_qty"] = pd.to_numeric(df["po_qty"], errors="coerce").fillna(0)
         df["po_total_ico"] = pd.to_numeric(df["po_total_ico"], errors="coerce").fillna(0)
         df["order_date"] = pd.to_datetime(df["order_date"], errors="coerce")
@@ -441,9 +459,9 @@ def load_so_dn_anomalies() -> pd.DataFrame:
         df = pd.read_sql_query("""
             WITH so_lines AS (
                 SELECT SO_ID,
-                       CAST([Line item] AS INTEGER) AS line_item,
-                       CAST([Sales Unit Price] AS REAL) AS so_unit_price,
-                       CAST([Item qty] AS REAL)         AS so_qty,
+                       [Line item] AS line_item,
+                       [Sales Unit Price] AS so_unit_price,
+                       [Item qty] AS so_qty,
                        COALESCE([Customer name], '')    AS customer_name,
                        COALESCE(Sector, '')             AS sector,
                        COALESCE([OS name], '')          AS os_name,
@@ -454,9 +472,9 @@ def load_so_dn_anomalies() -> pd.DataFrame:
                 WHERE COALESCE(Status, '') != 'Cancelled'
                 UNION ALL
                 SELECT SO_ID,
-                       CAST([Line item] AS INTEGER),
-                       CAST([Sales Unit Price] AS REAL),
-                       CAST([Item qty] AS REAL),
+                       [Line item],
+                       [Sales Unit Price],
+                       [Item qty],
                        COALESCE([Customer name], ''),
                        COALESCE(Sector, ''),
                        COALESCE([OS name], ''),
@@ -468,18 +486,18 @@ def load_so_dn_anomalies() -> pd.DataFrame:
             ),
             dn_lines AS (
                 SELECT SO_ID,
-                       CAST([Line item] AS INTEGER) AS line_item,
-                       CAST(Qty AS REAL)            AS dn_qty,
-                       CAST([Unit Price] AS REAL)   AS dn_unit_price,
-                       CAST([Total Sales] AS REAL)  AS dn_amount,
+                       [Line item] AS line_item,
+                       Qty AS dn_qty,
+                       [Unit Price] AS dn_unit_price,
+                       [Total Sales] AS dn_amount,
                        '국내' AS market
                 FROM dn_domestic
                 UNION ALL
                 SELECT SO_ID,
-                       CAST([Line item] AS INTEGER),
-                       CAST(Qty AS REAL),
-                       CAST([Unit Price] AS REAL),
-                       CAST([Total Sales] AS REAL),
+                       [Line item],
+                       Qty,
+                       [Unit Price],
+                       [Total Sales],
                        '해외'
                 FROM dn_export
             )
@@ -549,19 +567,19 @@ def load_dn_lines_by_so_line() -> pd.DataFrame:
     try:
         df = pd.read_sql_query("""
             SELECT DN_ID, SO_ID,
-                   CAST([Line item] AS INTEGER) AS line_item,
-                   CAST(Qty AS REAL)            AS dn_qty,
-                   CAST([Unit Price] AS REAL)   AS dn_unit_price,
-                   CAST([Total Sales] AS REAL)  AS dn_amount,
+                   [Line item] AS line_item,
+                   Qty AS dn_qty,
+                   [Unit Price] AS dn_unit_price,
+                   [Total Sales] AS dn_amount,
                    [출고일] AS dispatch_date,
                    '국내' AS market
             FROM dn_domestic
             UNION ALL
             SELECT DN_ID, SO_ID,
-                   CAST([Line item] AS INTEGER),
-                   CAST(Qty AS REAL),
-                   CAST([Unit Price] AS REAL),
-                   CAST([Total Sales] AS REAL),
+                   [Line item],
+                   Qty,
+                   [Unit Price],
+                   [Total Sales],
                    [선적일],
                    '해외'
             FROM dn_export
@@ -573,6 +591,7 @@ def load_dn_lines_by_so_line() -> pd.DataFrame:
     finally:
         conn.close()
     if not df.empty:
+        _numeric(df, "line_item", "dn_qty", "dn_unit_price", "dn_amount")
         df["dispatch_date"] = pd.to_datetime(df["dispatch_date"], errors="coerce")
     return df
 
@@ -587,18 +606,18 @@ def load_dn_tax_pending() -> pd.DataFrame:
         df = pd.read_sql_query("""
             SELECT DN_ID, SO_ID, [Customer name] AS customer_name,
                    [Item] AS item_name,
-                   CAST([Line item] AS INTEGER) AS line_item,
-                   CAST(Qty AS REAL) AS qty,
-                   CAST([Total Sales] AS REAL) AS amount_krw,
+                   [Line item] AS line_item,
+                   Qty AS qty,
+                   [Total Sales] AS amount_krw,
                    [출고일] AS dispatch_date
             FROM dn_domestic
-            WHERE [출고일] IS NOT NULL AND TRIM(COALESCE([출고일], '')) != ''
+            WHERE [출고일] IS NOT NULL
               AND (TRIM(COALESCE([세금계산서 발행일], '')) = '' OR [세금계산서 발행일] IS NULL)
               AND UPPER(TRIM(COALESCE([세금계산서 발행일], ''))) != 'N/A'
               AND ([선수금 세금계산서 발행일] IS NULL
                    OR TRIM(COALESCE([선수금 세금계산서 발행일], '')) = ''
                    OR UPPER(TRIM(COALESCE([선수금 세금계산서 발행일], ''))) = 'N/A')
-              AND CAST(COALESCE([Total Sales], 0) AS REAL) > 0
+              AND [Total Sales] > 0
         """, conn)
     except Exception as e:
         logger.warning("데이터 로드 실패: %s", e)
@@ -606,6 +625,7 @@ def load_dn_tax_pending() -> pd.DataFrame:
         return pd.DataFrame()
     finally:
         conn.close()
+    _numeric(df, "line_item", "qty", "amount_krw")
     df["dispatch_date"] = pd.to_datetime(df["dispatch_date"], errors="coerce")
     return df
 
@@ -622,9 +642,9 @@ def load_backlog() -> pd.DataFrame:
         so_combined AS (
             SELECT SO_ID, [Customer name] AS customer_name,
                    [OS name] AS os_name,
-                   CAST([Line item] AS INTEGER) AS line_item,
-                   CAST([Item qty] AS REAL) AS qty,
-                   CAST([Sales amount] AS REAL) AS amount,
+                   [Line item] AS line_item,
+                   [Item qty] AS qty,
+                   [Sales amount] AS amount,
                    [Model code] AS model_code, Sector AS sector,
                    [Expected delivery date] AS delivery_date, '국내' AS market
             FROM so_domestic
@@ -632,25 +652,25 @@ def load_backlog() -> pd.DataFrame:
               AND Period IS NOT NULL AND TRIM(Period) != ''
             UNION ALL
             SELECT SO_ID, [Customer name], [OS name],
-                   CAST([Line item] AS INTEGER),
-                   CAST([Item qty] AS REAL),
-                   CAST([Sales amount KRW] AS REAL),
+                   [Line item],
+                   [Item qty],
+                   [Sales amount KRW],
                    [Model code], Sector, [Expected delivery date], '해외'
             FROM so_export
             WHERE COALESCE(Status, '') != 'Cancelled'
               AND Period IS NOT NULL AND TRIM(Period) != ''
         ),
         dn_combined AS (
-            SELECT SO_ID, CAST([Line item] AS INTEGER) AS line_item,
-                   CAST(Qty AS REAL) AS out_qty,
-                   CAST([Total Sales] AS REAL) AS out_amt
+            SELECT SO_ID, [Line item] AS line_item,
+                   Qty AS out_qty,
+                   [Total Sales] AS out_amt
             FROM dn_domestic
-            WHERE [출고일] IS NOT NULL AND TRIM(COALESCE([출고일], '')) != ''
+            WHERE [출고일] IS NOT NULL
             UNION ALL
-            SELECT SO_ID, CAST([Line item] AS INTEGER),
-                   CAST(Qty AS REAL), CAST([Total Sales KRW] AS REAL)
+            SELECT SO_ID, [Line item],
+                   Qty, [Total Sales KRW]
             FROM dn_export
-            WHERE [선적일] IS NOT NULL AND TRIM(COALESCE([선적일], '')) != ''
+            WHERE [선적일] IS NOT NULL
         ),
         events AS (
             SELECT SO_ID, customer_name, os_name, line_item,
@@ -872,6 +892,55 @@ def load_sync_runs(days: int = 30) -> pd.DataFrame:
     return df
 
 
+@st.cache_data(ttl=60)
+def load_sync_perf(days: int = 30) -> pd.DataFrame:
+    """_sync_runs 성능 지표 로드 (오래된 순). 지표 기록 이전 DB면 빈 DataFrame."""
+    conn = _conn()
+    if not conn:
+        return pd.DataFrame()
+    try:
+        cols = {r[1] for r in conn.execute("PRAGMA table_info(_sync_runs)")}
+        if "elapsed_seconds" not in cols:
+            return pd.DataFrame()
+        cutoff = (_TODAY - timedelta(days=days)).strftime("%Y-%m-%d") if days > 0 else ""
+        df = pd.read_sql_query(
+            "SELECT sync_id, started_at, note, total_changes, elapsed_seconds, total_rows, "
+            "       rows_per_sec, bytes_written, peak_rss_bytes, phases_json "
+            "FROM _sync_runs WHERE elapsed_seconds IS NOT NULL AND started_at >= ? "
+            "ORDER BY sync_id",
+            conn, params=(cutoff,),
+        )
+    except Exception as e:
+        logger.warning("동기화 성능 로드 실패: %s", e)
+        _record_load_error("Sync Perf", e)
+        return pd.DataFrame()
+    finally:
+        conn.close()
+    return df
+
+
+def sync_phase_breakdown(perf: pd.DataFrame) -> pd.DataFrame:
+    """실행별 단계 소요 시간 (long 형식: sync_id, started_at, phase, seconds) — 시트 단계는 전 시트 합"""
+    records = [
+        {"sync_id": row.sync_id, "started_at": row.started_at, "phase": name, "seconds": seconds}
+        for row in perf.itertuples(index=False)
+        for name, seconds in phase_totals(row.phases_json).items()
+    ]
+    return pd.DataFrame(records, columns=["sync_id", "started_at", "phase", "seconds"])
+
+
+def flag_sync_slowdowns(perf: pd.DataFrame) -> pd.Series:
+    """처리 속도(행/초)가 직전 실행들 중앙값보다 크게 떨어진 실행 (perf는 오래된 순)"""
+    flags = []
+    history: list[float] = []
+    for rows, rate in zip(perf["total_rows"], perf["rows_per_sec"]):
+        has_rows = bool(rows) and pd.notna(rate)
+        flags.append(has_rows and is_slowdown(rate, history[-SLOWDOWN_WINDOW:]))
+        if has_rows:
+            history.append(rate)
+    return pd.Series(flags, index=perf.index, dtype=bool)
+
+
 # SO 시트에서 단가/수량은 변경됐지만 Customer PO는 변경되지 않은 케이스를 감시.
 # 매출/세금계산서/매출대사에 영향이 있어 한 번이라도 못 보면 안 됨 → ack 기반 dismiss.
 #
@@ -5480,15 +5549,93 @@ def _render_sync_log_explore() -> None:
     )
 
 
+def _render_sync_perf() -> None:
+    """동기화 성능 추이 — 실행별 소요 시간 · 단계 구성 · 처리 속도 · 메모리."""
+    range_opt = st.selectbox("조회 기간", ["7일", "30일", "90일", "전체"], index=1, key="perf_range")
+    days_map = {"7일": 7, "30일": 30, "90일": 90, "전체": 0}
+    perf = load_sync_perf(days=days_map[range_opt])
+    if perf.empty:
+        st.info("성능 지표가 기록된 동기화가 없습니다. (sync_db.py 실행 후 표시)")
+        return
+
+    perf = perf.copy()
+    perf["slow"] = flag_sync_slowdowns(perf)
+    last = perf.iloc[-1]
+    earlier = perf.iloc[:-1]
+    earlier = earlier[earlier["total_rows"] > 0]
+
+    # ── KPI (직전 실행들 중앙값 대비) ──
+    c1, c2, c3, c4 = st.columns(4)
+    c1.metric(
+        "최근 소요", f"{last['elapsed_seconds']:.1f}s",
+        delta=(f"{last['elapsed_seconds'] - earlier['elapsed_seconds'].median():+.1f}s"
+               if not earlier.empty else None),
+        delta_color="inverse",
+    )
+    c2.metric(
+        "최근 행/초", f"{last['rows_per_sec'] or 0:,.0f}",
+        delta=(f"{(last['rows_per_sec'] or 0) - earlier['rows_per_sec'].median():+,.0f}"
+               if not earlier.empty and last["total_rows"] else None),
+    )
+    peak, written = last["peak_rss_bytes"], last["bytes_written"]
+    c3.metric("피크 메모리", f"{peak / 1024 / 1024:,.0f} MB" if pd.notna(peak) else "-")
+    c4.metric("DB 쓰기", f"{written / 1024 / 1024:,.1f} MB" if pd.notna(written) else "-")
+    if last["slow"]:
+        st.warning("최근 동기화의 처리 속도가 직전 실행들보다 크게 떨어졌습니다 — 단계 구성을 확인하세요.")
+
+    # ── 실행별 단계 구성 ──
+    st.subheader("실행별 단계 소요 시간")
+    phases = sync_phase_breakdown(perf)
+    if not phases.empty:
+        phases["실행"] = phases["sync_id"].astype(str)
+        fig = px.bar(
+            phases, x="실행", y="seconds", color="phase",
+            hover_data=["started_at"],
+            labels={"seconds": "초", "phase": "단계", "실행": "sync_id"},
+        )
+        fig.update_layout(height=360, margin=dict(t=30, b=30))
+        st.plotly_chart(fig, use_container_width=True)
+
+    # ── 처리 속도 추이 ──
+    st.subheader("처리 속도 추이")
+    rate = perf[perf["total_rows"] > 0]
+    if not rate.empty:
+        fig = px.line(
+            rate, x="started_at", y="rows_per_sec", markers=True,
+            hover_data=["sync_id", "total_rows", "elapsed_seconds"],
+            labels={"started_at": "시작", "rows_per_sec": "행/초"},
+        )
+        fig.update_layout(height=300, margin=dict(t=30, b=30))
+        st.plotly_chart(fig, use_container_width=True)
+
+    # ── 실행 목록 ──
+    view = perf.sort_values("sync_id", ascending=False).head(50)
+    view = pd.DataFrame({
+        "sync_id": view["sync_id"],
+        "시작": view["started_at"],
+        "비고": view["note"].fillna(""),
+        "변경수": view["total_changes"],
+        "소요(s)": view["elapsed_seconds"].round(1),
+        "행수": view["total_rows"],
+        "행/초": view["rows_per_sec"].round(0),
+        "쓰기(MB)": (view["bytes_written"] / 1024 / 1024).round(1),
+        "메모리(MB)": (view["peak_rss_bytes"] / 1024 / 1024).round(0),
+        "하락": view["slow"].map({True: "▼", False: ""}),
+    })
+    st.dataframe(view, use_container_width=True, hide_index=True)
+
+
 def pg_sync_log(**_):
     st.title("🔄 동기화 로그")
     st.caption("Excel → SQLite 동기화 시 발생한 신규/수정/삭제 이력 (_sync_log v2 + _sync_runs)")
 
-    tab_explore, tab_timeline = st.tabs(["📋 탐색", "🕐 주문 타임라인"])
+    tab_explore, tab_timeline, tab_perf = st.tabs(["📋 탐색", "🕐 주문 타임라인", "⏱ 성능"])
     with tab_explore:
         _render_sync_log_explore()
     with tab_timeline:
         _render_order_timeline()
+    with tab_perf:
+        _render_sync_perf()
 
 
 if __name__ == "__main__":
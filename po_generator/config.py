@@ -73,6 +73,32 @@ OC_TEMPLATE_FILE: Final[Path] = TEMPLATE_DIR / "order_confirmation.xlsx"
 OC_OUTPUT_DIR: Final[Path] = _OUT_BASE / "generated_oc"
 
 
+# === 시트 디스크 캐시 (NOAH_SO_PO_DN.xlsx 파싱 결과를 워크북 옆에 저장) ===
+# False면 매 실행마다 Excel을 새로 파싱 (프로세스 내 메모리 캐시는 항상 사용)
+SHEET_CACHE_ENABLED: Final[bool] = _load_user_setting('SHEET_CACHE_ENABLED', True)
+
+# === Excel 읽기 엔진 ===
+# 'auto': python-calamine 설치 시 calamine (빠름), 없으면 openpyxl
+# 'calamine' / 'openpyxl': 강제 지정 (calamine 실패 시 openpyxl로 자동 재시도)
+EXCEL_READER_ENGINE: Final[str] = _load_user_setting('EXCEL_READER_ENGINE', 'auto')
+
+# === 문서 생성 데이터 소스 ===
+# 'excel': NOAH_SO_PO_DN.xlsx 파싱 (기본)
+# 'sqlite': sync_db.py로 동기화된 noah_data.db 조회 (Excel이 열려 있어도 동작)
+# 'auto': DB가 Excel 저장 이후 동기화되었거나 Excel을 읽을 수 없으면 DB, 아니면 Excel
+DATA_SOURCE: Final[str] = _load_user_setting('DATA_SOURCE', 'excel')
+
+# === DB 동기화 스트리밍 ===
+# 0: 시트 전체를 한 번에 읽음 (기본, 가장 빠름)
+# N: N행 단위로 스트리밍 읽기 — 시트 크기와 무관하게 메모리 사용량 일정 (openpyxl)
+SYNC_BATCH_SIZE: Final[int] = _load_user_setting('SYNC_BATCH_SIZE', 0)
+
+# === 시트 병렬 파싱 (DB 동기화, 여러 시트를 읽는 로더) ===
+# 0: 자동 (CPU 코어 수만큼, 작은 파일·단일 코어는 순차)
+# 1: 항상 순차 파싱 / N: 최대 N개 프로세스
+PARSE_WORKERS: Final[int] = _load_user_setting('PARSE_WORKERS', 0)
+
+
 # === 시트 설정 (NOAH_SO_PO_DN.xlsx) ===
 # 국내 시트
 SO_DOMESTIC_SHEET: Final[str] = 'SO_국내'
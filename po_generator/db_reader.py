@@ -0,0 +1,287 @@
+"""
+SQLite 조회 계층
+================
+
+sync_db.py로 동기화된 noah_data.db에서 시트 데이터를 조회합니다.
+문서 생성 시 Excel 파싱 대신 PK 인덱스를 타는 SQL 조회로 필요한 행만 읽으며,
+Excel 파일이 다른 사용자에게 열려(잠겨) 있어도 동작합니다.
+
+DB는 타입 컬럼(SheetConfig.column_types — 수량/금액/날짜 등) 외에는 값을 TEXT로
+저장하므로 조회 결과는 Excel 로더와 같은 타입(정수/실수/날짜/시각/불리언/문자열)으로
+복원합니다. 타입은 조회된 행만 보고 추론하므로, 시트 전체 기준인 Excel 로더와
+컬럼 dtype이 다를 수 있습니다 (예: 다른 행에 빈 칸이 있는 정수 컬럼 — Excel은
+float64, DB 조회는 int64).
+
+데이터 소스 (user_settings.py의 DATA_SOURCE):
+- 'excel' (기본): 항상 NOAH_SO_PO_DN.xlsx 파싱
+- 'sqlite': 항상 DB 조회
+- 'auto': DB가 Excel 저장 시각 이후에 동기화되었거나 Excel을 읽을 수 없으면 DB
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import re
+import sqlite3
+from collections.abc import Iterable
+from datetime import datetime, time
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from po_generator.config import DATA_SOURCE, DB_FILE, NOAH_SO_PO_DN_FILE
+from po_generator.db_schema import COL_DATE, ROW_HASH_COLUMN, SYNC_SHEETS, get_sync_metadata
+from po_generator.utils import SHEET_DTYPES
+
+logger = logging.getLogger(__name__)
+
+SOURCE_EXCEL = 'excel'
+SOURCE_SQLITE = 'sqlite'
+SOURCE_AUTO = 'auto'
+DATA_SOURCES: tuple[str, ...] = (SOURCE_EXCEL, SOURCE_SQLITE, SOURCE_AUTO)
+
+# 시트명 → 테이블명
+SHEET_TABLES: dict[str, str] = {c.sheet_name: c.table_name for c in SYNC_SHEETS}
+
+# 동기화 엔진이 추가하는 내부 컬럼 (Excel 시트에는 없음)
+_INTERNAL_COLUMNS = frozenset({'_sync_updated_at', '_row_seq', ROW_HASH_COLUMN})
+
+# pandas dtype=str 변환 결과 형태 (db_sync가 저장하는 텍스트)
+_INT_RE = re.compile(r'-?(?:0|[1-9]\d*)\Z')
+_DATETIME_RE = re.compile(r'\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}(?:\.\d{1,6})?\Z')
+_TIME_RE = re.compile(r'\d{2}:\d{2}:\d{2}\Z')
+# DATE 컬럼의 ISO 날짜 (시각 생략형)
+_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}\Z')
+
+
+def _parse_text(value: str) -> Any:
+    """DB TEXT 값 → Excel 셀 값 (원래 텍스트로 정확히 되돌아가는 경우만 변환)
+
+    '00123'처럼 숫자로 바꾸면 형태가 달라지는 값은 문자열로 유지합니다.
+    """
+    if _INT_RE.match(value):
+        return int(value)
+    try:
+        number = float(value)
+    except ValueError:
+        pass
+    else:
+        if math.isfinite(number) and repr(number) == value:
+            return number
+        return value
+    if _DATETIME_RE.match(value):
+        return datetime.fromisoformat(value)
+    if _TIME_RE.match(value):
+        return time.fromisoformat(value)
+    if value in ('True', 'False'):
+        return value == 'True'
+    return value
+
+
+def _parse_value(value: Any, col_type: str | None) -> Any:
+    """DB 값 → Excel 셀 값 (타입 컬럼의 숫자/ISO 날짜 포함)
+
+    REAL 컬럼의 정수값(1234.0)은 openpyxl처럼 int로 돌려줍니다.
+    """
+    if isinstance(value, float):
+        return int(value) if value.is_integer() else value
+    if not isinstance(value, str):
+        return value
+    if col_type == COL_DATE and _DATE_RE.match(value):
+        return datetime.fromisoformat(value)
+    return _parse_text(value)
+
+
+def _restore_column(values: list[Any], as_text: bool,
+                    col_type: str | None = None) -> pd.Series:
+    """DB 컬럼 → Excel 로더와 같은 dtype의 Series
+
+    정수만 → int64 (빈 값 있으면 float64), 숫자만 → float64, 날짜만 → datetime64,
+    그 외는 셀 값이 섞인 object. as_text면 문자열 그대로 (빈 값은 NaN).
+    col_type은 테이블 선언 타입 (DATE면 'YYYY-MM-DD'도 날짜로 복원).
+    """
+    if not values:
+        return pd.Series(values, dtype=object)
+    missing = [v is None or v == '' for v in values]
+    present = [v for v, m in zip(values, missing) if not m]
+    if not present:
+        return pd.Series(np.nan, index=range(len(values)), dtype='float64')
+    if as_text:
+        return pd.Series([np.nan if m else _to_text(v) for v, m in zip(values, missing)],
+                         dtype=object)
+
+    parsed = [_parse_value(v, col_type) for v in present]
+    kinds = {type(v) for v in parsed}
+    has_missing = any(missing)
+    it = iter(parsed)
+    cells = [np.nan if m else next(it) for m in missing]
+
+    if kinds == {int}:
+        return pd.Series(cells, dtype='float64' if has_missing else 'int64')
+    if kinds <= {int, float}:
+        return pd.Series(cells, dtype='float64')
+    if kinds == {datetime}:
+        return pd.Series(pd.to_datetime(pd.Series(cells, dtype=object)), dtype='datetime64[ns]')
+    if kinds == {bool} and not has_missing:
+        return pd.Series(cells, dtype=bool)
+    return pd.Series(cells, dtype=object)
+
+
+def _to_text(value: Any) -> str:
+    """조회 조건 값 → DB 저장 형태 (정수값 float은 '1.0'이 아니라 '1')"""
+    if isinstance(value, (float, np.floating)) and float(value).is_integer():
+        return str(int(value))
+    if isinstance(value, (np.integer,)):
+        return str(int(value))
+    return str(value)
+
+
+class DbReader:
+    """noah_data.db 읽기 전용 조회
+
+    Usage:
+        with DbReader() as db:
+            df = db.read_sheet('DN_국내', where={'DN_ID': ['DND-2026-0001']})
+    """
+
+    def __init__(self, db_path: Path | None = None):
+        self.db_path = Path(db_path or DB_FILE)
+        self._conn: sqlite3.Connection | None = None
+        self._columns: dict[str, list[str]] = {}
+        self._types: dict[str, dict[str, str]] = {}
+
+    def __enter__(self) -> DbReader:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            if not self.db_path.exists():
+                raise FileNotFoundError(
+                    f"DB 파일을 찾을 수 없습니다: {self.db_path} (sync_db.py로 먼저 동기화하세요)"
+                )
+            self._conn = sqlite3.connect(f"{self.db_path.resolve().as_uri()}?mode=ro", uri=True)
+        return self._conn
+
+    def columns(self, table: str) -> list[str]:
+        """테이블 컬럼 (내부 컬럼 제외, 테이블 정의 순서). 테이블이 없으면 []"""
+        if table not in self._columns:
+            rows = self._connect().execute(f'PRAGMA table_info([{table}])').fetchall()
+            self._columns[table] = [r[1] for r in rows if r[1] not in _INTERNAL_COLUMNS]
+            self._types[table] = {r[1]: (r[2] or '').upper() for r in rows}
+        return self._columns[table]
+
+    def select(self, table: str, where: dict[str, Iterable[Any]] | None = None,
+               text_columns: Iterable[str] = ()) -> pd.DataFrame:
+        """테이블 조회 (동기화 순서 = rowid 순)
+
+        Args:
+            table: 테이블명
+            where: {컬럼: 허용 값 목록} — 컬럼별 IN 조건을 AND로 결합
+            text_columns: 타입 복원 없이 문자열로 둘 컬럼
+
+        Returns:
+            DataFrame (Excel 로더와 같은 타입으로 복원)
+
+        Raises:
+            ValueError: 테이블이 없는 경우
+        """
+        columns = self.columns(table)
+        if not columns:
+            raise ValueError(f"DB에 테이블이 없습니다: {table} (sync_db.py로 먼저 동기화하세요)")
+
+        sql = f'SELECT {", ".join(f"[{c}]" for c in columns)} FROM [{table}]'
+        params: list[str] = []
+        clauses = []
+        for col, values in (where or {}).items():
+            values = list(dict.fromkeys(_to_text(v) for v in values))
+            if not values or col not in columns:
+                return pd.DataFrame({c: pd.Series(dtype=object) for c in columns})
+            clauses.append(f'[{col}] IN ({", ".join("?" * len(values))})')
+            params.extend(values)
+        if clauses:
+            sql += ' WHERE ' + ' AND '.join(clauses)
+        rows = self._connect().execute(sql + ' ORDER BY rowid', params).fetchall()
+
+        text_columns = set(text_columns)
+        types = self._types[table]
+        data = list(zip(*rows)) if rows else [()] * len(columns)
+        return pd.DataFrame({
+            col: _restore_column(list(values), col in text_columns, types.get(col))
+            for col, values in zip(columns, data)
+        })
+
+    def read_sheet(self, sheet_name: str,
+                   where: dict[str, Iterable[Any]] | None = None) -> pd.DataFrame:
+        """시트에 해당하는 테이블 조회 (시트별 고정 dtype 적용)"""
+        text_columns = [c for c, t in SHEET_DTYPES.get(sheet_name, {}).items() if t is str]
+        return self.select(SHEET_TABLES[sheet_name], where, text_columns)
+
+    def last_sync(self) -> datetime | None:
+        """전체 동기화 대상 테이블 중 가장 오래된 동기화 시각 (한 테이블이라도 없으면 None)"""
+        meta = get_sync_metadata(self._connect())
+        times = []
+        for table in SHEET_TABLES.values():
+            last = meta.get(table, {}).get('last_sync')
+            if not last:
+                return None
+            times.append(datetime.fromisoformat(last))
+        return min(times)
+
+
+def _excel_readable(path: Path) -> bool:
+    """Excel 파일을 읽을 수 있는지 (없거나 잠겨 있으면 False)"""
+    try:
+        with open(path, 'rb') as f:
+            f.read(1)
+        return True
+    except OSError:
+        return False
+
+
+def resolve_data_source(source: str | None = None, db_path: Path | None = None,
+                        excel_path: Path | None = None) -> str:
+    """설정값('auto' 포함)을 실제 데이터 소스로 변환
+
+    Args:
+        source: 'excel' | 'sqlite' | 'auto' (None이면 DATA_SOURCE)
+        db_path: DB 경로 (None이면 DB_FILE)
+        excel_path: Excel 경로 (None이면 NOAH_SO_PO_DN_FILE)
+
+    Returns:
+        'excel' 또는 'sqlite'
+    """
+    source = (source or DATA_SOURCE or SOURCE_EXCEL).lower()
+    if source not in DATA_SOURCES:
+        logger.warning(f"알 수 없는 DATA_SOURCE '{source}' → excel")
+        return SOURCE_EXCEL
+    if source != SOURCE_AUTO:
+        return source
+
+    db_path = Path(db_path or DB_FILE)
+    excel_path = Path(excel_path or NOAH_SO_PO_DN_FILE)
+    if not db_path.exists():
+        return SOURCE_EXCEL
+    if not _excel_readable(excel_path):
+        logger.info(f"Excel을 읽을 수 없어 DB 사용: {excel_path.name}")
+        return SOURCE_SQLITE
+    try:
+        with DbReader(db_path) as db:
+            synced = db.last_sync()
+    except (sqlite3.Error, ValueError) as e:
+        logger.warning(f"DB 동기화 정보 확인 실패 → excel: {e}")
+        return SOURCE_EXCEL
+    if synced is not None and synced >= datetime.fromtimestamp(excel_path.stat().st_mtime):
+        return SOURCE_SQLITE
+    logger.info("DB가 Excel보다 오래됨 → excel (sync_db.py로 동기화하면 DB 사용)")
+    return SOURCE_EXCEL
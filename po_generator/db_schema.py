@@ -8,10 +8,13 @@ SQLite 테이블/PK 정의 및 스키마 관리.
 
 from __future__ import annotations
 
+import json
 import os
 import socket
 import sqlite3
 import logging
+import math
+import re
 from dataclasses import dataclass, field
 from datetime import datetime
 
@@ -20,11 +23,60 @@ from po_generator.config import (
     PO_DOMESTIC_SHEET, PO_EXPORT_SHEET,
     DN_DOMESTIC_SHEET, DN_EXPORT_SHEET,
     PMT_DOMESTIC_SHEET,
+    CUSTOMER_EXPORT_SHEET,
 )
+from po_generator.xlsx_package import RowBlocks
 
 logger = logging.getLogger(__name__)
 
 
+# 컬럼 타입 (SQLite 선언 타입) — column_types에 없는 컬럼은 TEXT
+COL_TEXT = 'TEXT'
+COL_INTEGER = 'INTEGER'
+COL_REAL = 'REAL'
+COL_DATE = 'DATE'       # ISO-8601 텍스트 ('YYYY-MM-DD', 시각이 있으면 'YYYY-MM-DD HH:MM:SS')
+
+# 동기화가 관리하는 보조 인덱스 이름 접두어 — ix_<테이블>__<이름>
+INDEX_PREFIX = 'ix_'
+
+# 표현식/WHERE 안의 컬럼 참조 ([컬럼])
+_BRACKET_COLUMN_RE = re.compile(r'\[([^\]]+)\]')
+
+
+@dataclass(frozen=True)
+class IndexSpec:
+    """시트 테이블 보조 인덱스 선언 (SheetConfig.indexes)
+
+    columns의 각 항목은 컬럼명이거나, '('를 포함하면 SQL 표현식입니다
+    (예: "COALESCE([Status], '')"). 표현식과 where(부분 인덱스 조건)에서는
+    컬럼을 반드시 [컬럼]으로 감싸야 시트에 컬럼이 없을 때 건너뛸 수 있습니다.
+    """
+    columns: tuple[str, ...]
+    where: str = ''          # 부분 인덱스 조건 (비어 있으면 전체 행)
+    name: str = ''           # 비어 있으면 컬럼명으로 생성 (표현식 인덱스는 필수)
+
+    def __post_init__(self):
+        if not self.columns:
+            raise ValueError("인덱스 컬럼이 비어 있습니다")
+        if not self.name and any('(' in c for c in self.columns):
+            raise ValueError(f"표현식 인덱스는 name이 필요합니다: {self.columns}")
+
+    @property
+    def key(self) -> str:
+        """인덱스 이름 중 테이블 뒤 부분"""
+        return self.name or '_'.join(re.sub(r'\W+', '_', c).strip('_') for c in self.columns)
+
+    def referenced_columns(self) -> set[str]:
+        """인덱스가 참조하는 테이블 컬럼"""
+        refs = set(_BRACKET_COLUMN_RE.findall(self.where))
+        for col in self.columns:
+            if '(' in col:
+                refs.update(_BRACKET_COLUMN_RE.findall(col))
+            else:
+                refs.add(col)
+        return refs
+
+
 @dataclass(frozen=True)
 class SheetConfig:
     """시트별 동기화 설정"""
@@ -34,21 +86,70 @@ class SheetConfig:
     required_column: str     # NaN이면 행 스킵 (빈 행 필터링)
     needs_row_seq: bool = False  # _row_seq 자동 생성 여부
     row_seq_group: tuple[str, ...] = field(default_factory=tuple)  # _row_seq 그룹핑 컬럼
+    # 타입 컬럼 ((컬럼, COL_*), ...) — 동기화 시 값을 한 번 정규화해 저장 (쿼리에서 CAST 불필요)
+    column_types: tuple[tuple[str, str], ...] = field(default_factory=tuple)
+    # 보조 인덱스 — 동기화마다 선언과 DB를 맞춤 (ensure_indexes)
+    indexes: tuple[IndexSpec, ...] = field(default_factory=tuple)
+
+    def column_type(self, column: str) -> str:
+        """컬럼 선언 타입 (column_types에 없으면 COL_TEXT)"""
+        column = column.strip()
+        return next((t for c, t in self.column_types if c == column), COL_TEXT)
+
+
+# 시트 공통 타입 컬럼 — 시트에 없는 컬럼은 무시됩니다.
+# Expected delivery date는 ob_snapshot PK로 기존 스냅샷 텍스트와 비교하므로 TEXT 유지
+_SO_TYPES = (
+    ('Line item', COL_INTEGER), ('Item qty', COL_REAL),
+    ('Sales Unit Price', COL_REAL), ('Sales amount', COL_REAL), ('Sales amount KRW', COL_REAL),
+)
+_PO_TYPES = (
+    ('Line item', COL_INTEGER), ('Item qty', COL_REAL), ('Total ICO', COL_REAL),
+)
+_DN_TYPES = (
+    ('Line item', COL_INTEGER), ('Qty', COL_REAL), ('Unit Price', COL_REAL),
+    ('Total Sales', COL_REAL), ('Total Sales KRW', COL_REAL),
+    ('\ucd9c\uace0\uc77c', COL_DATE),  # 출고일
+    ('\uc120\uc801\uc77c', COL_DATE),  # 선적일
+)
+
+# 시트 공통 보조 인덱스 — PK 선두 컬럼(SO_ID/PO_ID/DN_ID) 조회는 PK로 충분.
+# 대시보드/스냅샷/DB 로더의 필터·JOIN 컬럼 기준이며, 시트에 없는 컬럼의 인덱스는 건너뜁니다.
+_SO_INDEXES = (
+    IndexSpec(('Customer name',)),
+    IndexSpec(('Item name',)),
+    IndexSpec(('Sector',)),
+)
+_PO_INDEXES = (
+    IndexSpec(('SO_ID',)),                                   # SO ↔ PO 연결, 관련 ID 조회
+    # Status = 'Sent' 필터, SO별 Open PO 상관 서브쿼리 (Status + SO_ID)
+    IndexSpec(("COALESCE([Status], '')", 'SO_ID'), name='status_SO_ID'),
+)
+_DN_INDEXES = (
+    IndexSpec(('SO_ID', 'Line item')),                       # SO 라인 ↔ DN JOIN
+    IndexSpec(('Item',)),
+    IndexSpec(('\ucd9c\uace0\uc77c',), where='[\ucd9c\uace0\uc77c] IS NOT NULL'),  # 출고일
+    IndexSpec(('\uc120\uc801\uc77c',), where='[\uc120\uc801\uc77c] IS NOT NULL'),  # 선적일
+)
 
 
-# 7개 시트 설정
+# 8개 시트 설정
 SYNC_SHEETS: list[SheetConfig] = [
     SheetConfig(
         sheet_name=SO_DOMESTIC_SHEET,
         table_name='so_domestic',
         pk_columns=('SO_ID', 'Line item'),
         required_column='SO_ID',
+        column_types=_SO_TYPES,
+        indexes=_SO_INDEXES,
     ),
     SheetConfig(
         sheet_name=SO_EXPORT_SHEET,
         table_name='so_export',
         pk_columns=('SO_ID', 'Line item'),
         required_column='SO_ID',
+        column_types=_SO_TYPES,
+        indexes=_SO_INDEXES,
     ),
     SheetConfig(
         sheet_name=PO_DOMESTIC_SHEET,
@@ -57,6 +158,8 @@ SYNC_SHEETS: list[SheetConfig] = [
         required_column='PO_ID',
         needs_row_seq=True,
         row_seq_group=('PO_ID', 'Line item'),
+        column_types=_PO_TYPES,
+        indexes=_PO_INDEXES,
     ),
     SheetConfig(
         sheet_name=PO_EXPORT_SHEET,
@@ -65,18 +168,24 @@ SYNC_SHEETS: list[SheetConfig] = [
         required_column='PO_ID',
         needs_row_seq=True,
         row_seq_group=('PO_ID', 'Line item'),
+        column_types=_PO_TYPES,
+        indexes=_PO_INDEXES,
     ),
     SheetConfig(
         sheet_name=DN_DOMESTIC_SHEET,
         table_name='dn_domestic',
         pk_columns=('DN_ID', 'SO_ID', 'Line item'),
         required_column='DN_ID',
+        column_types=_DN_TYPES,
+        indexes=_DN_INDEXES,
     ),
     SheetConfig(
         sheet_name=DN_EXPORT_SHEET,
         table_name='dn_export',
         pk_columns=('DN_ID', 'SO_ID', 'Line item'),
         required_column='DN_ID',
+        column_types=_DN_TYPES,
+        indexes=_DN_INDEXES,
     ),
     SheetConfig(
         sheet_name=PMT_DOMESTIC_SHEET,
@@ -84,6 +193,16 @@ SYNC_SHEETS: list[SheetConfig] = [
         pk_columns=('\uc120\uc218\uae08_ID',),  # 선수금_ID
         required_column='\uc120\uc218\uae08_ID',  # 선수금_ID
     ),
+    # 고객 마스터 (DB 조회 시 OC/FI의 Bill to, Payment terms JOIN용)
+    # 고객코드 중복 행은 _row_seq로 구분 — Excel 로더처럼 첫 행(_row_seq=1) 우선
+    SheetConfig(
+        sheet_name=CUSTOMER_EXPORT_SHEET,
+        table_name='customer_export',
+        pk_columns=('C-code by \ud574\uc678', '_row_seq'),  # C-code by 해외
+        required_column='C-code by \ud574\uc678',
+        needs_row_seq=True,
+        row_seq_group=('C-code by \ud574\uc678',),
+    ),
 ]
 
 
@@ -120,6 +239,7 @@ def migrate_pk_if_changed(conn: sqlite3.Connection, config: 'SheetConfig') -> bo
     # 기존 테이블 백업 후 삭제 (스냅샷 등 파생 데이터 복구 가능)
     backup = f"{config.table_name}_bak"
     conn.execute(f'DROP TABLE IF EXISTS [{backup}]')
+    drop_sync_indexes(conn, config.table_name)  # 인덱스 이름이 백업 테이블에 남지 않도록
     conn.execute(f'ALTER TABLE [{config.table_name}] RENAME TO [{backup}]')
     logger.info("%s → %s 백업 완료", config.table_name, backup)
     return True
@@ -133,21 +253,91 @@ def _sanitize_col_name(col: str) -> str:
     return col.strip()
 
 
+# 행 내용 해시 컬럼 (동기화 엔진 내부용 — 값이 같은 행은 컬럼 비교 없이 건너뜀)
+ROW_HASH_COLUMN = '_row_hash'
+
+
+# DATE 컬럼 입력 형태 (ISO 외) — 날짜만 있는 형식
+_DATE_FORMATS = ('%Y.%m.%d', '%Y/%m/%d')
+
+
+def _coerce_date(text: str) -> str:
+    """날짜 텍스트 → ISO-8601 ('YYYY-MM-DD', 자정이 아니면 'YYYY-MM-DD HH:MM:SS'). 해석 불가면 그대로"""
+    try:
+        dt = datetime.fromisoformat(text)
+    except ValueError:
+        for fmt in _DATE_FORMATS:
+            try:
+                dt = datetime.strptime(text, fmt)
+                break
+            except ValueError:
+                continue
+        else:
+            return text
+    if (dt.hour, dt.minute, dt.second, dt.microsecond) == (0, 0, 0, 0):
+        return dt.strftime('%Y-%m-%d')
+    return dt.replace(tzinfo=None).isoformat(sep=' ', timespec='seconds')
+
+
+def coerce_value(value, col_type: str):
+    """값을 컬럼 타입의 저장 형태로 정규화 (동기화 쓰기 + 타입 마이그레이션 공용)
+
+    - INTEGER: 정수값이면 int, 소수면 float ('1', '1.0' → 1)
+    - REAL: float ('1234', '1234.0' → 1234.0)
+    - DATE: ISO-8601 텍스트 ('2024-01-15 00:00:00', '2024.01.15' → '2024-01-15')
+    - TEXT: 정수값 float은 '1234', 그 외 숫자는 str
+
+    앞뒤 공백은 제거하고 빈 값은 None. 숫자/날짜로 해석할 수 없는 값('N/A' 등)은
+    텍스트 그대로 저장합니다 (SQLite는 타입 컬럼에도 텍스트를 허용).
+    """
+    if value is None:
+        return None
+    if col_type == COL_TEXT:
+        if isinstance(value, float) and value.is_integer():
+            return str(int(value))
+        return value if isinstance(value, str) else str(value)
+    if isinstance(value, str):
+        value = value.strip()
+        if value == '':
+            return None
+    if col_type == COL_DATE:
+        return _coerce_date(value) if isinstance(value, str) else value
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return value
+    if not math.isfinite(number):
+        return value
+    if col_type == COL_INTEGER and number.is_integer():
+        return int(number)
+    return number
+
+
+def _column_def(col: str, col_type: str) -> str:
+    return f'[{_sanitize_col_name(col)}] {col_type}'
+
+
 def create_table(conn: sqlite3.Connection, table_name: str,
-                 columns: list[str], pk_columns: tuple[str, ...]) -> None:
-    """테이블 생성 (없으면 생성, 있으면 무시)"""
+                 columns: list[str], pk_columns: tuple[str, ...],
+                 config: SheetConfig | None = None) -> None:
+    """테이블 생성 (없으면 생성, 있으면 무시)
+
+    Args:
+        config: 시트 설정 — column_types의 컬럼은 해당 타입으로 선언 (None이면 전부 TEXT)
+    """
     col_defs = []
     for col in columns:
-        safe = _sanitize_col_name(col)
-        col_defs.append(f'[{safe}] TEXT')
+        col_type = config.column_type(col) if config is not None else COL_TEXT
+        col_defs.append(_column_def(col, col_type))
 
     pk_list = ', '.join(f'[{_sanitize_col_name(c)}]' for c in pk_columns)
     col_defs_str = ',\n  '.join(col_defs)
 
-    # _sync_updated_at: 마지막 동기화 시각
+    # _sync_updated_at: 마지막 동기화 시각, _row_hash: 행 내용 해시
     sql = f"""CREATE TABLE IF NOT EXISTS [{table_name}] (
   {col_defs_str},
   [_sync_updated_at] TEXT,
+  [{ROW_HASH_COLUMN}] TEXT,
   PRIMARY KEY ({pk_list})
 )"""
     conn.execute(sql)
@@ -155,22 +345,148 @@ def create_table(conn: sqlite3.Connection, table_name: str,
 
 
 def ensure_columns_exist(conn: sqlite3.Connection, table_name: str,
-                         new_columns: list[str]) -> int:
-    """기존 테이블에 없는 컬럼 추가. 추가된 컬럼 수 반환."""
+                         new_columns: list[str],
+                         config: SheetConfig | None = None) -> int:
+    """기존 테이블에 없는 컬럼 추가. 추가된 컬럼 수 반환.
+
+    _row_hash가 없는 이전 버전 테이블에는 해시 컬럼도 추가합니다 (개수에는 미포함).
+    """
     cursor = conn.execute(f'PRAGMA table_info([{table_name}])')
     existing = {row[1] for row in cursor.fetchall()}
 
     added = 0
     for col in new_columns:
         safe = _sanitize_col_name(col)
-        if safe not in existing and safe != '_sync_updated_at':
-            conn.execute(f'ALTER TABLE [{table_name}] ADD COLUMN [{safe}] TEXT')
-            logger.debug("컬럼 추가: %s.[%s]", table_name, safe)
+        if safe not in existing and safe not in ('_sync_updated_at', ROW_HASH_COLUMN):
+            col_type = config.column_type(col) if config is not None else COL_TEXT
+            conn.execute(f'ALTER TABLE [{table_name}] ADD COLUMN {_column_def(col, col_type)}')
+            logger.debug("컬럼 추가: %s.[%s] %s", table_name, safe, col_type)
             added += 1
 
+    if ROW_HASH_COLUMN not in existing:
+        conn.execute(f'ALTER TABLE [{table_name}] ADD COLUMN [{ROW_HASH_COLUMN}] TEXT')
+
     return added
 
 
+def migrate_column_types(conn: sqlite3.Connection, config: SheetConfig) -> list[str]:
+    """기존 테이블의 컬럼 선언 타입이 config.column_types와 다르면 테이블 재작성
+
+    SQLite는 컬럼 타입 변경(ALTER COLUMN)을 지원하지 않으므로 새 타입으로 만든
+    테이블에 coerce_value()로 정규화한 값을 옮긴 뒤 교체합니다. 동기화 트랜잭션
+    안에서 호출하므로 dry-run/에러 시 함께 ROLLBACK 됩니다. 행 해시는 그대로 두며,
+    정규화로 표현이 바뀐 행은 다음 비교에서 값이 같으므로 해시만 갱신됩니다.
+
+    Returns:
+        타입이 바뀐 컬럼명 리스트 (테이블이 없거나 같으면 빈 리스트)
+    """
+    info = conn.execute(f'PRAGMA table_info([{config.table_name}])').fetchall()
+    # table_info: (cid, name, type, notnull, dflt_value, pk)
+    columns = [r[1] for r in info if r[1] not in ('_sync_updated_at', ROW_HASH_COLUMN)]
+    declared = {r[1]: (r[2] or '').upper() for r in info}
+    changed = [c for c in columns if declared[c] != config.column_type(c)]
+    if not changed:
+        return []
+
+    table = config.table_name
+    typed = f'{table}__typed'
+    pk_columns = _get_table_pk(conn, table)
+    conn.execute(f'DROP TABLE IF EXISTS [{typed}]')
+    create_table(conn, typed, columns, pk_columns, config)
+
+    conn.create_function('_sync_coerce', 2, coerce_value, deterministic=True)
+    select = [
+        f"_sync_coerce([{c}], '{config.column_type(c)}')" if c in changed else f'[{c}]'
+        for c in columns
+    ]
+    for internal in ('_sync_updated_at', ROW_HASH_COLUMN):
+        select.append(f'[{internal}]' if internal in declared else 'NULL')
+    target_cols = [f'[{c}]' for c in columns] + ['[_sync_updated_at]', f'[{ROW_HASH_COLUMN}]']
+    # 정규화로 PK가 겹치면 ('1'과 '1.0') 먼저 동기화된 행만 유지
+    before = get_table_row_count(conn, table)
+    conn.execute(
+        f'INSERT OR IGNORE INTO [{typed}] ({", ".join(target_cols)}) '
+        f'SELECT {", ".join(select)} FROM [{table}] ORDER BY rowid'
+    )
+    after = get_table_row_count(conn, typed)
+    conn.execute(f'DROP TABLE [{table}]')
+    conn.execute(f'ALTER TABLE [{typed}] RENAME TO [{table}]')
+
+    logger.info("%s: 컬럼 타입 변경 %s", table,
+                ', '.join(f'{c} {declared[c] or "?"}→{config.column_type(c)}' for c in changed))
+    if after != before:
+        logger.warning("%s: 타입 정규화 후 PK 중복 %d행 제외", table, before - after)
+    return changed
+
+
+def index_name(table_name: str, spec: IndexSpec) -> str:
+    """동기화 관리 인덱스 이름 (ix_<테이블>__<이름>)"""
+    return f'{INDEX_PREFIX}{table_name}__{spec.key}'
+
+
+def _index_sql(table_name: str, spec: IndexSpec) -> str:
+    terms = ', '.join(c if '(' in c else f'[{_sanitize_col_name(c)}]' for c in spec.columns)
+    sql = f'CREATE INDEX [{index_name(table_name, spec)}] ON [{table_name}] ({terms})'
+    return f'{sql} WHERE {spec.where}' if spec.where else sql
+
+
+def _sync_indexes(conn: sqlite3.Connection, table_name: str) -> dict[str, str]:
+    """테이블에 붙은 동기화 관리 인덱스 {이름: CREATE 문}"""
+    prefix = f'{INDEX_PREFIX}{table_name}__'
+    rows = conn.execute(
+        "SELECT name, sql FROM sqlite_master WHERE type = 'index' AND tbl_name = ?",
+        (table_name,),
+    ).fetchall()
+    return {name: sql for name, sql in rows if name.startswith(prefix)}
+
+
+def drop_sync_indexes(conn: sqlite3.Connection, table_name: str) -> int:
+    """동기화 관리 인덱스 전부 삭제 (테이블 백업/교체 전 이름 충돌 방지). 삭제 수 반환."""
+    names = list(_sync_indexes(conn, table_name))
+    for name in names:
+        conn.execute(f'DROP INDEX [{name}]')
+    return len(names)
+
+
+def ensure_indexes(conn: sqlite3.Connection,
+                   config: SheetConfig) -> tuple[list[str], list[str]]:
+    """config.indexes 선언과 테이블의 동기화 관리 인덱스를 일치시킴 (멱등)
+
+    선언에 없거나 정의가 바뀐 인덱스는 삭제하고, 없는 인덱스는 생성합니다.
+    참조 컬럼이 테이블에 없는 인덱스는 건너뜁니다. 타입 마이그레이션 등으로
+    테이블을 다시 만들면 인덱스도 사라지므로 매 동기화마다 호출합니다.
+    ix_ 접두어가 아닌 (사용자가 직접 만든) 인덱스는 건드리지 않습니다.
+
+    Returns:
+        (생성한 인덱스명 리스트, 삭제한 인덱스명 리스트)
+    """
+    table = config.table_name
+    info = conn.execute(f'PRAGMA table_info([{table}])').fetchall()
+    if not info:
+        return [], []
+    columns = {r[1] for r in info}
+
+    desired = {}
+    for spec in config.indexes:
+        missing = spec.referenced_columns() - columns
+        if missing:
+            logger.debug("%s: 인덱스 %s 건너뜀 (컬럼 없음: %s)", table, spec.key, sorted(missing))
+            continue
+        desired[index_name(table, spec)] = _index_sql(table, spec)
+
+    existing = _sync_indexes(conn, table)
+    dropped = [name for name, sql in existing.items() if desired.get(name) != sql]
+    for name in dropped:
+        conn.execute(f'DROP INDEX [{name}]')
+    created = [name for name in desired if name not in existing or name in dropped]
+    for name in created:
+        conn.execute(desired[name])
+
+    if dropped:
+        logger.info("%s: 인덱스 삭제/재생성 대상 %s", table, ', '.join(dropped))
+    return created, dropped
+
+
 def get_table_row_count(conn: sqlite3.Connection, table_name: str) -> int:
     """테이블 행 수 조회"""
     try:
@@ -220,11 +536,23 @@ def create_snapshot_tables(conn: sqlite3.Connection) -> None:
     logger.debug("스냅샷 테이블 생성/확인 완료")
 
 
+# _sync_runs 성능 지표 컬럼 (finalize_sync_run의 metrics 키)
+SYNC_RUN_METRIC_COLUMNS: tuple[tuple[str, str], ...] = (
+    ('elapsed_seconds', 'REAL'),    # 동기화 전체 소요 시간
+    ('total_rows', 'INTEGER'),      # 처리한 Excel 행 수 (건너뛴 시트 제외)
+    ('rows_per_sec', 'REAL'),
+    ('bytes_written', 'INTEGER'),   # writer 프로세스 쓰기 바이트
+    ('peak_rss_bytes', 'INTEGER'),  # 이번 실행 피크 메모리 (writer/워커 중 최대, 측정 불가면 NULL)
+    ('phases_json', 'TEXT'),        # {"run": {단계: 초}, "sheets": {시트: {단계: 초, "rows": n}}}
+)
+
+
 def ensure_sync_log_tables(conn: sqlite3.Connection) -> None:
     """_sync_runs + _sync_log v2 스키마 생성 (idempotent).
 
     구조:
     - _sync_runs : 동기화 세션 메타 (sync_id, started/ended_at, actor, host, dry_run, total_changes)
+                   + 성능 지표 (SYNC_RUN_METRIC_COLUMNS)
     - _sync_log  : 변경 이벤트 (sync_id FK, sheet, type, pk_json, pk_display, changes_json, row_snapshot_json)
                    record(레코드)당 1행. 신규/수정/삭제 정보는 changes_json 또는 row_snapshot_json으로 저장.
     """
@@ -240,6 +568,11 @@ def ensure_sync_log_tables(conn: sqlite3.Connection) -> None:
             note           TEXT
         )
     """)
+    # 성능 지표 컬럼 — 이전 버전 DB에는 추가
+    existing = {row[1] for row in conn.execute('PRAGMA table_info(_sync_runs)')}
+    for col, col_type in SYNC_RUN_METRIC_COLUMNS:
+        if col not in existing:
+            conn.execute(f'ALTER TABLE _sync_runs ADD COLUMN {col} {col_type}')
     conn.execute("""
         CREATE TABLE IF NOT EXISTS _sync_log (
             id                INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -259,6 +592,113 @@ def ensure_sync_log_tables(conn: sqlite3.Connection) -> None:
     conn.execute("CREATE INDEX IF NOT EXISTS idx_sync_runs_started ON _sync_runs (started_at)")
 
 
+def sync_log_text(val) -> str | None:
+    """로그 값 → JSON-호환 텍스트. None/빈 문자열은 None으로 통일 (REAL 컬럼 1234.0은 '1234')."""
+    if val is None:
+        return None
+    if isinstance(val, float) and val.is_integer():
+        return str(int(val))
+    s = str(val)
+    return s if s else None
+
+
+def sync_log_json(obj) -> str:
+    """JSON 직렬화 — 한글 비-escape, 키 순서 유지."""
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+
+
+def format_pk_display(pk: tuple) -> str:
+    """PK 표시 문자열 (_sync_log.pk_display) — 'ND-1 | 1 | 1'"""
+    return ' | '.join(str(v) for v in pk)
+
+
+def insert_sync_log_rows(conn: sqlite3.Connection, sync_id: int,
+                         rows: list[tuple]) -> None:
+    """_sync_log 행 일괄 INSERT
+
+    Args:
+        rows: [(sheet_name, change_type, pk_json, pk_display, changes_json, row_snapshot_json)]
+    """
+    conn.executemany(
+        "INSERT INTO _sync_log "
+        "(sync_id, sheet_name, change_type, pk_json, pk_display, "
+        " changes_json, row_snapshot_json) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+        ((sync_id, *row) for row in rows),
+    )
+
+
+# PO_해외 라인별 Weight 해결 결과 (동기화 시 재계산, Packing List 조회용)
+PO_LINE_WEIGHT_TABLE = 'po_line_weight'
+
+
+def ensure_po_line_weight_table(conn: sqlite3.Connection) -> None:
+    """PO 라인 Weight 파생 테이블 — idempotent.
+
+    (SO_ID, Line item)당 1행. 미매칭 라인도 weight=NULL, match_tier='unmatched'로 보관.
+    """
+    conn.execute(f"""
+        CREATE TABLE IF NOT EXISTS {PO_LINE_WEIGHT_TABLE} (
+            SO_ID         TEXT NOT NULL,
+            [Line item]   TEXT NOT NULL,
+            Model         TEXT,
+            weight        REAL,
+            matched_code  TEXT,
+            match_tier    TEXT NOT NULL,
+            PRIMARY KEY (SO_ID, [Line item])
+        )
+    """)
+    conn.execute(
+        f"CREATE INDEX IF NOT EXISTS idx_po_line_weight_tier ON {PO_LINE_WEIGHT_TABLE} (match_tier)"
+    )
+
+
+# 시트별 행 블록 해시 (마지막 동기화 시점) — 바뀐 행 범위 감지용
+SYNC_BLOCKS_TABLE = '_sync_blocks'
+
+
+def ensure_sync_blocks_table(conn: sqlite3.Connection) -> None:
+    """행 블록 해시 테이블 — idempotent. 테이블(시트)당 1행, hashes는 JSON 배열."""
+    conn.execute(f"""
+        CREATE TABLE IF NOT EXISTS {SYNC_BLOCKS_TABLE} (
+            table_name  TEXT PRIMARY KEY,
+            block_rows  INTEGER NOT NULL,
+            base        TEXT NOT NULL,
+            hashes      TEXT NOT NULL,
+            synced_at   TEXT
+        )
+    """)
+
+
+def get_row_blocks(conn: sqlite3.Connection, table_name: str) -> RowBlocks | None:
+    """마지막 동기화 때 저장한 행 블록 해시 (없으면 None)"""
+    try:
+        row = conn.execute(
+            f'SELECT block_rows, base, hashes FROM {SYNC_BLOCKS_TABLE} WHERE table_name = ?',
+            (table_name,),
+        ).fetchone()
+    except sqlite3.OperationalError:
+        return None
+    if row is None:
+        return None
+    return RowBlocks(row[0], row[1], tuple(json.loads(row[2])))
+
+
+def save_row_blocks(conn: sqlite3.Connection, table_name: str,
+                    blocks: RowBlocks, sync_time: str) -> None:
+    """행 블록 해시 저장 (테이블당 1행 덮어쓰기)"""
+    ensure_sync_blocks_table(conn)
+    conn.execute(f"""
+        INSERT INTO {SYNC_BLOCKS_TABLE} (table_name, block_rows, base, hashes, synced_at)
+        VALUES (?, ?, ?, ?, ?)
+        ON CONFLICT(table_name) DO UPDATE SET
+            block_rows = excluded.block_rows,
+            base = excluded.base,
+            hashes = excluded.hashes,
+            synced_at = excluded.synced_at
+    """, (table_name, blocks.block_rows, blocks.base, json.dumps(list(blocks.hashes)), sync_time))
+
+
 def ensure_so_change_ack_table(conn: sqlite3.Connection) -> None:
     """SO 시트 무단 단가/수량 변경 확인(ack) 테이블 — idempotent."""
     conn.execute("""
@@ -289,9 +729,9 @@ def _resolve_actor() -> str | None:
 
 
 def create_sync_run(conn: sqlite3.Connection, dry_run: bool = False,
-                    note: str | None = None) -> int:
-    """동기화 세션 시작 → _sync_runs 행 INSERT 후 sync_id 반환."""
-    started_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                    note: str | None = None, started_at: str | None = None) -> int:
+    """동기화 세션 시작 → _sync_runs 행 INSERT 후 sync_id 반환 (started_at 기본: 지금)."""
+    started_at = started_at or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     actor = _resolve_actor()
     host = socket.gethostname()
     cur = conn.execute(
@@ -303,37 +743,67 @@ def create_sync_run(conn: sqlite3.Connection, dry_run: bool = False,
 
 
 def finalize_sync_run(conn: sqlite3.Connection, sync_id: int,
-                      total_changes: int) -> None:
-    """동기화 세션 종료 — ended_at + total_changes 갱신."""
+                      total_changes: int, metrics: dict | None = None,
+                      note: str | None = None) -> None:
+    """동기화 세션 종료 — ended_at + total_changes (+ 성능 지표, note) 갱신.
+
+    Args:
+        metrics: {SYNC_RUN_METRIC_COLUMNS 컬럼명: 값} — 없는 키는 그대로 둠
+        note: 주어지면 _sync_runs.note 덮어씀
+    """
     ended_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    assignments = ['ended_at=?', 'total_changes=?']
+    params: list = [ended_at, total_changes]
+    if note is not None:
+        assignments.append('note=?')
+        params.append(note)
+    for col, _ in SYNC_RUN_METRIC_COLUMNS:
+        if metrics and col in metrics:
+            assignments.append(f'{col}=?')
+            params.append(metrics[col])
     conn.execute(
-        "UPDATE _sync_runs SET ended_at=?, total_changes=? WHERE sync_id=?",
-        (ended_at, total_changes, sync_id),
+        f"UPDATE _sync_runs SET {', '.join(assignments)} WHERE sync_id=?",
+        (*params, sync_id),
     )
 
 
 def get_sync_metadata(conn: sqlite3.Connection) -> dict[str, dict]:
-    """_sync_meta 테이블에서 동기화 메타정보 조회"""
+    """_sync_meta 테이블에서 동기화 메타정보 조회 (fingerprint는 없으면 None)"""
     try:
-        cursor = conn.execute('SELECT table_name, last_sync, row_count FROM _sync_meta')
-        return {
-            row[0]: {'last_sync': row[1], 'row_count': row[2]}
-            for row in cursor.fetchall()
-        }
+        cursor = conn.execute('SELECT * FROM _sync_meta')
     except sqlite3.OperationalError:
         return {}
+    names = [d[0] for d in cursor.description]
+    meta = {}
+    for row in cursor.fetchall():
+        values = dict(zip(names, row))
+        meta[values['table_name']] = {
+            'last_sync': values['last_sync'],
+            'row_count': values['row_count'],
+            'fingerprint': values.get('fingerprint'),
+        }
+    return meta
 
 
-def update_sync_metadata(conn: sqlite3.Connection, table_name: str,
-                         sync_time: str, row_count: int) -> None:
-    """동기화 메타정보 업데이트"""
+def _ensure_sync_meta_table(conn: sqlite3.Connection) -> None:
+    """_sync_meta 생성 — fingerprint 컬럼이 없는 이전 버전 테이블은 컬럼 추가"""
     conn.execute("""
         CREATE TABLE IF NOT EXISTS _sync_meta (
             table_name TEXT PRIMARY KEY,
             last_sync TEXT,
-            row_count INTEGER
+            row_count INTEGER,
+            fingerprint TEXT
         )
     """)
+    columns = {row[1] for row in conn.execute('PRAGMA table_info(_sync_meta)')}
+    if 'fingerprint' not in columns:
+        conn.execute('ALTER TABLE _sync_meta ADD COLUMN fingerprint TEXT')
+
+
+def update_sync_metadata(conn: sqlite3.Connection, table_name: str,
+                         sync_time: str, row_count: int) -> None:
+    """동기화 메타정보 업데이트"""
+    _ensure_sync_meta_table(conn)
     conn.execute("""
         INSERT INTO _sync_meta (table_name, last_sync, row_count)
         VALUES (?, ?, ?)
@@ -341,3 +811,26 @@ def update_sync_metadata(conn: sqlite3.Connection, table_name: str,
             last_sync = excluded.last_sync,
             row_count = excluded.row_count
     """, (table_name, sync_time, row_count))
+
+
+def touch_sync_time(conn: sqlite3.Connection, table_name: str, sync_time: str) -> None:
+    """동기화 시각만 갱신 (지문이 같아 건너뛴 시트 — 행 수는 그대로)"""
+    _ensure_sync_meta_table(conn)
+    conn.execute("""
+        INSERT INTO _sync_meta (table_name, last_sync)
+        VALUES (?, ?)
+        ON CONFLICT(table_name) DO UPDATE SET
+            last_sync = excluded.last_sync
+    """, (table_name, sync_time))
+
+
+def update_sync_fingerprint(conn: sqlite3.Connection, table_name: str,
+                            fingerprint: str) -> None:
+    """동기화한 시트 지문 저장 — 다음 동기화에서 같으면 시트를 건너뜀"""
+    _ensure_sync_meta_table(conn)
+    conn.execute("""
+        INSERT INTO _sync_meta (table_name, fingerprint)
+        VALUES (?, ?)
+        ON CONFLICT(table_name) DO UPDATE SET
+            fingerprint = excluded.fingerprint
+    """, (table_name, fingerprint))
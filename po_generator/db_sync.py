@@ -7,9 +7,19 @@ NOAH_SO_PO_DN.xlsx의 수동 입력 시트를 SQLite DB에 upsert 방식으로 
 
 from __future__ import annotations
 
+import hashlib
+import os
+import pickle
 import sqlite3
 import logging
 import math
+import tempfile
+import time
+import zipfile
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import closing, contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -17,16 +27,45 @@ from pathlib import Path
 import numpy as np
 import pandas as pd
 
-from po_generator.config import NOAH_SO_PO_DN_FILE, DB_FILE
+from po_generator.config import (
+    NOAH_SO_PO_DN_FILE, DB_FILE, SYNC_BATCH_SIZE, PO_EXPORT_SHEET, WEIGHT_SHEET,
+)
+from po_generator.excel_reader import ExcelReader, parse_workers
+from po_generator.xlsx_package import XlsxPackage, format_row_ranges
 from po_generator.db_schema import (
-    SheetConfig, SYNC_SHEETS,
-    create_table, ensure_columns_exist,
-    update_sync_metadata, get_table_row_count,
+    SheetConfig, SYNC_SHEETS, ROW_HASH_COLUMN, COL_TEXT,
+    coerce_value, create_table, ensure_columns_exist, migrate_column_types,
+    ensure_indexes,
+    update_sync_metadata, touch_sync_time, get_table_row_count,
+    get_sync_metadata, update_sync_fingerprint,
     migrate_pk_if_changed,
+    PO_LINE_WEIGHT_TABLE, ensure_po_line_weight_table,
+    get_row_blocks, save_row_blocks,
+    ensure_sync_log_tables, create_sync_run, finalize_sync_run, insert_sync_log_rows,
+    sync_log_json, sync_log_text, format_pk_display,
+)
+from po_generator.sync_metrics import (
+    PHASE_PARSE, PHASE_DIFF, PHASE_WRITE, PHASE_PRUNE, PHASE_INDEX, PHASE_BLOCKS,
+    PHASE_FINGERPRINT, PHASE_WEIGHT, PHASE_COMMIT, PHASE_LOG,
+    RunPeakRss, io_write_bytes, peak_rss_bytes, phase_timer, rows_per_second,
+)
+from po_generator.utils import (
+    PO_LINE_WEIGHT_COLUMNS, WEIGHT_TIER_UNMATCHED,
+    build_model_weight_map, resolve_po_line_weights,
 )
 
 logger = logging.getLogger(__name__)
 
+# 시트 읽기 옵션 — 모든 값을 Excel 표시 그대로의 문자열로 (빈 셀만 NULL)
+_READ_KWARGS = {'dtype': str, 'keep_default_na': False, 'na_values': ['']}
+
+# _sync_log 스트리밍 기록 묶음 크기 — 이 행 수만큼 모이면 INSERT
+SYNC_LOG_BATCH_ROWS = 500
+# SheetSyncResult에 남기는 신규/수정/삭제 상세 표본 수 (콘솔 출력용)
+CHANGE_SAMPLE_LIMIT = 20
+# 변경 묶음 크기 — 이 행 수만큼 비교할 때마다 반영(순차)하거나 임시 파일로 넘김(워커)
+CHANGE_CHUNK_ROWS = 500
+
 
 @dataclass
 class SheetSyncResult:
@@ -40,8 +79,7 @@ class SheetSyncResult:
     errors: int = 0
     error_messages: list[str] = field(default_factory=list)
     unchanged: int = 0
-    inserted_pks: list[tuple] = field(default_factory=list)
-    updated_pks: list[tuple] = field(default_factory=list)
+    # 아래 상세는 앞에서부터 CHANGE_SAMPLE_LIMIT건까지만 (전체 내역은 _sync_log)
     # 신규 상세: [{pk: tuple, values: {col: value}}] — 비어있지 않은 값만
     inserted_details: list[dict] = field(default_factory=list)
     # 수정 상세: [{pk: tuple, changes: {col: (old, new)}}]
@@ -49,13 +87,44 @@ class SheetSyncResult:
     # 삭제(prune): Excel에서 제거된 행
     pruned: int = 0
     pruned_pks: list[tuple] = field(default_factory=list)
-    # 삭제 직전 행 스냅샷 — 감사/복구용 ([{pk: tuple, snapshot: {col: value}}])
-    pruned_snapshots: list[dict] = field(default_factory=list)
+    # 지난 동기화 대비 바뀐 Excel 행 범위 [(시작 행, 끝 행)] — None이면 감지 불가
+    changed_rows: list[tuple[int, int]] | None = None
+    # 시트 지문이 지난 동기화와 같아 파싱/비교 없이 건너뜀
+    unchanged_skipped: bool = False
+    # 이번 동기화에서 만든 보조 인덱스 수
+    indexes_created: int = 0
+    # 단계별 소요 시간 (초) — 키는 sync_metrics.SHEET_PHASES
+    phase_seconds: dict[str, float] = field(default_factory=dict)
 
     @property
     def success(self) -> bool:
         return self.errors == 0
 
+    @property
+    def index_seconds(self) -> float:
+        return self.phase_seconds.get(PHASE_INDEX, 0.0)
+
+    @property
+    def elapsed_seconds(self) -> float:
+        """시트 처리 시간 (단계 합계 — 병렬 파싱/비교는 워커 프로세스 시간)"""
+        return sum(self.phase_seconds.values())
+
+    @property
+    def rows_per_second(self) -> float:
+        return rows_per_second(self.total_rows, self.elapsed_seconds)
+
+
+@dataclass
+class _ExistingRow:
+    """DB에 이미 있는 행 — 원본 PK, 행 해시, (이번 묶음에서 정한 경우) columns 값
+
+    written: 앞 묶음에서 sink로 넘긴 행 — 값은 넘길 때 버리고 필요하면 sink/DB에서 다시 조회
+    """
+    db_pk: tuple
+    row_hash: str | None
+    values: tuple | None = None
+    written: bool = False
+
 
 @dataclass
 class SyncSummary:
@@ -64,6 +133,15 @@ class SyncSummary:
     elapsed_seconds: float = 0.0
     source_file: str = ''
     db_file: str = ''
+    weight_lines: int = 0       # po_line_weight에 저장한 PO 라인 수
+    weight_unmatched: int = 0   # 그중 Weight 미매칭 라인 수
+    # 실행 단위 단계 소요 시간 (초) — 키는 sync_metrics.RUN_PHASES
+    phase_seconds: dict[str, float] = field(default_factory=dict)
+    bytes_written: int | None = None    # writer 프로세스 쓰기 바이트 (측정 불가면 None)
+    peak_rss_bytes: int | None = None   # 이번 실행의 writer/워커 프로세스 중 최대 피크 메모리
+    # 동기화 트랜잭션과 함께 commit된 _sync_runs 행 (로그 행이 없거나 ROLLBACK이면 None)
+    sync_id: int | None = None
+    log_rows: int = 0                   # 그 실행으로 _sync_log에 기록한 행 수
 
     @property
     def total_rows(self) -> int:
@@ -85,6 +163,28 @@ class SyncSummary:
     def total_errors(self) -> int:
         return sum(r.errors for r in self.results)
 
+    @property
+    def total_indexes_created(self) -> int:
+        return sum(r.indexes_created for r in self.results)
+
+    @property
+    def total_index_seconds(self) -> float:
+        return sum(r.index_seconds for r in self.results)
+
+    @property
+    def rows_per_second(self) -> float:
+        return rows_per_second(self.total_rows, self.elapsed_seconds)
+
+    def phase_totals(self) -> dict[str, float]:
+        """단계별 합계 — 시트 단계(전 시트 합) + 실행 단계"""
+        totals: dict[str, float] = {}
+        for r in self.results:
+            for name, seconds in r.phase_seconds.items():
+                totals[name] = totals.get(name, 0.0) + seconds
+        for name, seconds in self.phase_seconds.items():
+            totals[name] = totals.get(name, 0.0) + seconds
+        return totals
+
 
 def _sanitize_value(val):
     """pandas/numpy 값을 SQLite 호환 Python 타입으로 변환.
@@ -120,21 +220,58 @@ def _sanitize_value(val):
     return val
 
 
-def _add_row_seq(df: pd.DataFrame, group_cols: tuple[str, ...]) -> pd.DataFrame:
+def _add_row_seq(df: pd.DataFrame, group_cols: tuple[str, ...],
+                 counts: dict[tuple, int] | None = None) -> pd.DataFrame:
     """그룹 내 순번(_row_seq) 부여. Excel 행 순서 기준.
 
     명시적으로 int로 cast — group key 컬럼에 숫자가 섞이면 cumcount 결과가
     float64로 승격되어 DB에 "1.0"로 저장되는 버그 방지.
+
+    counts를 넘기면 이전 묶음까지의 그룹별 마지막 순번에 이어서 부여하고
+    갱신합니다 (스트리밍 동기화용).
     """
     existing = [c for c in group_cols if c in df.columns]
     if not existing:
         df['_row_seq'] = 1
         return df
     df = df.copy()
-    df['_row_seq'] = (df.groupby(existing, sort=False).cumcount() + 1).astype(int)
+    seq = (df.groupby(existing, sort=False).cumcount() + 1).astype(int)
+    if counts is not None:
+        keys = list(df[existing].itertuples(index=False, name=None))
+        seq = seq + [counts.get(k, 0) for k in keys]
+        counts.update(zip(keys, seq))
+    df['_row_seq'] = seq
     return df
 
 
+def _norm_value(val) -> str | None:
+    """변경 비교용 정규화 — None/빈문자열/'None'은 같은 빈 값(None)으로 취급
+
+    정수값 float(REAL 컬럼의 1234.0)은 '1234'로 — 이전 TEXT 저장값과 같은 표현.
+    """
+    if isinstance(val, float) and val.is_integer():
+        return str(int(val))
+    return None if val in (None, '', 'None') else str(val)
+
+
+def _row_hash(columns: list[str], values: list) -> str:
+    """행 내용 해시 — (컬럼, 정규화 값) 기준. 빈 값 컬럼은 제외
+
+    빈 컬럼이 새로 추가되어도 기존 행의 해시는 그대로입니다.
+    해시가 같으면 컬럼별 비교 결과도 '변경 없음'입니다.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    for col, val in zip(columns, values):
+        norm = _norm_value(val)
+        if norm is None:
+            continue
+        h.update(col.encode('utf-8'))
+        h.update(b'\x1f')
+        h.update(norm.encode('utf-8'))
+        h.update(b'\x1e')
+    return h.hexdigest()
+
+
 def _normalize_pk(pk: tuple) -> tuple:
     """PK 값을 문자열 튜플로 정규화 — Python set 비교 시 타입 불일치 방지.
 
@@ -154,25 +291,573 @@ def _normalize_pk(pk: tuple) -> tuple:
     return tuple(out)
 
 
+def _keep_sample(samples: list, item) -> None:
+    """변경 상세 표본 — CHANGE_SAMPLE_LIMIT건까지만 보관"""
+    if len(samples) < CHANGE_SAMPLE_LIMIT:
+        samples.append(item)
+
+
+class SyncLogWriter:
+    """_sync_log 행을 동기화 트랜잭션 안에서 묶음 단위로 기록
+
+    변경 내역을 끝까지 모아 두지 않고 batch_rows행마다 INSERT하므로 메모리는
+    변경량과 무관합니다. 동기화가 ROLLBACK되면 로그와 실행 행도 함께 취소됩니다.
+    _sync_runs 행은 첫 묶음을 쓸 때 만듭니다 (변경 없는 실행은 호출 측에서 기록).
+
+    Args:
+        conn: 동기화 writer 연결 (_sync_log 테이블 생성 완료 상태)
+        started_at: _sync_runs.started_at (동기화 시작 시각)
+        batch_rows: INSERT 묶음 행 수
+    """
+
+    def __init__(self, conn: sqlite3.Connection, started_at: str,
+                 batch_rows: int = SYNC_LOG_BATCH_ROWS):
+        self.conn = conn
+        self.started_at = started_at
+        self.batch_rows = batch_rows
+        self.sync_id: int | None = None
+        self.count = 0          # 기록(INSERT)한 행 수
+        self.seconds = 0.0      # 직렬화 + INSERT 소요 시간
+        self._buffer: list[tuple] = []
+
+    def inserted(self, sheet_name: str, pk: tuple, values: dict) -> None:
+        """신규: changes_json = {col: value}"""
+        changes = {col: text for col, val in values.items()
+                   if (text := sync_log_text(val)) is not None}
+        self._add(sheet_name, '신규', pk, changes, None)
+
+    def updated(self, sheet_name: str, pk: tuple, diff: dict) -> None:
+        """수정: changes_json = {col: {old, new}}"""
+        changes = {col: {'old': sync_log_text(old), 'new': sync_log_text(new)}
+                   for col, (old, new) in diff.items()}
+        self._add(sheet_name, '수정', pk, changes, None)
+
+    def pruned(self, sheet_name: str, pk: tuple, snapshot: dict) -> None:
+        """삭제: row_snapshot_json = 삭제 직전 {col: value}"""
+        snap = {col: text for col, val in snapshot.items()
+                if (text := sync_log_text(val)) is not None}
+        self._add(sheet_name, '삭제', pk, None, snap)
+
+    def _add(self, sheet_name: str, change_type: str, pk: tuple,
+             changes: dict | None, snapshot: dict | None) -> None:
+        started = time.perf_counter()
+        self._buffer.append((
+            sheet_name, change_type, sync_log_json(list(pk)), format_pk_display(pk),
+            sync_log_json(changes) if changes else None,
+            sync_log_json(snapshot) if snapshot else None,
+        ))
+        if len(self._buffer) >= self.batch_rows:
+            self._flush()
+        self.seconds += time.perf_counter() - started
+
+    def _flush(self) -> None:
+        if not self._buffer:
+            return
+        if self.sync_id is None:
+            self.sync_id = create_sync_run(self.conn, started_at=self.started_at)
+        insert_sync_log_rows(self.conn, self.sync_id, self._buffer)
+        self.count += len(self._buffer)
+        self._buffer.clear()
+
+    def finish(self) -> int | None:
+        """남은 행 기록 + _sync_runs 종료 갱신 (COMMIT 직전 호출) — sync_id 반환"""
+        started = time.perf_counter()
+        self._flush()
+        if self.sync_id is not None:
+            finalize_sync_run(self.conn, self.sync_id, self.count)
+        self.seconds += time.perf_counter() - started
+        return self.sync_id
+
+
+@dataclass
+class SheetDiff:
+    """시트 1개의 비교 결과 — 비교 단계(_diff_sheet) 집계, 변경은 묶음(ChangeChunk)으로 sink가 받음
+
+    result에는 비교 단계 집계(행 수, 스킵, 동일, 행 에러)만 들어 있고,
+    신규/수정/삭제 건수와 상세는 반영에 성공한 행만 writer가 채웁니다.
+    """
+    result: SheetSyncResult
+    now_iso: str
+    aborted: bool = False                  # 시트 단위 실패 — 반영하지 않음
+    columns: list[str] | None = None       # None이면 데이터 행 없음 (전체 prune 대상)
+    # 워커가 변경 묶음을 기록한 임시 파일 (writer 연결에서 비교하며 반영했으면 None)
+    spill_path: str | None = None
+    # 비교를 수행한 워커 프로세스의 피크 메모리 (writer 연결에서 비교했으면 None)
+    peak_rss_bytes: int | None = None
+
+
+@dataclass
+class ChangeChunk:
+    """변경 묶음 — 비교한 행 CHANGE_CHUNK_ROWS개 분량"""
+    # (행 index, PK, 새 값, 해시)
+    inserts: list[tuple] = field(default_factory=list)
+    # (행 index, PK, 새 값, 해시, DB 원본 PK, 변경 내역)
+    updates: list[tuple] = field(default_factory=list)
+    # (행 index, [해시, *DB 원본 PK]) — 값은 같고 해시만 갱신
+    rehash: list[tuple] = field(default_factory=list)
+    # 반영 후 남아야 할 행의 PK (동일 행은 DB 원본 PK) — prune anti-join 기준
+    keep: list[tuple] = field(default_factory=list)
+
+
+def _read_batches(xls: ExcelReader, sheet_name: str,
+                  batch_size: int | None) -> Iterator[pd.DataFrame]:
+    """시트 로드 — batch_size가 없으면 한 번에, 있으면 묶음 단위 스트리밍 (dtype=str)
+
+    제너레이터이므로 읽기 오류는 첫 묶음을 꺼낼 때(_diff_sheet 안에서) 발생합니다.
+    """
+    if batch_size:
+        yield from xls.iter_batches(sheet_name, batch_size=batch_size,
+                                    dtype=str, keep_default_na=False)
+    else:
+        yield xls.read(sheet_name, **_READ_KWARGS)
+
+
+def _table_columns(conn: sqlite3.Connection, config: SheetConfig) -> set[str] | None:
+    """비교 기준 테이블의 컬럼명 — 테이블이 없거나 PK가 설정과 달라 재생성될 예정이면 None"""
+    try:
+        info = conn.execute(f'PRAGMA table_info([{config.table_name}])').fetchall()
+    except sqlite3.Error:
+        return None
+    # table_info: (cid, name, type, notnull, dflt_value, pk)
+    pk = tuple(r[1] for r in sorted((r for r in info if r[5] > 0), key=lambda r: r[5]))
+    if not info or pk != config.pk_columns:
+        return None
+    return {r[1] for r in info}
+
+
+# prune anti-join용 PK 임시 테이블
+_KEY_TABLE = '_sync_keys'
+
+
+def _create_key_table(conn: sqlite3.Connection, config: SheetConfig) -> None:
+    """반영 후 남아야 할 PK를 모을 임시 테이블(TEMP, 연결 전용) 생성
+
+    임시 테이블 컬럼도 TEXT이므로 숫자 PK는 DB와 같은 문자열로 비교됩니다.
+    """
+    pk_cols = [f'[{c}]' for c in config.pk_columns]
+    conn.execute(f'DROP TABLE IF EXISTS temp.{_KEY_TABLE}')
+    conn.execute(f'CREATE TEMP TABLE {_KEY_TABLE} ({", ".join(f"{c} TEXT" for c in pk_cols)})')
+    conn.execute(f'CREATE INDEX temp.idx{_KEY_TABLE} ON {_KEY_TABLE} ({", ".join(pk_cols)})')
+
+
+def _add_keys(conn: sqlite3.Connection, config: SheetConfig, keys: Iterable[tuple]) -> None:
+    """키 테이블에 PK 묶음 추가"""
+    conn.executemany(
+        f'INSERT INTO temp.{_KEY_TABLE} VALUES ({", ".join("?" for _ in config.pk_columns)})',
+        keys,
+    )
+
+
+def _not_in_keys(config: SheetConfig, target: str) -> str:
+    """키 테이블에 PK가 없는 대상 행 조건 'NOT EXISTS (...)'
+
+    Args:
+        target: 조건절에서 대상 테이블을 가리킬 이름 (별칭 또는 [테이블명])
+    """
+    match = ' AND '.join(f'k.[{c}] = {target}.[{c}]' for c in config.pk_columns)
+    return f'NOT EXISTS (SELECT 1 FROM temp.{_KEY_TABLE} AS k WHERE {match})'
+
+
+class _ChangeSpill:
+    """워커 비교용 sink — 변경 묶음을 임시 SQLite 파일에 차례로 기록
+
+    writer는 파일을 묶음 단위로 읽어 반영하므로(_read_spill) 양쪽 모두 메모리가
+    변경량과 무관합니다. 같은 PK가 다시 나오면 앞서 정한 값을 written 테이블에서 찾습니다.
+
+    Args:
+        conn: 비교 기준 DB 연결 (읽기 전용)
+        config: 시트 설정
+    """
+
+    def __init__(self, conn: sqlite3.Connection, config: SheetConfig):
+        self.conn = conn
+        self.config = config
+        fd, self.path = tempfile.mkstemp(prefix='sync_', suffix='.db')
+        os.close(fd)
+        self._db = sqlite3.connect(self.path, isolation_level=None)
+        self._db.execute('PRAGMA journal_mode=OFF')
+        self._db.execute('PRAGMA synchronous=OFF')
+        self._db.execute('CREATE TABLE chunks (seq INTEGER PRIMARY KEY, data BLOB NOT NULL)')
+        self._db.execute('CREATE TABLE written (pk TEXT PRIMARY KEY, vals BLOB NOT NULL)')
+        self._db.execute('BEGIN')
+
+    def prepare(self, diff: SheetDiff) -> set[str] | None:
+        """비교 기준 컬럼 (테이블 준비는 writer가 반영할 때)"""
+        return _table_columns(self.conn, self.config)
+
+    def emit(self, diff: SheetDiff, chunk: ChangeChunk) -> None:
+        with phase_timer(diff.result.phase_seconds, PHASE_DIFF):
+            self._db.execute('INSERT INTO chunks (data) VALUES (?)',
+                             (pickle.dumps(chunk, pickle.HIGHEST_PROTOCOL),))
+            # 같은 묶음에 같은 PK가 신규 → 수정 순으로 있으면 수정 값이 남음
+            self._db.executemany('INSERT OR REPLACE INTO written VALUES (?, ?)', (
+                (repr(pk), pickle.dumps(tuple(values), pickle.HIGHEST_PROTOCOL))
+                for _, pk, values, *_ in (*chunk.inserts, *chunk.updates)
+            ))
+
+    def values(self, pk: tuple) -> tuple | None:
+        """앞 묶음에서 정한 행 값"""
+        found = self._db.execute('SELECT vals FROM written WHERE pk = ?', (repr(pk),)).fetchone()
+        return pickle.loads(found[0]) if found else None
+
+    def close(self) -> str:
+        """기록 마무리 — 파일 경로 반환 (writer가 반영 후 삭제)"""
+        self._db.execute('COMMIT')
+        self._db.close()
+        return self.path
+
+    def discard(self) -> None:
+        self._db.close()
+        Path(self.path).unlink(missing_ok=True)
+
+
+def _read_spill(path: str) -> Iterator[ChangeChunk]:
+    """_ChangeSpill 파일의 변경 묶음을 기록 순서대로 하나씩"""
+    conn = sqlite3.connect(path)
+    try:
+        for (data,) in conn.execute('SELECT data FROM chunks ORDER BY seq'):
+            yield pickle.loads(data)
+    finally:
+        conn.close()
+
+
+class _WriterSink:
+    """순차 비교용 sink — 변경 묶음을 writer 연결에 바로 반영 (반영한 값은 DB에서 다시 조회)"""
+
+    def __init__(self, engine: SyncEngine, conn: sqlite3.Connection, config: SheetConfig):
+        self.engine = engine
+        self.conn = conn
+        self.config = config
+
+    def prepare(self, diff: SheetDiff) -> set[str] | None:
+        return self.engine._prepare_table(self.conn, self.config, diff)
+
+    def emit(self, diff: SheetDiff, chunk: ChangeChunk) -> None:
+        self.engine._write_chunk(self.conn, self.config, diff, chunk)
+
+    @staticmethod
+    def values(pk: tuple) -> tuple | None:
+        return None
+
+
+def _load_existing(conn: sqlite3.Connection, config: SheetConfig,
+                   db_columns: set[str]) -> dict[tuple, _ExistingRow]:
+    """테이블의 PK + 행 해시만 한 번에 읽어 {정규화 PK: _ExistingRow} 맵 생성
+
+    컬럼 값은 해시가 다를 때만 _row_values()로 읽습니다.
+    """
+    hash_col = f'[{ROW_HASH_COLUMN}]' if ROW_HASH_COLUMN in db_columns else 'NULL'
+    safe_cols = [f'[{c}]' for c in config.pk_columns] + [hash_col]
+    cursor = conn.execute(f'SELECT {", ".join(safe_cols)} FROM [{config.table_name}]')
+    return {
+        _normalize_pk(row[:-1]): _ExistingRow(row[:-1], row[-1])
+        for row in cursor
+    }
+
+
+def _row_values(conn: sqlite3.Connection, config: SheetConfig, columns: list[str],
+                db_columns: set[str], row: _ExistingRow,
+                sink: _WriterSink | _ChangeSpill) -> tuple:
+    """기존 행의 columns 값 — 이번 묶음에서 정한 값, 앞 묶음에서 sink로 넘긴 값, DB 순으로 조회
+
+    DB에 아직 없는 컬럼(새로 추가될 컬럼)은 None입니다.
+    """
+    if row.values is not None:
+        return row.values
+    if row.written and (values := sink.values(row.db_pk)) is not None:
+        return values
+    pk_placeholders = ' AND '.join(f'[{c}] = ?' for c in config.pk_columns)
+    select_cols = [f'[{c.strip()}]' if c.strip() in db_columns else 'NULL' for c in columns]
+    found = conn.execute(
+        f'SELECT {", ".join(select_cols)} FROM [{config.table_name}] WHERE {pk_placeholders}',
+        list(row.db_pk),
+    ).fetchone()
+    return found if found is not None else (None,) * len(columns)
+
+
+def _diff_rows(conn: sqlite3.Connection, config: SheetConfig, df: pd.DataFrame,
+               diff: SheetDiff, chunk: ChangeChunk, db_columns: set[str],
+               existing: dict[tuple, _ExistingRow],
+               sink: _WriterSink | _ChangeSpill) -> None:
+    """행 묶음 비교 — 행 해시로 동일 행을 걸러내고, 나머지만 컬럼 비교하여 chunk에 누적
+
+    existing은 _load_existing() 결과로, 정한 새 값으로 갱신됩니다 (같은 PK가 다시 나오면 수정 판정).
+    """
+    result = diff.result
+    columns = diff.columns
+    pk_cols = config.pk_columns
+    pk_set = set(pk_cols)
+    positions = {c: i for i, c in enumerate(df.columns)}
+    col_pos = [positions.get(c) for c in columns]
+    pk_pos = [positions.get(c) for c in pk_cols]
+    # 타입 컬럼 (index, 타입) — 저장 형태로 한 번 정규화
+    col_types = [config.column_type(c) for c in columns]
+    typed = [(i, t) for i, t in enumerate(col_types) if t != COL_TEXT]
+    pk_types = [config.column_type(c) for c in pk_cols]
+
+    for idx, *values in df.itertuples(name=None):
+        try:
+            # PK 값 추출 (required_column만 필수, 나머지 PK는 빈 문자열 허용)
+            pk_vals = []
+            skip = False
+            for pk_col, pos, pk_type in zip(pk_cols, pk_pos, pk_types):
+                val = _sanitize_value(values[pos]) if pos is not None else None
+                if val is None or (isinstance(val, str) and val.strip() == ''):
+                    if pk_col == config.required_column:
+                        skip = True
+                        break
+                    val = ''  # 비필수 PK는 빈 문자열로 치환
+                elif pk_type != COL_TEXT:
+                    val = coerce_value(val, pk_type)
+                pk_vals.append(val)
+
+            if skip:
+                result.skipped += 1
+                continue
+
+            # _row_seq 제외 원본 PK가 전부 빈값 → 빈 행으로 간주
+            real_pk_vals = [
+                v for v, c in zip(pk_vals, pk_cols) if c != '_row_seq'
+            ]
+            if real_pk_vals and all(v == '' for v in real_pk_vals):
+                result.skipped += 1
+                logger.debug(
+                    "%s - 행 %d: PK 전부 빈값 → 스킵", config.sheet_name, idx,
+                )
+                continue
+
+            pk_key = _normalize_pk(tuple(pk_vals))
+
+            # 새 값 준비 (PK 컬럼은 None→'' 통일 — SQLite에서 NULL은 PK 비교 불가)
+            new_values = [_sanitize_value(values[pos]) if pos is not None else None
+                          for pos in col_pos]
+            for i, t in typed:
+                new_values[i] = coerce_value(new_values[i], t)
+            for i, c in enumerate(columns):
+                val = new_values[i]
+                if c in pk_set and (val is None or (isinstance(val, str) and val.strip() == '')):
+                    new_values[i] = ''
+            new_hash = _row_hash(columns, new_values)
+
+            previous = existing.get(pk_key)
+            if previous is not None:
+                # 해시가 같으면 컬럼 비교 없이 동일 처리
+                if previous.row_hash == new_hash:
+                    result.unchanged += 1
+                    chunk.keep.append(previous.db_pk)
+                    continue
+
+                # 변경된 필드 감지 (해시가 다르거나 없을 때만 기존 값 조회)
+                old_values = _row_values(conn, config, columns, db_columns, previous, sink)
+                changed = {}
+                for i, col in enumerate(columns):
+                    old_val = old_values[i]
+                    new_val = new_values[i]
+                    # 둘 다 None/빈문자열이면 같은 것으로 취급. 타입 컬럼은 이전 TEXT 저장값도
+                    # 같은 규칙으로 정규화해 비교 ('1234.0' vs '1234'는 변경 아님)
+                    old_cmp = old_val
+                    if col_types[i] != COL_TEXT:
+                        old_cmp = coerce_value(old_val, col_types[i])
+                    if _norm_value(old_cmp) != _norm_value(new_val):
+                        changed[col] = (old_val, new_val)
+
+                if not changed:
+                    result.unchanged += 1
+                    chunk.keep.append(previous.db_pk)
+                    chunk.rehash.append((idx, [new_hash, *previous.db_pk]))
+                    existing[pk_key] = _ExistingRow(previous.db_pk, new_hash,
+                                                    previous.values, previous.written)
+                    continue
+                chunk.updates.append((idx, tuple(pk_vals), new_values, new_hash,
+                                      previous.db_pk, changed))
+            else:
+                chunk.inserts.append((idx, tuple(pk_vals), new_values, new_hash))
+            chunk.keep.append(tuple(pk_vals))
+            existing[pk_key] = _ExistingRow(tuple(pk_vals), new_hash, tuple(new_values))
+
+        except Exception as e:
+            result.errors += 1
+            result.error_messages.append(f"행 {idx}: {e}")
+
+
+def _forget_values(chunk: ChangeChunk, existing: dict[tuple, _ExistingRow]) -> None:
+    """sink로 넘긴 묶음의 신규/수정 행 값을 기존 행 맵에서 버림 (다시 필요하면 sink/DB 조회)"""
+    for _, pk, *_ in (*chunk.inserts, *chunk.updates):
+        row = existing[_normalize_pk(pk)]
+        row.values = None
+        row.written = True
+
+
+def _timed_batches(batches: Iterable[pd.DataFrame],
+                   phases: dict[str, float]) -> Iterator[pd.DataFrame]:
+    """묶음을 꺼내는(파싱) 시간만 phases['parse']에 누적"""
+    it = iter(batches)
+    while True:
+        with phase_timer(phases, PHASE_PARSE):
+            df = next(it, None)
+        if df is None:
+            return
+        yield df
+
+
+def _diff_sheet(conn: sqlite3.Connection, config: SheetConfig,
+                batches: Iterable[pd.DataFrame],
+                sink: _WriterSink | _ChangeSpill) -> SheetDiff:
+    """시트를 DB와 비교 — 비교한 행 CHANGE_CHUNK_ROWS개마다 변경 묶음을 sink로 넘김
+
+    sink는 묶음을 바로 반영하거나(_WriterSink, 순차) 임시 파일에 기록하므로(_ChangeSpill,
+    워커) 변경이 많아도 메모리는 묶음 하나 크기입니다. conn은 읽기만 합니다.
+
+    Args:
+        conn: 비교 기준 DB 연결 (워커는 읽기 전용)
+        config: 시트 설정
+        batches: 시트 DataFrame 묶음 (dtype=str)
+        sink: prepare(diff) → 비교 기준 컬럼, emit(diff, 묶음), values(PK) → 넘긴 행 값
+    """
+    diff = SheetDiff(
+        result=SheetSyncResult(sheet_name=config.sheet_name, table_name=config.table_name),
+        now_iso=datetime.now().isoformat(),
+    )
+    result = diff.result
+    phases = result.phase_seconds
+    started = time.perf_counter()
+    sink_seconds = 0.0      # sink 시간은 sink가 자기 단계(쓰기 등)로 기록
+    try:
+        # 1. DataFrame 로드 (batch_size 지정 시 묶음 단위 스트리밍)
+        db_columns: set[str] | None = None
+        existing: dict[tuple, _ExistingRow] = {}
+        row_seq_counts: dict[tuple, int] = {}
+        for df in _timed_batches(batches, phases):
+            df.columns = [str(c).strip() for c in df.columns]
+
+            # 2. 필수 컬럼 NaN인 행 제거 (빈 행 필터링)
+            if config.required_column not in df.columns:
+                result.error_messages.append(
+                    f"필수 컬럼 '{config.required_column}'이 시트에 없습니다"
+                )
+                result.errors = 1
+                diff.aborted = True
+                return diff
+
+            df = df.dropna(subset=[config.required_column])
+            df = df[df[config.required_column].str.strip() != '']
+            if df.empty:
+                continue
+            result.total_rows += len(df)
+
+            # 3. _row_seq 생성 (필요한 시트만, 묶음 간 순번 이어짐)
+            if config.needs_row_seq:
+                df = _add_row_seq(df, config.row_seq_group, row_seq_counts)
+
+            # 4~5. 첫 묶음에서 컬럼 목록 구성 + 테이블 준비(sink) + 기존 행 맵
+            #      (PK가 바뀌어 재생성되는 테이블이면 빈 맵)
+            if diff.columns is None:
+                diff.columns = list(df.columns)
+                sink_started = time.perf_counter()
+                db_columns = sink.prepare(diff)
+                sink_seconds += time.perf_counter() - sink_started
+                if db_columns is not None:
+                    existing = _load_existing(conn, config, db_columns)
+
+            # 6~7. 행 비교 — 묶음마다 sink로 넘기고 새 값은 버림
+            for start in range(0, len(df), CHANGE_CHUNK_ROWS):
+                chunk = ChangeChunk()
+                _diff_rows(conn, config, df.iloc[start:start + CHANGE_CHUNK_ROWS], diff, chunk,
+                           db_columns or set(), existing, sink)
+                sink_started = time.perf_counter()
+                sink.emit(diff, chunk)
+                sink_seconds += time.perf_counter() - sink_started
+                _forget_values(chunk, existing)
+
+    except Exception as e:
+        result.errors += 1
+        result.error_messages.append(str(e))
+        diff.aborted = True
+    # 비교 = 전체 - 파싱 - sink (묶음 스트리밍 시 번갈아 진행)
+    phases[PHASE_DIFF] = (phases.get(PHASE_DIFF, 0.0) + time.perf_counter() - started
+                          - phases.get(PHASE_PARSE, 0.0) - sink_seconds)
+    return diff
+
+
+def _diff_sheet_job(excel_path: Path, engine: str, db_path: Path, config: SheetConfig,
+                    batch_size: int | None) -> SheetDiff:
+    """워커 프로세스용 — 시트를 직접 파싱하고 읽기 전용 DB 연결로 비교
+
+    변경 묶음은 임시 파일(SheetDiff.spill_path)로 넘기므로 결과 크기는 변경량과 무관합니다.
+    """
+    try:
+        conn = sqlite3.connect(f'{Path(db_path).resolve().as_uri()}?mode=ro', uri=True)
+    except sqlite3.Error:
+        conn = sqlite3.connect(':memory:')  # DB 파일 없음 → 빈 DB와 비교
+    spill = _ChangeSpill(conn, config)
+    try:
+        with ExcelReader(excel_path, engine=engine) as xls:
+            diff = _diff_sheet(conn, config, _read_batches(xls, config.sheet_name, batch_size),
+                               spill)
+    except BaseException:
+        spill.discard()
+        raise
+    finally:
+        conn.close()
+    if diff.aborted:
+        spill.discard()
+    else:
+        diff.spill_path = spill.close()
+    diff.peak_rss_bytes = peak_rss_bytes()
+    return diff
+
+
+def _discard_spills(futures: Iterable[Future]) -> None:
+    """반영하지 못한 워커 결과의 임시 파일 삭제 (중간 에러/중단 시 — 반영한 파일은 이미 삭제됨)"""
+    for future in futures:
+        if future.done() and not future.cancelled() and future.exception() is None:
+            path = future.result().spill_path
+            if path is not None:
+                Path(path).unlink(missing_ok=True)
+
+
 class SyncEngine:
     """Excel → SQLite 동기화 엔진"""
 
-    def __init__(self, excel_path: Path | None = None, db_path: Path | None = None):
+    def __init__(self, excel_path: Path | None = None, db_path: Path | None = None,
+                 batch_size: int | None = None, workers: int | None = None):
+        """
+        Args:
+            excel_path: 원본 Excel (None이면 NOAH_SO_PO_DN_FILE)
+            db_path: 대상 DB (None이면 DB_FILE)
+            batch_size: 스트리밍 동기화 묶음 행 수 (None이면 SYNC_BATCH_SIZE,
+                0이면 시트 전체를 한 번에 읽음)
+            workers: 시트 병렬 파싱/비교 프로세스 수 (None이면 PARSE_WORKERS, 1이면 순차)
+        """
         self.excel_path = excel_path or NOAH_SO_PO_DN_FILE
         self.db_path = db_path or DB_FILE
+        self.batch_size = SYNC_BATCH_SIZE if batch_size is None else batch_size
+        self.workers = workers
+        # 실행 중인 동기화의 _sync_log 기록기 (dry-run/시트 단위 호출은 None)
+        self._log: SyncLogWriter | None = None
 
     def sync_all(self, dry_run: bool = False,
-                 sheet_filter: list[str] | None = None) -> SyncSummary:
+                 sheet_filter: list[str] | None = None,
+                 full: bool = False) -> SyncSummary:
         """전체 시트 동기화.
 
+        시트 지문(시트 XML 내용 + SheetConfig)이 지난 동기화와 같은 시트는
+        파싱/비교 없이 건너뜁니다 (SheetSyncResult.unchanged_skipped).
+
+        dry-run이 아니면 신규/수정/삭제 내역을 반영과 함께 _sync_log에 묶음 단위로
+        기록하고 같은 트랜잭션으로 commit합니다 (SyncSummary.sync_id, log_rows).
+
         Args:
             dry_run: True면 실제 DB 변경 없이 시뮬레이션만 수행
             sheet_filter: 동기화할 시트명 리스트 (None이면 전체)
+            full: True면 지문이 같아도 모든 시트를 다시 동기화
 
         Returns:
             SyncSummary: 동기화 결과 요약
         """
         start = datetime.now()
+        written_before = io_write_bytes()
+        run_peak = RunPeakRss()
         summary = SyncSummary(
             source_file=self.excel_path.name,
             db_file=self.db_path.name,
@@ -182,9 +867,10 @@ class SyncEngine:
             raise FileNotFoundError(f"Excel 파일을 찾을 수 없습니다: {self.excel_path}")
 
         # Excel 파일 한 번만 오픈
-        logger.info("Excel 파일 로딩: %s", self.excel_path.name)
-        xls = pd.ExcelFile(self.excel_path)
+        xls = ExcelReader(self.excel_path)
+        logger.info("Excel 파일 로딩: %s (엔진: %s)", self.excel_path.name, xls.engine)
         available_sheets = set(xls.sheet_names)
+        pkg = self._open_package()
 
         # 대상 시트 필터링
         configs = SYNC_SHEETS
@@ -198,10 +884,36 @@ class SyncEngine:
         # DB 연결 — dry-run도 실제 DB에 연결하여 정확한 diff 산출 후 롤백
         # isolation_level=None → 수동 트랜잭션 제어 (DDL 암묵적 COMMIT 방지)
         conn = sqlite3.connect(str(self.db_path), isolation_level=None)
+        pool: ProcessPoolExecutor | None = None
+        diffs: dict[str, Future] = {}
+        worker_peaks: list[int] = []    # 워커 프로세스 피크 메모리
         try:
             conn.execute('PRAGMA journal_mode=WAL')
             conn.execute('PRAGMA synchronous=NORMAL')
+
+            # 시트 지문 비교 → 지난 동기화 이후 바뀌지 않은 시트는 건너뜀
+            with phase_timer(summary.phase_seconds, PHASE_FINGERPRINT):
+                fingerprints = {
+                    c.sheet_name: self._sheet_fingerprint(pkg, c)
+                    for c in configs if pkg is not None and c.sheet_name in available_sheets
+                }
+                unchanged = set() if full else self._unchanged_sheets(conn, configs, fingerprints)
+                weight_fingerprint = (
+                    self._weight_fingerprint(pkg)
+                    if pkg is not None and WEIGHT_SHEET in available_sheets else None
+                )
+
+            # 대상 시트 파싱 + DB 비교는 워커 프로세스에서 병렬 (읽기 전용 DB 연결)
+            pool, diffs = self._submit_diffs(xls, [
+                c for c in configs
+                if c.sheet_name in available_sheets and c.sheet_name not in unchanged
+            ])
+            # 반영은 이 연결 하나(single writer)에서 시트 순서대로, 한 트랜잭션으로
             conn.execute('BEGIN')
+            if not dry_run:
+                # 변경 내역은 반영하면서 같은 트랜잭션에 바로 기록 (결과에는 표본만)
+                ensure_sync_log_tables(conn)
+                self._log = SyncLogWriter(conn, start.strftime('%Y-%m-%d %H:%M:%S'))
 
             for config in configs:
                 if config.sheet_name not in available_sheets:
@@ -214,267 +926,288 @@ class SyncEngine:
                     summary.results.append(result)
                     continue
 
-                result = self._sync_sheet(conn, xls, config, dry_run)
+                if config.sheet_name in unchanged:
+                    logger.info("%s: 변경 없음 (건너뜀)", config.sheet_name)
+                    result = SheetSyncResult(
+                        sheet_name=config.sheet_name,
+                        table_name=config.table_name,
+                        changed_rows=[],
+                        unchanged_skipped=True,
+                    )
+                    # 데이터는 그대로여도 동기화 시각은 갱신 — DbReader.last_sync는
+                    # 가장 오래된 시각을 쓰므로 안 하면 'auto'가 Excel로 돌아감
+                    touch_sync_time(conn, config.table_name, datetime.now().isoformat())
+                    # 인덱스 선언/누락은 맞춤
+                    try:
+                        self._ensure_indexes(conn, config, result)
+                    except sqlite3.Error as e:
+                        result.errors += 1
+                        result.error_messages.append(f"인덱스 생성 실패: {e}")
+                        logger.error("%s 인덱스 생성 실패: %s", config.sheet_name, e)
+                    summary.results.append(result)
+                    continue
+
+                diff = self._collect_diff(conn, xls, config, diffs)
+                if diff.peak_rss_bytes is not None:
+                    worker_peaks.append(diff.peak_rss_bytes)
+                result = self._apply_changes(conn, config, diff)
+                if pkg is not None and result.success:
+                    with phase_timer(result.phase_seconds, PHASE_BLOCKS):
+                        self._track_row_blocks(conn, pkg, config, result)
+                if result.success and fingerprints.get(config.sheet_name):
+                    update_sync_fingerprint(conn, config.table_name,
+                                            fingerprints[config.sheet_name])
                 summary.results.append(result)
 
-            if dry_run:
-                conn.rollback()
-            elif summary.total_errors > 0:
-                conn.rollback()
-                logger.error(
-                    "동기화 중단: %d건 에러 발생 → ROLLBACK (데이터 수정 후 재시도 필요)",
-                    summary.total_errors,
-                )
-            else:
-                conn.commit()
+            if summary.total_errors == 0 and WEIGHT_SHEET in available_sheets:
+                # PO_해외 데이터나 Weight 시트가 바뀐 경우에만 재계산 (--full은 항상)
+                if full or self._po_line_weight_stale(conn, summary, weight_fingerprint):
+                    with phase_timer(summary.phase_seconds, PHASE_WEIGHT):
+                        if (self._materialize_po_line_weight(conn, xls, summary)
+                                and weight_fingerprint):
+                            update_sync_fingerprint(conn, PO_LINE_WEIGHT_TABLE, weight_fingerprint)
+                else:
+                    logger.info("PO 라인 Weight: PO_해외/Weight 변경 없음 (건너뜀)")
+
+            with phase_timer(summary.phase_seconds, PHASE_COMMIT):
+                if dry_run:
+                    conn.rollback()
+                elif summary.total_errors > 0:
+                    conn.rollback()
+                    logger.error(
+                        "동기화 중단: %d건 에러 발생 → ROLLBACK (데이터 수정 후 재시도 필요)",
+                        summary.total_errors,
+                    )
+                else:
+                    if self._log is not None:
+                        summary.sync_id = self._log.finish()
+                    conn.commit()
+                    if self._log is not None:
+                        summary.log_rows = self._log.count
         finally:
+            if self._log is not None and self._log.seconds:
+                summary.phase_seconds[PHASE_LOG] = self._log.seconds
+            self._log = None
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+                _discard_spills(diffs.values())
             conn.close()
             xls.close()
+            if pkg is not None:
+                pkg.close()
 
         summary.elapsed_seconds = (datetime.now() - start).total_seconds()
+        written_after = io_write_bytes()
+        if written_before is not None and written_after is not None:
+            summary.bytes_written = written_after - written_before
+        # 워커는 실행마다 새 풀의 프로세스라 프로세스 피크가 곧 이번 실행 피크
+        peaks = [p for p in (run_peak.peak(), *worker_peaks) if p is not None]
+        summary.peak_rss_bytes = max(peaks) if peaks else None
         return summary
 
-    def _sync_sheet(self, conn: sqlite3.Connection, xls: pd.ExcelFile,
-                    config: SheetConfig, dry_run: bool) -> SheetSyncResult:
-        """단일 시트 동기화"""
-        result = SheetSyncResult(
-            sheet_name=config.sheet_name,
-            table_name=config.table_name,
-        )
+    @staticmethod
+    def _sheet_fingerprint(pkg: XlsxPackage, config: SheetConfig) -> str | None:
+        """시트 지문 — 시트 XML + 참조 공유 문자열 + 스타일 + SheetConfig(PK 포함) + 읽기 옵션"""
+        try:
+            return pkg.content_key(config.sheet_name, extra=f'{config!r}|{_READ_KWARGS!r}')
+        except KeyError:
+            return None
 
+    @staticmethod
+    def _unchanged_sheets(conn: sqlite3.Connection, configs: list[SheetConfig],
+                          fingerprints: dict[str, str | None]) -> set[str]:
+        """저장된 지문과 같고 테이블도 남아 있는 시트명"""
+        meta = get_sync_metadata(conn)
+        tables = {row[0] for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table'"
+        )}
+        return {
+            c.sheet_name for c in configs
+            if fingerprints.get(c.sheet_name)
+            and c.table_name in tables
+            and meta.get(c.table_name, {}).get('fingerprint') == fingerprints[c.sheet_name]
+        }
+
+    @staticmethod
+    def _weight_fingerprint(pkg: XlsxPackage) -> str | None:
+        """Weight 시트 지문 — _sync_meta에 po_line_weight 행으로 저장"""
         try:
-            # 1. DataFrame 로드
-            df = pd.read_excel(xls, sheet_name=config.sheet_name, dtype=str,
-                                 keep_default_na=False, na_values=[''])
-            df.columns = [str(c).strip() for c in df.columns]
+            return pkg.content_key(WEIGHT_SHEET, extra=PO_LINE_WEIGHT_TABLE)
+        except KeyError:
+            return None
 
-            # 2. 필수 컬럼 NaN인 행 제거 (빈 행 필터링)
-            if config.required_column not in df.columns:
-                msg = f"필수 컬럼 '{config.required_column}'이 시트에 없습니다"
-                logger.error("%s: %s", config.sheet_name, msg)
-                result.error_messages.append(msg)
-                result.errors = 1
-                return result
+    @staticmethod
+    def _po_line_weight_stale(conn: sqlite3.Connection, summary: SyncSummary,
+                              weight_fingerprint: str | None) -> bool:
+        """po_line_weight 재계산 필요 여부 — 이번 동기화에서 PO_해외 행이 바뀌었거나
+        Weight 시트 지문이 저장값과 다름 (지문 없음/첫 동기화 포함)"""
+        po = next((r for r in summary.results if r.sheet_name == PO_EXPORT_SHEET), None)
+        if po is not None and (po.inserted or po.updated or po.pruned):
+            return True
+        if weight_fingerprint is None:
+            return True
+        stored = get_sync_metadata(conn).get(PO_LINE_WEIGHT_TABLE, {}).get('fingerprint')
+        return stored != weight_fingerprint
+
+    def _open_package(self) -> XlsxPackage | None:
+        """행 블록 변경 감지용 zip 접근자 (xlsx가 아니면 None)"""
+        try:
+            return XlsxPackage(self.excel_path)
+        except (zipfile.BadZipFile, KeyError, OSError) as e:
+            logger.debug("xlsx 패키지 열기 실패 — 행 블록 변경 감지 생략: %s", e)
+            return None
 
-            df = df.dropna(subset=[config.required_column])
-            df = df[df[config.required_column].str.strip() != '']
-            result.total_rows = len(df)
+    def _track_row_blocks(self, conn: sqlite3.Connection, pkg: XlsxPackage,
+                          config: SheetConfig, result: SheetSyncResult) -> None:
+        """시트 행 블록 해시를 지난 동기화 값과 비교해 result.changed_rows 기록 후 저장
 
-            if result.total_rows == 0:
-                logger.info("%s: 데이터 없음 — prune 확인", config.sheet_name)
-                # 시트가 비었어도 DB 테이블에 잔류 행이 있으면 prune
-                try:
-                    row_count = get_table_row_count(conn, config.table_name)
-                except Exception:
-                    row_count = 0
-                if row_count > 0:
-                    safe_pk_cols = [f'[{c}]' for c in config.pk_columns]
-                    # 전체 컬럼 + PK 함께 조회해서 스냅샷 확보
-                    all_cols_info = conn.execute(
-                        f'PRAGMA table_info([{config.table_name}])'
-                    ).fetchall()
-                    snapshot_cols = [c[1] for c in all_cols_info if c[1] != '_sync_updated_at']
-                    safe_snap_cols = [f'[{c}]' for c in snapshot_cols]
-                    db_rows = conn.execute(
-                        f'SELECT {", ".join(safe_snap_cols)} FROM [{config.table_name}]'
-                    ).fetchall()
-                    stale_pks = []
-                    snapshots = []
-                    pk_idx = [snapshot_cols.index(c) for c in config.pk_columns if c in snapshot_cols]
-                    for row in db_rows:
-                        pk_tuple = _normalize_pk(tuple(row[i] for i in pk_idx))
-                        stale_pks.append(pk_tuple)
-                        snap = {col: row[i] for i, col in enumerate(snapshot_cols)
-                                if row[i] is not None and str(row[i]) != ''}
-                        snapshots.append({'pk': pk_tuple, 'snapshot': snap})
-                    if stale_pks:
-                        pk_placeholders = ' AND '.join(
-                            f'[{c}] = ?' for c in config.pk_columns
-                        )
-                        for stale_pk in stale_pks:
-                            conn.execute(
-                                f'DELETE FROM [{config.table_name}] WHERE {pk_placeholders}',
-                                list(stale_pk),
-                            )
-                    result.pruned = len(stale_pks)
-                    result.pruned_pks = stale_pks
-                    result.pruned_snapshots = snapshots
-                    if stale_pks:
-                        logger.info(
-                            "%s: %d행 삭제(prune) — 시트 전체 비어있음",
-                            config.sheet_name, result.pruned,
-                        )
-                return result
+        저장은 동기화 트랜잭션 안에서 하므로 dry-run/에러 ROLLBACK 시 함께 취소됩니다.
+        """
+        try:
+            blocks = pkg.row_block_hashes(config.sheet_name)
+        except (KeyError, ValueError) as e:
+            logger.debug("%s: 행 블록 해시 계산 불가 — %s", config.sheet_name, e)
+            return
+        result.changed_rows = blocks.changed_ranges(get_row_blocks(conn, config.table_name))
+        if result.changed_rows:
+            logger.info("%s: 변경 행 범위 %s", config.sheet_name,
+                        format_row_ranges(result.changed_rows))
+        save_row_blocks(conn, config.table_name, blocks, datetime.now().isoformat())
+
+    def _materialize_po_line_weight(self, conn: sqlite3.Connection, xls: ExcelReader,
+                                    summary: SyncSummary) -> bool:
+        """동기화된 po_export + Weight 시트로 PO 라인별 Weight를 계산해 테이블 재작성
+
+        Packing List 생성 시 매번 PO_해외/Weight를 다시 읽어 매칭하지 않도록,
+        결과를 (SO_ID, Line item) PK 테이블로 저장합니다. 실패해도 동기화는 계속합니다.
 
-            # 3. _row_seq 생성 (필요한 시트만)
-            if config.needs_row_seq:
-                df = _add_row_seq(df, config.row_seq_group)
+        Returns:
+            테이블을 다시 썼으면 True (PO 테이블 없음/해결 실패 시 False)
+        """
+        po_table = next(c.table_name for c in SYNC_SHEETS if c.sheet_name == PO_EXPORT_SHEET)
+        try:
+            df_po = pd.read_sql_query(f'SELECT * FROM [{po_table}]', conn)
+        except (sqlite3.Error, pd.errors.DatabaseError):
+            logger.debug("%s 테이블 없음 — Weight 해결 건너뜀", po_table)
+            return False
+        try:
+            model_weight_map = build_model_weight_map(xls.read(WEIGHT_SHEET))
+            lines = resolve_po_line_weights(df_po, model_weight_map)
+        except Exception as e:
+            logger.warning("PO 라인 Weight 해결 실패 (건너뜀): %s", e)
+            return False
+
+        ensure_po_line_weight_table(conn)
+        conn.execute(f'DELETE FROM {PO_LINE_WEIGHT_TABLE}')
+        conn.executemany(
+            f'INSERT INTO {PO_LINE_WEIGHT_TABLE} '
+            f'({", ".join(f"[{c}]" for c in PO_LINE_WEIGHT_COLUMNS)}) '
+            f'VALUES ({", ".join("?" * len(PO_LINE_WEIGHT_COLUMNS))})',
+            (tuple(_sanitize_value(v) for v in row)
+             for row in lines[list(PO_LINE_WEIGHT_COLUMNS)].itertuples(index=False)),
+        )
+        summary.weight_lines = len(lines)
+        summary.weight_unmatched = int((lines['match_tier'] == WEIGHT_TIER_UNMATCHED).sum())
+        logger.info(
+            "PO 라인 Weight 저장: %d건 (미매칭 %d건)",
+            summary.weight_lines, summary.weight_unmatched,
+        )
+        return True
 
-            # 4. 컬럼 목록 구성
-            columns = list(df.columns)
+    def _submit_diffs(self, xls: ExcelReader, configs: list[SheetConfig],
+                      ) -> tuple[ProcessPoolExecutor | None, dict[str, Future]]:
+        """시트별 파싱 + DB 비교(_diff_sheet_job)를 프로세스 풀에 제출
 
-            # 5. PK 변경 시 테이블 재생성 + 테이블 생성/컬럼 추가
-            migrate_pk_if_changed(conn, config)
-            create_table(conn, config.table_name, columns, config.pk_columns)
-            added_cols = ensure_columns_exist(conn, config.table_name, columns)
-            if added_cols > 0:
-                logger.info("%s: %d개 새 컬럼 추가", config.sheet_name, added_cols)
+        순차 설정(workers=1, 작은 파일)이거나 풀을 만들 수 없으면 (None, {}) —
+        각 시트는 _collect_diff에서 writer 연결로 비교합니다.
+        """
+        n_workers = parse_workers(self.excel_path, len(configs), self.workers)
+        if n_workers <= 1:
+            return None, {}
+        try:
+            pool = ProcessPoolExecutor(max_workers=n_workers)
+            futures = {
+                c.sheet_name: pool.submit(_diff_sheet_job, self.excel_path, xls.engine,
+                                          self.db_path, c, self.batch_size)
+                for c in configs
+            }
+        except OSError as e:
+            logger.warning("병렬 비교 불가 (%s) → 시트별 순차 처리", e)
+            return None, {}
+        logger.debug("병렬 파싱/비교: %d개 시트 (%d프로세스)", len(futures), n_workers)
+        return pool, futures
+
+    def _collect_diff(self, conn: sqlite3.Connection, xls: ExcelReader,
+                      config: SheetConfig, diffs: dict[str, Future]) -> SheetDiff:
+        """시트 비교 결과 — 워커 결과를 기다리거나, 없으면 여기서 비교하며 바로 반영"""
+        future = diffs.get(config.sheet_name)
+        if future is not None:
+            try:
+                return future.result()
+            except (BrokenProcessPool, OSError) as e:
+                logger.warning("병렬 비교 실패 (%s) → 시트별 순차 처리", e)
+                diffs.clear()
+            except Exception as e:
+                diff = SheetDiff(
+                    result=SheetSyncResult(sheet_name=config.sheet_name,
+                                           table_name=config.table_name),
+                    now_iso=datetime.now().isoformat(),
+                    aborted=True,
+                )
+                diff.result.errors = 1
+                diff.result.error_messages.append(str(e))
+                return diff
+        return _diff_sheet(conn, config, _read_batches(xls, config.sheet_name, self.batch_size),
+                           _WriterSink(self, conn, config))
+
+    def _sync_sheet(self, conn: sqlite3.Connection, xls: ExcelReader,
+                    config: SheetConfig,
+                    df: pd.DataFrame | None = None) -> SheetSyncResult:
+        """단일 시트 동기화 — 비교하며 묶음마다 반영 (df: 미리 파싱한 시트, None이면 여기서 읽음)"""
+        batches = iter([df]) if df is not None else _read_batches(
+            xls, config.sheet_name, self.batch_size,
+        )
+        return self._apply_changes(
+            conn, config, _diff_sheet(conn, config, batches, _WriterSink(self, conn, config)),
+        )
 
-            # 6. PK 기반 기존 데이터 조회
-            pk_cols = config.pk_columns
-            pk_placeholders = ' AND '.join(
-                f'[{c}] = ?' for c in pk_cols
-            )
+    def _apply_changes(self, conn: sqlite3.Connection, config: SheetConfig,
+                       diff: SheetDiff) -> SheetSyncResult:
+        """비교 결과를 writer 연결(동기화 트랜잭션)에 마저 반영하고 결과 집계
 
-            now_iso = datetime.now().isoformat()
-            safe_cols = [f'[{c.strip()}]' for c in columns]
+        writer 연결에서 비교했으면 신규/수정은 이미 묶음마다 반영되어 있고, 워커 결과는
+        임시 파일의 묶음을 하나씩 읽어 반영합니다. 이어서 prune/인덱스/메타 정보를 처리합니다.
+        """
+        result = diff.result
+        if diff.aborted:
+            logger.error("%s 동기화 실패: %s", config.sheet_name, '; '.join(result.error_messages))
+            return result
+        for msg in result.error_messages:
+            logger.warning("%s - %s", config.sheet_name, msg)
 
-            # 7. Upsert 수행
-            excel_pks: set[tuple] = set()
-            for idx, row in df.iterrows():
-                try:
-                    # PK 값 추출 (required_column만 필수, 나머지 PK는 빈 문자열 허용)
-                    pk_vals = []
-                    skip = False
-                    for pk_col in pk_cols:
-                        val = _sanitize_value(row.get(pk_col))
-                        if val is None or (isinstance(val, str) and val.strip() == ''):
-                            if pk_col == config.required_column:
-                                skip = True
-                                break
-                            val = ''  # 비필수 PK는 빈 문자열로 치환
-                        pk_vals.append(val)
-
-                    if skip:
-                        result.skipped += 1
-                        continue
-
-                    # _row_seq 제외 원본 PK가 전부 빈값 → 빈 행으로 간주
-                    real_pk_vals = [
-                        v for v, c in zip(pk_vals, pk_cols) if c != '_row_seq'
-                    ]
-                    if real_pk_vals and all(v == '' for v in real_pk_vals):
-                        result.skipped += 1
-                        logger.debug(
-                            "%s - 행 %d: PK 전부 빈값 → 스킵", config.sheet_name, idx,
-                        )
-                        continue
-
-                    excel_pks.add(_normalize_pk(tuple(pk_vals)))
-
-                    # 기존 행 조회 (전체 컬럼)
-                    select_cols = ', '.join(safe_cols)
-                    cursor = conn.execute(
-                        f'SELECT {select_cols} FROM [{config.table_name}] WHERE {pk_placeholders}',
-                        pk_vals,
-                    )
-                    existing_row = cursor.fetchone()
-
-                    # 새 값 준비 (PK 컬럼은 None→'' 통일 — SQLite에서 NULL은 PK 비교 불가)
-                    pk_set = set(pk_cols)
-                    new_values = []
-                    for c in columns:
-                        val = _sanitize_value(row.get(c))
-                        if c in pk_set and (val is None or (isinstance(val, str) and val.strip() == '')):
-                            val = ''
-                        new_values.append(val)
-
-                    if existing_row is not None:
-                        # 변경된 필드 감지
-                        changes = {}
-                        for i, col in enumerate(columns):
-                            old_val = existing_row[i]
-                            new_val = new_values[i]
-                            # 둘 다 None/빈문자열이면 같은 것으로 취급
-                            old_norm = None if old_val in (None, '', 'None') else str(old_val)
-                            new_norm = None if new_val in (None, '', 'None') else str(new_val)
-                            if old_norm != new_norm:
-                                changes[col] = (old_val, new_val)
-
-                        if not changes:
-                            result.unchanged += 1
-                            continue
-
-                        # UPDATE (변경분 있을 때만)
-                        values_with_ts = new_values + [now_iso]
-                        set_clause = ', '.join(
-                            f'{sc} = ?' for sc in safe_cols
-                        )
-                        conn.execute(
-                            f'UPDATE [{config.table_name}] SET {set_clause}, '
-                            f'[_sync_updated_at] = ? WHERE {pk_placeholders}',
-                            values_with_ts + pk_vals,
-                        )
-                        result.updated += 1
-                        result.updated_pks.append(tuple(pk_vals))
-                        result.updated_details.append({
-                            'pk': tuple(pk_vals),
-                            'changes': changes,
-                        })
-                    else:
-                        # INSERT
-                        all_cols = safe_cols + ['[_sync_updated_at]']
-                        placeholders = ', '.join('?' for _ in all_cols)
-                        conn.execute(
-                            f'INSERT INTO [{config.table_name}] '
-                            f'({", ".join(all_cols)}) VALUES ({placeholders})',
-                            new_values + [now_iso],
-                        )
-                        result.inserted += 1
-                        result.inserted_pks.append(tuple(pk_vals))
-                        # 신규 행의 비어있지 않은 값 기록
-                        non_empty = {}
-                        for i, c in enumerate(columns):
-                            v = new_values[i]
-                            if v is not None and str(v).strip() != '':
-                                non_empty[c] = v
-                        result.inserted_details.append({
-                            'pk': tuple(pk_vals),
-                            'values': non_empty,
-                        })
-
-                except Exception as e:
-                    result.errors += 1
-                    msg = f"행 {idx}: {e}"
-                    result.error_messages.append(msg)
-                    logger.warning("%s - %s", config.sheet_name, msg)
+        try:
+            if diff.columns is None:
+                logger.info("%s: 데이터 없음 — prune 확인", config.sheet_name)
+                with self._sheet_phase(result, PHASE_PRUNE):
+                    self._prune_all(conn, config, result)
+                return result
 
-            # 8. Prune: Excel에서 삭제된 행 제거 (스냅샷 캡처 후 DELETE)
-            safe_pk_cols = [f'[{c}]' for c in pk_cols]
-            db_pks_cursor = conn.execute(
-                f'SELECT {", ".join(safe_pk_cols)} FROM [{config.table_name}]'
-            )
-            db_pks = {_normalize_pk(row) for row in db_pks_cursor.fetchall()}
-            stale_pks = db_pks - excel_pks
-            if stale_pks:
-                for stale_pk in stale_pks:
-                    # 삭제 직전 행 스냅샷 캡처 (감사/복구용)
-                    snap_row = conn.execute(
-                        f'SELECT {", ".join(safe_cols)} FROM [{config.table_name}] '
-                        f'WHERE {pk_placeholders}',
-                        list(stale_pk),
-                    ).fetchone()
-                    if snap_row is not None:
-                        snap = {col: snap_row[i] for i, col in enumerate(columns)
-                                if snap_row[i] is not None and str(snap_row[i]) != ''}
-                    else:
-                        snap = {}
-                    result.pruned_snapshots.append({'pk': stale_pk, 'snapshot': snap})
-
-                    conn.execute(
-                        f'DELETE FROM [{config.table_name}] WHERE {pk_placeholders}',
-                        list(stale_pk),
-                    )
-                result.pruned = len(stale_pks)
-                result.pruned_pks = [pk for pk in stale_pks]
-                logger.info(
-                    "%s: %d행 삭제(prune) — Excel에서 제거된 행",
-                    config.sheet_name, result.pruned,
-                )
+            # 4~7. 워커 결과: 테이블 준비 후 신규/수정 묶음 단위 반영
+            if diff.spill_path is not None:
+                self._prepare_table(conn, config, diff)
+                with closing(_read_spill(diff.spill_path)) as chunks:
+                    for chunk in chunks:
+                        self._write_chunk(conn, config, diff, chunk)
+
+            # 8. Prune: 반영 후 남길 PK(키 테이블)에 없는 행 = Excel에서 제거된 행
+            self._prune_stale(conn, config, diff)
 
-            # 9. 메타 정보 업데이트 (dry-run 시에도 실행, rollback으로 원복)
+            # 9. 보조 인덱스 생성/정리 — 데이터 반영 후라 첫 동기화·테이블 재작성 시 한 번에 빌드
+            self._ensure_indexes(conn, config, result)
+
+            # 10. 메타 정보 업데이트 (dry-run 시에도 실행, rollback으로 원복)
             row_count = get_table_row_count(conn, config.table_name)
-            update_sync_metadata(conn, config.table_name, now_iso, row_count)
+            update_sync_metadata(conn, config.table_name, diff.now_iso, row_count)
 
             logger.info(
                 "%s: %d행 처리 (신규 %d, 수정 %d, 삭제 %d, 동일 %d, 스킵 %d, 에러 %d)",
@@ -487,5 +1220,215 @@ class SyncEngine:
             result.errors += 1
             result.error_messages.append(str(e))
             logger.error("%s 동기화 실패: %s", config.sheet_name, e)
+        finally:
+            if diff.spill_path is not None:
+                Path(diff.spill_path).unlink(missing_ok=True)
 
         return result
+
+    def _prepare_table(self, conn: sqlite3.Connection, config: SheetConfig,
+                       diff: SheetDiff) -> set[str] | None:
+        """반영 대상 테이블 준비 + prune 키 테이블 생성 — 준비된 테이블의 컬럼명 반환
+
+        PK 변경 시 테이블 재생성, 컬럼 타입 변경 시 재작성 후 테이블 생성/컬럼 추가.
+        """
+        with self._sheet_phase(diff.result, PHASE_WRITE):
+            migrate_pk_if_changed(conn, config)
+            migrate_column_types(conn, config)
+            create_table(conn, config.table_name, diff.columns, config.pk_columns, config)
+            added_cols = ensure_columns_exist(conn, config.table_name, diff.columns, config)
+            if added_cols > 0:
+                logger.info("%s: %d개 새 컬럼 추가", config.sheet_name, added_cols)
+            _create_key_table(conn, config)
+        return _table_columns(conn, config)
+
+    def _write_chunk(self, conn: sqlite3.Connection, config: SheetConfig,
+                     diff: SheetDiff, chunk: ChangeChunk) -> None:
+        """변경 묶음 반영 — 신규/수정/해시 갱신 + 남길 PK를 prune 키 테이블에 추가"""
+        with self._sheet_phase(diff.result, PHASE_WRITE):
+            self._write_rows(conn, config, diff, chunk)
+            _add_keys(conn, config, chunk.keep)
+
+    def _prune_stale(self, conn: sqlite3.Connection, config: SheetConfig,
+                     diff: SheetDiff) -> None:
+        """키 테이블 anti-join으로 삭제 직전 스냅샷을 흘려 기록(_sync_log)한 뒤 DELETE 1회"""
+        result = diff.result
+        table = f'[{config.table_name}]'
+        n_pk = len(config.pk_columns)
+        select_cols = [f't.[{c}]' for c in (*config.pk_columns, *diff.columns)]
+        pruned = 0
+        with self._sheet_phase(result, PHASE_PRUNE):
+            for row in conn.execute(
+                f'SELECT {", ".join(select_cols)} FROM {table} AS t '
+                f'WHERE {_not_in_keys(config, "t")}'
+            ):
+                pk = _normalize_pk(row[:n_pk])
+                pruned += 1
+                _keep_sample(result.pruned_pks, pk)
+                if self._log is not None:
+                    snap = {col: v for col, v in zip(diff.columns, row[n_pk:])
+                            if v is not None and str(v) != ''}
+                    self._log.pruned(config.sheet_name, pk, snap)
+            if pruned:
+                conn.execute(f'DELETE FROM {table} WHERE {_not_in_keys(config, table)}')
+            conn.execute(f'DROP TABLE temp.{_KEY_TABLE}')
+        result.pruned = pruned
+        if pruned:
+            logger.info(
+                "%s: %d행 삭제(prune) — Excel에서 제거된 행",
+                config.sheet_name, result.pruned,
+            )
+
+    @contextmanager
+    def _sheet_phase(self, result: SheetSyncResult, name: str) -> Iterator[None]:
+        """시트 단계 시간 측정 — 그 사이 _sync_log 기록 시간은 빼고 'log' 단계로 집계"""
+        log_before = self._log.seconds if self._log is not None else 0.0
+        with phase_timer(result.phase_seconds, name):
+            yield
+        if self._log is not None:
+            result.phase_seconds[name] -= self._log.seconds - log_before
+
+    @staticmethod
+    def _ensure_indexes(conn: sqlite3.Connection, config: SheetConfig,
+                        result: SheetSyncResult) -> None:
+        """SheetConfig.indexes 반영 + 생성 수/소요 시간 기록"""
+        with phase_timer(result.phase_seconds, PHASE_INDEX):
+            created, _ = ensure_indexes(conn, config)
+        result.indexes_created = len(created)
+        if created:
+            logger.info("%s: 인덱스 %d개 생성 (%.2f초)",
+                        config.sheet_name, len(created), result.index_seconds)
+
+    def _write_rows(self, conn: sqlite3.Connection, config: SheetConfig,
+                    diff: SheetDiff, chunk: ChangeChunk) -> None:
+        """변경 묶음의 INSERT/UPDATE/해시 갱신을 executemany로 반영
+
+        성공한 행만 결과(건수 + 표본)와 _sync_log에 기록합니다.
+        """
+        result = diff.result
+        columns = diff.columns
+        now_iso = diff.now_iso
+        safe_cols = [f'[{c.strip()}]' for c in columns]
+        all_cols = safe_cols + ['[_sync_updated_at]', f'[{ROW_HASH_COLUMN}]']
+        pk_placeholders = ' AND '.join(f'[{c}] = ?' for c in config.pk_columns)
+
+        # INSERT 일괄 반영 (같은 시트 안에서 뒤에 나온 같은 PK 수정보다 먼저)
+        failed = self._execute_bulk(
+            conn, config, result,
+            f'INSERT INTO [{config.table_name}] '
+            f'({", ".join(all_cols)}) VALUES ({", ".join("?" for _ in all_cols)})',
+            [(idx, new_values + [now_iso, new_hash])
+             for idx, _, new_values, new_hash in chunk.inserts],
+        )
+        for idx, pk, new_values, _ in chunk.inserts:
+            if idx in failed:
+                continue
+            result.inserted += 1
+            # 신규 행의 비어있지 않은 값 기록
+            non_empty = {}
+            for i, c in enumerate(columns):
+                v = new_values[i]
+                if v is not None and str(v).strip() != '':
+                    non_empty[c] = v
+            _keep_sample(result.inserted_details, {
+                'pk': pk,
+                'values': non_empty,
+            })
+            if self._log is not None:
+                self._log.inserted(config.sheet_name, pk, non_empty)
+
+        # UPDATE 일괄 반영 (변경분 있는 행만, WHERE는 DB에 저장된 원본 PK)
+        set_clause = ', '.join(f'{sc} = ?' for sc in safe_cols)
+        failed = self._execute_bulk(
+            conn, config, result,
+            f'UPDATE [{config.table_name}] SET {set_clause}, '
+            f'[_sync_updated_at] = ?, [{ROW_HASH_COLUMN}] = ? WHERE {pk_placeholders}',
+            [(idx, new_values + [now_iso, new_hash] + list(db_pk))
+             for idx, _, new_values, new_hash, db_pk, _ in chunk.updates],
+        )
+        for idx, pk, _, _, _, changed in chunk.updates:
+            if idx in failed:
+                continue
+            result.updated += 1
+            _keep_sample(result.updated_details, {
+                'pk': pk,
+                'changes': changed,
+            })
+            if self._log is not None:
+                self._log.updated(config.sheet_name, pk, changed)
+
+        # 해시만 갱신 (이전 버전 DB의 빈 해시, 컬럼 구성 변경 등 — 수정 시각은 유지)
+        self._execute_bulk(
+            conn, config, result,
+            f'UPDATE [{config.table_name}] SET [{ROW_HASH_COLUMN}] = ? WHERE {pk_placeholders}',
+            chunk.rehash,
+        )
+
+    def _execute_bulk(self, conn: sqlite3.Connection, config: SheetConfig,
+                      result: SheetSyncResult, sql: str,
+                      rows: list[tuple[object, list]]) -> set:
+        """[(행 index, 파라미터)]를 executemany로 실행 — 실패한 행 index 집합 반환
+
+        일괄 실행이 실패하면 SAVEPOINT로 되돌린 뒤 행 단위로 다시 실행하여
+        문제 행만 에러로 기록합니다.
+        """
+        if not rows:
+            return set()
+        conn.execute('SAVEPOINT bulk_upsert')
+        try:
+            conn.executemany(sql, (params for _, params in rows))
+            return set()
+        except sqlite3.Error:
+            conn.execute('ROLLBACK TO bulk_upsert')
+            failed = set()
+            for idx, params in rows:
+                try:
+                    conn.execute(sql, params)
+                except sqlite3.Error as e:
+                    failed.add(idx)
+                    result.errors += 1
+                    msg = f"행 {idx}: {e}"
+                    result.error_messages.append(msg)
+                    logger.warning("%s - %s", config.sheet_name, msg)
+            return failed
+        finally:
+            conn.execute('RELEASE bulk_upsert')
+
+    def _prune_all(self, conn: sqlite3.Connection, config: SheetConfig,
+                   result: SheetSyncResult) -> None:
+        """시트가 비었어도 DB 테이블에 잔류 행이 있으면 전체 prune"""
+        try:
+            row_count = get_table_row_count(conn, config.table_name)
+        except Exception:
+            row_count = 0
+        if row_count > 0:
+            safe_pk_cols = [f'[{c}]' for c in config.pk_columns]
+            # 전체 컬럼 + PK 함께 조회해서 스냅샷 확보
+            all_cols_info = conn.execute(
+                f'PRAGMA table_info([{config.table_name}])'
+            ).fetchall()
+            snapshot_cols = [c[1] for c in all_cols_info
+                             if c[1] not in ('_sync_updated_at', ROW_HASH_COLUMN)]
+            safe_snap_cols = [f'[{c}]' for c in snapshot_cols]
+            # 한 행씩 읽으며 스냅샷을 _sync_log로 흘려보냄 (전체를 메모리에 모으지 않음)
+            pk_idx = [snapshot_cols.index(c) for c in config.pk_columns if c in snapshot_cols]
+            pruned = 0
+            for row in conn.execute(
+                f'SELECT {", ".join(safe_snap_cols)} FROM [{config.table_name}]'
+            ):
+                pk_tuple = _normalize_pk(tuple(row[i] for i in pk_idx))
+                pruned += 1
+                _keep_sample(result.pruned_pks, pk_tuple)
+                if self._log is not None:
+                    snap = {col: row[i] for i, col in enumerate(snapshot_cols)
+                            if row[i] is not None and str(row[i]) != ''}
+                    self._log.pruned(config.sheet_name, pk_tuple, snap)
+            if pruned:
+                # 시트가 비었으므로 테이블 전체가 삭제 대상
+                conn.execute(f'DELETE FROM [{config.table_name}]')
+            result.pruned = pruned
+            if pruned:
+                logger.info(
+                    "%s: %d행 삭제(prune) — 시트 전체 비어있음",
+                    config.sheet_name, result.pruned,
+                )
@@ -23,6 +23,7 @@ from po_generator.config import (
     PO_TEMPLATE_FILE,
 )
 from po_generator.utils import (
+    compile_records,
     get_value,
     escape_excel_formula,
     get_spec_option_fields,
@@ -161,7 +162,7 @@ def _create_purchase_order(
 
     # 아이템 목록 준비
     if items_df is not None:
-        items_list = [row for _, row in items_df.iterrows()]
+        items_list = compile_records(items_df)
     else:
         items_list = [order_data]
 
@@ -405,7 +406,7 @@ def _create_description_sheet(
 
     # 아이템 목록 준비
     if items_df is not None:
-        items_list = [row for _, row in items_df.iterrows()]
+        items_list = compile_records(items_df)
     else:
         items_list = [order_data]
 
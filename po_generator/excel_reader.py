@@ -0,0 +1,449 @@
+"""
+Excel 읽기 엔진
+===============
+
+모든 Excel 시트 읽기(pd.read_excel)를 한 곳으로 모은 읽기 계층입니다.
+엔진은 user_settings.py의 EXCEL_READER_ENGINE으로 선택합니다.
+
+- 'calamine': Rust 기반 python-calamine (openpyxl 대비 수~수십 배 빠름)
+- 'openpyxl': 순수 Python 기본 엔진
+- 'auto' (기본): calamine이 설치되어 있으면 calamine, 없으면 openpyxl
+
+calamine으로 읽다가 실패하면 openpyxl로 자동 재시도하며, 결과 DataFrame은
+openpyxl과 동일하도록 보정합니다 (tests/test_excel_reader.py 패리티 테스트).
+
+대용량 시트는 ExcelReader.iter_batches로 행 묶음 단위 스트리밍 읽기가 가능합니다
+(openpyxl read-only 모드, 메모리 사용량이 시트 크기와 무관).
+
+여러 시트는 read_sheets로 프로세스 풀에서 병렬 파싱합니다 (user_settings.py의
+PARSE_WORKERS, 코어가 1개이거나 풀을 쓸 수 없으면 순차 파싱).
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import io
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from pandas.io.parsers import TextParser
+
+from po_generator.config import EXCEL_READER_ENGINE, PARSE_WORKERS
+from po_generator.xlsx_package import XlsxPackage
+
+logger = logging.getLogger(__name__)
+
+ENGINE_AUTO = 'auto'
+ENGINE_CALAMINE = 'calamine'
+ENGINE_OPENPYXL = 'openpyxl'
+READER_ENGINES: tuple[str, ...] = (ENGINE_AUTO, ENGINE_CALAMINE, ENGINE_OPENPYXL)
+
+# iter_batches 기본 묶음 크기 (행)
+DEFAULT_BATCH_SIZE = 5000
+
+# PARSE_WORKERS=0(자동)일 때 병렬 파싱할 최소 파일 크기 — 작은 파일은 프로세스 기동 비용이 더 큼
+_PARALLEL_MIN_BYTES = 2 * 1024 * 1024
+
+# object 컬럼에 날짜가 섞였는지 판단할 때 보정이 필요한 infer_dtype 결과
+_MIXED_KINDS = frozenset({'mixed', 'mixed-integer', 'datetime', 'date'})
+
+
+def calamine_available() -> bool:
+    """python-calamine 설치 여부 (pandas 2.2+ 필요)"""
+    if importlib.util.find_spec('python_calamine') is None:
+        return False
+    major, minor = (int(p) for p in pd.__version__.split('.')[:2])
+    return (major, minor) >= (2, 2)
+
+
+def resolve_engine(engine: str | None = None) -> str:
+    """설정값('auto' 포함)을 실제 pandas 엔진명으로 변환
+
+    Args:
+        engine: 'auto' | 'calamine' | 'openpyxl' (None이면 EXCEL_READER_ENGINE)
+
+    Returns:
+        'calamine' 또는 'openpyxl'
+    """
+    engine = (engine or EXCEL_READER_ENGINE or ENGINE_AUTO).lower()
+    if engine not in READER_ENGINES:
+        logger.warning(f"알 수 없는 EXCEL_READER_ENGINE '{engine}' → auto")
+        engine = ENGINE_AUTO
+    if engine == ENGINE_OPENPYXL:
+        return ENGINE_OPENPYXL
+    if calamine_available():
+        return ENGINE_CALAMINE
+    if engine == ENGINE_CALAMINE:
+        logger.warning("python-calamine 미설치 → openpyxl 엔진 사용")
+    return ENGINE_OPENPYXL
+
+
+def _to_pydatetime(value: Any) -> Any:
+    return value.to_pydatetime() if isinstance(value, pd.Timestamp) else value
+
+
+def _match_openpyxl(df: pd.DataFrame) -> pd.DataFrame:
+    """calamine 결과를 openpyxl 결과와 동일하게 보정
+
+    문자열/숫자가 섞인 object 컬럼 안의 날짜 셀은 openpyxl이 datetime,
+    calamine이 pd.Timestamp로 돌려주므로 datetime으로 통일합니다.
+    (datetime64 컬럼과 dtype=str 결과는 두 엔진이 이미 동일)
+    """
+    for col in df.columns[df.dtypes == object]:
+        s = df[col]
+        if pd.api.types.infer_dtype(s, skipna=True) in _MIXED_KINDS:
+            df[col] = s.map(_to_pydatetime).astype(object)
+    return df
+
+
+def _column_positions(header: list[str | None], columns: Sequence[str]) -> list[int] | None:
+    """헤더에서 컬럼명 → 열 위치. 요청 컬럼명이 헤더에 중복되면 None (프로젝션 불가)"""
+    positions: dict[str, int] = {}
+    duplicated: set[str] = set()
+    for idx, name in enumerate(header):
+        if name is None:
+            continue
+        if name in positions:
+            duplicated.add(name)
+        positions.setdefault(name, idx)
+    if duplicated & set(columns):
+        return None
+    return sorted(positions[c] for c in set(columns) if c in positions)
+
+
+def _convert_cell(cell: Any) -> Any:
+    """openpyxl 셀 → pandas openpyxl 엔진과 같은 값 (빈 셀 '', 오류 셀 NaN, 정수값 float → int)"""
+    from openpyxl.cell.cell import TYPE_ERROR, TYPE_NUMERIC
+
+    value = cell.value
+    if value is None:
+        return ''
+    if cell.data_type == TYPE_ERROR:
+        return np.nan
+    if cell.data_type == TYPE_NUMERIC:
+        as_int = int(value)
+        return as_int if as_int == value else float(value)
+    return value
+
+
+def _header_names(cells: list[Any], strip: bool = True) -> list[str]:
+    """헤더 셀 → pandas와 같은 컬럼명 (빈 칸 'Unnamed: i', 중복 'A.1')
+
+    strip=True면 앞뒤 공백도 제거합니다 (iter_batches 규칙).
+    """
+    names = [f'Unnamed: {i}' if v == '' else str(v) for i, v in enumerate(cells)]
+    counts: dict[str, int] = {}
+    for i, name in enumerate(names):
+        count = counts.get(name, 0)
+        while count > 0:
+            counts[name] = count + 1
+            name = f'{name}.{count}'
+            count = counts.get(name, 0)
+        names[i] = name
+        counts[name] = count + 1
+    return [n.strip() for n in names] if strip else names
+
+
+class ExcelReader:
+    """Excel 파일 1개에 대한 시트 리더 (파일은 한 번만 오픈)
+
+    Usage:
+        with ExcelReader(path) as reader:
+            reader.sheet_names
+            df = reader.read('SO_국내', dtype=str)
+    """
+
+    def __init__(self, path: Path, engine: str | None = None):
+        self.path = Path(path)
+        self.engine = resolve_engine(engine)
+        self._book: pd.ExcelFile | None = None
+
+    def __enter__(self) -> ExcelReader:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._book is not None:
+            self._book.close()
+            self._book = None
+
+    def _open(self) -> pd.ExcelFile:
+        if self._book is None:
+            try:
+                self._book = pd.ExcelFile(self.path, engine=self.engine)
+            except Exception as e:
+                if self.engine == ENGINE_OPENPYXL:
+                    raise
+                self._fallback(e)
+                self._book = pd.ExcelFile(self.path, engine=self.engine)
+        return self._book
+
+    def _fallback(self, error: Exception) -> None:
+        """calamine 실패 → openpyxl로 전환"""
+        logger.warning(f"calamine 읽기 실패 ({self.path.name}: {error}) → openpyxl로 재시도")
+        self.close()
+        self.engine = ENGINE_OPENPYXL
+
+    @property
+    def sheet_names(self) -> list[str]:
+        return list(self._open().sheet_names)
+
+    def read(self, sheet_name: str | int = 0, columns: Sequence[str] | None = None,
+             **kwargs: Any) -> pd.DataFrame:
+        """시트 읽기 — pd.read_excel과 같은 인자 (dtype, nrows, usecols 등)
+
+        Args:
+            sheet_name: 시트명 또는 인덱스
+            columns: 파싱할 컬럼명 (None이면 전체). 지정하면 해당 열의 셀만
+                파싱하며, 결과는 전체를 읽은 뒤 컬럼을 고른 것과 같습니다.
+                시트에 없는 컬럼은 무시합니다.
+            **kwargs: pd.read_excel 인자
+
+        Returns:
+            DataFrame (엔진과 무관하게 openpyxl과 동일한 결과)
+        """
+        if columns is not None:
+            return self._read_columns(sheet_name, columns, **kwargs)
+        book = self._open()
+        if self.engine == ENGINE_OPENPYXL:
+            return pd.read_excel(book, sheet_name=sheet_name, **kwargs)
+        try:
+            df = pd.read_excel(book, sheet_name=sheet_name, **kwargs)
+        except ValueError:
+            # 시트 없음 등 호출자 오류는 엔진과 무관 — 그대로 전달
+            raise
+        except Exception as e:
+            self._fallback(e)
+            return self.read(sheet_name, **kwargs)
+        return _match_openpyxl(df)
+
+    def iter_batches(self, sheet_name: str | int = 0, batch_size: int = DEFAULT_BATCH_SIZE,
+                     columns: Sequence[str] | None = None, dtype: Any = None,
+                     keep_default_na: bool = True) -> Iterator[pd.DataFrame]:
+        """시트를 batch_size행씩 나눠 읽기 (메모리 사용량 일정)
+
+        openpyxl read-only 모드로 행을 순차 파싱하므로 엔진 설정과 무관하게
+        openpyxl을 사용합니다. 묶음을 이어 붙이면 read(dtype=..., keep_default_na=...)
+        결과와 같으며 (index도 이어짐), 컬럼명은 앞뒤 공백을 제거합니다.
+        단, dtype을 지정하지 않은 컬럼의 타입 추론은 묶음 단위입니다.
+
+        Args:
+            sheet_name: 시트명 또는 인덱스
+            batch_size: 묶음당 최대 행 수
+            columns: 읽을 컬럼명 (None이면 전체). 시트에 없는 컬럼은 무시
+            dtype: pd.read_excel의 dtype (str 또는 {컬럼: 타입})
+            keep_default_na: False면 빈 셀만 NaN ('N/A' 등은 문자열 유지)
+
+        Yields:
+            DataFrame 묶음 (데이터 행이 없으면 빈 DataFrame 1개)
+        """
+        import openpyxl
+
+        if batch_size < 1:
+            raise ValueError(f"batch_size는 1 이상이어야 합니다: {batch_size}")
+        wb = openpyxl.load_workbook(self.path, read_only=True, data_only=True, keep_links=False)
+        try:
+            ws = wb.worksheets[sheet_name] if isinstance(sheet_name, int) else wb[sheet_name]
+            ws.reset_dimensions()
+            rows = ws.iter_rows()
+            header = [_convert_cell(c) for c in next(rows, ())]
+            while header and header[-1] == '':
+                header.pop()
+            names = _header_names(header)
+            wanted = None if columns is None else set(columns)
+            positions = [i for i, name in enumerate(names) if wanted is None or name in wanted]
+            width = len(names)
+            names = [names[i] for i in positions]
+            if isinstance(dtype, dict):
+                dtype = {k.strip(): v for k, v in dtype.items() if k.strip() in names}
+
+            def to_frame(batch: list[list[Any]], start: int) -> pd.DataFrame:
+                if not batch:
+                    return pd.DataFrame(columns=names)
+                parser = TextParser(batch, names=names, header=None, dtype=dtype,
+                                    keep_default_na=keep_default_na, na_values=[''],
+                                    skip_blank_lines=False)
+                df = parser.read()
+                parser.close()
+                df.index = pd.RangeIndex(start, start + len(df))
+                return df
+
+            def records() -> Iterator[list[Any]]:
+                blank = 0  # 연속 빈 행 수 — 뒤에 데이터가 오면 포함, 시트 끝이면 제외
+                for row in rows:
+                    values = [_convert_cell(c) for c in row[:width]]
+                    if all(v == '' for v in values):
+                        blank += 1
+                        continue
+                    for _ in range(blank):
+                        yield [''] * len(positions)
+                    blank = 0
+                    values += [''] * (width - len(values))
+                    yield [values[i] for i in positions]
+
+            batch: list[list[Any]] = []
+            start = 0
+            for record in records():
+                batch.append(record)
+                if len(batch) == batch_size:
+                    yield to_frame(batch, start)
+                    start += batch_size
+                    batch = []
+            if batch or start == 0:
+                yield to_frame(batch, start)
+        finally:
+            wb.close()
+
+    def read_header(self, sheet_name: str | int = 0) -> list[str]:
+        """헤더 컬럼명만 조회 — read(sheet_name, nrows=0).columns와 같은 목록
+
+        시트 XML의 첫 행만 압축 해제하여 읽으므로 워크북 전체를 열지 않습니다.
+        문자열이 아닌 헤더 셀(숫자 등)은 빈 칸처럼 'Unnamed: i'가 됩니다.
+        1행이 비어 있거나 XML을 읽을 수 없으면 pandas로 헤더만 파싱합니다.
+        """
+        try:
+            with XlsxPackage(self.path) as pkg:
+                if isinstance(sheet_name, int):
+                    sheet_name = pkg.sheet_names[sheet_name]
+                cells = pkg.header_row(sheet_name)
+                if not cells:
+                    raise ValueError("1행 헤더 없음")
+        except Exception as e:
+            logger.debug(f"헤더 XML 조회 불가 ({self.path.name}[{sheet_name}]: {e}) → 헤더 파싱")
+            return list(self.read(sheet_name, nrows=0).columns)
+        return _header_names(['' if c is None else c for c in cells], strip=False)
+
+    def _read_columns(self, sheet_name: str | int, columns: Sequence[str],
+                      **kwargs: Any) -> pd.DataFrame:
+        """컬럼 프로젝션 읽기 — 요청 열의 셀만 남긴 워크북을 파싱"""
+        try:
+            with XlsxPackage(self.path) as pkg:
+                if isinstance(sheet_name, int):
+                    sheet_name = pkg.sheet_names[sheet_name]
+                positions = _column_positions(pkg.header_row(sheet_name), columns)
+                last_row = pkg.last_value_row(sheet_name)
+                if not positions or last_row is None:
+                    raise ValueError("헤더/행 범위를 확인할 수 없음")
+                data = pkg.projected_workbook(sheet_name, positions)
+        except Exception as e:
+            logger.debug(f"컬럼 프로젝션 불가 ({self.path.name}[{sheet_name}]: {e}) → 전체 파싱")
+            df = self.read(sheet_name, **kwargs)
+            return df[[c for c in df.columns if c in set(columns)]]
+
+        dtype = kwargs.pop('dtype', None)
+        if isinstance(dtype, dict):
+            dtype = {k: v for k, v in dtype.items() if k in set(columns)}
+        try:
+            # 남긴 열은 앞쪽 열로 당겨져 있음
+            df = pd.read_excel(io.BytesIO(data), sheet_name=sheet_name, engine=self.engine,
+                               usecols=list(range(len(positions))), dtype=dtype, **kwargs)
+        except ValueError:
+            raise
+        except Exception as e:
+            if self.engine == ENGINE_OPENPYXL:
+                raise
+            self._fallback(e)
+            return self._read_columns(sheet_name, columns, dtype=dtype, **kwargs)
+        if self.engine == ENGINE_CALAMINE:
+            df = _match_openpyxl(df)
+
+        # 끝쪽 행에 제외한 열의 값만 있으면 엔진이 잘라내므로 전체 파싱과 행 수를 맞춤
+        n_rows = max(last_row - 1, 0)
+        if len(df) < n_rows and 'nrows' not in kwargs:
+            df = df.reindex(pd.RangeIndex(n_rows))
+        return df
+
+
+def read_excel(path: Path, sheet_name: str | int = 0,
+               engine: str | None = None, **kwargs: Any) -> pd.DataFrame:
+    """시트 1개 읽기 (pd.read_excel 대체)
+
+    Args:
+        path: Excel 파일 경로
+        sheet_name: 시트명 또는 인덱스
+        engine: 엔진 (None이면 EXCEL_READER_ENGINE)
+        **kwargs: pd.read_excel 인자
+
+    Returns:
+        DataFrame
+    """
+    with ExcelReader(path, engine=engine) as reader:
+        return reader.read(sheet_name, **kwargs)
+
+
+def parse_workers(path: Path, n_sheets: int, workers: int | None = None) -> int:
+    """시트 병렬 파싱 프로세스 수
+
+    Args:
+        path: Excel 파일 경로
+        n_sheets: 파싱할 시트 수
+        workers: 0=자동 (CPU 코어 수, 작은 파일은 1), 1=순차, N=최대 N
+            (None이면 PARSE_WORKERS)
+
+    Returns:
+        1 이상 n_sheets 이하의 프로세스 수 (1이면 순차 파싱)
+    """
+    workers = PARSE_WORKERS if workers is None else workers
+    if not workers:
+        try:
+            if Path(path).stat().st_size < _PARALLEL_MIN_BYTES:
+                return 1
+        except OSError:
+            return 1
+        workers = os.cpu_count() or 1
+    return max(1, min(workers, n_sheets))
+
+
+def _read_sheet_job(path: Path, engine: str, sheet_name: str | int,
+                    kwargs: dict[str, Any]) -> pd.DataFrame:
+    """워커 프로세스에서 시트 1개 파싱 (pickle 가능한 모듈 수준 함수)"""
+    with ExcelReader(path, engine=engine) as reader:
+        return reader.read(sheet_name, **kwargs)
+
+
+def read_sheets(path: Path, requests: dict[str, dict[str, Any]],
+                engine: str | None = None, workers: int | None = None) -> dict[str, pd.DataFrame]:
+    """여러 시트를 프로세스 풀에서 병렬 파싱
+
+    시트별 파싱은 서로 독립적인 CPU 작업이므로 시트마다 워커 프로세스가 파일을
+    따로 열어 파싱합니다. 결과는 워커 완료 순서와 무관하게 요청 순서이며
+    순차 파싱과 같습니다.
+
+    Args:
+        path: Excel 파일 경로
+        requests: {시트명: ExcelReader.read 인자 (columns, dtype 등)}
+        engine: 엔진 (None이면 EXCEL_READER_ENGINE)
+        workers: 프로세스 수 (parse_workers 참고, None이면 PARSE_WORKERS)
+
+    Returns:
+        {시트명: DataFrame} (requests 순서)
+
+    Raises:
+        ValueError 등: 시트 파싱 실패 시 요청 순서상 첫 번째 오류
+    """
+    engine = resolve_engine(engine)
+    n_workers = parse_workers(path, len(requests), workers)
+    if n_workers > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=n_workers) as pool:
+                futures = {
+                    name: pool.submit(_read_sheet_job, Path(path), engine, name, kwargs)
+                    for name, kwargs in requests.items()
+                }
+                frames = {name: future.result() for name, future in futures.items()}
+            logger.debug(f"병렬 파싱: {Path(path).name} {len(frames)}개 시트 ({n_workers}프로세스)")
+            return frames
+        except (BrokenProcessPool, OSError) as e:
+            logger.warning(f"병렬 파싱 불가 ({e}) → 순차 파싱")
+
+    with ExcelReader(path, engine=engine) as reader:
+        return {name: reader.read(name, **kwargs) for name, kwargs in requests.items()}
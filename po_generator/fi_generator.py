@@ -19,7 +19,7 @@ import pandas as pd
 import xlwings as xw
 
 from po_generator.config import FI_TEMPLATE_FILE
-from po_generator.utils import get_value
+from po_generator.utils import compile_records, get_value
 from po_generator.excel_helpers import (
     XlConstants,
     xlwings_app_context,
@@ -335,18 +335,18 @@ def _fill_items_batch(
     currencies = []
     amounts = []
 
-    for item_idx, (_, item) in enumerate(items_df.iterrows()):
+    for item_idx, item in enumerate(compile_records(items_df)):
         # 품목명: Item 컬럼 사용 (DN_해외는 'Item' 컬럼)
         item_name = get_value(item, 'item_name', '')
         if not item_name:
             # DN_해외의 'Item' 컬럼 직접 참조
-            item_name = item.get('Item', '') if 'Item' in item.index else ''
+            item_name = get_value(item, 'Item', '')
         names.append(str(item_name) if item_name else '')
 
         # 수량 (DN_해외는 'Qty' 컬럼)
         raw_qty = get_value(item, 'item_qty', '')
         if not raw_qty or (isinstance(raw_qty, str) and raw_qty == ''):
-            raw_qty = item.get('Qty', 1) if 'Qty' in item.index else 1
+            raw_qty = get_value(item, 'Qty', 1)
         try:
             qty = int(raw_qty) if pd.notna(raw_qty) else 1
         except (ValueError, TypeError):
@@ -18,7 +18,7 @@ from pathlib import Path
 import pandas as pd
 import xlwings as xw
 
-from po_generator.utils import get_value
+from po_generator.utils import compile_records, get_value
 from po_generator.excel_helpers import (
     XlConstants,
     xlwings_app_context,
@@ -245,7 +245,7 @@ def _fill_items_batch(
     dispatch_dates = []
     amounts = []
 
-    for item_idx, (_, item) in enumerate(items_df.iterrows()):
+    for item_idx, item in enumerate(compile_records(items_df)):
         # 품목명: Model number + Item name (model number 있으면 앞에 붙임)
         raw_model = get_value(item, 'model', '')
         model = _to_text(raw_model)
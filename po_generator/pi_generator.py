@@ -19,7 +19,7 @@ import pandas as pd
 import xlwings as xw
 
 from po_generator.config import PI_TEMPLATE_FILE
-from po_generator.utils import get_value
+from po_generator.utils import compile_records, get_value
 from po_generator.excel_helpers import (
     XlConstants,
     xlwings_app_context,
@@ -343,7 +343,7 @@ def _fill_items_batch(
     prices = []
     amounts = []
 
-    for item_idx, (_, item) in enumerate(items_df.iterrows()):
+    for item_idx, item in enumerate(compile_records(items_df)):
         # 품목명: Model + Item name (Model은 텍스트로 변환하여 앞 0 보존)
         raw_model = get_value(item, 'model', '')
         model = _to_text(raw_model)
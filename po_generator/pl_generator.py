@@ -21,7 +21,7 @@ import pandas as pd
 import xlwings as xw
 
 from po_generator.config import PL_TEMPLATE_FILE
-from po_generator.utils import get_value
+from po_generator.utils import compile_records, get_value
 from po_generator.excel_helpers import (
     XlConstants,
     xlwings_app_context,
@@ -299,13 +299,13 @@ def _fill_items_batch(
     gross_weights = []
     cbms = []
 
-    for item_idx, (_, item) in enumerate(items_df.iterrows()):
+    for item_idx, item in enumerate(compile_records(items_df)):
         # 품목명: Model number + Item name
         raw_model = get_value(item, 'model', '')
         model = _to_text(raw_model)
         item_name = get_value(item, 'item_name', '')
         if not item_name:
-            item_name = item.get('Item', '') if 'Item' in item.index else ''
+            item_name = get_value(item, 'Item', '')
         if model and item_name:
             full_name = f"{model} {item_name}"
         elif model:
@@ -321,7 +321,7 @@ def _fill_items_batch(
         # 수량
         raw_qty = get_value(item, 'item_qty', '')
         if not raw_qty or (isinstance(raw_qty, str) and raw_qty == ''):
-            raw_qty = item.get('Qty', 1) if 'Qty' in item.index else 1
+            raw_qty = get_value(item, 'Qty', 1)
         try:
             qty = int(raw_qty) if pd.notna(raw_qty) else 1
         except (ValueError, TypeError):
@@ -31,8 +31,7 @@ from po_generator.config import (
 from po_generator.utils import (
     get_value,
     resolve_column,
-    build_po_line_weight_map,
-    normalize_line_item,
+    line_keys,
 )
 from po_generator.validators import validate_order_data, validate_multiple_items
 from po_generator.history import check_duplicate_order, save_to_history
@@ -65,12 +64,17 @@ class DocumentService:
             print(f"실패: {result.message}")
     """
 
-    def __init__(self, finder: FinderService | None = None):
+    def __init__(self, finder: FinderService | None = None, source: str | None = None,
+                 prewarm: str | None = None):
         """
         Args:
             finder: FinderService 인스턴스 (없으면 새로 생성)
+            source: 새로 생성할 FinderService의 데이터 소스
+                ('excel' | 'sqlite' | 'auto', None이면 DATA_SOURCE 설정)
+            prewarm: 새로 생성할 FinderService가 백그라운드로 미리 로드할 문서 유형
+                ('po', 'ts', 'pi', 'oc', 'ci', 'pl', 'fi')
         """
-        self._finder = finder or FinderService()
+        self._finder = finder or FinderService(source=source, prewarm=prewarm)
 
     @property
     def finder(self) -> FinderService:
@@ -97,8 +101,7 @@ class DocumentService:
             return items_df
 
         try:
-            df_so = self._finder.load_so_export_data()
-            so_items = df_so[df_so['SO_ID'].isin(so_ids)]
+            so_items = self._finder.find_so_export_rows(so_ids)
             if so_items.empty:
                 return items_df
 
@@ -117,25 +120,20 @@ class DocumentService:
             if not model_col and not model_code_col:
                 return items_df
 
-            # 복합키 생성 (SO_ID + Line item)
-            so_items = so_items.copy()
-            so_items['_join_key'] = so_items['SO_ID'].astype(str) + '_' + so_items[so_line_col].astype(str)
+            # (SO_ID, Line item) 복합키로 SO 라인 조회 (중복 라인은 마지막 행)
+            so_keys = line_keys(so_items, line_col=so_line_col)
+            so_items = so_items.set_axis(so_keys)[~so_keys.duplicated(keep='last')]
+            item_keys = line_keys(items_df, so_col=so_id_col, line_col=dn_line_col)
 
             items_df = items_df.copy()
-            items_df['_join_key'] = items_df[so_id_col].astype(str) + '_' + items_df[dn_line_col].astype(str)
-
             if model_col:
-                model_map = dict(zip(so_items['_join_key'], so_items[model_col]))
-                items_df['Model number'] = items_df['_join_key'].map(model_map)
+                items_df['Model number'] = so_items[model_col].reindex(item_keys).to_numpy()
                 logger.debug(f"Model number 보강 완료: {items_df['Model number'].notna().sum()}/{len(items_df)}건 매칭")
 
             if model_code_col:
-                model_code_map = dict(zip(so_items['_join_key'], so_items[model_code_col]))
-                items_df['Model code'] = items_df['_join_key'].map(model_code_map)
+                items_df['Model code'] = so_items[model_code_col].reindex(item_keys).to_numpy()
                 logger.debug(f"Model code 보강 완료: {items_df['Model code'].notna().sum()}/{len(items_df)}건 매칭")
 
-            items_df.drop(columns='_join_key', inplace=True)
-
         except Exception as e:
             logger.warning(f"Model number 보강 실패: {e}")
 
@@ -144,9 +142,9 @@ class DocumentService:
     def _enrich_with_weight(self, items_df: pd.DataFrame) -> pd.DataFrame:
         """PO_해외 Model+옵션 기반으로 Net Weight (Weight per unit) 보강
 
-        DN 아이템을 (SO_ID, Line item) 복합키로 PO_해외와 조인하여,
-        PO 라인의 Model + Y옵션을 Weight 시트와 매칭한 단위중량을
-        'Weight per unit' 컬럼에 채웁니다.
+        DN 아이템을 (SO_ID, Line item) 복합키로 PO 라인 Weight 해결 결과
+        (FinderService.find_po_line_weights — DB 소스면 동기화 때 저장한 테이블)와
+        조인하여 'Weight per unit' 컬럼에 채웁니다.
         """
         so_id_col = resolve_column(items_df.columns, 'so_id')
         line_col = 'Line item' if 'Line item' in items_df.columns else None
@@ -154,19 +152,16 @@ class DocumentService:
             logger.debug("SO_ID/Line item 컬럼 없음 — Weight 보강 건너뜀")
             return items_df
 
-        line_weight_map = build_po_line_weight_map()
-        if not line_weight_map:
+        lines = self.finder.find_po_line_weights(items_df[so_id_col])
+        if not lines['weight'].notna().any():
             return items_df
 
+        weights = lines['weight'].reindex(
+            line_keys(items_df, so_col=so_id_col, line_col=line_col)
+        ).to_numpy()
         items_df = items_df.copy()
-        weights = [
-            line_weight_map.get(
-                (str(row[so_id_col]).strip(), normalize_line_item(row[line_col]))
-            )
-            for _, row in items_df.iterrows()
-        ]
         items_df['Weight per unit'] = weights
-        matched = sum(w is not None for w in weights)
+        matched = int(pd.notna(weights).sum())
         logger.debug(f"Weight 보강 완료: {matched}/{len(items_df)}건 매칭")
         return items_df
 
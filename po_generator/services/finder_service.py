@@ -4,17 +4,34 @@
 
 NOAH_SO_PO_DN.xlsx에서 데이터를 조회하는 서비스입니다.
 utils.py의 함수들을 래핑하여 통합된 인터페이스를 제공합니다.
+
+데이터 소스가 'sqlite'이면 Excel 대신 동기화 DB(noah_data.db)에서
+요청한 ID의 행만 SQL로 조회하고, Excel 로더와 같은 JOIN 함수로
+동일한 형태의 Series/DataFrame을 만듭니다.
+
+prewarm에 문서 유형을 지정하면 생성 즉시 해당 문서에 필요한 시트를
+백그라운드 스레드에서 미리 로드합니다 (사용자가 ID를 입력하는 동안 파싱).
 """
 
 from __future__ import annotations
 
 import logging
+import threading
+from collections.abc import Iterable
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
-from po_generator.config import NOAH_SO_PO_DN_FILE, SO_DOMESTIC_SHEET
+from po_generator.config import (
+    NOAH_SO_PO_DN_FILE,
+    SO_DOMESTIC_SHEET, PO_DOMESTIC_SHEET, DN_DOMESTIC_SHEET, PMT_DOMESTIC_SHEET,
+    SO_EXPORT_SHEET, PO_EXPORT_SHEET, DN_EXPORT_SHEET, CUSTOMER_EXPORT_SHEET,
+)
+from po_generator.db_reader import DbReader, SHEET_TABLES, SOURCE_SQLITE, resolve_data_source
+from po_generator.db_schema import PO_LINE_WEIGHT_TABLE
 from po_generator.utils import (
     load_noah_po_lists,
     load_dn_data,
@@ -28,11 +45,32 @@ from po_generator.utils import (
     find_so_export_data,
     find_dn_export_data,
     load_so_for_advance,
+    build_po_line_weights,
     get_value,
+    _select_matches,
+    get_workbook_cache,
+    resolve_column,
+    _merge_po_so,
+    _merge_dn_so,
+    _merge_pmt_so,
+    _mark_so_export,
+    _merge_so_customer,
+    _merge_dn_export,
 )
 
 logger = logging.getLogger(__name__)
 
+# 문서 유형별 prewarm 대상 (FinderService 로드 메서드)
+PREWARM_LOADERS: dict[str, tuple[str, ...]] = {
+    'po': ('load_po_data',),
+    'ts': ('load_dn_data', 'load_pmt_data', '_load_so_domestic'),
+    'pi': ('load_so_export_data',),
+    'oc': ('load_so_export_with_customer',),
+    'ci': ('load_dn_export_data', 'load_so_export_data'),
+    'pl': ('load_dn_export_data', 'load_so_export_data', 'load_po_line_weights'),
+    'fi': ('load_dn_export_data', 'load_so_export_data'),
+}
+
 
 @dataclass
 class OrderData:
@@ -78,14 +116,74 @@ class OrderData:
         return self.item_count > 1
 
 
+def _ids(values: Iterable[Any]) -> list[Any]:
+    """조회 조건용 ID 목록 (빈 값 제외, 순서 유지 중복 제거)"""
+    return list(dict.fromkeys(v for v in values if pd.notna(v) and v != ''))
+
+
+class _LookupIndex:
+    """DataFrame 1개에 대한 컬럼별 해시 인덱스 (값 → 행 위치)
+
+    컬럼별로 처음 조회할 때 한 번 만들고, 이후 조회는 O(1) 슬라이스입니다.
+    값 비교는 불리언 마스크(df[col] == value)와 같습니다 (빈 값은 색인하지 않음).
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        self.df = df
+        self._maps: dict[tuple[str, bool], dict[Any, np.ndarray]] = {}
+
+    def _map(self, column: str, as_str: bool = False) -> dict[Any, np.ndarray]:
+        key = (column, as_str)
+        if key not in self._maps:
+            values = self.df[column].astype(str) if as_str else self.df[column]
+            self._maps[key] = values.groupby(values, sort=False).indices
+        return self._maps[key]
+
+    def rows(self, column: str, value: Any, as_str: bool = False) -> pd.DataFrame:
+        """column == value인 행 (as_str면 문자열로 변환한 값 기준)"""
+        try:
+            positions = self._map(column, as_str).get(value)
+        except TypeError:  # 해시 불가 값
+            positions = None
+        if positions is None:
+            return self.df.iloc[0:0]
+        return self.df.iloc[positions]
+
+    def rows_in(self, column: str, values: Iterable[Any]) -> pd.DataFrame:
+        """column 값이 values 중 하나인 행 (원래 행 순서)"""
+        index = self._map(column)
+        found = [index[v] for v in dict.fromkeys(values) if v in index]
+        if not found:
+            return self.df.iloc[0:0]
+        return self.df.iloc[np.sort(np.concatenate(found))]
+
+    def first_rows(self, column: str, limit: int) -> pd.DataFrame:
+        """값별 첫 행을 원래 순서로 limit개 (dropna + drop_duplicates + head와 동일)"""
+        firsts = sorted(positions[0] for positions in self._map(column).values())
+        return self.df.iloc[firsts[:limit]]
+
+
 class FinderService:
     """데이터 조회 서비스
 
-    NOAH_SO_PO_DN.xlsx에서 각종 데이터를 조회합니다.
+    NOAH_SO_PO_DN.xlsx(또는 동기화 DB)에서 각종 데이터를 조회합니다.
     데이터 로딩은 지연 로딩(lazy loading)으로 처리합니다.
     """
 
-    def __init__(self):
+    def __init__(self, source: str | None = None, db_path: Path | None = None,
+                 prewarm: str | None = None):
+        """
+        Args:
+            source: 데이터 소스 'excel' | 'sqlite' | 'auto' (None이면 DATA_SOURCE 설정)
+            db_path: DB 경로 (None이면 DB_FILE)
+            prewarm: 문서 유형 ('po', 'ts', 'pi', 'oc', 'ci', 'pl', 'fi') —
+                지정하면 필요한 데이터를 즉시 백그라운드에서 로드
+        """
+        self.source = resolve_data_source(source, db_path)
+        self._db = DbReader(db_path) if self.source == SOURCE_SQLITE else None
+        logger.debug(f"FinderService 데이터 소스: {self.source}")
+        # 로드된 DataFrame별 조회 인덱스 (이름 → 인덱스)
+        self._indexes: dict[str, _LookupIndex] = {}
         self._po_df: pd.DataFrame | None = None
         self._dn_df: pd.DataFrame | None = None
         self._pmt_df: pd.DataFrame | None = None
@@ -93,36 +191,87 @@ class FinderService:
         self._so_export_df: pd.DataFrame | None = None
         self._so_export_cust_df: pd.DataFrame | None = None
         self._dn_export_df: pd.DataFrame | None = None
+        self._po_line_weight_df: pd.DataFrame | None = None
+        self._prewarm_thread: threading.Thread | None = None
+        if prewarm:
+            self.start_prewarm(prewarm)
+
+    # === 백그라운드 prewarm ===
+
+    def start_prewarm(self, doc_type: str) -> None:
+        """문서 유형에 필요한 데이터를 백그라운드 스레드에서 로드 시작
+
+        이후 load_*/find_* 호출은 prewarm이 끝날 때까지 기다린 뒤 그 결과를
+        사용합니다. DB 소스는 ID별 SQL 조회라 미리 읽을 것이 없고,
+        sqlite 연결은 생성한 스레드에서만 쓸 수 있으므로 생략합니다.
+
+        Args:
+            doc_type: 문서 유형 (PREWARM_LOADERS 키)
+
+        Raises:
+            ValueError: 알 수 없는 문서 유형
+        """
+        loaders = PREWARM_LOADERS.get(doc_type)
+        if loaders is None:
+            raise ValueError(f"알 수 없는 문서 유형: {doc_type} (가능: {', '.join(PREWARM_LOADERS)})")
+        if self._db is not None or self._prewarm_thread is not None:
+            return
+        self._prewarm_thread = threading.Thread(
+            target=self._run_prewarm, args=(loaders,),
+            name=f'finder-prewarm-{doc_type}', daemon=True,
+        )
+        self._prewarm_thread.start()
+        logger.debug(f"백그라운드 로딩 시작: {doc_type} ({', '.join(loaders)})")
+
+    def _run_prewarm(self, loaders: tuple[str, ...]) -> None:
+        for name in loaders:
+            try:
+                getattr(self, name)()
+            except Exception as e:
+                # 실패한 데이터는 None으로 남아 호출 시점에 다시 로드 (오류도 그때 전달)
+                logger.debug(f"백그라운드 로딩 실패 ({name}): {e}")
+
+    def wait_prewarm(self) -> None:
+        """진행 중인 prewarm이 끝날 때까지 대기 (prewarm 스레드 자신은 대기하지 않음)"""
+        thread = self._prewarm_thread
+        if thread is None or thread is threading.current_thread():
+            return
+        thread.join()
+        self._prewarm_thread = None
 
     def load_po_data(self) -> pd.DataFrame:
         """PO 데이터 로드 (국내 + 해외)"""
+        self.wait_prewarm()
         if self._po_df is None:
             logger.info("PO 데이터 로딩 중...")
-            self._po_df = load_noah_po_lists()
+            self._po_df = self._db_po() if self._db else load_noah_po_lists()
             logger.info(f"PO 데이터 {len(self._po_df)}건 로드 완료")
         return self._po_df
 
     def load_dn_data(self) -> pd.DataFrame:
         """DN 데이터 로드"""
+        self.wait_prewarm()
         if self._dn_df is None:
             logger.info("DN 데이터 로딩 중...")
-            self._dn_df = load_dn_data()
+            self._dn_df = self._db_dn() if self._db else load_dn_data()
             logger.info(f"DN 데이터 {len(self._dn_df)}건 로드 완료")
         return self._dn_df
 
     def load_pmt_data(self) -> pd.DataFrame:
         """PMT 데이터 로드"""
+        self.wait_prewarm()
         if self._pmt_df is None:
             logger.info("PMT 데이터 로딩 중...")
-            self._pmt_df = load_pmt_data()
+            self._pmt_df = self._db_pmt() if self._db else load_pmt_data()
             logger.info(f"PMT 데이터 {len(self._pmt_df)}건 로드 완료")
         return self._pmt_df
 
     def load_so_export_data(self) -> pd.DataFrame:
         """SO 해외 데이터 로드"""
+        self.wait_prewarm()
         if self._so_export_df is None:
             logger.info("SO 해외 데이터 로딩 중...")
-            self._so_export_df = load_so_export_data()
+            self._so_export_df = self._db_so_export() if self._db else load_so_export_data()
             logger.info(f"SO 해외 데이터 {len(self._so_export_df)}건 로드 완료")
         return self._so_export_df
 
@@ -135,8 +284,10 @@ class FinderService:
         Returns:
             OrderData 또는 None
         """
-        df = self.load_po_data()
-        result = find_order_data(df, order_no)
+        if self._db:
+            result = find_order_data(self._db_po(order_no), order_no)
+        else:
+            result = self._find('po', self.load_po_data(), 'order_no', order_no, '주문번호')
         if result is None:
             return None
         return OrderData.from_result(result)
@@ -150,8 +301,10 @@ class FinderService:
         Returns:
             OrderData 또는 None
         """
-        df = self.load_dn_data()
-        result = find_dn_data(df, dn_id)
+        if self._db:
+            result = find_dn_data(self._db_dn(dn_id), dn_id)
+        else:
+            result = self._find('dn', self.load_dn_data(), 'dn_id', dn_id, 'DN_ID')
         if result is None:
             return None
         return OrderData.from_result(result)
@@ -165,8 +318,13 @@ class FinderService:
         Returns:
             OrderData 또는 None
         """
-        df = self.load_pmt_data()
-        result = find_pmt_data(df, advance_id)
+        if self._db:
+            result = find_pmt_data(self._db_pmt(advance_id), advance_id)
+        else:
+            result = self._find(
+                'pmt', self.load_pmt_data(), 'advance_id', advance_id, '선수금_ID',
+                allow_multiple=False,
+            )
         if result is None:
             return None
         return OrderData.from_result(result)
@@ -180,17 +338,23 @@ class FinderService:
         Returns:
             OrderData 또는 None
         """
-        df = self.load_so_export_data()
-        result = find_so_export_data(df, so_id)
+        if self._db:
+            result = find_so_export_data(self._db_so_export(so_id), so_id)
+        else:
+            result = self._find('so_export', self.load_so_export_data(), 'so_id', so_id, 'SO_ID')
         if result is None:
             return None
         return OrderData.from_result(result)
 
     def load_so_export_with_customer(self) -> pd.DataFrame:
         """SO 해외 + Customer_해외 데이터 로드"""
+        self.wait_prewarm()
         if self._so_export_cust_df is None:
             logger.info("SO 해외 + Customer 데이터 로딩 중...")
-            self._so_export_cust_df = load_so_export_with_customer()
+            self._so_export_cust_df = (
+                self._db_so_export_with_customer() if self._db
+                else load_so_export_with_customer()
+            )
             logger.info(f"SO 해외 + Customer 데이터 {len(self._so_export_cust_df)}건 로드 완료")
         return self._so_export_cust_df
 
@@ -203,21 +367,60 @@ class FinderService:
         Returns:
             OrderData 또는 None
         """
-        df = self.load_so_export_with_customer()
-        result = find_so_export_data(df, so_id)
+        if self._db:
+            result = find_so_export_data(self._db_so_export_with_customer(so_id), so_id)
+        else:
+            result = self._find(
+                'so_export_cust', self.load_so_export_with_customer(), 'so_id', so_id, 'SO_ID',
+            )
         if result is None:
             return None
         return OrderData.from_result(result)
 
-
     def load_dn_export_data(self) -> pd.DataFrame:
         """DN 해외 데이터 로드 (Customer_해외 JOIN 포함)"""
+        self.wait_prewarm()
         if self._dn_export_df is None:
             logger.info("DN 해외 데이터 로딩 중...")
-            self._dn_export_df = load_dn_export_data()
+            self._dn_export_df = self._db_dn_export() if self._db else load_dn_export_data()
             logger.info(f"DN 해외 데이터 {len(self._dn_export_df)}건 로드 완료")
         return self._dn_export_df
 
+    def load_po_line_weights(self) -> pd.DataFrame:
+        """PO 라인별 Weight 해결 결과 — (SO_ID, Line item) 인덱스
+
+        Excel 소스에서만 사용합니다 (PO_해외 + Weight 시트로 계산, 인스턴스당 1회).
+        DB 소스는 find_po_line_weights()가 동기화 때 저장한 테이블을 조회합니다.
+        """
+        self.wait_prewarm()
+        if self._po_line_weight_df is None:
+            self._po_line_weight_df = build_po_line_weights().set_index(['SO_ID', 'Line item'])
+        return self._po_line_weight_df
+
+    def find_po_line_weights(self, so_ids: Iterable[Any]) -> pd.DataFrame:
+        """SO_ID 목록에 해당하는 PO 라인 Weight — (SO_ID, Line item) 인덱스
+
+        DB 소스는 sync_db.py가 저장한 po_line_weight 테이블을 PK로 조회하고,
+        테이블이 없는 DB(이전 버전 동기화)면 시트에서 계산합니다.
+
+        Args:
+            so_ids: SO_ID 목록
+
+        Returns:
+            weight / matched_code / match_tier 컬럼 DataFrame (미매칭 라인은 weight NaN)
+        """
+        so_ids = list(dict.fromkeys(str(v).strip() for v in _ids(so_ids)))
+        if self._db and self._db.columns(PO_LINE_WEIGHT_TABLE):
+            df = self._db.select(
+                PO_LINE_WEIGHT_TABLE, {'SO_ID': so_ids},
+                text_columns=('SO_ID', 'Line item', 'Model', 'matched_code', 'match_tier'),
+            )
+            return df.set_index(['SO_ID', 'Line item'])
+        if self._db:
+            logger.info("DB에 PO 라인 Weight 테이블 없음 → 시트에서 계산 (sync_db.py로 동기화하면 DB 사용)")
+        lines = self.load_po_line_weights()
+        return lines[lines.index.get_level_values('SO_ID').isin(so_ids)]
+
     def find_dn_export(self, dn_id: str) -> OrderData | None:
         """DN 해외 데이터 검색
 
@@ -227,8 +430,12 @@ class FinderService:
         Returns:
             OrderData 또는 None
         """
-        df = self.load_dn_export_data()
-        result = find_dn_export_data(df, dn_id)
+        if self._db:
+            result = find_dn_export_data(self._db_dn_export(dn_ids=[dn_id]), dn_id)
+        else:
+            result = self._find(
+                'dn_export', self.load_dn_export_data(), 'dn_id', dn_id, 'DN_ID (해외)',
+            )
         if result is None:
             return None
         return OrderData.from_result(result)
@@ -244,15 +451,17 @@ class FinderService:
         Returns:
             OrderData 또는 None
         """
-        from po_generator.utils import resolve_column
-
-        df = self.load_dn_export_data()
+        if self._db:
+            df = self._db_dn_export_by_customer_po(customer_po)
+        else:
+            df = self.load_dn_export_data()
         cpo_col = resolve_column(df.columns, 'customer_po')
         if cpo_col is None:
             logger.warning("Customer PO 컬럼을 찾을 수 없습니다.")
             return None
 
-        matched = df[df[cpo_col].astype(str) == customer_po]
+        index = self._index(None if self._db else 'dn_export', df)
+        matched = index.rows(cpo_col, customer_po, as_str=True)
         if matched.empty:
             return None
 
@@ -267,10 +476,7 @@ class FinderService:
         Returns:
             (DN_ID, 고객명) 튜플 목록
         """
-        df = self.load_dn_export_data()
-        pairs = (df.dropna(subset=['DN_ID'])
-                 .drop_duplicates(subset='DN_ID', keep='first')
-                 .head(limit))
+        pairs = self._index('dn_export', self.load_dn_export_data()).first_rows('DN_ID', limit)
         return [
             (str(row['DN_ID']), str(row['Customer name']) if pd.notna(row.get('Customer name')) else '')
             for _, row in pairs.iterrows()
@@ -278,11 +484,13 @@ class FinderService:
 
     def _load_so_domestic(self) -> pd.DataFrame:
         """SO_국내 원본 데이터 로드 (캐시)"""
+        self.wait_prewarm()
         if self._so_domestic_df is None:
             if not NOAH_SO_PO_DN_FILE.exists():
                 raise FileNotFoundError(f"소스 파일을 찾을 수 없습니다: {NOAH_SO_PO_DN_FILE}")
-            with pd.ExcelFile(NOAH_SO_PO_DN_FILE) as xl:
-                self._so_domestic_df = pd.read_excel(xl, sheet_name=SO_DOMESTIC_SHEET)
+            self._so_domestic_df = get_workbook_cache().get_sheet(
+                NOAH_SO_PO_DN_FILE, SO_DOMESTIC_SHEET,
+            )
         return self._so_domestic_df
 
     def find_so_for_advance(self, advance_id: str) -> tuple[pd.Series, OrderData] | None:
@@ -298,20 +506,25 @@ class FinderService:
         Returns:
             (PMT 정보, SO 아이템 OrderData) 또는 None
         """
-        # 캐시된 PMT 데이터에서 선수금_ID 검색
-        pmt_df = self.load_pmt_data()
-        pmt_mask = pmt_df['선수금_ID'] == advance_id
-        if pmt_mask.sum() == 0:
+        # 캐시된 PMT 데이터에서 선수금_ID 검색 (DB 소스면 해당 행만 조회)
+        if self._db:
+            pmt_rows = _LookupIndex(self._db_pmt(advance_id)).rows('선수금_ID', advance_id)
+        else:
+            pmt_rows = self._index('pmt', self.load_pmt_data()).rows('선수금_ID', advance_id)
+        if pmt_rows.empty:
             logger.warning(f"선수금_ID '{advance_id}'를 찾을 수 없습니다.")
             return None
 
-        pmt_data = pmt_df[pmt_mask].iloc[0]
+        pmt_data = pmt_rows.iloc[0]
         so_id = pmt_data['SO_ID']
         logger.info(f"선수금_ID '{advance_id}' -> SO_ID: {so_id}")
 
         # 캐시된 SO 데이터에서 해당 SO_ID의 모든 아이템 검색
-        so_df = self._load_so_domestic()
-        so_items = so_df[so_df['SO_ID'] == so_id].copy()
+        if self._db:
+            so_index = _LookupIndex(self._db.read_sheet(SO_DOMESTIC_SHEET, {'SO_ID': [so_id]}))
+        else:
+            so_index = self._index('so_domestic', self._load_so_domestic())
+        so_items = so_index.rows('SO_ID', so_id).copy()
 
         if len(so_items) == 0:
             logger.warning(f"SO_ID '{so_id}'에 해당하는 SO 데이터를 찾을 수 없습니다.")
@@ -324,6 +537,165 @@ class FinderService:
         logger.info(f"SO_ID '{so_id}': {len(so_items)}개 아이템 발견")
         return pmt_data, OrderData.from_result(so_items)
 
+    def find_so_export_rows(self, so_ids: Iterable[Any]) -> pd.DataFrame:
+        """SO_ID 목록에 해당하는 SO_해외 행 (원래 행 순서, 없으면 빈 DataFrame)
+
+        Args:
+            so_ids: SO_ID 목록
+
+        Returns:
+            SO_해외 DataFrame
+        """
+        if self._db:
+            return self._db_so_export_where(_ids(so_ids))
+        return self._index('so_export', self.load_so_export_data()).rows_in('SO_ID', so_ids)
+
+    # === 조회 인덱스 ===
+
+    def _index(self, name: str | None, df: pd.DataFrame) -> _LookupIndex:
+        """DataFrame의 조회 인덱스 (name이 있으면 같은 DataFrame에 대해 재사용)"""
+        if name is None:
+            return _LookupIndex(df)
+        index = self._indexes.get(name)
+        if index is None or index.df is not df:
+            index = _LookupIndex(df)
+            self._indexes[name] = index
+        return index
+
+    def _find(
+        self,
+        name: str,
+        df: pd.DataFrame,
+        column_key: str,
+        id_value: str,
+        id_label: str,
+        allow_multiple: bool = True,
+    ) -> pd.Series | pd.DataFrame | None:
+        """인덱스로 ID 검색 — _find_data_by_id()와 같은 결과"""
+        col = resolve_column(df.columns, column_key)
+        if col is None:
+            logger.error(f"{id_label} 컬럼을 찾을 수 없습니다.")
+            return None
+        matched = self._index(name, df).rows(col, id_value)
+        return _select_matches(matched, id_value, id_label, allow_multiple)
+
+    # === DB 소스 조회 (id가 None이면 전체, 아니면 해당 ID 행만) ===
+
+    def _db_po(self, order_no: str | None = None) -> pd.DataFrame:
+        """PO + SO (국내/해외) — load_noah_po_lists()와 같은 형태"""
+        frames = []
+        for so_sheet, po_sheet, sheet_type in (
+            (SO_DOMESTIC_SHEET, PO_DOMESTIC_SHEET, '국내'),
+            (SO_EXPORT_SHEET, PO_EXPORT_SHEET, '해외'),
+        ):
+            where = None if order_no is None else {'PO_ID': [order_no]}
+            df_po = self._db.read_sheet(po_sheet, where)
+            df_so = self._db.read_sheet(so_sheet, self._so_where(df_po, order_no))
+            frames.append(_merge_po_so(df_po, df_so, sheet_type))
+
+        # 두 시트를 합친 Excel 결과와 같은 컬럼 구성 — 조회되지 않은 시트의
+        # 컬럼도 NaN으로 채우고, dtype은 concat처럼 해당 시트 컬럼을 따름
+        dfs = [df for df in frames if len(df) > 0]
+        if not dfs:
+            return pd.concat(frames, ignore_index=True)
+        df = pd.concat(dfs, ignore_index=True)
+        for frame in frames:
+            for col in frame.columns.difference(df.columns, sort=False):
+                df[col] = pd.Series(np.nan, index=df.index).astype(frame[col].dtype)
+        columns = list(dict.fromkeys(c for frame in frames for c in frame.columns))
+        return df[columns]
+
+    def _db_dn(self, dn_id: str | None = None) -> pd.DataFrame:
+        """DN_국내 + SO_국내 — load_dn_data()와 같은 형태"""
+        df_dn = self._db.read_sheet(DN_DOMESTIC_SHEET, None if dn_id is None else {'DN_ID': [dn_id]})
+        df_so = self._db.read_sheet(SO_DOMESTIC_SHEET, self._so_where(df_dn, dn_id))
+        return _merge_dn_so(df_dn, df_so)
+
+    def _db_pmt(self, advance_id: str | None = None) -> pd.DataFrame:
+        """PMT_국내 + SO_국내 — load_pmt_data()와 같은 형태"""
+        where = None if advance_id is None else {'선수금_ID': [advance_id]}
+        df_pmt = self._db.read_sheet(PMT_DOMESTIC_SHEET, where)
+        df_so = self._db.read_sheet(SO_DOMESTIC_SHEET, self._so_where(df_pmt, advance_id))
+        return _merge_pmt_so(df_pmt, df_so)
+
+    def _db_so_export(self, so_id: str | None = None) -> pd.DataFrame:
+        """SO_해외 — load_so_export_data()와 같은 형태"""
+        return self._db_so_export_where(None if so_id is None else [so_id])
+
+    def _db_so_export_where(self, so_ids: list[Any] | None) -> pd.DataFrame:
+        where = None if so_ids is None else {'SO_ID': so_ids}
+        return _mark_so_export(self._db.read_sheet(SO_EXPORT_SHEET, where))
+
+    def _db_so_export_with_customer(self, so_id: str | None = None) -> pd.DataFrame:
+        """SO_해외 + Customer_해외 — load_so_export_with_customer()와 같은 형태"""
+        where = None if so_id is None else {'SO_ID': [so_id]}
+        df_so = self._db.read_sheet(SO_EXPORT_SHEET, where)
+        df_cust = self._db.read_sheet(
+            CUSTOMER_EXPORT_SHEET, self._customer_where(so_id, df_so),
+        )
+        return _merge_so_customer(df_so, df_cust)
+
+    def _db_dn_export(self, dn_ids: list[str] | None = None,
+                      so_ids: list[str] | None = None) -> pd.DataFrame:
+        """DN_해외 + SO_해외 + Customer_해외 — load_dn_export_data()와 같은 형태
+
+        Args:
+            dn_ids: 조회할 DN_ID (None이면 조건 없음)
+            so_ids: 조회할 SO_ID (None이면 조건 없음)
+        """
+        where = {}
+        if dn_ids is not None:
+            where['DN_ID'] = dn_ids
+        if so_ids is not None:
+            where['SO_ID'] = so_ids
+        key = where or None
+        df_dn = self._db.read_sheet(DN_EXPORT_SHEET, key)
+        df_so = self._db.read_sheet(SO_EXPORT_SHEET, self._so_where(df_dn, key))
+        # 고객코드는 SO 값이 우선이지만, SO에 없으면 DN 값으로 JOIN
+        df_cust = self._db.read_sheet(
+            CUSTOMER_EXPORT_SHEET, self._customer_where(key, df_dn, df_so),
+        )
+        return _merge_dn_export(df_dn, df_so, df_cust)
+
+    def _db_dn_export_by_customer_po(self, customer_po: str) -> pd.DataFrame:
+        """Customer PO 후보 DN_해외 행 (최종 필터는 호출자가 JOIN 결과로 수행)
+
+        JOIN 후 Customer PO는 SO_해외 값이 우선하므로 SO에서 SO_ID를 찾고,
+        SO에 Customer PO 컬럼이 없으면 DN_해외 자체 값으로 찾습니다.
+        """
+        so_cpo_col = resolve_column(self._db.columns(SHEET_TABLES[SO_EXPORT_SHEET]), 'customer_po')
+        if so_cpo_col:
+            df_so = self._db.read_sheet(SO_EXPORT_SHEET, {so_cpo_col: [customer_po]})
+            return self._db_dn_export(so_ids=_ids(df_so['SO_ID']))
+        dn_cpo_col = resolve_column(self._db.columns(SHEET_TABLES[DN_EXPORT_SHEET]), 'customer_po')
+        if dn_cpo_col is None:
+            return self._db_dn_export(dn_ids=[])
+        df_dn = self._db.read_sheet(DN_EXPORT_SHEET, {dn_cpo_col: [customer_po]})
+        return self._db_dn_export(dn_ids=_ids(df_dn['DN_ID']))
+
+    @staticmethod
+    def _so_where(df: pd.DataFrame, key: Any) -> dict[str, list[Any]] | None:
+        """df의 SO_ID에 해당하는 SO 행 조건 (key가 None = 전체 조회면 조건 없음)"""
+        if key is None:
+            return None
+        return {'SO_ID': _ids(df['SO_ID']) if 'SO_ID' in df.columns else []}
+
+    @staticmethod
+    def _customer_where(key: Any, *frames: pd.DataFrame) -> dict[str, list[Any]] | None:
+        """frames의 고객코드에 해당하는 Customer_해외 행 조건 (key가 None이면 조건 없음)"""
+        if key is None:
+            return None
+        codes = []
+        for df in frames:
+            col = resolve_column(df.columns, 'customer_code')
+            if col:
+                codes.extend(df[col])
+        return {'C-code by 해외': _ids(codes)}
+
+    def cache_stats(self) -> dict[str, int]:
+        """워크북 캐시 적중/미스 통계 (프로세스 공용)"""
+        return get_workbook_cache().stats.as_dict()
+
     def get_available_po_ids(self, limit: int = 20) -> list[tuple[str, str]]:
         """사용 가능한 PO_ID 목록 반환
 
@@ -344,9 +716,7 @@ class FinderService:
         if po_col is None:
             return []
 
-        pairs = (df.dropna(subset=[po_col])
-                 .drop_duplicates(subset=po_col, keep='first')
-                 .head(limit))
+        pairs = self._index('po', df).first_rows(po_col, limit)
         return [
             (str(row[po_col]), str(row['Customer name']) if pd.notna(row.get('Customer name')) else '')
             for _, row in pairs.iterrows()
@@ -361,10 +731,7 @@ class FinderService:
         Returns:
             (DN_ID, 고객명) 튜플 목록
         """
-        df = self.load_dn_data()
-        pairs = (df.dropna(subset=['DN_ID'])
-                 .drop_duplicates(subset='DN_ID', keep='first')
-                 .head(limit))
+        pairs = self._index('dn', self.load_dn_data()).first_rows('DN_ID', limit)
         return [
             (str(row['DN_ID']), str(row['Customer name']) if pd.notna(row.get('Customer name')) else '')
             for _, row in pairs.iterrows()
@@ -379,10 +746,7 @@ class FinderService:
         Returns:
             (SO_ID, 고객명) 튜플 목록
         """
-        df = self.load_so_export_data()
-        pairs = (df.dropna(subset=['SO_ID'])
-                 .drop_duplicates(subset='SO_ID', keep='first')
-                 .head(limit))
+        pairs = self._index('so_export', self.load_so_export_data()).first_rows('SO_ID', limit)
         return [
             (str(row['SO_ID']), str(row['Customer name']) if pd.notna(row.get('Customer name')) else '')
             for _, row in pairs.iterrows()
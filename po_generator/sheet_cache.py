@@ -0,0 +1,264 @@
+"""
+시트 디스크 캐시 (sidecar)
+==========================
+
+NOAH_SO_PO_DN.xlsx의 시트 파싱 결과를 워크북 옆 폴더에 바이너리 컬럼 포맷
+(Arrow Feather)으로 저장합니다. 시트 내용 해시가 같으면 openpyxl 파싱 없이
+수 ms 안에 DataFrame을 복원합니다.
+
+- 캐시 키: 시트 XML 파트 + 참조 공유 문자열 + 스타일 해시 (+ dtype, pandas 버전)
+- 빠른 확인: zip 목록의 파트 CRC/크기가 저장 시점과 같으면 해시 계산 생략
+- Feather로 dtype이 보존되지 않는 시트(혼합 타입 컬럼 등)는 pickle로 저장
+- 헤더 컬럼명만 필요한 조회(사양/옵션 필드 등)는 `<시트>.header.json`에 따로 저장
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import shutil
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from po_generator.xlsx_package import XlsxPackage
+
+logger = logging.getLogger(__name__)
+
+# 저장 포맷/규칙이 바뀌면 올려서 기존 캐시를 자동 무효화
+CACHE_FORMAT_VERSION = 1
+
+FORMAT_FEATHER = 'feather'
+FORMAT_PICKLE = 'pickle'
+_EXTENSIONS = {FORMAT_FEATHER: '.feather', FORMAT_PICKLE: '.pkl'}
+_HEADER_SUFFIX = '.header.json'
+
+
+def sheet_cache_dir(workbook_path: Path) -> Path:
+    """워크북 옆 캐시 폴더 (예: .NOAH_SO_PO_DN.sheetcache)"""
+    return workbook_path.parent / f'.{workbook_path.stem}.sheetcache'
+
+
+def _dtype_token(dtype: dict[str, Any] | None) -> str:
+    if not dtype:
+        return ''
+    return ','.join(f'{k}:{getattr(v, "__name__", v)}' for k, v in sorted(dtype.items()))
+
+
+def _key_extra(dtype: dict[str, Any] | None) -> str:
+    """내용 해시에 섞을 파싱 조건"""
+    return f'v{CACHE_FORMAT_VERSION}|pandas={pd.__version__}|dtype={_dtype_token(dtype)}'
+
+
+def _normalize_missing(df: pd.DataFrame) -> pd.DataFrame:
+    """Arrow 복원 시 object 컬럼의 None → NaN (read_excel 결과와 동일하게)"""
+    for col in df.columns[df.dtypes == object]:
+        s = df[col]
+        if s.isna().any():
+            df[col] = s.where(s.notna(), np.nan)
+    return df
+
+
+def _feather_roundtrip_ok(df: pd.DataFrame, path: Path) -> bool:
+    """Feather 저장 후 다시 읽어 원본과 동일한지 확인"""
+    try:
+        back = _normalize_missing(pd.read_feather(path))
+        pd.testing.assert_frame_equal(df, back, check_dtype=True)
+        return True
+    except AssertionError:
+        return False
+
+
+class SheetCache:
+    """워크북 1개에 대한 시트 디스크 캐시
+
+    시트마다 데이터 파일(.feather/.pkl) + 메타 파일(.json)을 둡니다.
+    쓰기는 임시 파일 → os.replace로 원자적으로 처리하여 동시 실행에도 안전합니다.
+    """
+
+    def __init__(self, workbook_path: Path, cache_dir: Path | None = None):
+        self.workbook_path = Path(workbook_path)
+        self.cache_dir = cache_dir or sheet_cache_dir(self.workbook_path)
+
+    def _meta_path(self, sheet_name: str) -> Path:
+        return self.cache_dir / f'{sheet_name}.json'
+
+    def _header_path(self, sheet_name: str) -> Path:
+        return self.cache_dir / f'{sheet_name}{_HEADER_SUFFIX}'
+
+    def _data_path(self, sheet_name: str, fmt: str) -> Path:
+        return self.cache_dir / f'{sheet_name}{_EXTENSIONS[fmt]}'
+
+    def _read_meta(self, sheet_name: str) -> dict | None:
+        try:
+            return json.loads(self._meta_path(sheet_name).read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+
+    def _is_valid(self, meta: dict, pkg: XlsxPackage, sheet_name: str,
+                  dtype: dict[str, Any] | None) -> bool:
+        """메타가 현재 워크북 시트와 일치하는지 (CRC 빠른 확인 → 내용 해시)"""
+        extra = _key_extra(dtype)
+        if meta.get('extra') != extra:
+            return False
+        if meta.get('signature') == pkg.part_signature(sheet_name):
+            return True
+        if meta.get('key') == pkg.content_key(sheet_name, extra):
+            # 내용은 같고 다른 파트만 바뀜 → 다음 확인이 빠르도록 서명 갱신
+            meta['signature'] = pkg.part_signature(sheet_name)
+            self._write_json(self._meta_path(sheet_name), meta)
+            return True
+        return False
+
+    def load(self, pkg: XlsxPackage, sheet_name: str,
+             dtype: dict[str, Any] | None = None,
+             columns: list[str] | None = None) -> pd.DataFrame | None:
+        """캐시된 시트 로드 — 키가 다르거나 캐시가 없으면 None
+
+        Args:
+            pkg: 열린 XlsxPackage
+            sheet_name: 시트명
+            dtype: 파싱 dtype (키의 일부)
+            columns: 읽을 컬럼 (None이면 전체)
+        """
+        meta = self._read_meta(sheet_name)
+        if meta is None or not self._is_valid(meta, pkg, sheet_name, dtype):
+            return None
+
+        fmt = meta.get('format')
+        data_path = self._data_path(sheet_name, fmt) if fmt in _EXTENSIONS else None
+        if data_path is None or not data_path.exists():
+            return None
+        try:
+            if fmt == FORMAT_FEATHER:
+                df = _normalize_missing(pd.read_feather(data_path, columns=columns))
+            else:
+                df = pd.read_pickle(data_path)
+                if columns is not None:
+                    df = df[columns]
+        except Exception as e:
+            logger.warning(f"시트 캐시 읽기 실패 ({sheet_name}): {e}")
+            return None
+        return df
+
+    def store(self, pkg: XlsxPackage, sheet_name: str, df: pd.DataFrame,
+              dtype: dict[str, Any] | None = None) -> str | None:
+        """시트 DataFrame 저장. 사용한 포맷 반환 (실패 시 None)"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        extra = _key_extra(dtype)
+        meta = {
+            'sheet': sheet_name,
+            'extra': extra,
+            'key': pkg.content_key(sheet_name, extra),
+            'signature': pkg.part_signature(sheet_name),
+            'rows': len(df),
+            'columns': len(df.columns),
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+        }
+
+        fmt = FORMAT_FEATHER
+        tmp = self._data_path(sheet_name, fmt).with_suffix(f'.tmp{os.getpid()}')
+        try:
+            df.to_feather(tmp)
+            if not _feather_roundtrip_ok(df, tmp):
+                raise TypeError('dtype 보존 실패')
+        except Exception as e:
+            logger.debug(f"Feather 저장 불가 ({sheet_name}: {e}) → pickle")
+            tmp.unlink(missing_ok=True)
+            fmt = FORMAT_PICKLE
+            try:
+                df.to_pickle(tmp)
+            except Exception as e2:
+                logger.warning(f"시트 캐시 저장 실패 ({sheet_name}): {e2}")
+                tmp.unlink(missing_ok=True)
+                return None
+
+        os.replace(tmp, self._data_path(sheet_name, fmt))
+        other = FORMAT_PICKLE if fmt == FORMAT_FEATHER else FORMAT_FEATHER
+        self._data_path(sheet_name, other).unlink(missing_ok=True)
+
+        meta['format'] = fmt
+        meta['bytes'] = self._data_path(sheet_name, fmt).stat().st_size
+        self._write_json(self._meta_path(sheet_name), meta)
+        logger.debug(f"시트 캐시 저장: {sheet_name} ({fmt}, {len(df)}행)")
+        return fmt
+
+    def _file_stat(self) -> list[int]:
+        st = self.workbook_path.stat()
+        return [st.st_mtime_ns, st.st_size]
+
+    def load_header(self, sheet_name: str) -> list[str] | None:
+        """저장된 헤더 컬럼명 — 워크북이 바뀌었으면 None
+
+        파일 mtime/size가 저장 시점과 같으면 워크북을 열지 않고 반환합니다.
+        다르면 zip 목록에서 시트 파트 서명만 비교하고, 같으면 mtime/size를 갱신합니다.
+        """
+        path = self._header_path(sheet_name)
+        try:
+            meta = json.loads(path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+        if meta.get('version') != CACHE_FORMAT_VERSION or not isinstance(meta.get('columns'), list):
+            return None
+
+        stat = self._file_stat()
+        if meta.get('stat') == stat:
+            return meta['columns']
+        with XlsxPackage(self.workbook_path) as pkg:
+            if meta.get('signature') != pkg.part_signature(sheet_name):
+                return None
+        # 내용은 같고 저장만 다시 됨 → 다음 조회가 워크북을 열지 않도록 갱신
+        meta['stat'] = stat
+        self._write_json(path, meta)
+        return meta['columns']
+
+    def store_header(self, pkg: XlsxPackage, sheet_name: str, columns: list[str]) -> None:
+        """헤더 컬럼명 저장 (워크북 fingerprint와 함께)"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._write_json(self._header_path(sheet_name), {
+            'sheet': sheet_name,
+            'version': CACHE_FORMAT_VERSION,
+            'stat': self._file_stat(),
+            'signature': pkg.part_signature(sheet_name),
+            'columns': list(columns),
+        })
+
+    @staticmethod
+    def _write_json(path: Path, obj: dict) -> None:
+        tmp = path.with_suffix(f'.tmp{os.getpid()}')
+        tmp.write_text(json.dumps(obj, ensure_ascii=False, indent=1), encoding='utf-8')
+        os.replace(tmp, path)
+
+    def entries(self) -> list[dict]:
+        """저장된 캐시 항목 메타 목록"""
+        if not self.cache_dir.exists():
+            return []
+        result = []
+        for meta_path in sorted(self.cache_dir.glob('*.json')):
+            if meta_path.name.endswith(_HEADER_SUFFIX):
+                continue
+            try:
+                result.append(json.loads(meta_path.read_text(encoding='utf-8')))
+            except (OSError, ValueError):
+                continue
+        return result
+
+    def is_fresh(self, pkg: XlsxPackage, meta: dict,
+                 dtype: dict[str, Any] | None = None) -> bool:
+        """캐시 항목이 현재 워크북과 일치하는지"""
+        sheet_name = meta.get('sheet', '')
+        if sheet_name not in pkg.sheet_names:
+            return False
+        return self._is_valid(meta, pkg, sheet_name, dtype)
+
+    def purge(self) -> int:
+        """캐시 폴더 삭제. 삭제한 파일 수 반환"""
+        if not self.cache_dir.exists():
+            return 0
+        count = sum(1 for p in self.cache_dir.iterdir() if p.is_file())
+        shutil.rmtree(self.cache_dir)
+        return count
@@ -27,9 +27,9 @@ WITH
 so_combined AS (
     SELECT
         SO_ID, [Customer name], [Customer PO], [Item name], [OS name],
-        CAST([Line item] AS INTEGER) AS [Line item],
-        CAST([Item qty] AS REAL) AS [Item qty],
-        CAST([Sales amount] AS REAL) AS [Sales amount KRW],
+        [Line item],
+        [Item qty],
+        [Sales amount] AS [Sales amount KRW],
         Period, [AX Period], [Model code], Sector,
         [Business registration number], [Industry code],
         [Expected delivery date], '국내' AS 구분
@@ -39,9 +39,9 @@ so_combined AS (
     UNION ALL
     SELECT
         SO_ID, [Customer name], [Customer PO], [Item name], [OS name],
-        CAST([Line item] AS INTEGER),
-        CAST([Item qty] AS REAL),
-        CAST([Sales amount KRW] AS REAL),
+        [Line item],
+        [Item qty],
+        [Sales amount KRW],
         Period, [AX Period], [Model code], Sector,
         [Business registration number], [Industry code],
         [Expected delivery date], '해외'
@@ -50,17 +50,17 @@ so_combined AS (
       AND Period IS NOT NULL AND TRIM(Period) != ''
 ),
 dn_combined AS (
-    SELECT SO_ID, CAST([Line item] AS INTEGER) AS [Line item],
-        CAST(Qty AS REAL) AS Qty, CAST([Total Sales] AS REAL) AS 출고금액,
+    SELECT SO_ID, [Line item],
+        Qty, [Total Sales] AS 출고금액,
         SUBSTR([출고일], 1, 7) AS 출고월
     FROM dn_domestic
-    WHERE [출고일] IS NOT NULL AND TRIM(COALESCE([출고일], '')) != ''
+    WHERE [출고일] IS NOT NULL
     UNION ALL
-    SELECT SO_ID, CAST([Line item] AS INTEGER),
-        CAST(Qty AS REAL), CAST([Total Sales KRW] AS REAL),
+    SELECT SO_ID, [Line item],
+        Qty, [Total Sales KRW],
         SUBSTR([선적일], 1, 7)
     FROM dn_export
-    WHERE [선적일] IS NOT NULL AND TRIM(COALESCE([선적일], '')) != ''
+    WHERE [선적일] IS NOT NULL
 ),
 dn_by_month AS (
     SELECT SO_ID, [Line item], 출고월,
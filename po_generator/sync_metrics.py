@@ -0,0 +1,198 @@
+"""
+동기화 성능 지표
+================
+
+Excel → SQLite 동기화의 단계별 소요 시간, 프로세스 쓰기 바이트, 피크 메모리를
+표준 라이브러리만으로 측정합니다 (psutil 불필요).
+
+- 단계 시간: time.perf_counter 누적 (phase_timer)
+- 쓰기 바이트: 프로세스 I/O 카운터 — Linux /proc/self/io의 wchar,
+  Windows GetProcessIoCounters의 WriteTransferCount (그 외 OS는 None)
+- 피크 RSS: Unix resource.getrusage, Windows GetProcessMemoryInfo (그 외 None)
+  — 프로세스 수명 전체의 최대값이므로 실행(동기화 1회) 단위는 RunPeakRss로 잽니다
+
+DB 쓰기는 writer 프로세스 하나에서만 일어나므로(워커는 읽기 전용), writer의
+쓰기 바이트 증가량을 DB 쓰기량으로 봅니다 (로그 출력 등이 약간 포함될 수 있음).
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import statistics
+import sys
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+# 시트 단위 단계 (SheetSyncResult.phase_seconds 키) — 표시 순서
+PHASE_PARSE = 'parse'       # Excel 파싱
+PHASE_DIFF = 'diff'         # DB 비교 (신규/수정/삭제 판정)
+PHASE_WRITE = 'write'       # 테이블 마이그레이션/생성 + INSERT/UPDATE
+PHASE_PRUNE = 'prune'       # Excel에서 제거된 행 삭제
+PHASE_INDEX = 'index'       # 보조 인덱스 생성/정리
+PHASE_BLOCKS = 'blocks'     # 행 블록 해시 (변경 행 범위)
+SHEET_PHASES = (PHASE_PARSE, PHASE_DIFF, PHASE_WRITE, PHASE_PRUNE, PHASE_INDEX, PHASE_BLOCKS)
+
+# 실행 단위 단계 (SyncSummary.phase_seconds 키)
+PHASE_FINGERPRINT = 'fingerprint'   # 시트 지문 계산/비교
+PHASE_WEIGHT = 'weight'             # po_line_weight 계산
+PHASE_COMMIT = 'commit'             # COMMIT/ROLLBACK
+PHASE_LOG = 'log'                   # _sync_log 기록 (반영 중 스트리밍 — write/prune에서 제외)
+RUN_PHASES = (PHASE_FINGERPRINT, PHASE_WEIGHT, PHASE_COMMIT, PHASE_LOG)
+
+# 처리 속도 하락 표시 기준 — 행/초가 직전 실행들 중앙값의 1/1.5 미만
+SLOWDOWN_RATIO = 1.5
+SLOWDOWN_MIN_HISTORY = 3    # 비교에 필요한 직전 실행 수
+SLOWDOWN_WINDOW = 10        # 비교에 쓰는 최대 직전 실행 수
+
+
+@contextmanager
+def phase_timer(phases: dict[str, float], name: str) -> Iterator[None]:
+    """with 블록 소요 시간을 phases[name]에 누적 (예외가 나도 기록)"""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        phases[name] = phases.get(name, 0.0) + time.perf_counter() - started
+
+
+def io_write_bytes() -> int | None:
+    """현재 프로세스가 지금까지 write한 바이트 수 (측정 불가면 None)"""
+    if sys.platform == 'win32':
+        return _win_io_write_bytes()
+    try:
+        with open('/proc/self/io', encoding='ascii') as f:
+            for line in f:
+                if line.startswith('wchar:'):
+                    return int(line.split()[1])
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def peak_rss_bytes() -> int | None:
+    """현재 프로세스의 피크 상주 메모리 (바이트, 측정 불가면 None)"""
+    if sys.platform == 'win32':
+        return _win_peak_rss_bytes()
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 바이트
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def reset_peak_rss() -> bool:
+    """프로세스 피크 RSS 카운터를 현재 RSS로 재설정 (Linux /proc/self/clear_refs) — 성공하면 True"""
+    if not sys.platform.startswith('linux'):
+        return False
+    try:
+        with open('/proc/self/clear_refs', 'w', encoding='ascii') as f:
+            f.write('5')
+    except OSError:
+        return False
+    return True
+
+
+class RunPeakRss:
+    """실행 한 번의 피크 메모리
+
+    peak_rss_bytes()는 프로세스 수명 전체 최대값이라 --watch처럼 한 프로세스에서
+    동기화를 반복하면 줄지 않습니다. Linux는 시작할 때 카운터를 재설정해 이번 실행의
+    피크를 재고, 재설정할 수 없는 OS는 이번 실행 중 피크가 갱신된 경우에만 값을
+    냅니다 (갱신되지 않았으면 이전 실행의 피크라 None).
+    """
+
+    def __init__(self) -> None:
+        self._reset = reset_peak_rss()
+        self._before = None if self._reset else peak_rss_bytes()
+
+    def peak(self) -> int | None:
+        """시작 이후 피크 RSS (바이트, 알 수 없으면 None)"""
+        peak = peak_rss_bytes()
+        if peak is None or self._reset:
+            return peak
+        return peak if self._before is None or peak > self._before else None
+
+
+def _win_io_write_bytes() -> int | None:
+    import ctypes
+    from ctypes import wintypes
+
+    class IO_COUNTERS(ctypes.Structure):
+        _fields_ = [(name, ctypes.c_ulonglong) for name in (
+            'ReadOperationCount', 'WriteOperationCount', 'OtherOperationCount',
+            'ReadTransferCount', 'WriteTransferCount', 'OtherTransferCount',
+        )]
+
+    kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    kernel32.GetCurrentProcess.restype = wintypes.HANDLE
+    kernel32.GetProcessIoCounters.argtypes = [wintypes.HANDLE, ctypes.POINTER(IO_COUNTERS)]
+    kernel32.GetProcessIoCounters.restype = wintypes.BOOL
+    counters = IO_COUNTERS()
+    if not kernel32.GetProcessIoCounters(kernel32.GetCurrentProcess(), ctypes.byref(counters)):
+        return None
+    return counters.WriteTransferCount
+
+
+def _win_peak_rss_bytes() -> int | None:
+    import ctypes
+    from ctypes import wintypes
+
+    class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+        _fields_ = [('cb', wintypes.DWORD), ('PageFaultCount', wintypes.DWORD)] + [
+            (name, ctypes.c_size_t) for name in (
+                'PeakWorkingSetSize', 'WorkingSetSize',
+                'QuotaPeakPagedPoolUsage', 'QuotaPagedPoolUsage',
+                'QuotaPeakNonPagedPoolUsage', 'QuotaNonPagedPoolUsage',
+                'PagefileUsage', 'PeakPagefileUsage',
+            )
+        ]
+
+    kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    psapi = ctypes.WinDLL('psapi', use_last_error=True)
+    kernel32.GetCurrentProcess.restype = wintypes.HANDLE
+    psapi.GetProcessMemoryInfo.argtypes = [
+        wintypes.HANDLE, ctypes.POINTER(PROCESS_MEMORY_COUNTERS), wintypes.DWORD,
+    ]
+    psapi.GetProcessMemoryInfo.restype = wintypes.BOOL
+    counters = PROCESS_MEMORY_COUNTERS()
+    counters.cb = ctypes.sizeof(counters)
+    if not psapi.GetProcessMemoryInfo(kernel32.GetCurrentProcess(),
+                                      ctypes.byref(counters), counters.cb):
+        return None
+    return counters.PeakWorkingSetSize
+
+
+def rows_per_second(rows: int, seconds: float) -> float:
+    """처리 속도 (행/초) — 시간이 0이면 0"""
+    return rows / seconds if seconds > 0 else 0.0
+
+
+def phase_totals(phases_json: str | None) -> dict[str, float]:
+    """_sync_runs.phases_json → 단계별 합계 (시트 단계는 전 시트 합 + 실행 단계)"""
+    if not phases_json:
+        return {}
+    data = json.loads(phases_json)
+    totals: dict[str, float] = dict(data.get('run', {}))
+    for sheet in data.get('sheets', {}).values():
+        for name, seconds in sheet.items():
+            if name != 'rows':
+                totals[name] = totals.get(name, 0.0) + seconds
+    return totals
+
+
+def is_slowdown(rate: float | None, earlier_rates: list[float]) -> bool:
+    """처리 속도가 직전 실행들(행을 처리한 실행만) 중앙값보다 크게 떨어졌는지
+
+    Args:
+        rate: 이번 실행 행/초
+        earlier_rates: 직전 실행들의 행/초 (최근 SLOWDOWN_WINDOW개를 넘기면 호출 측에서 자름)
+    """
+    if rate is None or len(earlier_rates) < SLOWDOWN_MIN_HISTORY:
+        return False
+    return rate * SLOWDOWN_RATIO < statistics.median(earlier_rates)
@@ -0,0 +1,131 @@
+"""
+워크북 변경 감시 (폴링)
+=======================
+
+`sync_db.py --watch`용 변경 감지기. OS별 파일 알림 API 없이 워크북의
+(mtime, size)를 주기적으로 폴링하고, 연속 저장(burst)이 잦아들 때까지
+기다린 뒤(debounce) 한 번만 동기화를 트리거합니다.
+
+- 파일이 잠시 사라지거나(임시 파일로 저장 후 교체) 잠겨 있으면 대기
+- zip 중앙 디렉터리를 열 수 없는 상태(저장 중)면 다음 폴링에서 재확인
+- 상태는 마지막 동기화 (mtime, size)와 대기 중인 변경 하나만 보관 — 주기
+  수와 무관하게 메모리 일정
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+import zipfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+# 기본 폴링 주기 / 안정 대기 시간 (초)
+DEFAULT_POLL_SECONDS = 2.0
+DEFAULT_DEBOUNCE_SECONDS = 3.0
+
+
+@dataclass(frozen=True)
+class FileState:
+    """워크북 파일 상태 — 변경 비교용 (mtime ns, 크기)"""
+    mtime_ns: int
+    size: int
+
+
+def file_state(path: Path) -> FileState | None:
+    """파일 상태 조회 (없거나 접근 불가면 None)"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return FileState(st.st_mtime_ns, st.st_size)
+
+
+def is_readable_workbook(path: Path) -> bool:
+    """저장이 끝나 읽을 수 있는 xlsx인지 확인
+
+    zip 중앙 디렉터리(파일 끝)까지 쓰여 있어야 열리므로 저장 중인 파일,
+    다른 프로세스가 배타적으로 잠근 파일은 False.
+    """
+    try:
+        with zipfile.ZipFile(path):
+            return True
+    except (OSError, zipfile.BadZipFile):
+        return False
+
+
+class WorkbookWatcher:
+    """워크북 변경 감지 + debounce
+
+    poll()은 대기 없이 한 번 확인하고, wait()는 동기화할 변경이 생길 때까지
+    폴링합니다. 동기화를 마치면 mark_synced()로 그 시점 상태를 기록해야
+    같은 변경으로 다시 트리거되지 않습니다.
+
+    Args:
+        path: 감시할 워크북 경로
+        poll_interval: 폴링 주기 (초)
+        debounce: 마지막 변경 후 이 시간 동안 상태가 그대로여야 트리거 (초)
+        clock: 단조 시계 (테스트용)
+        sleep: 대기 함수 (테스트용)
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        poll_interval: float = DEFAULT_POLL_SECONDS,
+        debounce: float = DEFAULT_DEBOUNCE_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if poll_interval <= 0 or debounce < 0:
+            raise ValueError(f"잘못된 폴링 설정: interval={poll_interval}, debounce={debounce}")
+        self.path = Path(path)
+        self.poll_interval = poll_interval
+        self.debounce = debounce
+        self._clock = clock
+        self._sleep = sleep
+        self._synced: FileState | None = None
+        self._pending: FileState | None = None
+        self._pending_since = 0.0
+
+    def poll(self) -> FileState | None:
+        """한 번 확인 — 동기화할 안정된 변경이 있으면 그 상태, 없으면 None"""
+        state = file_state(self.path)
+        if state is None or state == self._synced:
+            # 없음(저장 중 교체/삭제) 또는 동기화 이후 그대로
+            self._pending = None
+            return None
+
+        now = self._clock()
+        if state != self._pending:
+            # 새 변경 (또는 burst 중 추가 저장) → 안정 대기 다시 시작
+            self._pending = state
+            self._pending_since = now
+            return None
+        if now - self._pending_since < self.debounce:
+            return None
+        if not is_readable_workbook(self.path):
+            logger.debug("워크북 저장 중/잠김 — 다음 폴링에서 재확인: %s", self.path.name)
+            return None
+        return state
+
+    def wait(self) -> FileState:
+        """동기화할 변경이 생길 때까지 폴링 (KeyboardInterrupt로 중단)"""
+        while True:
+            state = self.poll()
+            if state is not None:
+                return state
+            self._sleep(self.poll_interval)
+
+    def mark_synced(self, state: FileState) -> None:
+        """state 시점까지 동기화 완료 — 이후 state와 다른 변경만 트리거"""
+        self._synced = state
+        self._pending = None
+
+    def retry_later(self) -> None:
+        """동기화 실패(파일 잠김 등) — 대기 중 변경을 debounce부터 다시 확인"""
+        self._pending = None
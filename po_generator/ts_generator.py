@@ -25,7 +25,7 @@ from po_generator.config import (
     ITEM_START_ROW_FALLBACK,
     VAT_RATE_DOMESTIC,
 )
-from po_generator.utils import get_value
+from po_generator.utils import compile_records, get_value
 from po_generator.excel_helpers import (
     XlConstants,
     xlwings_app_context,
@@ -280,9 +280,9 @@ def _fill_items_batch(
     total_tax = 0
     default_date_str = f"{dispatch_date.month}월 {dispatch_date.day}일"
 
-    for item_idx, (_, item) in enumerate(items_df.iterrows()):
+    for item_idx, item in enumerate(compile_records(items_df)):
         # 아이템별 출고일 (없으면 기본 출고일 사용)
-        item_date = item.get('출고일', None)
+        item_date = get_value(item, '출고일', None)
         if item_date is not None and pd.notna(item_date):
             try:
                 if not isinstance(item_date, (datetime, pd.Timestamp)):
@@ -9,6 +9,12 @@ from __future__ import annotations
 
 import logging
 import re
+import threading
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Any
 
 import pandas as pd
@@ -33,7 +39,11 @@ from po_generator.config import (
     OPTION_FIELDS,
     WEIGHT_OPTION_SUFFIX,
     WEIGHT_OPTION_PRIORITY,
+    SHEET_CACHE_ENABLED,
 )
+from po_generator.excel_reader import ExcelReader, read_sheets
+from po_generator.sheet_cache import SheetCache
+from po_generator.xlsx_package import XlsxPackage
 
 logger = logging.getLogger(__name__)
 
@@ -93,30 +103,82 @@ get_safe_value = _get_safe_value
 
 
 _RESOLVE_SENTINEL = object()
-_resolve_cache: dict[tuple[int, str], str | None] = {}
 
+# 컬럼 스키마 레지스트리 최대 크기 (LRU) — 장시간 실행(대시보드, 일괄 생성)에도 메모리 일정
+_SCHEMA_CACHE_SIZE = 256
 
-def resolve_column(
-    columns: pd.Index | list[str],
-    key: str,
-) -> str | None:
-    """별칭에서 실제 컬럼명 찾기
 
-    Args:
-        columns: DataFrame의 컬럼 목록 (df.columns)
-        key: 내부 키 (예: 'customer_name') 또는 실제 컬럼명
+class _ColumnSchema:
+    """컬럼 구성 1개에 대한 별칭 해석 테이블
 
-    Returns:
-        실제 컬럼명 또는 None (찾지 못한 경우)
+    같은 컬럼 구성을 가진 DataFrame/Series는 모두 이 테이블 하나를 공유하며,
+    키별 해석 결과를 기억하므로 반복 조회는 dict 조회 1회입니다.
+    해석 규칙은 _find_column과 같습니다 (실제 컬럼명 → 별칭 → 대소문자 무시).
     """
-    cache_key = (id(columns), key)
-    cached = _resolve_cache.get(cache_key, _RESOLVE_SENTINEL)
-    if cached is not _RESOLVE_SENTINEL:
-        return cached
 
+    __slots__ = ('_exact', '_lower', '_resolved')
+
+    def __init__(self, columns: tuple) -> None:
+        self._exact = frozenset(columns)
+        self._lower: dict[str, str] = {}
+        for col in columns:
+            if isinstance(col, str):
+                self._lower.setdefault(col.lower(), col)
+        self._resolved: dict[str, str | None] = {}
+
+    def resolve(self, key: str) -> str | None:
+        resolved = self._resolved.get(key, _RESOLVE_SENTINEL)
+        if resolved is _RESOLVE_SENTINEL:
+            resolved = self._find(key)
+            self._resolved[key] = resolved
+        return resolved
+
+    def _find(self, key: str) -> str | None:
+        if key in self._exact:
+            return key
+        for alias in COLUMN_ALIASES.get(key, ()):
+            if alias in self._exact:
+                return alias
+        return self._lower.get(key.lower())
+
+
+# 컬럼 튜플 → 스키마 (LRU)
+_schemas: OrderedDict[tuple, _ColumnSchema] = OrderedDict()
+# pd.Index 객체 → 스키마 (Index는 불변이므로 객체 단위로 재사용, Index가 사라지면 함께 제거)
+_index_schemas: dict[int, tuple[weakref.ref, _ColumnSchema]] = {}
+
+
+def _column_schema(columns: pd.Index | list[str]) -> _ColumnSchema:
+    """컬럼 목록의 해석 테이블 (같은 컬럼 구성이면 같은 객체)"""
+    entry = _index_schemas.get(id(columns))
+    if entry is not None and entry[0]() is columns:
+        return entry[1]
+
+    key = tuple(columns)
+    schema = _schemas.get(key)
+    if schema is None:
+        schema = _ColumnSchema(key)
+        _schemas[key] = schema
+        while len(_schemas) > _SCHEMA_CACHE_SIZE:
+            _schemas.popitem(last=False)
+    else:
+        _schemas.move_to_end(key)
+
+    if isinstance(columns, pd.Index):
+        index_id = id(columns)
+
+        def _forget(ref: weakref.ref) -> None:
+            if _index_schemas.get(index_id, (None,))[0] is ref:
+                del _index_schemas[index_id]
+
+        _index_schemas[index_id] = (weakref.ref(columns, _forget), schema)
+    return schema
+
+
+def _find_column(columns: pd.Index | list[str], key: str) -> str | None:
+    """별칭에서 실제 컬럼명 찾기 (캐시 없음)"""
     # 1. key가 이미 실제 컬럼명인 경우
     if key in columns:
-        _resolve_cache[cache_key] = key
         return key
 
     # 2. key가 내부 키인 경우, 별칭에서 찾기
@@ -124,22 +186,37 @@ def resolve_column(
     if aliases:
         for alias in aliases:
             if alias in columns:
-                _resolve_cache[cache_key] = alias
                 return alias
 
     # 3. 대소문자 무시 검색 (fallback)
     key_lower = key.lower()
     for col in columns:
         if col.lower() == key_lower:
-            _resolve_cache[cache_key] = col
             return col
 
-    _resolve_cache[cache_key] = None
     return None
 
 
+def resolve_column(
+    columns: pd.Index | list[str],
+    key: str,
+) -> str | None:
+    """별칭에서 실제 컬럼명 찾기
+
+    결과는 컬럼 구성(튜플)별 해석 테이블에 캐시됩니다 (LRU, 최대 _SCHEMA_CACHE_SIZE개).
+
+    Args:
+        columns: DataFrame의 컬럼 목록 (df.columns)
+        key: 내부 키 (예: 'customer_name') 또는 실제 컬럼명
+
+    Returns:
+        실제 컬럼명 또는 None (찾지 못한 경우)
+    """
+    return _column_schema(columns).resolve(key)
+
+
 def get_value(
-    order_data: pd.Series,
+    order_data: pd.Series | ItemRecord,
     key: str,
     default: Any = '',
 ) -> Any:
@@ -149,13 +226,16 @@ def get_value(
     외부에서 데이터에 접근할 때는 이 함수를 사용하세요.
 
     Args:
-        order_data: 주문 데이터 Series
+        order_data: 주문 데이터 Series (또는 compile_records()의 ItemRecord)
         key: 내부 키 (예: 'customer_name') 또는 실제 컬럼명
         default: 기본값 (값이 없거나 NaN인 경우)
 
     Returns:
         해당 키의 값 또는 기본값
     """
+    if isinstance(order_data, ItemRecord):
+        return order_data.get(key, default)
+
     # 실제 컬럼명 찾기
     actual_col = resolve_column(order_data.index, key)
 
@@ -165,8 +245,583 @@ def get_value(
     return _get_safe_value(order_data, actual_col, default)
 
 
+# 컴파일된 컬럼에서 값이 없는(None/NaN/'nan') 칸
+_MISSING = object()
+
+
+def _is_missing(value: Any) -> bool:
+    """_get_safe_value가 기본값으로 바꾸는 값인지"""
+    if value is None:
+        return True
+    if isinstance(value, str):
+        return value.strip().lower() == 'nan'
+    try:
+        return bool(pd.isna(value))
+    except (TypeError, ValueError):
+        return False
+
+
+class _CompiledColumns:
+    """DataFrame 컬럼별 값 목록 (빈 값 정규화 완료) — 같은 프레임의 ItemRecord가 공유
+
+    키(내부 키/실제 컬럼명)별로 처음 조회할 때 컬럼 1개만 변환합니다.
+    """
+
+    __slots__ = ('_df', '_schema', '_by_key')
+
+    def __init__(self, df: pd.DataFrame) -> None:
+        self._df = df
+        self._schema = _column_schema(df.columns)
+        self._by_key: dict[str, list[Any] | None] = {}
+
+    def values(self, key: str) -> list[Any] | None:
+        values = self._by_key.get(key, _RESOLVE_SENTINEL)
+        if values is _RESOLVE_SENTINEL:
+            col = self._schema.resolve(key)
+            values = None if col is None else self._compile(col)
+            self._by_key[key] = values
+        return values
+
+    def _compile(self, col: str) -> list[Any]:
+        series = self._df[col]
+        if isinstance(series, pd.DataFrame):  # 중복 컬럼명 → 첫 컬럼
+            series = series.iloc[:, 0]
+        return [_MISSING if _is_missing(v) else v for v in series.tolist()]
+
+
+class ItemRecord:
+    """컴파일된 아이템 행 — get_value(item, key, default)와 같은 결과를 dict 조회로 반환
+
+    compile_records()로 생성합니다. get_value()에 Series 대신 넘겨도 됩니다.
+    """
+
+    __slots__ = ('_columns', '_pos')
+
+    def __init__(self, columns: _CompiledColumns, pos: int) -> None:
+        self._columns = columns
+        self._pos = pos
+
+    def get(self, key: str, default: Any = '') -> Any:
+        """내부 키 또는 실제 컬럼명으로 값 조회 (없거나 NaN이면 default)"""
+        values = self._columns.values(key)
+        if values is None:
+            return default
+        value = values[self._pos]
+        return default if value is _MISSING else value
+
+
+def compile_records(df: pd.DataFrame) -> list[ItemRecord]:
+    """아이템 DataFrame → 행 레코드 목록 (iterrows + get_value 대체)
+
+    컬럼 해석(별칭)과 NaN 정규화를 컬럼 단위로 한 번만 수행하므로,
+    행마다 여러 필드를 읽는 문서 생성 루프에서 iterrows()보다 빠릅니다.
+    datetime64 값은 iterrows()와 같이 pd.Timestamp입니다.
+
+    Args:
+        df: 아이템 DataFrame
+
+    Returns:
+        ItemRecord 목록 (행 순서)
+    """
+    columns = _CompiledColumns(df)
+    return [ItemRecord(columns, pos) for pos in range(len(df))]
+
+
+# === 워크북 시트 캐시 (프로세스 단위) ===
+
+# 시트별 고정 dtype — 같은 시트는 어느 로더에서 읽든 동일한 형태로 한 번만 파싱
+# Model 계열 컬럼은 문자열로 읽어 앞 0 보존 (예: '006')
+SHEET_DTYPES: dict[str, dict[str, type]] = {
+    SO_EXPORT_SHEET: {'Model': str, 'Model number': str, 'Model code': str},
+    PO_EXPORT_SHEET: {'Model': str},
+}
+
+
+@dataclass
+class WorkbookCacheStats:
+    """워크북 캐시 적중 통계
+
+    hits: 메모리 적중, disk_hits: 디스크 캐시(sidecar) 적중, misses: Excel 파싱
+    projected: misses 중 컬럼 매니페스트로 일부 컬럼만 파싱한 횟수
+    view_hits / view_builds: JOIN 뷰(get_view) 재사용 / 생성 횟수
+    """
+    hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+    projected: int = 0
+    view_hits: int = 0
+    view_builds: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return {
+            'hits': self.hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'invalidations': self.invalidations,
+            'projected': self.projected,
+            'view_hits': self.view_hits,
+            'view_builds': self.view_builds,
+        }
+
+
+@dataclass
+class _CachedWorkbook:
+    """파일 1개의 파싱 결과 (fingerprint 기준)
+
+    parsed[시트]: 파싱된 컬럼 집합 (None이면 전체 컬럼)
+    headers[시트]: 헤더 행 컬럼명 (매니페스트 해석용)
+    views[이름]: 시트들로 만든 JOIN 뷰 (get_view)
+    """
+    fingerprint: tuple[int, int]
+    sheet_names: list[str] | None = None
+    frames: dict[str, pd.DataFrame] = field(default_factory=dict)
+    parsed: dict[str, frozenset[str] | None] = field(default_factory=dict)
+    headers: dict[str, list[str]] = field(default_factory=dict)
+    views: dict[str, pd.DataFrame] = field(default_factory=dict)
+
+    def covers(self, sheet_name: str, columns: list[str] | None) -> bool:
+        """캐시된 프레임이 요청 컬럼을 모두 포함하는지"""
+        if sheet_name not in self.frames:
+            return False
+        parsed = self.parsed.get(sheet_name)
+        if parsed is None:
+            return True
+        return columns is not None and parsed.issuperset(columns)
+
+
+def _resolve_manifest(header: list[str], manifest: Sequence[str]) -> list[str]:
+    """컬럼 매니페스트(내부 키 또는 실제 컬럼명) → 시트의 실제 컬럼명 (시트 순서)
+
+    COLUMN_ALIASES로 해석하며, 시트에 없는 항목은 제외합니다.
+    """
+    wanted = {_find_column(header, key) for key in manifest}
+    return [c for c in header if c in wanted]
+
+
+class WorkbookCache:
+    """Excel 시트 파싱 결과 캐시
+
+    시트는 프로세스당 최대 한 번만 파싱하고, 파일의 mtime/size가 바뀌면
+    해당 파일의 캐시 전체를 무효화합니다. 호출자는 항상 복사본을 받으므로
+    반환된 DataFrame을 수정해도 캐시는 오염되지 않습니다.
+
+    메모리에 없는 시트는 디스크 캐시(SheetCache)를 먼저 확인하고,
+    거기에도 없을 때만 Excel을 파싱한 뒤 디스크 캐시에 저장합니다.
+
+    컬럼 매니페스트를 지정하면 해당 컬럼만 파싱합니다 (디스크 캐시는
+    Feather 컬럼 단위 읽기, Excel은 해당 열의 셀만 파싱). 같은 시트를
+    나중에 더 많은 컬럼으로 요청하면 합집합으로 다시 파싱합니다.
+
+    시트를 JOIN한 결과(뷰)도 get_view로 같은 fingerprint 아래 보관하므로,
+    파일이 바뀌지 않는 한 같은 JOIN을 프로세스에서 한 번만 계산합니다.
+
+    FinderService의 백그라운드 prewarm 스레드와 함께 쓰이므로 조회는 락으로
+    직렬화합니다 (같은 시트를 두 스레드가 중복 파싱하지 않음).
+    """
+
+    def __init__(self, disk_cache: bool = SHEET_CACHE_ENABLED) -> None:
+        self._books: dict[Path, _CachedWorkbook] = {}
+        self.stats = WorkbookCacheStats()
+        self.disk_cache = disk_cache
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def _fingerprint(path: Path) -> tuple[int, int]:
+        st = path.stat()
+        return st.st_mtime_ns, st.st_size
+
+    def _book(self, path: Path) -> _CachedWorkbook:
+        """fingerprint 확인 후 파일별 캐시 반환 (변경 시 무효화)"""
+        key = path.resolve()
+        fingerprint = self._fingerprint(path)
+        book = self._books.get(key)
+        if book is not None and book.fingerprint != fingerprint:
+            logger.info(f"워크북 변경 감지, 캐시 무효화: {path.name}")
+            self.stats.invalidations += 1
+            book = None
+        if book is None:
+            book = _CachedWorkbook(fingerprint=fingerprint)
+            self._books[key] = book
+        return book
+
+    def sheet_names(self, path: Path) -> list[str]:
+        """시트명 목록 (캐시)"""
+        with self._lock:
+            book = self._book(path)
+            if book.sheet_names is None:
+                try:
+                    with XlsxPackage(path) as pkg:
+                        book.sheet_names = pkg.sheet_names
+                except Exception:
+                    with ExcelReader(path) as reader:
+                        book.sheet_names = reader.sheet_names
+            return list(book.sheet_names)
+
+    def _header(self, path: Path, book: _CachedWorkbook, sheet_name: str) -> list[str] | None:
+        """시트 헤더 컬럼명 (캐시). 읽을 수 없으면 None"""
+        if sheet_name not in book.headers:
+            if book.parsed.get(sheet_name, False) is None:
+                book.headers[sheet_name] = [
+                    c for c in book.frames[sheet_name].columns if isinstance(c, str)
+                ]
+            else:
+                try:
+                    with XlsxPackage(path) as pkg:
+                        header = [c for c in pkg.header_row(sheet_name) if c is not None]
+                except Exception as e:
+                    logger.debug(f"헤더 읽기 실패 ({path.name}[{sheet_name}]): {e}")
+                    return None
+                if not header:
+                    return None
+                book.headers[sheet_name] = header
+        return book.headers[sheet_name]
+
+    def get_sheets(
+        self,
+        path: Path,
+        sheet_names: list[str],
+        columns: dict[str, Sequence[str]] | None = None,
+    ) -> dict[str, pd.DataFrame]:
+        """여러 시트를 한 번에 로드 — 캐시에 없는 시트만 파일 1회 오픈으로 파싱
+
+        Args:
+            path: Excel 파일 경로
+            sheet_names: 시트명 목록
+            columns: {시트명: 컬럼 매니페스트} — 지정한 시트는 해당 컬럼만
+                로드 (내부 키/실제 컬럼명, COLUMN_ALIASES로 해석)
+
+        Returns:
+            {시트명: DataFrame 복사본}
+        """
+        with self._lock:
+            book = self._book(path)
+            wanted: dict[str, list[str] | None] = {}
+            for name in sheet_names:
+                manifest = (columns or {}).get(name)
+                header = self._header(path, book, name) if manifest is not None else None
+                wanted[name] = None if header is None else _resolve_manifest(header, manifest)
+
+            missing = {name: cols for name, cols in wanted.items() if not book.covers(name, cols)}
+            self.stats.hits += len(sheet_names) - len(missing)
+
+            if missing:
+                self._load_missing(path, book, missing)
+            logger.debug(
+                f"워크북 캐시: 적중 {self.stats.hits} / 미스 {self.stats.misses} "
+                f"/ 무효화 {self.stats.invalidations}"
+            )
+
+            return {
+                name: (book.frames[name] if cols is None else book.frames[name][cols]).copy()
+                for name, cols in wanted.items()
+            }
+
+    def _load_missing(self, path: Path, book: _CachedWorkbook,
+                      requests: dict[str, list[str] | None]) -> None:
+        """메모리에 없는 시트 로드 — 디스크 캐시 → Excel 파싱 순
+
+        Args:
+            requests: {시트명: 컬럼 목록 (None이면 전체)}
+        """
+        # 일부 컬럼만 캐시된 시트는 기존 컬럼과 합쳐서 다시 로드
+        for name, cols in requests.items():
+            parsed = book.parsed.get(name)
+            if cols is not None and name in book.frames and parsed is not None:
+                merged = parsed.union(cols)
+                requests[name] = [c for c in book.headers[name] if c in merged]
+
+        sidecar: SheetCache | None = None
+        pkg: XlsxPackage | None = None
+        if self.disk_cache:
+            try:
+                pkg = XlsxPackage(path)
+                sidecar = SheetCache(path)
+            except Exception as e:
+                logger.debug(f"디스크 캐시 사용 불가 ({path.name}): {e}")
+
+        try:
+            to_parse: dict[str, list[str] | None] = {}
+            for name, cols in requests.items():
+                df = None
+                if sidecar is not None:
+                    try:
+                        df = sidecar.load(pkg, name, SHEET_DTYPES.get(name), columns=cols)
+                    except Exception as e:
+                        logger.debug(f"디스크 캐시 조회 실패 ({name}): {e}")
+                if df is None:
+                    to_parse[name] = cols
+                else:
+                    self._put(book, name, df, cols)
+                    self.stats.disk_hits += 1
+                    logger.debug(f"디스크 캐시 적중: {path.name}[{name}] ({len(df)}행)")
+
+            if not to_parse:
+                return
+            self.stats.misses += len(to_parse)
+            # 시트가 여러 개면 프로세스 풀에서 병렬 파싱
+            frames = read_sheets(path, {
+                name: {'dtype': SHEET_DTYPES.get(name), 'columns': cols}
+                for name, cols in to_parse.items()
+            })
+            for name, cols in to_parse.items():
+                df = frames[name]
+                self._put(book, name, df, cols)
+                if cols is not None:
+                    self.stats.projected += 1
+                    logger.debug(
+                        f"시트 파싱: {path.name}[{name}] ({len(df)}행, "
+                        f"{len(df.columns)}/{len(book.headers[name])}열)"
+                    )
+                    continue
+                logger.debug(f"시트 파싱: {path.name}[{name}] ({len(df)}행)")
+                # 디스크 캐시는 전체 컬럼 시트만 저장
+                if sidecar is not None:
+                    try:
+                        sidecar.store(pkg, name, df, SHEET_DTYPES.get(name))
+                    except Exception as e:
+                        logger.warning(f"디스크 캐시 저장 실패 ({name}): {e}")
+        finally:
+            if pkg is not None:
+                pkg.close()
+
+    @staticmethod
+    def _put(book: _CachedWorkbook, name: str, df: pd.DataFrame,
+             cols: list[str] | None) -> None:
+        book.frames[name] = df
+        book.parsed[name] = None if cols is None else frozenset(cols)
+        if cols is None:
+            book.headers[name] = [c for c in df.columns if isinstance(c, str)]
+
+    def get_sheet(self, path: Path, sheet_name: str,
+                  columns: Sequence[str] | None = None) -> pd.DataFrame:
+        """단일 시트 로드 (캐시)"""
+        manifest = None if columns is None else {sheet_name: columns}
+        return self.get_sheets(path, [sheet_name], manifest)[sheet_name]
+
+    def get_view(self, path: Path, name: str,
+                 build: Callable[[], pd.DataFrame]) -> pd.DataFrame:
+        """파일의 현재 버전에 대한 JOIN 뷰 (없으면 build()로 만들어 보관)
+
+        Args:
+            path: Excel 파일 경로 (fingerprint가 바뀌면 시트와 함께 무효화)
+            name: 뷰 이름 (JOIN_VIEWS 참조)
+            build: 뷰 생성 함수 (이 캐시의 시트 조회를 사용)
+
+        Returns:
+            뷰 DataFrame 복사본
+        """
+        with self._lock:
+            book = self._book(path)
+            view = book.views.get(name)
+            if view is None:
+                view = build()
+                book.views[name] = view
+                self.stats.view_builds += 1
+            else:
+                self.stats.view_hits += 1
+            return view.copy()
+
+    def clear(self) -> None:
+        """캐시 비우기 (통계는 유지)"""
+        with self._lock:
+            self._books.clear()
+
+
+_workbook_cache = WorkbookCache()
+
+
+def get_workbook_cache() -> WorkbookCache:
+    """프로세스 공용 WorkbookCache 인스턴스"""
+    return _workbook_cache
+
+
+def workbook_cache_stats() -> dict[str, int]:
+    """워크북 캐시 적중/미스 통계"""
+    return _workbook_cache.stats.as_dict()
+
+
+def _read_sheets(
+    *sheet_names: str,
+    columns: dict[str, Sequence[str]] | None = None,
+) -> list[pd.DataFrame]:
+    """NOAH_SO_PO_DN.xlsx 시트들을 워크북 캐시를 거쳐 로드 (인자 순서대로 반환)
+
+    Args:
+        *sheet_names: 시트명
+        columns: {시트명: 컬럼 매니페스트} — 지정한 시트는 해당 컬럼만 파싱
+    """
+    frames = _workbook_cache.get_sheets(NOAH_SO_PO_DN_FILE, list(sheet_names), columns)
+    return [frames[name] for name in sheet_names]
+
+
+# === 로더별 컬럼 매니페스트 ===
+# 조인 상대로만 읽는 시트는 로더가 실제로 쓰는 컬럼만 파싱합니다.
+# 항목은 실제 컬럼명 또는 COLUMN_ALIASES 내부 키이며 시트 헤더 기준으로 해석됩니다.
+
+# PO 로딩 (_load_and_merge_sheets) — SO 시트
+_PO_SO_COLUMNS: tuple[str, ...] = (
+    'SO_ID', 'Line item', 'Customer PO', 'Customer name', 'Incoterms',
+    'Opportunity', 'Sector', 'Industry code',
+    'Sales Unit Price', 'Sales amount', 'Currency',
+    'PO receipt date', 'Requested delivery date', '납품 주소',
+    'Model number', 'Item name',
+)
+
+# DN 국내 (load_dn_data) — SO_국내
+_DN_SO_COLUMNS: tuple[str, ...] = (
+    'SO_ID',
+    'Line item',            # 복합키용
+    'Customer name',        # 고객명
+    'Customer PO',          # PO No.
+    'Item name',            # 품목명
+    'Item qty',             # 수량
+    'Sales Unit Price',     # 판매단가
+    'Total Sales',          # 총 판매금액
+    'Business registration number',
+)
+
+# PMT 국내 (load_pmt_data) — SO_국내
+_PMT_SO_COLUMNS: tuple[str, ...] = (
+    'SO_ID',
+    'Customer name',        # 고객명
+    'Customer PO',          # PO No.
+    'Item name',            # 품목명
+    'Item qty',             # 수량
+    'Sales Unit Price',     # 판매단가
+    'Total Sales',          # 총 판매금액
+    'Business registration number',
+)
+
+# OC / FI (load_so_export_with_customer, load_dn_export_data) — Customer_해외
+_CUSTOMER_COLUMNS: tuple[str, ...] = (
+    'C-code by 해외', 'Bill to 1', 'Bill to 2', 'Bill to 3', 'Payment terms',
+)
+
+# FI (load_dn_export_data) — SO_해외 (SO가 Single Source of Truth인 필드)
+_DN_EXPORT_SO_COLUMNS: tuple[str, ...] = (
+    'SO_ID', 'customer_code', 'Customer PO', 'PO receipt date', 'Currency',
+    'Incoterms', 'EXW NOAH',
+)
+
+# PL Net Weight (build_po_line_weight_map) — PO_해외
+_PO_WEIGHT_COLUMNS: tuple[str, ...] = (
+    'PO_ID', 'SO_ID', 'Line item', 'model', *WEIGHT_OPTION_SUFFIX,
+)
+
+
+# === JOIN 계층 ===
+# SO를 기준으로 하는 시트 간 JOIN은 모두 아래 함수로 수행합니다.
+# 키는 (SO_ID, Line item) 복합키를 정규화한 문자열 쌍(line_keys)이며,
+# 시트마다 Line item이 int/float/문자열로 다르게 읽혀도 같은 라인끼리 연결됩니다.
+# Excel 로더의 JOIN 결과는 워크북 버전별로 한 번만 계산합니다 (_view).
+
+# 워크북 캐시에 보관하는 JOIN 뷰 이름
+VIEW_PO = 'po'                          # PO + SO (국내/해외) — load_noah_po_lists
+VIEW_DN = 'dn'                          # DN_국내 + SO_국내 — load_dn_data
+VIEW_PMT = 'pmt'                        # PMT_국내 + SO_국내 — load_pmt_data
+VIEW_SO_EXPORT = 'so_export'            # SO_해외 — load_so_export_data
+VIEW_SO_CUSTOMER = 'so_export_customer'  # SO_해외 + Customer_해외
+VIEW_DN_EXPORT = 'dn_export'            # DN_해외 + SO_해외 + Customer_해외
+JOIN_VIEWS: tuple[str, ...] = (
+    VIEW_PO, VIEW_DN, VIEW_PMT, VIEW_SO_EXPORT, VIEW_SO_CUSTOMER, VIEW_DN_EXPORT,
+)
+
+_KEY_SO = '_key_so'
+_KEY_LINE = '_key_line'
+
+
+def _key_text(values: pd.Series) -> pd.Series:
+    """JOIN 키 값 → 공백 제거 문자열 (빈 값은 '')"""
+    return values.map(lambda v: '' if pd.isna(v) else str(v).strip())
+
+
+def line_keys(df: pd.DataFrame, so_col: str = 'SO_ID',
+              line_col: str = 'Line item') -> pd.MultiIndex:
+    """(SO_ID, Line item) 복합키 — 문자열 연결 대신 쓰는 조회/JOIN 키
+
+    SO_ID는 공백 제거 문자열, Line item은 normalize_line_item()으로
+    정규화합니다 (1, 1.0, '1' → '1').
+
+    Args:
+        df: 대상 DataFrame
+        so_col: SO_ID 컬럼명
+        line_col: Line item 컬럼명
+
+    Returns:
+        df와 같은 길이의 MultiIndex (이름: SO_ID, Line item)
+    """
+    return pd.MultiIndex.from_arrays(
+        [_key_text(df[so_col]), df[line_col].map(normalize_line_item)],
+        names=['SO_ID', 'Line item'],
+    )
+
+
+def _join_so(
+    left: pd.DataFrame,
+    df_so: pd.DataFrame,
+    by_line: bool = True,
+    suffixes: tuple[str, str] = ('', '_SO'),
+) -> pd.DataFrame:
+    """left에 SO 컬럼 병합 (left 기준 left join)
+
+    by_line이고 양쪽에 Line item이 있으면 (SO_ID, Line item) 복합키로,
+    아니면 SO_ID별 첫 SO 행으로 병합합니다. 키 컬럼은 left 값을 유지합니다.
+
+    Args:
+        left: 기준 DataFrame (SO_ID 포함)
+        df_so: 병합할 SO 컬럼 (SO_ID 포함)
+        by_line: 라인 단위 병합 여부
+        suffixes: 이름이 겹치는 컬럼 접미사
+
+    Returns:
+        병합된 DataFrame (left 컬럼 → SO 컬럼 순)
+    """
+    if by_line and 'Line item' in left.columns and 'Line item' in df_so.columns:
+        left_keys, so_keys = line_keys(left), line_keys(df_so)
+        key_cols, on = ['SO_ID', 'Line item'], [_KEY_SO, _KEY_LINE]
+        left = left.assign(**{
+            _KEY_SO: left_keys.get_level_values(0), _KEY_LINE: left_keys.get_level_values(1),
+        })
+        right = df_so.drop(columns=key_cols).assign(**{
+            _KEY_SO: so_keys.get_level_values(0), _KEY_LINE: so_keys.get_level_values(1),
+        })
+    else:
+        on = [_KEY_SO]
+        left = left.assign(**{_KEY_SO: _key_text(left['SO_ID'])})
+        right = df_so.drop_duplicates(subset='SO_ID', keep='first')
+        right = right.drop(columns='SO_ID').assign(**{_KEY_SO: _key_text(right['SO_ID'])})
+    return left.merge(right, on=on, how='left', suffixes=suffixes).drop(columns=on)
+
+
+def _customer_subset(df_cust: pd.DataFrame) -> pd.DataFrame:
+    """Customer_해외 JOIN 컬럼 (고객코드별 첫 행)"""
+    cust_cols = [c for c in _CUSTOMER_COLUMNS if c in df_cust.columns]
+    return df_cust[cust_cols].drop_duplicates(subset='C-code by 해외', keep='first')
+
+
+def _join_customer(df: pd.DataFrame, df_cust: pd.DataFrame) -> pd.DataFrame:
+    """df의 고객코드로 Customer_해외 Bill to / Payment terms 병합"""
+    df_cust_subset = _customer_subset(df_cust)
+    cust_code_col = resolve_column(df.columns, 'customer_code')
+    if cust_code_col and 'C-code by 해외' in df_cust_subset.columns:
+        return df.merge(
+            df_cust_subset,
+            left_on=cust_code_col,
+            right_on='C-code by 해외',
+            how='left',
+            suffixes=('', '_CUST'),
+        )
+    logger.warning(f"Customer JOIN 실패: cust_code_col={cust_code_col}")
+    return df
+
+
+def _view(name: str, build: Callable[[], pd.DataFrame]) -> pd.DataFrame:
+    """NOAH_SO_PO_DN.xlsx 현재 버전의 JOIN 뷰 (워크북 캐시에 보관)"""
+    return _workbook_cache.get_view(NOAH_SO_PO_DN_FILE, name, build)
+
+
 def _load_and_merge_sheets(
-    xl: pd.ExcelFile,
     so_sheet: str,
     po_sheet: str,
     sheet_type: str,
@@ -174,7 +829,6 @@ def _load_and_merge_sheets(
     """SO와 PO 시트를 로드하고 SO_ID로 병합
 
     Args:
-        xl: ExcelFile 객체
         so_sheet: SO 시트명
         po_sheet: PO 시트명
         sheet_type: 시트 구분 ('국내' 또는 '해외')
@@ -182,37 +836,31 @@ def _load_and_merge_sheets(
     Returns:
         병합된 DataFrame (PO 기준, SO 정보 포함)
     """
-    # SO 시트 로드 (고객 정보)
-    df_so = pd.read_excel(xl, sheet_name=so_sheet)
+    # SO 시트 (고객 정보, 필요한 컬럼만) + PO 시트 (발주 정보 + 사양)
+    df_so, df_po = _read_sheets(so_sheet, po_sheet, columns={so_sheet: _PO_SO_COLUMNS})
+    return _merge_po_so(df_po, df_so, sheet_type)
+
+
+def _merge_po_so(df_po: pd.DataFrame, df_so: pd.DataFrame, sheet_type: str) -> pd.DataFrame:
+    """PO 시트에 SO 정보 병합 (PO 기준 left join)
 
-    # PO 시트 로드 (발주 정보 + 사양)
-    df_po = pd.read_excel(xl, sheet_name=po_sheet)
+    Args:
+        df_po: PO 시트
+        df_so: SO 시트 (_PO_SO_COLUMNS 외 컬럼은 무시)
+        sheet_type: 시트 구분 ('국내' 또는 '해외')
 
-    # SO에서 필요한 컬럼만 선택 (PO에 없는 것들)
+    Returns:
+        병합된 DataFrame
+    """
     # PO_ID가 없는 행(빈 행) 제외
     df_po = df_po[df_po['PO_ID'].notna()].copy()
 
     # SO_ID + Line item 복합키로 병합 (라인별 납기일 등 개별 데이터 보존)
-    so_cols_to_merge = ['SO_ID', 'Line item', 'Customer PO', 'Customer name', 'Incoterms',
-                        'Opportunity', 'Sector', 'Industry code',
-                        'Sales Unit Price', 'Sales amount', 'Currency',
-                        'PO receipt date', 'Requested delivery date', '납품 주소',
-                        'Model number', 'Item name']
     # SO에 실제 존재하는 컬럼만 선택
-    so_cols_to_merge = [c for c in so_cols_to_merge if c in df_so.columns]
-
-    df_so_subset = df_so[so_cols_to_merge].copy()
-
-    # Line item 컬럼 존재 시 SO_ID + Line item 복합키로 join
-    join_keys = ['SO_ID']
-    if 'Line item' in df_so_subset.columns and 'Line item' in df_po.columns:
-        join_keys = ['SO_ID', 'Line item']
-    else:
-        # Line item 없으면 기존 방식 (SO_ID별 첫 행)
-        df_so_subset = df_so_subset.drop_duplicates(subset='SO_ID', keep='first')
+    so_cols_to_merge = [c for c in _PO_SO_COLUMNS if c in df_so.columns]
 
-    # PO 기준으로 left join
-    df_merged = df_po.merge(df_so_subset, on=join_keys, how='left', suffixes=('', '_SO'))
+    # PO 기준으로 left join (Line item 없으면 SO_ID별 첫 행)
+    df_merged = _join_so(df_po, df_so[so_cols_to_merge])
 
     # 시트 구분 추가
     df_merged['_시트구분'] = sheet_type
@@ -220,6 +868,16 @@ def _load_and_merge_sheets(
     return df_merged
 
 
+def _build_po_view() -> pd.DataFrame:
+    """국내/해외 SO+PO 병합 후 합치기 (VIEW_PO)"""
+    df_domestic = _load_and_merge_sheets(SO_DOMESTIC_SHEET, PO_DOMESTIC_SHEET, '국내')
+    df_export = _load_and_merge_sheets(SO_EXPORT_SHEET, PO_EXPORT_SHEET, '해외')
+
+    # concat: pandas가 자동으로 없는 컬럼에 NaN 채움
+    dfs = [df for df in [df_domestic, df_export] if len(df) > 0]
+    return pd.concat(dfs, ignore_index=True) if dfs else pd.DataFrame()
+
+
 def load_noah_po_lists() -> pd.DataFrame:
     """NOAH_SO_PO_DN.xlsx에서 데이터 로드
 
@@ -235,30 +893,16 @@ def load_noah_po_lists() -> pd.DataFrame:
     # 새 파일 우선 사용
     if NOAH_SO_PO_DN_FILE.exists():
         logger.info(f"데이터 로드: {NOAH_SO_PO_DN_FILE.name}")
-        with pd.ExcelFile(NOAH_SO_PO_DN_FILE) as xl:
-            # 국내 데이터 로드 및 병합
-            df_domestic = _load_and_merge_sheets(
-                xl, SO_DOMESTIC_SHEET, PO_DOMESTIC_SHEET, '국내'
-            )
-
-            # 해외 데이터 로드 및 병합
-            df_export = _load_and_merge_sheets(
-                xl, SO_EXPORT_SHEET, PO_EXPORT_SHEET, '해외'
-            )
-
-        # concat: pandas가 자동으로 없는 컬럼에 NaN 채움
-        dfs = [df for df in [df_domestic, df_export] if len(df) > 0]
-        df = pd.concat(dfs, ignore_index=True) if dfs else pd.DataFrame()
-
+        df = _view(VIEW_PO, _build_po_view)
         logger.info(f"총 {len(df)}건의 주문 데이터 로드 완료")
         return df
 
     # 기존 파일로 폴백
     if NOAH_PO_LISTS_FILE.exists():
         logger.info(f"데이터 로드 (Legacy): {NOAH_PO_LISTS_FILE.name}")
-        with pd.ExcelFile(NOAH_PO_LISTS_FILE) as xl:
-            df_domestic = pd.read_excel(xl, sheet_name=0)
-            df_export = pd.read_excel(xl, sheet_name=1)
+        with ExcelReader(NOAH_PO_LISTS_FILE) as reader:
+            df_domestic = reader.read(0)
+            df_export = reader.read(1)
 
         df_domestic['_시트구분'] = '국내'
         df_export['_시트구분'] = '해외'
@@ -301,8 +945,17 @@ def _find_data_by_id(
         logger.error(f"{id_label} 컬럼을 찾을 수 없습니다.")
         return None
 
-    mask = df[col] == id_value
-    match_count = mask.sum()
+    return _select_matches(df[df[col] == id_value], id_value, id_label, allow_multiple)
+
+
+def _select_matches(
+    matched: pd.DataFrame,
+    id_value: str,
+    id_label: str,
+    allow_multiple: bool = True,
+) -> pd.Series | pd.DataFrame | None:
+    """ID 검색 결과 행 → 단일 Series / 다중 DataFrame / None (_find_data_by_id 공통)"""
+    match_count = len(matched)
 
     if match_count == 0:
         logger.warning(f"{id_label} '{id_value}'를 찾을 수 없습니다.")
@@ -310,10 +963,10 @@ def _find_data_by_id(
 
     if allow_multiple and match_count > 1:
         logger.info(f"{id_label} '{id_value}': {match_count}개 아이템 발견 (다중 아이템)")
-        return df[mask]
+        return matched
 
     logger.info(f"{id_label} '{id_value}': {'발견' if not allow_multiple else '단일 아이템'}")
-    return df[mask].iloc[0]
+    return matched.iloc[0]
 
 
 def find_order_data(
@@ -367,41 +1020,29 @@ def load_dn_data() -> pd.DataFrame:
         raise FileNotFoundError(f"소스 파일을 찾을 수 없습니다: {NOAH_SO_PO_DN_FILE}")
 
     logger.info(f"DN 데이터 로드: {NOAH_SO_PO_DN_FILE.name}")
-    with pd.ExcelFile(NOAH_SO_PO_DN_FILE) as xl:
-        # DN_국내 로드 (DN 고유 정보만: DN_ID, SO_ID, 납품일 등)
-        df_dn = pd.read_excel(xl, sheet_name=DN_DOMESTIC_SHEET)
-        # SO_국내에서 품목/금액/고객 정보 가져오기
-        df_so = pd.read_excel(xl, sheet_name=SO_DOMESTIC_SHEET)
+    # DN_국내 (DN 고유 정보만: DN_ID, SO_ID, 납품일 등)
+    # SO_국내 (품목/금액/고객 정보)
+    df_merged = _view(VIEW_DN, lambda: _merge_dn_so(*_read_sheets(
+        DN_DOMESTIC_SHEET, SO_DOMESTIC_SHEET,
+        columns={SO_DOMESTIC_SHEET: _DN_SO_COLUMNS},
+    )))
 
+    logger.info(f"DN 데이터 {len(df_merged)}건 로드 완료")
+    return df_merged
+
+
+def _merge_dn_so(df_dn: pd.DataFrame, df_so: pd.DataFrame) -> pd.DataFrame:
+    """DN_국내에 SO_국내 품목/금액/고객 정보 병합"""
     df_dn = df_dn[df_dn['DN_ID'].notna()].copy()
-    so_cols = [
-        'SO_ID',
-        'Line item',            # 복합키용
-        'Customer name',        # 고객명
-        'Customer PO',          # PO No.
-        'Item name',            # 품목명
-        'Item qty',             # 수량
-        'Sales Unit Price',     # 판매단가
-        'Total Sales',          # 총 판매금액
-        'Business registration number',
-    ]
-    so_cols = [c for c in so_cols if c in df_so.columns]
-    df_so_subset = df_so[so_cols].copy()
+    so_cols = [c for c in _DN_SO_COLUMNS if c in df_so.columns]
 
     # Line item 존재 시 SO_ID + Line item 복합키로 join (PO 로딩과 동일 패턴)
-    join_keys = ['SO_ID']
-    if 'Line item' in df_so_subset.columns and 'Line item' in df_dn.columns:
-        join_keys = ['SO_ID', 'Line item']
-    else:
-        # Line item 없으면 DN_ID 중복 제거 후 SO_ID만으로 join
+    # 없으면 DN_ID 중복 제거 후 SO_ID만으로 join
+    if 'Line item' not in so_cols or 'Line item' not in df_dn.columns:
         df_dn = df_dn.drop_duplicates(subset='DN_ID', keep='first')
-        df_so_subset = df_so_subset.drop_duplicates(subset='SO_ID', keep='first')
-
-    df_merged = df_dn.merge(df_so_subset, on=join_keys, how='left', suffixes=('', '_SO'))
+    df_merged = _join_so(df_dn, df_so[so_cols])
     df_merged['_시트구분'] = '국내'
     df_merged['_문서유형'] = 'DN'
-
-    logger.info(f"DN 데이터 {len(df_merged)}건 로드 완료")
     return df_merged
 
 
@@ -440,36 +1081,28 @@ def load_pmt_data() -> pd.DataFrame:
         raise FileNotFoundError(f"소스 파일을 찾을 수 없습니다: {NOAH_SO_PO_DN_FILE}")
 
     logger.info(f"PMT 데이터 로드: {NOAH_SO_PO_DN_FILE.name}")
-    with pd.ExcelFile(NOAH_SO_PO_DN_FILE) as xl:
-        # PMT_국내 로드
-        df_pmt = pd.read_excel(xl, sheet_name=PMT_DOMESTIC_SHEET)
-        # SO_국내에서 거래명세표에 필요한 모든 정보 가져오기
-        df_so = pd.read_excel(xl, sheet_name=SO_DOMESTIC_SHEET)
+    # PMT_국내 + SO_국내 (거래명세표에 필요한 모든 정보)
+    df_merged = _view(VIEW_PMT, lambda: _merge_pmt_so(*_read_sheets(
+        PMT_DOMESTIC_SHEET, SO_DOMESTIC_SHEET,
+        columns={SO_DOMESTIC_SHEET: _PMT_SO_COLUMNS},
+    )))
 
+    logger.info(f"PMT 데이터 {len(df_merged)}건 로드 완료")
+    return df_merged
+
+
+def _merge_pmt_so(df_pmt: pd.DataFrame, df_so: pd.DataFrame) -> pd.DataFrame:
+    """PMT_국내에 SO_국내 대표 정보(SO_ID별 첫 행) 병합"""
     df_pmt = df_pmt[df_pmt['선수금_ID'].notna()].copy()
     # 선수금_ID 중복 제거 (선수금_ID는 고유해야 함)
     df_pmt = df_pmt.drop_duplicates(subset='선수금_ID', keep='first')
-    so_cols = [
-        'SO_ID',
-        'Customer name',        # 고객명
-        'Customer PO',          # PO No.
-        'Item name',            # 품목명
-        'Item qty',             # 수량
-        'Sales Unit Price',     # 판매단가
-        'Total Sales',          # 총 판매금액
-        'Business registration number',
-    ]
-    so_cols = [c for c in so_cols if c in df_so.columns]
+    so_cols = [c for c in _PMT_SO_COLUMNS if c in df_so.columns]
     # 목록 표시용이므로 SO_ID별 첫 행만 사용 (고객명 등 대표 정보만 필요)
     # 실제 ADV 처리는 load_so_for_advance()에서 전체 아이템 로드
-    df_so_subset = df_so[so_cols].drop_duplicates(subset='SO_ID', keep='first')
-
     # SO_ID로 조인
-    df_merged = df_pmt.merge(df_so_subset, on='SO_ID', how='left', suffixes=('', '_SO'))
+    df_merged = _join_so(df_pmt, df_so[so_cols], by_line=False)
     df_merged['_시트구분'] = '국내'
     df_merged['_문서유형'] = 'PMT'
-
-    logger.info(f"PMT 데이터 {len(df_merged)}건 로드 완료")
     return df_merged
 
 
@@ -508,11 +1141,8 @@ def load_so_for_advance(advance_id: str) -> tuple[pd.Series, pd.DataFrame] | Non
     if not NOAH_SO_PO_DN_FILE.exists():
         raise FileNotFoundError(f"소스 파일을 찾을 수 없습니다: {NOAH_SO_PO_DN_FILE}")
 
-    with pd.ExcelFile(NOAH_SO_PO_DN_FILE) as xl:
-        # 1. PMT_국내에서 선수금_ID로 SO_ID 찾기
-        df_pmt = pd.read_excel(xl, sheet_name=PMT_DOMESTIC_SHEET)
-        # 2. SO_국내 로드
-        df_so = pd.read_excel(xl, sheet_name=SO_DOMESTIC_SHEET)
+    # 1. PMT_국내에서 선수금_ID로 SO_ID 찾기 / 2. SO_국내 로드
+    df_pmt, df_so = _read_sheets(PMT_DOMESTIC_SHEET, SO_DOMESTIC_SHEET)
 
     df_pmt = df_pmt[df_pmt['선수금_ID'].notna()].copy()
 
@@ -556,18 +1186,17 @@ def load_so_export_data() -> pd.DataFrame:
         raise FileNotFoundError(f"소스 파일을 찾을 수 없습니다: {NOAH_SO_PO_DN_FILE}")
 
     logger.info(f"SO 해외 데이터 로드: {NOAH_SO_PO_DN_FILE.name}")
-    with pd.ExcelFile(NOAH_SO_PO_DN_FILE) as xl:
-        # SO_해외 로드 (Model 컬럼을 문자열로 읽어 앞 0 보존)
-        df_so = pd.read_excel(
-            xl,
-            sheet_name=SO_EXPORT_SHEET,
-            dtype={'Model': str, 'Model number': str, 'Model code': str}
-        )
+    # SO_해외 로드 (Model 컬럼은 SHEET_DTYPES에 따라 문자열 — 앞 0 보존)
+    df_so = _view(VIEW_SO_EXPORT, lambda: _mark_so_export(*_read_sheets(SO_EXPORT_SHEET)))
 
+    logger.info(f"SO 해외 데이터 {len(df_so)}건 로드 완료")
+    return df_so
+
+
+def _mark_so_export(df_so: pd.DataFrame) -> pd.DataFrame:
+    """SO_해외 빈 행 제외 + 시트 구분 추가"""
     df_so = df_so[df_so['SO_ID'].notna()].copy()
     df_so['_시트구분'] = '해외'
-
-    logger.info(f"SO 해외 데이터 {len(df_so)}건 로드 완료")
     return df_so
 
 
@@ -607,40 +1236,24 @@ def load_so_export_with_customer() -> pd.DataFrame:
         raise FileNotFoundError(f"소스 파일을 찾을 수 없습니다: {NOAH_SO_PO_DN_FILE}")
 
     logger.info(f"SO 해외 + Customer 데이터 로드: {NOAH_SO_PO_DN_FILE.name}")
-    with pd.ExcelFile(NOAH_SO_PO_DN_FILE) as xl:
-        df_so = pd.read_excel(
-            xl,
-            sheet_name=SO_EXPORT_SHEET,
-            dtype={'Model': str, 'Model number': str, 'Model code': str}
-        )
-        df_cust = pd.read_excel(xl, sheet_name=CUSTOMER_EXPORT_SHEET)
+    df_so = _view(VIEW_SO_CUSTOMER, lambda: _merge_so_customer(*_read_sheets(
+        SO_EXPORT_SHEET, CUSTOMER_EXPORT_SHEET,
+        columns={CUSTOMER_EXPORT_SHEET: _CUSTOMER_COLUMNS},
+    )))
 
-    df_so = df_so[df_so['SO_ID'].notna()].copy()
+    logger.info(f"SO 해외 + Customer 데이터 {len(df_so)}건 로드 완료")
+    return df_so
 
-    # Customer_해외에서 필요한 컬럼만 추출 (고객코드 중복 제거)
-    cust_cols = ['C-code by 해외', 'Bill to 1', 'Bill to 2', 'Bill to 3', 'Payment terms']
-    cust_cols = [c for c in cust_cols if c in df_cust.columns]
-    df_cust_subset = df_cust[cust_cols].drop_duplicates(
-        subset='C-code by 해외', keep='first',
-    )
+
+def _merge_so_customer(df_so: pd.DataFrame, df_cust: pd.DataFrame) -> pd.DataFrame:
+    """SO_해외에 Customer_해외 Bill to / Payment terms 병합 (고객코드)"""
+    df_so = df_so[df_so['SO_ID'].notna()].copy()
 
     # SO_해외 → Customer_해외 JOIN (고객코드)
-    so_cust_code_col = resolve_column(df_so.columns, 'customer_code')
-    if so_cust_code_col and 'C-code by 해외' in df_cust_subset.columns:
-        df_so = df_so.merge(
-            df_cust_subset,
-            left_on=so_cust_code_col,
-            right_on='C-code by 해외',
-            how='left',
-            suffixes=('', '_CUST'),
-        )
-    else:
-        logger.warning(f"Customer JOIN 실패: so_cust_code_col={so_cust_code_col}")
+    df_so = _join_customer(df_so, df_cust)
 
     df_so['_시트구분'] = '해외'
     df_so['_문서유형'] = 'OC'
-
-    logger.info(f"SO 해외 + Customer 데이터 {len(df_so)}건 로드 완료")
     return df_so
 
 
@@ -662,25 +1275,32 @@ def load_dn_export_data() -> pd.DataFrame:
         raise FileNotFoundError(f"소스 파일을 찾을 수 없습니다: {NOAH_SO_PO_DN_FILE}")
 
     logger.info(f"DN 해외 데이터 로드: {NOAH_SO_PO_DN_FILE.name}")
-    with pd.ExcelFile(NOAH_SO_PO_DN_FILE) as xl:
-        # 1. DN_해외 로드
-        df_dn = pd.read_excel(xl, sheet_name=DN_EXPORT_SHEET)
-        # 2. SO_해외 로드 (고객코드 추출용)
-        df_so = pd.read_excel(xl, sheet_name=SO_EXPORT_SHEET)
-        # 3. Customer_해외 로드 (Bill to, Payment terms)
-        df_cust = pd.read_excel(xl, sheet_name=CUSTOMER_EXPORT_SHEET)
+    # 1. DN_해외 / 2. SO_해외 (고객코드 추출용) / 3. Customer_해외 (Bill to, Payment terms)
+    df_dn = _view(VIEW_DN_EXPORT, lambda: _merge_dn_export(*_read_sheets(
+        DN_EXPORT_SHEET, SO_EXPORT_SHEET, CUSTOMER_EXPORT_SHEET,
+        columns={
+            SO_EXPORT_SHEET: _DN_EXPORT_SO_COLUMNS,
+            CUSTOMER_EXPORT_SHEET: _CUSTOMER_COLUMNS,
+        },
+    )))
 
+    logger.info(f"DN 해외 데이터 {len(df_dn)}건 로드 완료 (Customer JOIN 포함)")
+    return df_dn
+
+
+def _merge_dn_export(df_dn: pd.DataFrame, df_so: pd.DataFrame,
+                     df_cust: pd.DataFrame) -> pd.DataFrame:
+    """DN_해외 → SO_해외(SO_ID) → Customer_해외(고객코드) 병합"""
     # DN_ID가 있는 행만 사용
     df_dn = df_dn[df_dn['DN_ID'].notna()].copy()
 
     # SO_해외에서 가져올 컬럼 (SO가 Single Source of Truth인 필드)
     # 고객코드 컬럼명은 시트마다 다를 수 있으므로 resolve_column()으로 동적 탐지
     so_cust_code_col = resolve_column(df_so.columns, 'customer_code')
-    so_code_cols = ['SO_ID', 'Customer PO', 'PO receipt date', 'Currency', 'Incoterms', 'EXW NOAH']
-    if so_cust_code_col:
-        so_code_cols.insert(1, so_cust_code_col)
-    so_code_cols = [c for c in so_code_cols if c in df_so.columns]
-    df_so_codes = df_so[so_code_cols].drop_duplicates(subset='SO_ID', keep='first')
+    so_code_cols = [
+        so_cust_code_col if c == 'customer_code' else c for c in _DN_EXPORT_SO_COLUMNS
+    ]
+    so_code_cols = [c for c in so_code_cols if c and c in df_so.columns]
 
     # DN_해외에 동일 컬럼명이 있으면 merge 전에 제거 (SO 값을 우선 사용)
     # SO_ID는 JOIN 키이므로 제외
@@ -689,34 +1309,15 @@ def load_dn_export_data() -> pd.DataFrame:
         df_dn.drop(columns=overlap_cols, inplace=True)
         logger.debug(f"DN-SO 컬럼 충돌 해소 (SO 우선): {overlap_cols}")
 
-    # DN_해외 + SO_해외 JOIN (SO_ID)
-    df_dn = df_dn.merge(df_so_codes, on='SO_ID', how='left')
-
-    # Customer_해외에서 필요한 컬럼만 추출 (고객코드 중복 제거)
-    cust_cols = ['C-code by 해외', 'Bill to 1', 'Bill to 2', 'Bill to 3', 'Payment terms']
-    cust_cols = [c for c in cust_cols if c in df_cust.columns]
-    df_cust_subset = df_cust[cust_cols].drop_duplicates(
-        subset='C-code by 해외', keep='first',
-    )
+    # DN_해외 + SO_해외 JOIN (SO_ID별 첫 행)
+    df_dn = _join_so(df_dn, df_so[so_code_cols], by_line=False)
 
     # DN_해외+SO → Customer_해외 JOIN (고객코드)
-    # 고객코드 컬럼명을 동적으로 찾기 (Business registration number, C-code by 해외 등)
-    dn_cust_code_col = resolve_column(df_dn.columns, 'customer_code')
-    if dn_cust_code_col and 'C-code by 해외' in df_cust_subset.columns:
-        df_dn = df_dn.merge(
-            df_cust_subset,
-            left_on=dn_cust_code_col,
-            right_on='C-code by 해외',
-            how='left',
-            suffixes=('', '_CUST'),
-        )
-    else:
-        logger.warning(f"Customer JOIN 실패: dn_cust_code_col={dn_cust_code_col}")
+    # 고객코드 컬럼명은 동적으로 찾음 (Business registration number, C-code by 해외 등)
+    df_dn = _join_customer(df_dn, df_cust)
 
     df_dn['_시트구분'] = '해외'
     df_dn['_문서유형'] = 'FI'
-
-    logger.info(f"DN 해외 데이터 {len(df_dn)}건 로드 완료 (Customer JOIN 포함)")
     return df_dn
 
 
@@ -744,6 +1345,41 @@ def find_dn_export_data(
 _spec_option_fields_cache: dict[str, tuple[list[str], list[str]]] = {}
 
 
+def read_header_columns(path: Path, sheet_name: str) -> list[str]:
+    """시트 헤더 컬럼명 — read_excel(nrows=0)과 같은 목록
+
+    시트 XML의 첫 행만 읽고, 디스크 캐시가 켜져 있으면 워크북 fingerprint와
+    함께 저장해 둡니다. 워크북이 그대로면 다음 실행은 파일을 열지 않습니다.
+
+    Args:
+        path: Excel 파일 경로
+        sheet_name: 시트명
+
+    Returns:
+        컬럼명 목록
+    """
+    sidecar = SheetCache(path) if SHEET_CACHE_ENABLED else None
+    if sidecar is not None:
+        try:
+            columns = sidecar.load_header(sheet_name)
+        except Exception as e:
+            logger.debug(f"헤더 캐시 조회 실패 ({path.name}[{sheet_name}]): {e}")
+            columns = None
+        if columns is not None:
+            return columns
+
+    with ExcelReader(path) as reader:
+        columns = reader.read_header(sheet_name)
+
+    if sidecar is not None and all(isinstance(c, str) for c in columns):
+        try:
+            with XlsxPackage(path) as pkg:
+                sidecar.store_header(pkg, sheet_name, columns)
+        except Exception as e:
+            logger.debug(f"헤더 캐시 저장 실패 ({path.name}[{sheet_name}]): {e}")
+    return columns
+
+
 def get_spec_option_fields(
     sheet_type: str = '국내',
     force_reload: bool = False,
@@ -774,10 +1410,8 @@ def get_spec_option_fields(
             logger.warning(f"데이터 파일 없음, 기본 필드 사용: {NOAH_SO_PO_DN_FILE}")
             return list(SPEC_FIELDS), list(OPTION_FIELDS)
 
-        # PO 시트 컬럼 목록 가져오기
-        with pd.ExcelFile(NOAH_SO_PO_DN_FILE) as xl:
-            df = pd.read_excel(xl, sheet_name=po_sheet, nrows=0)  # 헤더만 읽기
-            columns = list(df.columns)
+        # PO 시트 컬럼 목록 가져오기 (헤더 행만)
+        columns = read_header_columns(NOAH_SO_PO_DN_FILE, po_sheet)
 
         # 마커 컬럼 위치 찾기
         spec_start_idx = None
@@ -835,29 +1469,32 @@ def load_weight_data() -> pd.DataFrame:
         raise FileNotFoundError(f"소스 파일을 찾을 수 없습니다: {NOAH_SO_PO_DN_FILE}")
 
     logger.info(f"Weight 데이터 로드: {NOAH_SO_PO_DN_FILE.name}")
-    with pd.ExcelFile(NOAH_SO_PO_DN_FILE) as xl:
-        if WEIGHT_SHEET not in xl.sheet_names:
-            raise ValueError(f"'{WEIGHT_SHEET}' 시트를 찾을 수 없습니다.")
-        df = pd.read_excel(xl, sheet_name=WEIGHT_SHEET)
+    if WEIGHT_SHEET not in _workbook_cache.sheet_names(NOAH_SO_PO_DN_FILE):
+        raise ValueError(f"'{WEIGHT_SHEET}' 시트를 찾을 수 없습니다.")
+    df, = _read_sheets(WEIGHT_SHEET)
 
     logger.info(f"Weight 데이터 {len(df)}건 로드 완료")
     return df
 
 
-def build_model_weight_map() -> dict[str, float]:
+def build_model_weight_map(df: pd.DataFrame | None = None) -> dict[str, float]:
     """Weight 시트 MODEL 코드 → WEIGHT 매핑 (대문자 정규화 키)
 
     Weight 시트의 MODEL 단축코드(예: '006IM', '005LP')를 key,
     WEIGHT 를 value 로 dict 생성. 시트가 없거나 로드 실패 시 빈 dict 반환.
 
+    Args:
+        df: 이미 읽은 Weight 시트 (None이면 load_weight_data()로 로드)
+
     Returns:
         {model_code_upper: weight_value} 딕셔너리
     """
-    try:
-        df = load_weight_data()
-    except (FileNotFoundError, ValueError) as e:
-        logger.warning(f"Weight 데이터 로드 실패 (빈 매핑 반환): {e}")
-        return {}
+    if df is None:
+        try:
+            df = load_weight_data()
+        except (FileNotFoundError, ValueError) as e:
+            logger.warning(f"Weight 데이터 로드 실패 (빈 매핑 반환): {e}")
+            return {}
 
     # MODEL, WEIGHT 컬럼 찾기 (대소문자 무관)
     model_col = None
@@ -972,12 +1609,15 @@ def resolve_weight_code(
     return None, None
 
 
-def load_po_export_data() -> pd.DataFrame:
+def load_po_export_data(columns: Sequence[str] | None = None) -> pd.DataFrame:
     """PO_해외 데이터 로드 (Model + 옵션 컬럼 포함)
 
     Packing List Net Weight 매핑에 사용됩니다.
     Model 컬럼은 문자열로 읽어 코드 형태를 보존합니다.
 
+    Args:
+        columns: 컬럼 매니페스트 (None이면 전체 컬럼)
+
     Returns:
         PO_해외 DataFrame (PO_ID 가 있는 행만)
 
@@ -988,8 +1628,8 @@ def load_po_export_data() -> pd.DataFrame:
         raise FileNotFoundError(f"소스 파일을 찾을 수 없습니다: {NOAH_SO_PO_DN_FILE}")
 
     logger.info(f"PO 해외 데이터 로드: {NOAH_SO_PO_DN_FILE.name}")
-    with pd.ExcelFile(NOAH_SO_PO_DN_FILE) as xl:
-        df_po = pd.read_excel(xl, sheet_name=PO_EXPORT_SHEET, dtype={'Model': str})
+    manifest = None if columns is None else {PO_EXPORT_SHEET: columns}
+    df_po, = _read_sheets(PO_EXPORT_SHEET, columns=manifest)
 
     if 'PO_ID' in df_po.columns:
         df_po = df_po[df_po['PO_ID'].notna()].copy()
@@ -998,58 +1638,142 @@ def load_po_export_data() -> pd.DataFrame:
     return df_po
 
 
-def build_po_line_weight_map() -> dict[tuple[str, str], float]:
-    """PO_해외 기반 (SO_ID, Line item) → Net Weight(단위중량) 매핑
+# resolve_po_line_weights() 매칭 단계 (match_tier 값)
+WEIGHT_TIER_COMBINED = 'combined'    # LCU + PCU+PIU 결합코드 base+'LP'
+WEIGHT_TIER_OPTION = 'option'        # 우선순위 최상위 단일 옵션 base+접미사
+WEIGHT_TIER_BASE = 'base'            # base 코드 (옵션 무시)
+WEIGHT_TIER_MODEL = 'model'          # 원본 Model 코드
+WEIGHT_TIER_UNMATCHED = 'unmatched'
 
-    각 PO 라인의 Model + Y옵션을 Weight 시트와 매칭하여 단위중량을 구합니다.
-    매칭 실패 시 base Model 무게로 폴백하며, 그것도 없으면 제외됩니다.
-    동일 (SO_ID, Line item) 이 중복되면 첫 행을 사용합니다.
+# resolve_po_line_weights() 결과 컬럼
+PO_LINE_WEIGHT_COLUMNS: tuple[str, ...] = (
+    'SO_ID', 'Line item', 'Model', 'weight', 'matched_code', 'match_tier',
+)
+
+
+def resolve_po_line_weights(
+    df_po: pd.DataFrame,
+    model_weight_map: dict[str, float],
+) -> pd.DataFrame:
+    """PO 라인별 Weight 해결 — resolve_weight_code()를 전체 행에 벡터 연산으로 적용
+
+    Model이 있고 SO_ID/Line item이 있는 PO 라인마다 1행을 반환합니다.
+    동일 (SO_ID, Line item) 이 중복되면 매칭된 행 중 첫 행을 사용하며 (없으면 첫 행),
+    매칭되지 않은 라인도 weight=NaN, match_tier='unmatched'로 남깁니다 (미매칭 보고용).
+
+    Args:
+        df_po: PO_해외 DataFrame (Model, SO_ID, Line item, 옵션 컬럼)
+        model_weight_map: build_model_weight_map() 결과
 
     Returns:
-        {(so_id, line_item): weight} 딕셔너리
+        PO_LINE_WEIGHT_COLUMNS DataFrame (SO_ID, Line item은 정규화된 문자열)
+    """
+    model_col = resolve_column(df_po.columns, 'model')
+    if model_col is None or 'SO_ID' not in df_po.columns or 'Line item' not in df_po.columns:
+        logger.warning("PO 해외에 Model/SO_ID/Line item 컬럼 없음 — Weight 매핑 건너뜀")
+        return pd.DataFrame(columns=list(PO_LINE_WEIGHT_COLUMNS))
+
+    model = df_po[model_col]
+    model_text = model.astype(str).str.strip()
+    valid = (
+        model.notna() & (model_text != '')
+        & df_po['SO_ID'].notna() & df_po['Line item'].notna()
+    )
+    df = df_po[valid]
+    result = pd.DataFrame({
+        'SO_ID': df['SO_ID'].astype(str).str.strip(),
+        'Line item': df['Line item'].map(normalize_line_item),
+        'Model': model_text[valid],
+    })
+    model_upper = result['Model'].str.upper()
+    base = model_upper.str.replace(_NA_SA_PREFIX, '', regex=True)
+    base_has_lcu = base.str.endswith('L')
+    # 무게 영향 옵션 컬럼 중 실제 존재하는 것 → Y 체크 여부 (우선순위 순서)
+    checked = {
+        o: df[o].astype(str).str.strip().str.upper().eq('Y')
+        for o in WEIGHT_OPTION_PRIORITY if o in WEIGHT_OPTION_SUFFIX and o in df.columns
+    }
+    # Model명이 이미 'L'(LCU)로 끝나면 옵션열 LCU=Y 는 중복 표기 → 제거
+    if 'LCU' in checked:
+        checked['LCU'] = checked['LCU'] & ~base_has_lcu
+
+    # resolve_weight_code()와 같은 후보 순서: (후보 코드, 적용 행, 단계)
+    every = pd.Series(True, index=result.index)
+    candidates: list[tuple[pd.Series, pd.Series, str]] = []
+    if 'LCU' in checked and 'PCU+PIU' in checked:
+        candidates.append((base + 'LP', checked['LCU'] & checked['PCU+PIU'], WEIGHT_TIER_COMBINED))
+    for o, mask in checked.items():
+        candidates.append((base + WEIGHT_OPTION_SUFFIX[o], mask, WEIGHT_TIER_OPTION))
+    candidates.append((base, every, WEIGHT_TIER_BASE))
+    candidates.append((model_upper, every, WEIGHT_TIER_MODEL))
+
+    weight = pd.Series(float('nan'), index=result.index, dtype=float)
+    code = pd.Series(None, index=result.index, dtype=object)
+    tier = pd.Series(WEIGHT_TIER_UNMATCHED, index=result.index, dtype=object)
+    pending = base != ''
+    for cand, mask, name in candidates:
+        found = cand.map(model_weight_map)
+        hit = pending & mask & found.notna()
+        weight[hit] = found[hit].astype(float)
+        code[hit] = cand[hit]
+        tier[hit] = name
+        pending &= ~hit
+
+    result['weight'] = weight
+    result['matched_code'] = code
+    result['match_tier'] = tier
+    # 중복 (SO_ID, Line item) — 매칭된 행 우선, 그중 첫 행 (안정 정렬 후 원래 순서로)
+    result = result.loc[weight.isna().sort_values(kind='stable').index]
+    result = result[~result.duplicated(['SO_ID', 'Line item'])].sort_index()
+    return result.reset_index(drop=True)
+
+
+def build_po_line_weights() -> pd.DataFrame:
+    """PO_해외 + Weight 시트로 PO 라인별 Weight 해결 결과 생성
+
+    Returns:
+        resolve_po_line_weights() 결과 (로드 실패 시 빈 DataFrame)
     """
+    empty = pd.DataFrame(columns=list(PO_LINE_WEIGHT_COLUMNS))
     model_weight_map = build_model_weight_map()
     if not model_weight_map:
-        return {}
+        return empty
 
     try:
-        df_po = load_po_export_data()
+        df_po = load_po_export_data(columns=_PO_WEIGHT_COLUMNS)
     except FileNotFoundError as e:
         logger.warning(f"PO 해외 로드 실패 (빈 Weight 매핑 반환): {e}")
-        return {}
+        return empty
 
-    model_col = resolve_column(df_po.columns, 'model')
-    if model_col is None or 'SO_ID' not in df_po.columns or 'Line item' not in df_po.columns:
-        logger.warning("PO 해외에 Model/SO_ID/Line item 컬럼 없음 — Weight 매핑 건너뜀")
-        return {}
+    lines = resolve_po_line_weights(df_po, model_weight_map)
+    log_weight_unmatched(lines)
+    return lines
 
-    # 무게 영향 옵션 컬럼 중 실제 존재하는 것
-    opt_cols = [o for o in WEIGHT_OPTION_SUFFIX if o in df_po.columns]
 
-    line_map: dict[tuple[str, str], float] = {}
-    unmatched: list[str] = []
-    for _, row in df_po.iterrows():
-        model = row[model_col]
-        if model is None or pd.isna(model) or str(model).strip() == '':
-            continue
-        so_id, line_item = row['SO_ID'], row['Line item']
-        if pd.isna(so_id) or pd.isna(line_item):
-            continue
-        key = (str(so_id).strip(), normalize_line_item(line_item))
-        if key in line_map:
-            continue  # 중복 (SO_ID, Line item) — 첫 행 우선
-
-        y_opts = [c for c in opt_cols if str(row.get(c, '')).strip().upper() == 'Y']
-        weight, _code = resolve_weight_code(model, y_opts, model_weight_map)
-        if weight is not None:
-            line_map[key] = weight
-        else:
-            unmatched.append(f"{key[0]}#{key[1]}({model})")
-
-    if unmatched:
+def log_weight_unmatched(lines: pd.DataFrame) -> None:
+    """resolve_po_line_weights() 결과의 매칭/미매칭 건수 로그"""
+    unmatched = lines[lines['match_tier'] == WEIGHT_TIER_UNMATCHED]
+    if len(unmatched):
+        samples = [
+            f"{so_id}#{line}({model})"
+            for so_id, line, model in unmatched[['SO_ID', 'Line item', 'Model']].head(10).itertuples(index=False)
+        ]
         logger.warning(
-            f"Weight 미매칭 {len(unmatched)}건 (비표준 Model 등): "
-            f"{', '.join(unmatched[:10])}"
+            f"Weight 미매칭 {len(unmatched)}건 (비표준 Model 등): {', '.join(samples)}"
         )
-    logger.info(f"PO 라인 Weight 매핑 {len(line_map)}건 생성 완료")
-    return line_map
+    logger.info(f"PO 라인 Weight 매핑 {len(lines) - len(unmatched)}건 생성 완료")
+
+
+def build_po_line_weight_map() -> dict[tuple[str, str], float]:
+    """PO_해외 기반 (SO_ID, Line item) → Net Weight(단위중량) 매핑
+
+    각 PO 라인의 Model + Y옵션을 Weight 시트와 매칭하여 단위중량을 구합니다.
+    매칭 실패 시 base Model 무게로 폴백하며, 그것도 없으면 제외됩니다.
+    동일 (SO_ID, Line item) 이 중복되면 매칭된 첫 행을 사용합니다.
+
+    Returns:
+        {(so_id, line_item): weight} 딕셔너리
+    """
+    lines = build_po_line_weights()
+    matched = lines[lines['weight'].notna()]
+    return dict(zip(zip(matched['SO_ID'], matched['Line item']), matched['weight'].astype(float)))
@@ -0,0 +1,448 @@
+"""
+xlsx 패키지(zip) 저수준 접근
+============================
+
+xlsx 파일을 openpyxl로 파싱하지 않고 zip 파트 단위로 직접 읽습니다.
+시트명 → 워크시트 XML 파트 매핑, 파트 서명(CRC/크기), 시트 내용 해시 등
+캐시 키/변경 감지에 필요한 가벼운 정보를 제공합니다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import html
+import io
+import logging
+import posixpath
+import re
+import zipfile
+import xml.etree.ElementTree as ET
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+from openpyxl.utils import column_index_from_string, get_column_letter
+
+logger = logging.getLogger(__name__)
+
+_WORKBOOK_PART_DEFAULT = 'xl/workbook.xml'
+_OFFICE_DOCUMENT_REL = '/officeDocument'
+_SHARED_STRINGS_REL = '/sharedStrings'
+_STYLES_REL = '/styles'
+
+# <si>...</si> (공유 문자열 1건) — 네임스페이스 접두어(x:si 등) 허용
+_SI_RE = re.compile(rb'<(?:\w+:)?si\b[^>]*?(?:/>|>(.*?)</(?:\w+:)?si>)', re.DOTALL)
+# t="s" 셀의 공유 문자열 인덱스
+_SST_CELL_RE = re.compile(rb'<(?:\w+:)?c\b[^>]*\bt="s"[^>]*>\s*<(?:\w+:)?v>(\d+)</')
+_DATE1904_RE = re.compile(rb'\bdate1904="(1|true)"')
+# 셀 1개 (r, 속성, 내용) — 헤더 행 파싱용
+_CELL_RE = re.compile(
+    rb'<c\s+r="([A-Z]+)(\d+)"([^>]*?)(?:/>|>(.*?)</c>)', re.DOTALL,
+)
+_T_ATTR_RE = re.compile(rb'\bt="(\w+)"')
+_V_RE = re.compile(rb'<v>(.*?)</v>', re.DOTALL)
+_TEXT_RE = re.compile(rb'<t(?:\s[^>]*)?>(.*?)</t>', re.DOTALL)
+_RPH_RE = re.compile(rb'<rPh\b.*?</rPh>', re.DOTALL)
+_ESCAPED_CHAR_RE = re.compile(r'_x([0-9A-Fa-f]{4})_')
+_ROW_NUMBER_RE = re.compile(rb'<row\b[^>]*?\br="(\d+)"')
+_FIRST_ROW_END = b'</row>'
+# <row> 요소 1개 (행 번호, 전체 원문) — 행 블록 해시용
+_ROW_ELEMENT_RE = re.compile(rb'<row\b[^>]*?\br="(\d+)"[^>]*?(?:/>|>.*?</row>)', re.DOTALL)
+
+# 행 블록 해시의 기본 블록 크기 (행 수)
+DEFAULT_BLOCK_ROWS = 256
+
+# 프로젝션 시 다른 시트 자리에 넣는 빈 워크시트
+_EMPTY_WORKSHEET = (
+    b'<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    b'<sheetData/></worksheet>'
+)
+
+
+@dataclass(frozen=True)
+class RowBlocks:
+    """시트 행 블록 해시 — XlsxPackage.row_block_hashes() 결과
+
+    Excel 행 1~block_rows가 블록 0, 그다음 block_rows행이 블록 1 … 입니다.
+    행이 없는 블록도 빈 해시로 자리를 채우므로 hashes[i]가 곧 블록 i입니다.
+
+    Attributes:
+        block_rows: 블록당 행 수
+        base: 모든 행의 해석에 영향을 주는 정보(스타일, date1904) 해시
+        hashes: 블록별 해시 (블록 번호 순)
+    """
+    block_rows: int
+    base: str
+    hashes: tuple[str, ...]
+
+    def changed_ranges(self, previous: RowBlocks | None) -> list[tuple[int, int]]:
+        """previous 대비 바뀐 Excel 행 범위 [(시작 행, 끝 행)] — 1부터, 양끝 포함
+
+        연속한 변경 블록은 한 범위로 합칩니다. 범위는 블록 경계 단위라
+        끝 행이 실제 마지막 행보다 클 수 있습니다. 한쪽에만 있는 블록
+        (행 추가/삭제)도 변경으로 봅니다. previous가 없거나 블록 크기/base가
+        다르면 전체 범위를 반환합니다.
+        """
+        n_blocks = max(len(self.hashes), len(previous.hashes) if previous else 0)
+        if (previous is None or previous.block_rows != self.block_rows
+                or previous.base != self.base):
+            return [(1, n_blocks * self.block_rows)] if n_blocks else []
+
+        ranges: list[tuple[int, int]] = []
+        for i in range(n_blocks):
+            old = previous.hashes[i] if i < len(previous.hashes) else None
+            new = self.hashes[i] if i < len(self.hashes) else None
+            if old == new:
+                continue
+            start, end = i * self.block_rows + 1, (i + 1) * self.block_rows
+            if ranges and ranges[-1][1] == start - 1:
+                ranges[-1] = (ranges[-1][0], end)
+            else:
+                ranges.append((start, end))
+        return ranges
+
+
+def format_row_ranges(ranges: Iterable[tuple[int, int]]) -> str:
+    """[(2, 257), (513, 768)] → '2-257, 513-768'"""
+    return ', '.join(f'{start}-{end}' for start, end in ranges)
+
+
+def _local(tag: str) -> str:
+    """'{ns}name' → 'name'"""
+    return tag.rsplit('}', 1)[-1]
+
+
+def _resolve_target(base_part: str, target: str) -> str:
+    """관계(Target) 경로를 zip 파트 이름으로 변환"""
+    if target.startswith('/'):
+        return target.lstrip('/')
+    return posixpath.normpath(posixpath.join(posixpath.dirname(base_part), target))
+
+
+def _text(raw: bytes) -> str:
+    """<si>/<is> 조각 → 문자열 (리치 텍스트 run 연결, 윗주 제외, XML 이스케이프 해제)"""
+    raw = _RPH_RE.sub(b'', raw)
+    text = html.unescape(b''.join(_TEXT_RE.findall(raw)).decode('utf-8'))
+    return _ESCAPED_CHAR_RE.sub(lambda m: chr(int(m.group(1), 16)), text)
+
+
+def _rels_part(part: str) -> str:
+    """'xl/workbook.xml' → 'xl/_rels/workbook.xml.rels'"""
+    folder, name = posixpath.split(part)
+    return posixpath.join(folder, '_rels', f'{name}.rels')
+
+
+class XlsxPackage:
+    """xlsx 파일의 zip 파트 접근자
+
+    Usage:
+        with XlsxPackage(path) as pkg:
+            pkg.sheet_names
+            pkg.part_signature('SO_국내')
+            pkg.content_key('SO_국내')
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._zf = zipfile.ZipFile(self.path)
+        self._workbook_part = _WORKBOOK_PART_DEFAULT
+        self._sheet_parts: dict[str, str] = {}
+        self._shared_strings_part: str | None = None
+        self._styles_part: str | None = None
+        self._shared_strings: list[bytes] | None = None
+        self._last_xml: tuple[str, bytes] | None = None
+        self._date1904 = False
+        self._load_workbook_map()
+
+    def __enter__(self) -> XlsxPackage:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._zf.close()
+
+    # --- 구조 ---
+
+    def _load_workbook_map(self) -> None:
+        """workbook.xml + rels에서 시트명 → 파트, 공유 문자열/스타일 파트 확인"""
+        try:
+            root_rels = ET.fromstring(self._zf.read('_rels/.rels'))
+            for rel in root_rels:
+                if rel.get('Type', '').endswith(_OFFICE_DOCUMENT_REL):
+                    self._workbook_part = _resolve_target('', rel.get('Target', ''))
+                    break
+        except KeyError:
+            pass
+
+        wb_bytes = self._zf.read(self._workbook_part)
+        self._date1904 = bool(_DATE1904_RE.search(wb_bytes))
+        rels = ET.fromstring(self._zf.read(_rels_part(self._workbook_part)))
+        targets: dict[str, str] = {}
+        for rel in rels:
+            target = _resolve_target(self._workbook_part, rel.get('Target', ''))
+            rel_type = rel.get('Type', '')
+            targets[rel.get('Id', '')] = target
+            if rel_type.endswith(_SHARED_STRINGS_REL):
+                self._shared_strings_part = target
+            elif rel_type.endswith(_STYLES_REL):
+                self._styles_part = target
+
+        for elem in ET.fromstring(wb_bytes).iter():
+            if _local(elem.tag) != 'sheet':
+                continue
+            rid = next((v for k, v in elem.attrib.items() if _local(k) == 'id'), None)
+            if rid in targets:
+                self._sheet_parts[elem.get('name', '')] = targets[rid]
+
+    @property
+    def sheet_names(self) -> list[str]:
+        return list(self._sheet_parts)
+
+    def sheet_part(self, sheet_name: str) -> str:
+        """시트명 → 워크시트 XML 파트 이름 (없으면 KeyError)"""
+        try:
+            return self._sheet_parts[sheet_name]
+        except KeyError:
+            raise KeyError(f"시트를 찾을 수 없습니다: {sheet_name}") from None
+
+    def read_part(self, part: str) -> bytes:
+        return self._zf.read(part)
+
+    def _part_crc(self, part: str | None) -> tuple[int, int]:
+        if part is None:
+            return 0, 0
+        try:
+            info = self._zf.getinfo(part)
+        except KeyError:
+            return 0, 0
+        return info.CRC, info.file_size
+
+    # --- 서명 / 해시 ---
+
+    def part_signature(self, sheet_name: str) -> list[int]:
+        """시트 내용을 결정하는 파트들의 (CRC, 크기) — 압축 해제 없이 zip 목록에서 조회
+
+        시트 XML + 공유 문자열 + 스타일(날짜 서식 판정). 모두 같으면 시트 내용도 같습니다.
+        """
+        sig: list[int] = []
+        for part in (self.sheet_part(sheet_name), self._shared_strings_part, self._styles_part):
+            sig.extend(self._part_crc(part))
+        sig.append(int(self._date1904))
+        return sig
+
+    def shared_strings(self) -> list[bytes]:
+        """공유 문자열 원문(XML 조각) 목록 — 인덱스 순"""
+        if self._shared_strings is None:
+            if self._shared_strings_part is None:
+                self._shared_strings = []
+            else:
+                raw = self._zf.read(self._shared_strings_part)
+                self._shared_strings = [m.group(1) or b'' for m in _SI_RE.finditer(raw)]
+        return self._shared_strings
+
+    def content_key(self, sheet_name: str, extra: str = '') -> str:
+        """시트 내용 해시
+
+        시트 XML 원문 + 시트가 참조하는 공유 문자열 + 스타일로 계산합니다.
+        다른 시트 편집으로 공유 문자열 파트가 바뀌어도, 이 시트가 참조하는
+        문자열이 그대로면 키가 유지됩니다.
+
+        Args:
+            sheet_name: 시트명
+            extra: 키에 함께 섞을 문자열 (파싱 옵션 등)
+        """
+        sheet_xml = self._sheet_xml(sheet_name)
+        h = hashlib.blake2b(digest_size=20)
+        h.update(extra.encode('utf-8'))
+        h.update(b'\x00date1904=%d\x00' % int(self._date1904))
+        h.update(sheet_xml)
+
+        sst = self.shared_strings()
+        h.update(b'\x00sst\x00')
+        for m in _SST_CELL_RE.finditer(sheet_xml):
+            idx = int(m.group(1))
+            h.update(sst[idx] if idx < len(sst) else b'')
+            h.update(b'\x00')
+
+        if self._styles_part is not None:
+            h.update(b'\x00styles\x00')
+            h.update(self._zf.read(self._styles_part))
+        return h.hexdigest()
+
+    def row_block_hashes(self, sheet_name: str,
+                         block_rows: int = DEFAULT_BLOCK_ROWS) -> RowBlocks:
+        """시트 XML을 고정 크기 행 블록으로 나눠 블록별 해시 계산
+
+        블록 해시는 해당 블록 <row> 요소 원문 + 그 행들이 참조하는 공유 문자열로
+        계산합니다 (content_key와 같은 원칙). 이전 결과와
+        RowBlocks.changed_ranges()로 비교하면 바뀐 행 범위만 얻을 수 있습니다.
+
+        Args:
+            sheet_name: 시트명
+            block_rows: 블록당 행 수
+
+        Raises:
+            ValueError: block_rows가 1 미만이거나, r 속성 없는 <row>가 있어
+                행 번호를 판별할 수 없는 경우
+        """
+        if block_rows < 1:
+            raise ValueError(f"block_rows는 1 이상이어야 합니다: {block_rows}")
+        xml = self._sheet_xml(sheet_name)
+        sst = self.shared_strings()
+
+        hashers: dict[int, hashlib.blake2b] = {}
+        n_rows = 0
+        for m in _ROW_ELEMENT_RE.finditer(xml):
+            n_rows += 1
+            block = (int(m.group(1)) - 1) // block_rows
+            h = hashers.get(block)
+            if h is None:
+                h = hashers[block] = hashlib.blake2b(digest_size=16)
+            row = m.group(0)
+            h.update(row)
+            for c in _SST_CELL_RE.finditer(row):
+                idx = int(c.group(1))
+                h.update(sst[idx] if idx < len(sst) else b'')
+                h.update(b'\x00')
+        if n_rows != xml.count(b'<row ') + xml.count(b'<row>'):
+            raise ValueError("행 번호(r)가 없는 <row>가 있음")
+
+        empty = hashlib.blake2b(digest_size=16).hexdigest()
+        n_blocks = max(hashers) + 1 if hashers else 0
+        hashes = tuple(
+            hashers[i].hexdigest() if i in hashers else empty for i in range(n_blocks)
+        )
+
+        base = hashlib.blake2b(digest_size=16)
+        base.update(b'date1904=%d\x00' % int(self._date1904))
+        if self._styles_part is not None:
+            base.update(self._zf.read(self._styles_part))
+        return RowBlocks(block_rows, base.hexdigest(), hashes)
+
+    # --- 헤더 / 프로젝션 ---
+
+    def _read_first_row(self, part: str) -> bytes:
+        """시트 XML에서 첫 <row>까지만 압축 해제하여 반환"""
+        buf = b''
+        with self._zf.open(part) as fh:
+            while True:
+                chunk = fh.read(65536)
+                if not chunk:
+                    return buf
+                buf += chunk
+                end = buf.find(_FIRST_ROW_END)
+                if end >= 0:
+                    return buf[:end]
+
+    def header_row(self, sheet_name: str) -> list[str | None]:
+        """1행(헤더)의 문자열 값 — 열 위치 순 (A열 = 0)
+
+        문자열이 아닌 셀(숫자, 날짜 등)과 빈 셀은 None입니다.
+        1행이 비어 있거나 첫 <row>가 1행이 아니면 빈 리스트를 반환합니다.
+        """
+        first = self._read_first_row(self.sheet_part(sheet_name))
+        row_match = _ROW_NUMBER_RE.search(first)
+        if row_match is None or row_match.group(1) != b'1':
+            return []
+
+        values: dict[int, str] = {}
+        for m in _CELL_RE.finditer(first, row_match.end()):
+            if m.group(2) != b'1':
+                break
+            t_match = _T_ATTR_RE.search(m.group(3))
+            cell_type = t_match.group(1) if t_match else b'n'
+            body = m.group(4) or b''
+            if cell_type == b's':
+                v = _V_RE.search(body)
+                sst = self.shared_strings()
+                idx = int(v.group(1)) if v else -1
+                if 0 <= idx < len(sst):
+                    values[column_index_from_string(m.group(1).decode()) - 1] = _text(sst[idx])
+            elif cell_type == b'inlineStr':
+                values[column_index_from_string(m.group(1).decode()) - 1] = _text(body)
+            elif cell_type == b'str':
+                v = _V_RE.search(body)
+                if v:
+                    values[column_index_from_string(m.group(1).decode()) - 1] = (
+                        html.unescape(v.group(1).decode('utf-8'))
+                    )
+
+        if not values:
+            return []
+        header: list[str | None] = [None] * (max(values) + 1)
+        for idx, value in values.items():
+            header[idx] = value
+        return header
+
+    def _sheet_xml(self, sheet_name: str) -> bytes:
+        """시트 XML 원문 (마지막으로 읽은 시트 1개만 보관)"""
+        if self._last_xml is None or self._last_xml[0] != sheet_name:
+            self._last_xml = (sheet_name, self._zf.read(self.sheet_part(sheet_name)))
+        return self._last_xml[1]
+
+    def last_value_row(self, sheet_name: str) -> int | None:
+        """값이 있는 마지막 행 번호 (1부터). 판단할 수 없으면 None
+
+        pandas는 끝쪽의 빈 행을 잘라내므로, 컬럼 일부만 파싱했을 때
+        전체 파싱과 같은 행 수를 맞추는 데 사용합니다.
+        """
+        xml = self._sheet_xml(sheet_name)
+        pos = max(xml.rfind(b'</v>'), xml.rfind(b'</is>'))
+        if pos < 0:
+            return 0
+        row_start = xml.rfind(b'<row', 0, pos)
+        m = _ROW_NUMBER_RE.match(xml, row_start) if row_start >= 0 else None
+        return int(m.group(1)) if m else None
+
+    def projected_workbook(self, sheet_name: str, keep: Iterable[int]) -> bytes:
+        """지정 열(0부터)의 셀만 남긴 단일 시트 워크북(xlsx bytes)
+
+        대상 시트의 <sheetData>를 행 태그 + 남길 열의 <c> 요소만으로 다시 만들고
+        (남긴 열은 A, B, C… 순서로 당겨 붙임), 다른 시트는 빈 워크시트로 바꾼 뒤
+        무압축 zip으로 묶습니다. 읽기 엔진은 남은 셀만 변환하므로 파싱 시간과
+        메모리가 건너뛴 열 수에 비례해 줄어듭니다.
+
+        Raises:
+            ValueError: r 속성이 맨 앞에 없는 셀이 있어 열을 판별할 수 없는 경우
+        """
+        target = self.sheet_part(sheet_name)
+        xml = self._sheet_xml(sheet_name)
+        if xml.count(b'<c ') != xml.count(b'<c r="') or b'<c>' in xml:
+            raise ValueError("열 주소(r)로 시작하지 않는 셀이 있음")
+
+        start = xml.find(b'<sheetData>')
+        end = xml.rfind(b'</sheetData>')
+        if start >= 0 and end > start:
+            columns = sorted(set(keep))
+            remap = {
+                get_column_letter(col + 1).encode(): get_column_letter(new + 1).encode()
+                for new, col in enumerate(columns)
+            }
+            # 리터럴 '<'로 시작해야 re의 접두어 탐색 최적화가 적용됨
+            kept = re.compile(
+                rb'<(?:(row\b[^>]*>|/row>)|c r="(' + b'|'.join(remap) + rb')'
+                rb'(\d+"[^>]*(?:/>|>[^<]*(?:<(?!/c>)[^<]*)*</c>)))'
+            )
+            parts = [xml[:start], b'<sheetData>']
+            for row_tag, letter, rest in kept.findall(xml, start, end):
+                if row_tag:
+                    parts.extend((b'<', row_tag))
+                else:
+                    parts.extend((b'<c r="', remap[letter], rest))
+            parts.append(xml[end:])
+            xml = b''.join(parts)
+        other_sheets = set(self._sheet_parts.values()) - {target}
+
+        out = io.BytesIO()
+        with zipfile.ZipFile(out, 'w', zipfile.ZIP_STORED) as dst:
+            for info in self._zf.infolist():
+                if info.filename == target:
+                    data = xml
+                elif info.filename in other_sheets:
+                    data = _EMPTY_WORKSHEET
+                else:
+                    data = self._zf.read(info.filename)
+                dst.writestr(info.filename, data)
+        return out.getvalue()
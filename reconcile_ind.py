@@ -34,6 +34,7 @@ from po_generator.config import (
     SO_DOMESTIC_SHEET, SO_EXPORT_SHEET,
     PO_DOMESTIC_SHEET, PO_EXPORT_SHEET,
 )
+from po_generator.excel_reader import ExcelReader, read_excel
 from po_generator.logging_config import setup_logging
 from po_generator.recon_paths import resolve_period_dir, iter_period_dirs
 
@@ -91,15 +92,15 @@ def get_ob_sheet_name(period_code: str) -> str:
 
 def build_mapping() -> tuple[dict[str, tuple[str, object, str | None]], set[str]]:
     """발주번호 → (SO_ID, Industry code, Sector) 매핑 딕셔너리 + 중복 O.C No. 집합"""
+    with ExcelReader(NOAH_SO_PO_DN_FILE) as xf:
+        po_dom = xf.read(PO_DOMESTIC_SHEET, usecols=[PO_OC_COL, PO_SO_ID_COL])
+        po_exp = xf.read(PO_EXPORT_SHEET, usecols=[PO_OC_COL, PO_SO_ID_COL])
+        so_dom = xf.read(SO_DOMESTIC_SHEET,
+                         usecols=[PO_SO_ID_COL, SO_IND_COL, SO_SECTOR_COL])
+        so_exp = xf.read(SO_EXPORT_SHEET,
+                         usecols=[PO_SO_ID_COL, SO_IND_COL, SO_SECTOR_COL])
+
     # PO: NOAH O.C No. → SO_ID
-    po_dom = pd.read_excel(
-        NOAH_SO_PO_DN_FILE, sheet_name=PO_DOMESTIC_SHEET,
-        usecols=[PO_OC_COL, PO_SO_ID_COL],
-    )
-    po_exp = pd.read_excel(
-        NOAH_SO_PO_DN_FILE, sheet_name=PO_EXPORT_SHEET,
-        usecols=[PO_OC_COL, PO_SO_ID_COL],
-    )
     po_map = pd.concat([po_dom, po_exp], ignore_index=True)
     po_map = po_map.dropna(subset=[PO_OC_COL, PO_SO_ID_COL])
     po_map[PO_OC_COL] = po_map[PO_OC_COL].astype(str).str.strip()
@@ -118,14 +119,6 @@ def build_mapping() -> tuple[dict[str, tuple[str, object, str | None]], set[str]
     po_map = po_map.drop_duplicates(subset=[PO_OC_COL])
 
     # SO: SO_ID → (Industry code, Sector)
-    so_dom = pd.read_excel(
-        NOAH_SO_PO_DN_FILE, sheet_name=SO_DOMESTIC_SHEET,
-        usecols=[PO_SO_ID_COL, SO_IND_COL, SO_SECTOR_COL],
-    )
-    so_exp = pd.read_excel(
-        NOAH_SO_PO_DN_FILE, sheet_name=SO_EXPORT_SHEET,
-        usecols=[PO_SO_ID_COL, SO_IND_COL, SO_SECTOR_COL],
-    )
     so_map = pd.concat([so_dom, so_exp], ignore_index=True)
     so_map = so_map.dropna(subset=[PO_SO_ID_COL])
     so_map[PO_SO_ID_COL] = so_map[PO_SO_ID_COL].astype(str).str.strip()
@@ -215,8 +208,8 @@ def load_industry_code_master(ob_file: Path) -> dict:
     Returns:
         dict: {industry_code_str: (Category, expected_sector)}
     """
-    master = pd.read_excel(ob_file, sheet_name='Industry code',
-                           usecols=['Category', 'New Industry Code'])
+    master = read_excel(ob_file, sheet_name='Industry code',
+                        usecols=['Category', 'New Industry Code'])
     master = master.dropna(subset=['New Industry Code'])
 
     result = {}
@@ -241,11 +234,12 @@ def validate_so_sector(
 
     # SO 로드 (국내 + 해외)
     so_cols = [PO_SO_ID_COL, 'Customer name', SO_SECTOR_COL, SO_IND_COL]
-    so_dom = pd.read_excel(NOAH_SO_PO_DN_FILE, sheet_name=SO_DOMESTIC_SHEET)
+    with ExcelReader(NOAH_SO_PO_DN_FILE) as xf:
+        so_dom = xf.read(SO_DOMESTIC_SHEET)
+        so_exp = xf.read(SO_EXPORT_SHEET)
     so_dom = so_dom[[c for c in so_cols if c in so_dom.columns]].copy()
     so_dom['구분'] = '국내'
 
-    so_exp = pd.read_excel(NOAH_SO_PO_DN_FILE, sheet_name=SO_EXPORT_SHEET)
     so_exp = so_exp[[c for c in so_cols if c in so_exp.columns]].copy()
     so_exp['구분'] = '해외'
 
@@ -471,7 +465,7 @@ def main() -> int:
     if not args.sector_only:
         ob_sheet = get_ob_sheet_name(period)
         try:
-            ob = pd.read_excel(ob_file, sheet_name=ob_sheet)
+            ob = read_excel(ob_file, sheet_name=ob_sheet)
         except Exception as e:
             print(f"[오류] Orderbook 로드 실패: {e}")
             return 1
@@ -24,6 +24,7 @@ import pandas as pd
 warnings.filterwarnings('ignore', category=UserWarning, module='openpyxl')
 
 from po_generator.config import NOAH_SO_PO_DN_FILE, BASE_DIR
+from po_generator.excel_reader import ExcelReader, read_excel
 from po_generator.logging_config import setup_logging
 from po_generator.recon_paths import resolve_period_dir
 
@@ -71,16 +72,16 @@ def load_internal_po() -> tuple[pd.DataFrame, pd.DataFrame]:
     Returns:
         (AX PO 있는 PO, 전체 PO — Cancelled 제외)
     """
-    xf = pd.ExcelFile(NOAH_SO_PO_DN_FILE)
+    with ExcelReader(NOAH_SO_PO_DN_FILE) as xf:
+        df_dom = xf.read('PO_국내')
+        df_exp = xf.read('PO_해외')
 
     # PO_국내
-    df_dom = pd.read_excel(xf, 'PO_국내')
     dom_cols = [c for c in PO_DOMESTIC_COLS if c in df_dom.columns]
     df_dom = df_dom[dom_cols].copy()
     df_dom['구분'] = '국내'
 
     # PO_해외
-    df_exp = pd.read_excel(xf, 'PO_해외')
     exp_cols = [c for c in PO_EXPORT_COLS if c in df_exp.columns]
     df_exp = df_exp[exp_cols].copy()
     df_exp['구분'] = '해외'
@@ -108,7 +109,7 @@ def load_internal_po() -> tuple[pd.DataFrame, pd.DataFrame]:
 
 def load_delivery(delivery_file: Path) -> pd.DataFrame:
     """공장 출고 리스트 Delivery 시트 읽기"""
-    df = pd.read_excel(delivery_file, sheet_name='Delivery')
+    df = read_excel(delivery_file, sheet_name='Delivery')
     df = df[df['RCK ODER'].notna()].copy()
     df['RCK ODER'] = df['RCK ODER'].astype(str).str.strip()
     logger.debug("출고 리스트 로드: %d건 (%s)", len(df), delivery_file.name)
@@ -117,19 +118,19 @@ def load_delivery(delivery_file: Path) -> pd.DataFrame:
 
 def load_grn(grn_file: Path) -> pd.DataFrame:
     """회계 GRN 파일 읽기 — 'Purchase order' 컬럼이 있는 시트를 자동 선택"""
-    xf = pd.ExcelFile(grn_file)
-    target_sheet = None
-    for sn in xf.sheet_names:
-        head = pd.read_excel(xf, sheet_name=sn, nrows=0)
-        if 'Purchase order' in head.columns:
-            target_sheet = sn
-            break
-    if target_sheet is None:
-        raise ValueError(
-            f"GRN 파일에서 'Purchase order' 컬럼이 있는 시트를 찾을 수 없습니다 "
-            f"(시트 목록: {xf.sheet_names})"
-        )
-    df = pd.read_excel(xf, sheet_name=target_sheet)
+    with ExcelReader(grn_file) as xf:
+        target_sheet = None
+        for sn in xf.sheet_names:
+            head = xf.read(sn, nrows=0)
+            if 'Purchase order' in head.columns:
+                target_sheet = sn
+                break
+        if target_sheet is None:
+            raise ValueError(
+                f"GRN 파일에서 'Purchase order' 컬럼이 있는 시트를 찾을 수 없습니다 "
+                f"(시트 목록: {xf.sheet_names})"
+            )
+        df = xf.read(target_sheet)
     use_cols = [c for c in GRN_USE_COLS if c in df.columns]
     df = df[use_cols].copy()
     df = df[df['Purchase order'].notna()].copy()
@@ -28,6 +28,7 @@ from po_generator.config import (
     NOAH_SO_PO_DN_FILE, BASE_DIR,
     DN_DOMESTIC_SHEET, DN_EXPORT_SHEET,
 )
+from po_generator.excel_reader import ExcelReader, read_excel
 from po_generator.logging_config import setup_logging
 from po_generator.recon_paths import resolve_period_dir
 
@@ -66,17 +67,17 @@ def find_ax_sales_file(period_code: str) -> Path | None:
 
 def load_ax_sales(file_path: Path) -> pd.DataFrame:
     """AX Sales 파일 로드 (Project, Customer, AX 금액)"""
-    xf = pd.ExcelFile(file_path)
-
-    # 시트명: Sheet1 우선, Sales fallback, 그 외 첫 번째 시트
-    if 'Sheet1' in xf.sheet_names:
-        sheet = 'Sheet1'
-    elif 'Sales' in xf.sheet_names:
-        sheet = 'Sales'
-    else:
-        sheet = xf.sheet_names[0]
-
-    df = pd.read_excel(xf, sheet_name=sheet)
+    with ExcelReader(file_path) as xf:
+        # 시트명: Sheet1 우선, Sales fallback, 그 외 첫 번째 시트
+        sheet_names = xf.sheet_names
+        if 'Sheet1' in sheet_names:
+            sheet = 'Sheet1'
+        elif 'Sales' in sheet_names:
+            sheet = 'Sales'
+        else:
+            sheet = sheet_names[0]
+
+        df = xf.read(sheet)
 
     # 필수 컬럼 확인
     for col in ['Project', 'AX']:
@@ -115,10 +116,11 @@ def load_noah_dn(year_month: str) -> pd.DataFrame:
     Args:
         year_month: 출고일 필터 기준 (예: '2026-03')
     """
-    xf = pd.ExcelFile(NOAH_SO_PO_DN_FILE)
+    with ExcelReader(NOAH_SO_PO_DN_FILE) as xf:
+        df_dom = xf.read(DN_DOMESTIC_SHEET)
+        df_exp = xf.read(DN_EXPORT_SHEET)
 
     # DN_국내
-    df_dom = pd.read_excel(xf, DN_DOMESTIC_SHEET)
     # 국내는 AX Project 컬럼명이 'AX Project no'
     if 'AX Project no' in df_dom.columns:
         df_dom = df_dom.rename(columns={'AX Project no': AX_PROJECT_COL})
@@ -129,7 +131,6 @@ def load_noah_dn(year_month: str) -> pd.DataFrame:
     df_dom['Total Sales KRW'] = df_dom['Total Sales']
 
     # DN_해외
-    df_exp = pd.read_excel(xf, DN_EXPORT_SHEET)
     exp_cols = [c for c in [AX_PROJECT_COL] + DN_COMMON_COLS + DN_EXPORT_EXTRA_COLS
                 if c in df_exp.columns]
     df_exp = df_exp[exp_cols].copy()
@@ -166,7 +167,7 @@ def load_fx_rates() -> pd.DataFrame:
     Returns:
         DataFrame with index=Currency (USD/EUR/GBP), columns=period (2026-01, ...)
     """
-    df = pd.read_excel(NOAH_SO_PO_DN_FILE, sheet_name=FX_SHEET)
+    df = read_excel(NOAH_SO_PO_DN_FILE, sheet_name=FX_SHEET)
     df = df.set_index('FX')
     logger.debug("FX 환율 로드: %s", list(df.columns))
     return df
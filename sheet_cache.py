@@ -0,0 +1,174 @@
+#!/usr/bin/env python
+"""
+NOAH 시트 디스크 캐시 관리
+===========================
+
+NOAH_SO_PO_DN.xlsx 파싱 결과 캐시(워크북 옆 .sheetcache 폴더)를
+조회/예열/삭제합니다. create_*.py는 캐시가 최신이면 Excel 파싱을 건너뜁니다.
+
+사용법:
+    python sheet_cache.py                     # 캐시 현황 조회
+    python sheet_cache.py --warm              # 전체 시트 예열 (파싱 후 저장)
+    python sheet_cache.py --warm --sheets SO_국내 DN_국내
+    python sheet_cache.py --purge             # 캐시 삭제
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+import warnings
+
+warnings.filterwarnings('ignore', category=UserWarning, module='openpyxl')
+
+from po_generator.config import (
+    NOAH_SO_PO_DN_FILE,
+    SO_DOMESTIC_SHEET, PO_DOMESTIC_SHEET, DN_DOMESTIC_SHEET, PMT_DOMESTIC_SHEET,
+    SO_EXPORT_SHEET, PO_EXPORT_SHEET, DN_EXPORT_SHEET,
+    CUSTOMER_EXPORT_SHEET, WEIGHT_SHEET,
+)
+from po_generator.logging_config import setup_logging
+from po_generator.sheet_cache import SheetCache
+from po_generator.utils import WorkbookCache, SHEET_DTYPES
+from po_generator.xlsx_package import XlsxPackage
+
+# 문서 생성 로더가 읽는 시트
+CACHED_SHEETS: tuple[str, ...] = (
+    SO_DOMESTIC_SHEET, PO_DOMESTIC_SHEET, DN_DOMESTIC_SHEET, PMT_DOMESTIC_SHEET,
+    SO_EXPORT_SHEET, PO_EXPORT_SHEET, DN_EXPORT_SHEET,
+    CUSTOMER_EXPORT_SHEET, WEIGHT_SHEET,
+)
+
+
+def show_info(cache: SheetCache) -> int:
+    """캐시 현황 조회"""
+    entries = cache.entries()
+    print(f"\nNOAH 시트 캐시 현황")
+    print("=" * 72)
+    print(f"워크북: {cache.workbook_path}")
+    print(f"캐시:   {cache.cache_dir}")
+
+    if not entries:
+        print("\n캐시 없음 — `python sheet_cache.py --warm`으로 예열하세요.")
+        return 0
+
+    pkg = None
+    if cache.workbook_path.exists():
+        try:
+            pkg = XlsxPackage(cache.workbook_path)
+        except Exception as e:
+            print(f"[경고] 워크북을 열 수 없어 최신 여부 확인 생략: {e}")
+
+    print(f"\n{'시트':<16} {'상태':<6} {'포맷':<8} {'행수':>7} {'열':>4} {'크기(KB)':>9} {'저장 시각':>20}")
+    print("-" * 76)
+    total_bytes = 0
+    try:
+        for meta in entries:
+            sheet = meta.get('sheet', '?')
+            if pkg is None:
+                state = '-'
+            else:
+                fresh = cache.is_fresh(pkg, meta, SHEET_DTYPES.get(sheet))
+                state = '최신' if fresh else '만료'
+            size = meta.get('bytes', 0)
+            total_bytes += size
+            created = meta.get('created_at', '-').replace('T', ' ')
+            print(
+                f"{sheet:<16} {state:<6} {meta.get('format', '-'):<8} "
+                f"{meta.get('rows', 0):>7} {meta.get('columns', 0):>4} "
+                f"{size / 1024:>9.1f} {created:>20}"
+            )
+    finally:
+        if pkg is not None:
+            pkg.close()
+
+    print("-" * 76)
+    print(f"{'합계':<16} {len(entries):>3}개 시트, {total_bytes / 1024:.1f} KB")
+    return 0
+
+
+def warm(cache: SheetCache, sheets: list[str] | None) -> int:
+    """시트 예열 — 캐시가 만료된 시트만 파싱 후 저장"""
+    if not cache.workbook_path.exists():
+        print(f"[오류] Excel 파일을 찾을 수 없습니다: {cache.workbook_path}")
+        return 1
+
+    workbook = WorkbookCache(disk_cache=True)
+    available = set(workbook.sheet_names(cache.workbook_path))
+    targets = [s for s in (sheets or CACHED_SHEETS) if s in available]
+    skipped = [s for s in (sheets or CACHED_SHEETS) if s not in available]
+    for s in skipped:
+        print(f"[경고] 시트 없음, 스킵: {s}")
+
+    start = time.perf_counter()
+    for sheet in targets:
+        t0 = time.perf_counter()
+        before = workbook.stats.misses
+        df = workbook.get_sheet(cache.workbook_path, sheet)
+        source = '파싱' if workbook.stats.misses > before else '캐시'
+        print(f"  {sheet:<16} {len(df):>7}행  {source}  {time.perf_counter() - t0:.2f}초")
+
+    print(f"\n예열 완료: {len(targets)}개 시트 ({time.perf_counter() - start:.1f}초)")
+    return 0
+
+
+def create_argument_parser() -> argparse.ArgumentParser:
+    """CLI 인자 파서 생성"""
+    parser = argparse.ArgumentParser(
+        prog='sheet_cache',
+        description='NOAH 시트 디스크 캐시 관리 — 조회/예열/삭제',
+        epilog='예시: python sheet_cache.py --warm --sheets SO_국내 DN_국내',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+
+    action = parser.add_mutually_exclusive_group()
+    action.add_argument(
+        '--warm',
+        action='store_true',
+        help='시트를 파싱하여 캐시 저장 (이미 최신이면 건너뜀)',
+    )
+    action.add_argument(
+        '--purge',
+        action='store_true',
+        help='캐시 폴더 삭제',
+    )
+
+    parser.add_argument(
+        '--sheets',
+        nargs='+',
+        metavar='SHEET',
+        help='예열할 시트명 (기본: 문서 생성에 쓰이는 전체 시트)',
+    )
+
+    parser.add_argument(
+        '-v', '--verbose',
+        action='store_true',
+        help='상세 로그 출력',
+    )
+
+    return parser
+
+
+def main() -> int:
+    """메인 함수"""
+    parser = create_argument_parser()
+    args = parser.parse_args()
+
+    setup_logging(verbose=args.verbose)
+
+    cache = SheetCache(NOAH_SO_PO_DN_FILE)
+
+    if args.purge:
+        removed = cache.purge()
+        print(f"캐시 삭제 완료: {removed}개 파일 ({cache.cache_dir})")
+        return 0
+
+    if args.warm:
+        return warm(cache, args.sheets)
+
+    return show_info(cache)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,7 +3,7 @@
 NOAH Excel → SQLite 동기화
 ===========================
 
-NOAH_SO_PO_DN.xlsx의 수동 입력 시트(SO, PO, DN, PMT)를
+NOAH_SO_PO_DN.xlsx의 수동 입력 시트(SO, PO, DN, PMT, Customer)를
 SQLite DB에 업로드하여 데이터를 안전하게 백업합니다.
 
 사용법:
@@ -11,16 +11,22 @@ SQLite DB에 업로드하여 데이터를 안전하게 백업합니다.
     python sync_db.py -v                        # 상세 로그
     python sync_db.py --sheets SO_국내 PO_국내  # 특정 시트만
     python sync_db.py --dry-run                 # 시뮬레이션
-    python sync_db.py --info                    # DB 현황 조회
+    python sync_db.py --full                    # 변경 없는 시트도 전체 동기화
+    python sync_db.py --info                    # DB 현황 + 최근 동기화 성능 추이
+    python sync_db.py --batch-size 5000         # 대용량 시트 스트리밍 (메모리 일정)
+    python sync_db.py --workers 1               # 시트 순차 파싱 (기본: 코어 수만큼 병렬)
+    python sync_db.py --watch                   # 워크북 저장 감시 → 변경 시 자동 증분 동기화
 """
 
 from __future__ import annotations
 
 import argparse
-import json
+import gc
 import sqlite3
 import sys
+import time
 import warnings
+import zipfile
 from datetime import datetime
 from pathlib import Path
 
@@ -30,9 +36,17 @@ from po_generator.config import NOAH_SO_PO_DN_FILE, DB_FILE
 from po_generator.db_schema import (
     SYNC_SHEETS, get_sync_metadata, get_table_row_count,
     ensure_sync_log_tables, create_sync_run, finalize_sync_run,
+    format_pk_display, sync_log_json, sync_log_text,
 )
 from po_generator.db_sync import SyncEngine, SyncSummary
 from po_generator.logging_config import setup_logging
+from po_generator.sync_metrics import (
+    PHASE_LOG, RUN_PHASES, SHEET_PHASES, is_slowdown, phase_totals,
+)
+from po_generator.sync_watch import (
+    DEFAULT_DEBOUNCE_SECONDS, DEFAULT_POLL_SECONDS, WorkbookWatcher,
+)
+from po_generator.xlsx_package import format_row_ranges
 
 
 def print_summary(summary: SyncSummary, dry_run: bool = False) -> None:
@@ -49,6 +63,9 @@ def print_summary(summary: SyncSummary, dry_run: bool = False) -> None:
     print("-" * 64)
 
     for r in summary.results:
+        if r.unchanged_skipped:
+            print(f"{r.sheet_name:<14} {'변경 없음 (건너뜀)':>34}")
+            continue
         err_mark = f"  *{r.errors}" if r.errors > 0 else f"  {r.errors}"
         print(f"{r.sheet_name:<14} {r.total_rows:>6} {r.inserted:>8} {r.updated:>8} {r.pruned:>8} {err_mark:>6}")
 
@@ -60,7 +77,26 @@ def print_summary(summary: SyncSummary, dry_run: bool = False) -> None:
         f"{'  *' + str(summary.total_errors) if summary.total_errors > 0 else '  ' + str(summary.total_errors):>6}"
     )
 
-    print(f"\n소요시간: {summary.elapsed_seconds:.1f}초")
+    if summary.weight_lines:
+        print(f"\nPO 라인 Weight: {summary.weight_lines}건 저장 (미매칭 {summary.weight_unmatched}건)")
+
+    changed = [r for r in summary.results if r.changed_rows]
+    if changed:
+        print("\n변경 행 범위 (지난 동기화 대비):")
+        for r in changed:
+            print(f"  {r.sheet_name}: {format_row_ranges(r.changed_rows)}")
+
+    if summary.total_indexes_created:
+        print(f"\n인덱스: {summary.total_indexes_created}개 생성 ({summary.total_index_seconds:.2f}초)")
+    print(f"\n소요시간: {summary.elapsed_seconds:.1f}초 ({_format_rate(summary.rows_per_second)})")
+    print(f"단계: {_format_phases(summary.phase_totals())}")
+    resources = []
+    if summary.bytes_written is not None:
+        resources.append(f"쓰기 {_format_mb(summary.bytes_written)}")
+    if summary.peak_rss_bytes is not None:
+        resources.append(f"피크 메모리 {_format_mb(summary.peak_rss_bytes)}")
+    if resources:
+        print(', '.join(resources))
 
     # 에러 상세
     for r in summary.results:
@@ -72,138 +108,190 @@ def print_summary(summary: SyncSummary, dry_run: bool = False) -> None:
                 print(f"  ... 외 {len(r.error_messages) - 5}건")
 
 
-def _format_pk(pk: tuple) -> str:
-    return ' | '.join(str(v) for v in pk)
+def _format_rate(rows_per_sec: float | None) -> str:
+    return f"{rows_per_sec or 0:,.0f}행/초"
+
+
+def _format_mb(n_bytes: int | None) -> str:
+    return '-' if n_bytes is None else f"{n_bytes / 1024 / 1024:.1f}MB"
+
+
+def _format_phases(phases: dict[str, float]) -> str:
+    """단계별 소요 시간 — 'parse 1.20s · diff 0.31s · ...' (표시 순서 고정, 0초 단계 생략)"""
+    order = [*SHEET_PHASES, *RUN_PHASES]
+    names = [n for n in order if phases.get(n)] + [n for n in phases if n not in order]
+    return ' · '.join(f"{n} {phases[n]:.2f}s" for n in names) or '-'
 
 
 def _format_val(val) -> str:
     if val is None:
         return '(빈값)'
-    s = str(val)
+    s = sync_log_text(val) or ''
     return s[:40] + '...' if len(s) > 40 else s
 
 
+def _print_more(total: int, shown: int) -> None:
+    if total > shown:
+        print(f"    ... 외 {total - shown}건")
+
+
 def print_changes(summary: SyncSummary) -> None:
-    """신규/수정/삭제된 레코드 상세 출력"""
-    has_changes = any(r.inserted_details or r.updated_details or r.pruned_pks for r in summary.results)
+    """신규/수정/삭제된 레코드 상세 출력 — 시트별 앞 CHANGE_SAMPLE_LIMIT건 (전체는 _sync_log)"""
+    has_changes = any(r.inserted or r.updated or r.pruned for r in summary.results)
     if not has_changes:
         print("\n변경 사항 없음")
         return
 
     for r in summary.results:
-        if not r.inserted_details and not r.updated_details and not r.pruned_pks:
+        if not r.inserted and not r.updated and not r.pruned:
             continue
 
         print(f"\n--- {r.sheet_name} ---")
 
-        if r.inserted_details:
-            print(f"  [신규] {len(r.inserted_details)}건:")
+        if r.inserted:
+            print(f"  [신규] {r.inserted}건:")
             for detail in r.inserted_details:
-                print(f"    + {_format_pk(detail['pk'])}")
+                print(f"    + {format_pk_display(detail['pk'])}")
                 for col, val in detail['values'].items():
                     print(f"        {col}: {_format_val(val)}")
+            _print_more(r.inserted, len(r.inserted_details))
 
-        if r.updated_details:
-            print(f"  [수정] {len(r.updated_details)}건:")
-            for detail in r.updated_details[:20]:
-                print(f"    ~ {_format_pk(detail['pk'])}")
+        if r.updated:
+            print(f"  [수정] {r.updated}건:")
+            for detail in r.updated_details:
+                print(f"    ~ {format_pk_display(detail['pk'])}")
                 for col, (old, new) in detail['changes'].items():
                     print(f"        {col}: {_format_val(old)} → {_format_val(new)}")
-            if len(r.updated_details) > 20:
-                print(f"    ... 외 {len(r.updated_details) - 20}건")
+            _print_more(r.updated, len(r.updated_details))
 
-        if r.pruned_pks:
-            print(f"  [삭제] {len(r.pruned_pks)}건:")
-            for pk in r.pruned_pks[:20]:
-                print(f"    - {_format_pk(pk)}")
-            if len(r.pruned_pks) > 20:
-                print(f"    ... 외 {len(r.pruned_pks) - 20}건")
+        if r.pruned:
+            print(f"  [삭제] {r.pruned}건:")
+            for pk in r.pruned_pks:
+                print(f"    - {format_pk_display(pk)}")
+            _print_more(r.pruned, len(r.pruned_pks))
 
 
-def _to_text(val) -> str | None:
-    """로그 값 → JSON-호환 텍스트. None/빈 문자열은 None으로 통일."""
-    if val is None:
-        return None
-    s = str(val)
-    return s if s else None
+def _run_metrics(summary: SyncSummary) -> dict:
+    """_sync_runs 성능 지표 컬럼 값 (SYNC_RUN_METRIC_COLUMNS)"""
+    sheets = {
+        r.sheet_name: {**{k: round(v, 4) for k, v in r.phase_seconds.items()}, 'rows': r.total_rows}
+        for r in summary.results if r.phase_seconds
+    }
+    run = {k: round(v, 4) for k, v in summary.phase_seconds.items()}
+    return {
+        'elapsed_seconds': round(summary.elapsed_seconds, 3),
+        'total_rows': summary.total_rows,
+        'rows_per_sec': round(summary.rows_per_second, 1),
+        'bytes_written': summary.bytes_written,
+        'peak_rss_bytes': summary.peak_rss_bytes,
+        'phases_json': sync_log_json({'run': run, 'sheets': sheets}),
+    }
+
+
+# 에러로 ROLLBACK된 실행의 _sync_runs.note 표시
+ROLLBACK_NOTE = 'ROLLBACK'
 
 
-def _jdump(obj) -> str:
-    """JSON 직렬화 — 한글 비-escape, 키 순서 유지."""
-    return json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+def _run_note(summary: SyncSummary, note: str | None) -> str | None:
+    """_sync_runs.note — 에러 ROLLBACK이면 'ROLLBACK (에러 N건)'을 붙여 변경 없는 실행과 구분"""
+    if summary.total_errors == 0:
+        return note
+    rollback = f"{ROLLBACK_NOTE} (에러 {summary.total_errors}건)"
+    return f"{note}: {rollback}" if note else rollback
 
 
-def write_sync_log_to_db(summary: SyncSummary, db_path: Path = DB_FILE) -> None:
-    """동기화 변경 내역을 _sync_log v2 스키마에 기록.
+def write_sync_log_to_db(summary: SyncSummary, db_path: Path = DB_FILE,
+                         note: str | None = None, record_empty: bool = False) -> None:
+    """동기화 실행을 _sync_runs에 마무리 기록 (성능 지표 + note).
+
+    _sync_log 변경 행(record당 1행)은 SyncEngine.sync_all이 반영과 같은 트랜잭션에서
+    묶음 단위로 이미 기록했습니다 (summary.sync_id). 여기서는 COMMIT 뒤에야 알 수 있는
+    소요 시간·쓰기 바이트 등을 그 실행 행에 채웁니다.
 
-    record(레코드)당 1행으로 압축 저장:
     - 신규: changes_json = {col: value, ...}, row_snapshot_json = NULL
     - 수정: changes_json = {col: {old, new}, ...}, row_snapshot_json = NULL
     - 삭제: changes_json = NULL, row_snapshot_json = {col: value, ...}
 
-    sync 트랜잭션과 분리된 별도 트랜잭션으로 기록 — 로그 기록 실패가
-    이미 commit된 sync 결과를 해치지 않도록.
-    """
-    has_changes = any(r.inserted_details or r.updated_details or r.pruned_pks for r in summary.results)
-    if not has_changes:
-        return
-
-    rows: list[tuple] = []
-    # placeholder sync_id — INSERT 시점에 채움
-    for r in summary.results:
-        # 신규
-        for detail in r.inserted_details:
-            pk_tuple = tuple(detail['pk'])
-            pk_json = _jdump(list(pk_tuple))
-            pk_disp = _format_pk(pk_tuple)
-            changes = {col: _to_text(val) for col, val in detail['values'].items()
-                       if _to_text(val) is not None}
-            rows.append((r.sheet_name, '신규', pk_json, pk_disp,
-                         _jdump(changes) if changes else None, None))
-
-        # 수정
-        for detail in r.updated_details:
-            pk_tuple = tuple(detail['pk'])
-            pk_json = _jdump(list(pk_tuple))
-            pk_disp = _format_pk(pk_tuple)
-            changes = {col: {'old': _to_text(old), 'new': _to_text(new)}
-                       for col, (old, new) in detail['changes'].items()}
-            rows.append((r.sheet_name, '수정', pk_json, pk_disp,
-                         _jdump(changes) if changes else None, None))
-
-        # 삭제 (스냅샷 매핑)
-        snap_map = {tuple(s['pk']): s.get('snapshot', {}) for s in r.pruned_snapshots}
-        for pk in r.pruned_pks:
-            pk_tuple = tuple(pk)
-            pk_json = _jdump(list(pk_tuple))
-            pk_disp = _format_pk(pk_tuple)
-            snap = snap_map.get(pk_tuple, {})
-            snap_clean = {k: _to_text(v) for k, v in snap.items() if _to_text(v) is not None}
-            rows.append((r.sheet_name, '삭제', pk_json, pk_disp,
-                         None, _jdump(snap_clean) if snap_clean else None))
+    변경이 없었거나 ROLLBACK된 실행은 sync_id가 없으므로 record_empty일 때만
+    변경 0건인 실행 행을 새로 만듭니다. ROLLBACK된 실행은 note에 'ROLLBACK (에러 N건)'이
+    붙습니다 (--info/대시보드에서 변경 없는 실행과 구분).
 
-    if not rows:
+    Args:
+        summary: 동기화 결과
+        db_path: DB 경로
+        note: _sync_runs.note (예: 'watch')
+        record_empty: True면 로그 행이 없어도 _sync_runs에 실행 기록 (total_changes=0)
+    """
+    if summary.sync_id is None and not record_empty:
         return
+    log_started = time.perf_counter()
+    note = _run_note(summary, note)
 
     conn = sqlite3.connect(str(db_path))
     try:
         ensure_sync_log_tables(conn)
-        sync_id = create_sync_run(conn, dry_run=False)
-        # sync_id를 각 행 앞에 prepend
-        rows_with_id = [(sync_id, *r) for r in rows]
-        conn.executemany(
-            "INSERT INTO _sync_log "
-            "(sync_id, sheet_name, change_type, pk_json, pk_display, "
-            " changes_json, row_snapshot_json) "
-            "VALUES (?, ?, ?, ?, ?, ?, ?)",
-            rows_with_id,
+        sync_id = summary.sync_id
+        if sync_id is None:
+            sync_id = create_sync_run(conn, dry_run=False, note=note)
+        summary.phase_seconds[PHASE_LOG] = (
+            summary.phase_seconds.get(PHASE_LOG, 0.0) + time.perf_counter() - log_started
         )
-        finalize_sync_run(conn, sync_id, len(rows))
+        finalize_sync_run(conn, sync_id, summary.log_rows, _run_metrics(summary), note=note)
         conn.commit()
     finally:
         conn.close()
 
-    print(f"\n동기화 로그 저장: _sync_log {len(rows):,}행 (sync_id={sync_id})")
+    if summary.log_rows:
+        print(f"\n동기화 로그 저장: _sync_log {summary.log_rows:,}행 (sync_id={sync_id})")
+
+
+def run_watch(args: argparse.Namespace) -> int:
+    """워크북 저장 감시 모드 — 변경이 안정되면 증분 동기화 반복 (Ctrl+C로 종료)
+
+    매 실행은 지문이 바뀐 시트만 동기화하고, 변경 유무와 관계없이
+    _sync_runs에 note='watch'로 기록합니다. 워크북이 저장 중이거나 워크북/DB가
+    잠겨 열리지 않으면 debounce 후 다시 시도합니다.
+    """
+    watcher = WorkbookWatcher(
+        NOAH_SO_PO_DN_FILE,
+        poll_interval=args.interval,
+        debounce=args.debounce,
+    )
+    print(f"워크북 감시 시작: {NOAH_SO_PO_DN_FILE} "
+          f"(폴링 {args.interval:g}초, 안정 대기 {args.debounce:g}초) — Ctrl+C로 종료")
+
+    runs = 0
+    try:
+        while True:
+            state = watcher.wait()
+            # 실행마다 새 엔진 — 이전 실행의 결과/리더가 남지 않도록
+            engine = SyncEngine(batch_size=args.batch_size, workers=args.workers)
+            try:
+                summary = engine.sync_all(sheet_filter=args.sheets, full=args.full and runs == 0)
+            except (OSError, zipfile.BadZipFile, sqlite3.OperationalError) as e:
+                # 폴링 후 다시 저장이 시작됐거나 워크북/DB를 다른 프로세스가 잠금
+                print(f"[대기] 워크북/DB를 읽을 수 없음 — 재시도 예정: {e}")
+                watcher.retry_later()
+                continue
+            except Exception as e:
+                # 재시도해도 같은 결과 — 다음 저장까지 대기
+                print(f"[오류] 동기화 실패: {e}")
+                watcher.mark_synced(state)
+                continue
+
+            watcher.mark_synced(state)
+            runs += 1
+            try:
+                write_sync_log_to_db(summary, db_path=engine.db_path, note='watch', record_empty=True)
+            except sqlite3.Error as e:
+                print(f"[경고] 동기화 로그 기록 실패: {e}")
+            print_summary(summary)
+            # 실행 간 남는 객체 없이 상주 메모리 일정하게
+            del engine, summary
+            gc.collect()
+    except KeyboardInterrupt:
+        print(f"\n워크북 감시 종료 (동기화 {runs}회)")
+    return 0
 
 
 def show_info() -> int:
@@ -239,12 +327,49 @@ def show_info() -> int:
         print("-" * 60)
         print(f"{'합계':<16} {total:>8}")
 
+        print_recent_runs(conn)
+
     finally:
         conn.close()
 
     return 0
 
 
+# --info 성능 추이에 표시할 최근 실행 수
+RECENT_RUNS = 10
+
+
+def print_recent_runs(conn: sqlite3.Connection, limit: int = RECENT_RUNS) -> None:
+    """최근 동기화 성능 추이 (_sync_runs 지표) — 직전 실행들보다 행/초가 크게 떨어지면 ▼,
+    에러로 ROLLBACK된 실행은 [ROLLBACK] 표시"""
+    try:
+        rows = conn.execute(
+            "SELECT sync_id, started_at, elapsed_seconds, total_rows, rows_per_sec, "
+            "       bytes_written, peak_rss_bytes, phases_json, note "
+            "FROM _sync_runs WHERE elapsed_seconds IS NOT NULL "
+            "ORDER BY sync_id DESC LIMIT ?",
+            (limit,),
+        ).fetchall()
+    except sqlite3.OperationalError:
+        return  # 로그 테이블 없음 / 성능 지표 이전 버전
+    if not rows:
+        return
+
+    print(f"\n최근 동기화 {len(rows)}회 (성능 추이)")
+    print(f"{'ID':>5} {'시작':<17} {'소요':>7} {'행수':>7} {'행/초':>8} "
+          f"{'쓰기':>8} {'메모리':>8}  가장 긴 단계")
+    print("-" * 86)
+    for i, (sync_id, started, elapsed, n_rows, rate, written, peak, phases_json, note) in enumerate(rows):
+        slow = bool(n_rows) and is_slowdown(rate, [r[4] for r in rows[i + 1:] if r[3]])
+        totals = phase_totals(phases_json)
+        top = max(totals, key=totals.get) if totals else None
+        top_text = f"{top} {totals[top]:.2f}s" if top else '-'
+        print(f"{sync_id:>5} {started[:16]:<17} {elapsed:>6.1f}s {n_rows or 0:>7,} "
+              f"{rate or 0:>8,.0f} {_format_mb(written):>8} {_format_mb(peak):>8}  "
+              f"{top_text}{'  ▼ 느려짐' if slow else ''}"
+              f"{'  [ROLLBACK]' if note and ROLLBACK_NOTE in note else ''}")
+
+
 def create_argument_parser() -> argparse.ArgumentParser:
     """CLI 인자 파서 생성"""
     parser = argparse.ArgumentParser(
@@ -267,6 +392,12 @@ def create_argument_parser() -> argparse.ArgumentParser:
         help='실제 DB 변경 없이 시뮬레이션만 수행',
     )
 
+    parser.add_argument(
+        '--full',
+        action='store_true',
+        help='시트 지문이 같아 건너뛰는 시트도 모두 다시 동기화',
+    )
+
     parser.add_argument(
         '--info',
         action='store_true',
@@ -279,6 +410,42 @@ def create_argument_parser() -> argparse.ArgumentParser:
         help='동기화 후 신규/수정된 레코드 상세 표시',
     )
 
+    parser.add_argument(
+        '--batch-size',
+        type=int,
+        metavar='N',
+        help='N행 단위 스트리밍 동기화 (기본: user_settings의 SYNC_BATCH_SIZE, 0이면 시트 전체 읽기)',
+    )
+
+    parser.add_argument(
+        '--workers',
+        type=int,
+        metavar='N',
+        help='시트 병렬 파싱/비교 프로세스 수 (기본: user_settings의 PARSE_WORKERS, 1이면 순차)',
+    )
+
+    parser.add_argument(
+        '--watch',
+        action='store_true',
+        help='워크북 저장을 감시하여 변경될 때마다 증분 동기화 (Ctrl+C로 종료)',
+    )
+
+    parser.add_argument(
+        '--interval',
+        type=float,
+        default=DEFAULT_POLL_SECONDS,
+        metavar='SEC',
+        help=f'--watch 폴링 주기 (기본: {DEFAULT_POLL_SECONDS:g}초)',
+    )
+
+    parser.add_argument(
+        '--debounce',
+        type=float,
+        default=DEFAULT_DEBOUNCE_SECONDS,
+        metavar='SEC',
+        help=f'--watch 마지막 저장 후 이 시간 동안 변화가 없으면 동기화 (기본: {DEFAULT_DEBOUNCE_SECONDS:g}초)',
+    )
+
     parser.add_argument(
         '-v', '--verbose',
         action='store_true',
@@ -304,12 +471,20 @@ def main() -> int:
         print(f"[오류] Excel 파일을 찾을 수 없습니다: {NOAH_SO_PO_DN_FILE}")
         return 1
 
+    # 저장 감시 모드
+    if args.watch:
+        if args.dry_run:
+            print("[오류] --watch는 --dry-run과 함께 사용할 수 없습니다")
+            return 1
+        return run_watch(args)
+
     # 동기화 실행
-    engine = SyncEngine()
+    engine = SyncEngine(batch_size=args.batch_size, workers=args.workers)
     try:
         summary = engine.sync_all(
             dry_run=args.dry_run,
             sheet_filter=args.sheets,
+            full=args.full,
         )
     except FileNotFoundError as e:
         print(f"[오류] {e}")
@@ -321,9 +496,9 @@ def main() -> int:
     if args.changes:
         print_changes(summary)
 
-    # dry-run이 아니면 _sync_log 테이블에 변경 내역 기록
+    # dry-run이 아니면 _sync_runs에 실행/성능 지표 기록 (변경 내역은 동기화 중 _sync_log에 기록됨)
     if not args.dry_run:
-        write_sync_log_to_db(summary)
+        write_sync_log_to_db(summary, record_empty=True)
 
     print_summary(summary, dry_run=args.dry_run)
 
@@ -6,9 +6,12 @@ from datetime import datetime, timedelta
 from pathlib import Path
 import shutil
 
+import openpyxl
 import pandas as pd
 import pytest
 
+from po_generator.db_sync import SyncEngine
+
 
 @pytest.fixture(autouse=True)
 def protect_templates(tmp_path, monkeypatch):
@@ -143,3 +146,86 @@ def multiple_items_df(valid_order_data: pd.Series) -> pd.DataFrame:
     item2['Sales Unit Price'] = 750000
 
     return pd.DataFrame([item1, item2])
+
+
+# --- Excel → SQLite 동기화 (test_db_reader, test_db_sync) ---
+
+@pytest.fixture
+def workbook(tmp_path):
+    """SO/PO/DN/PMT 국내·해외 + Customer_해외 + Weight 워크북"""
+    path = tmp_path / "NOAH_SO_PO_DN.xlsx"
+    wb = openpyxl.Workbook()
+
+    ws = wb.active
+    ws.title = 'SO_국내'
+    ws.append(['SO_ID', 'Line item', 'Customer name', 'Customer PO', 'Item name',
+               'Item qty', 'Sales Unit Price', 'Total Sales',
+               'Business registration number', 'PO receipt date', 'Model'])
+    ws.append(['SOD-0001', 1, '고객A', 'CPO-1', '밸브 A', 2, 1000, 2000,
+               '123-45-67890', datetime(2026, 1, 5), 'NA-100'])
+    ws.append(['SOD-0001', 2, '고객A', 'CPO-1', '밸브 B', 1, 2500.5, 2500.5,
+               '123-45-67890', datetime(2026, 1, 5), '00123'])
+    ws.append(['SOD-0002', 1, '고객B', None, '밸브 C', 3, 700, 2100,
+               None, None, 'NA-200'])
+
+    ws = wb.create_sheet('PO_국내')
+    ws.append(['PO_ID', 'SO_ID', 'Line item', 'Model', 'Item qty', 'ICO Unit', 'Power supply'])
+    ws.append(['ND-0001', 'SOD-0001', 1, 'NA-100', 2, 800, 'AC220V'])
+    ws.append(['ND-0001', 'SOD-0001', 2, '00123', 1, 2000.25, None])
+    ws.append(['ND-0002', 'SOD-0002', 1, 'NA-200', 3, 500, 'DC24V'])
+
+    ws = wb.create_sheet('DN_국내')
+    ws.append(['DN_ID', 'SO_ID', 'Line item', '출고일'])
+    ws.append(['DND-0001', 'SOD-0001', 1, datetime(2026, 2, 1)])
+    ws.append(['DND-0001', 'SOD-0001', 2, datetime(2026, 2, 1)])
+    ws.append(['DND-0002', 'SOD-0002', 1, None])
+
+    ws = wb.create_sheet('PMT_국내')
+    ws.append(['선수금_ID', 'SO_ID', '입금액', '입금일'])
+    ws.append(['ADV-0001', 'SOD-0001', 4500.5, datetime(2026, 1, 10)])
+
+    ws = wb.create_sheet('SO_해외')
+    ws.append(['SO_ID', 'Line item', 'Customer name', 'Customer PO', 'C-code by 해외',
+               'Model', 'Model number', 'Item qty', 'Sales Unit Price', 'Currency',
+               'Incoterms', 'PO receipt date', 'EXW NOAH'])
+    ws.append(['SOO-0001', 1, 'Acme', '26KPO001', 'C001', '006', 'M-1', 2, 1250.5,
+               'USD', 'FOB', datetime(2026, 1, 15), datetime(2026, 3, 1)])
+    ws.append(['SOO-0001', 2, 'Acme', '26KPO001', 'C001', 'NA-300', 'M-2', 1, 3000,
+               'USD', 'FOB', datetime(2026, 1, 15), datetime(2026, 3, 1)])
+    ws.append(['SOO-0002', 1, 'Globex', '26KPO002', 'C002', 'NA-400', None, 5, 99.9,
+               'EUR', 'EXW', datetime(2026, 2, 1), None])
+
+    ws = wb.create_sheet('PO_해외')
+    ws.append(['PO_ID', 'SO_ID', 'Line item', 'Model', 'Item qty', 'ICO Unit', 'IMS'])
+    ws.append(['NO-0001', 'SOO-0001', 1, '006', 2, 900, 'Y'])
+    ws.append(['NO-0001', 'SOO-0001', 2, 'NA-300', 1, 2500.75, None])
+
+    ws = wb.create_sheet('DN_해외')
+    ws.append(['DN_ID', 'SO_ID', 'Line item', 'Customer PO', 'Item qty', '선적일'])
+    ws.append(['DNO-0001', 'SOO-0001', 1, 'OLD-PO', 2, datetime(2026, 3, 2)])
+    ws.append(['DNO-0001', 'SOO-0001', 2, 'OLD-PO', 1, datetime(2026, 3, 2)])
+    ws.append(['DNO-0002', 'SOO-0002', 1, None, 5, None])
+
+    ws = wb.create_sheet('Customer_해외')
+    ws.append(['C-code by 해외', 'Customer name', 'Bill to 1', 'Bill to 2',
+               'Bill to 3', 'Payment terms'])
+    ws.append(['C001', 'Acme', 'Acme Street 1', 'Springfield', 'USA', 'T/T 30 days'])
+    ws.append(['C002', 'Globex', 'Globex Road 9', None, 'Germany', 'L/C'])
+    ws.append(['C001', 'Acme (old)', 'Old Street', None, None, 'T/T 60 days'])
+
+    ws = wb.create_sheet('Weight')
+    ws.append(['MODEL', 'WEIGHT'])
+    ws.append(['006', 11.0])
+    ws.append(['006IM', 15.2])
+
+    wb.save(path)
+    return path
+
+
+@pytest.fixture
+def synced(workbook, tmp_path):
+    """워크북을 DB로 동기화 → (Excel 경로, DB 경로)"""
+    db_path = tmp_path / "noah_data.db"
+    summary = SyncEngine(excel_path=workbook, db_path=db_path).sync_all()
+    assert summary.total_errors == 0
+    return workbook, db_path
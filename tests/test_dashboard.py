@@ -8,7 +8,10 @@ Streamlit UI 렌더링은 테스트하지 않음 — 순수 데이터 로직만.
 import pandas as pd
 import pytest
 
-from dashboard import build_calendar_data, calc_coverage, calc_margin, enrich_dn, filt, fmt_krw
+from dashboard import (
+    build_calendar_data, calc_coverage, calc_margin, enrich_dn, filt, flag_sync_slowdowns,
+    fmt_krw, sync_phase_breakdown,
+)
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -686,3 +689,36 @@ class TestCalcMargin:
         """빈 PO → 모두 원가 미확정"""
         result = calc_margin(so_for_margin, pd.DataFrame())
         assert (~result["has_cost"]).all()
+
+
+# ═══════════════════════════════════════════════════════════════
+# 동기화 성능 추이 순수함수 테스트
+# ═══════════════════════════════════════════════════════════════
+class TestSyncPerf:
+    """sync_phase_breakdown() / flag_sync_slowdowns() — _sync_runs 성능 지표"""
+
+    @pytest.fixture
+    def perf(self):
+        phases = '{"run":{"commit":0.5},"sheets":{"SO_국내":{"parse":1.0,"write":2.0,"rows":10},' \
+                 '"DN_국내":{"parse":0.5,"rows":5}}}'
+        return pd.DataFrame({
+            "sync_id": [1, 2, 3, 4, 5, 6],
+            "started_at": [f"2026-01-0{i} 09:00:00" for i in range(1, 7)],
+            "total_rows": [1000, 1000, 0, 1000, 1000, 1000],
+            "rows_per_sec": [500.0, 520.0, 0.0, 480.0, 200.0, 510.0],
+            "phases_json": [phases, None, None, None, None, None],
+        })
+
+    def test_phase_breakdown_sums_sheets(self, perf):
+        result = sync_phase_breakdown(perf)
+        assert dict(zip(result["phase"], result["seconds"])) == {
+            "commit": 0.5, "parse": 1.5, "write": 2.0,
+        }
+        assert set(result["sync_id"]) == {1}
+
+    def test_slowdown_flagged_against_earlier_runs(self, perf):
+        """행/초가 직전 실행들 중앙값의 1/1.5 미만인 실행만 표시 (행 없는 실행은 비교 제외)"""
+        assert flag_sync_slowdowns(perf).tolist() == [False, False, False, False, True, False]
+
+    def test_no_flag_without_history(self, perf):
+        assert not flag_sync_slowdowns(perf.head(2)).any()
@@ -0,0 +1,274 @@
+"""
+db_reader 모듈 테스트 (DB 조회 타입 복원 + FinderService Excel/DB 패리티)
+
+워크북/동기화 DB fixture(workbook, synced)는 conftest.py에 있습니다.
+"""
+
+import os
+import sqlite3
+from datetime import datetime, time
+from unittest.mock import patch
+
+import numpy as np
+import openpyxl
+import pandas as pd
+import pytest
+
+from po_generator import db_reader, utils
+from po_generator.db_reader import (
+    DbReader,
+    resolve_data_source,
+    _restore_column,
+    SOURCE_EXCEL,
+    SOURCE_SQLITE,
+)
+from po_generator.db_sync import SyncEngine
+from po_generator.services import DocumentService, FinderService, finder_service
+from po_generator.utils import WorkbookCache
+
+
+@pytest.fixture
+def finders(synced):
+    """같은 데이터의 Excel 소스 / DB 소스 FinderService"""
+    workbook, db_path = synced
+    with patch.object(utils, 'NOAH_SO_PO_DN_FILE', workbook), \
+            patch.object(finder_service, 'NOAH_SO_PO_DN_FILE', workbook), \
+            patch.object(utils, '_workbook_cache', WorkbookCache(disk_cache=False)):
+        yield (
+            FinderService(source='excel'),
+            FinderService(source='sqlite', db_path=db_path),
+        )
+
+
+def _nulls_as_none(row):
+    """단일 행의 빈 값 통일 — DB 조회는 조회한 행만으로 타입을 추론하므로
+    시트 전체 기준(Excel)과 빈 값 종류(NaN/NaT)가 다를 수 있음"""
+    return row.astype(object).where(row.notna(), None)
+
+
+def _assert_same(excel_result, db_result):
+    """OrderData 두 개가 같은 내용인지 (인덱스/행 이름 제외)"""
+    assert excel_result is not None and db_result is not None
+    assert db_result.item_count == excel_result.item_count
+    pd.testing.assert_series_equal(
+        _nulls_as_none(db_result.first_item), _nulls_as_none(excel_result.first_item),
+        check_names=False,
+    )
+    if excel_result.items_df is not None:
+        pd.testing.assert_frame_equal(
+            db_result.items_df.reset_index(drop=True),
+            excel_result.items_df.reset_index(drop=True),
+        )
+
+
+class TestRestoreColumn:
+    """TEXT → Excel 로더 타입 복원"""
+
+    def test_int_and_float(self):
+        assert _restore_column(['1', '2'], False).dtype == 'int64'
+        s = _restore_column(['1', None], False)
+        assert s.dtype == 'float64' and np.isnan(s[1])
+        assert _restore_column(['1', '2.5'], False).tolist() == [1.0, 2.5]
+
+    def test_leading_zero_stays_text(self):
+        """숫자로 바꾸면 형태가 달라지는 값은 문자열"""
+        assert _restore_column(['00123', '7'], False).tolist() == ['00123', 7]
+
+    def test_datetime_and_time(self):
+        s = _restore_column(['2026-01-05 00:00:00', None], False)
+        assert s.dtype == 'datetime64[ns]'
+        assert s[0] == pd.Timestamp(2026, 1, 5)
+        assert _restore_column(['09:30:00', 'x'], False).tolist() == [time(9, 30), 'x']
+
+    def test_as_text_and_empty(self):
+        assert _restore_column(['006', ''], True).tolist()[0] == '006'
+        assert _restore_column([None, None], False).isna().all()
+
+    def test_typed_values(self):
+        """REAL 컬럼의 정수값은 int (openpyxl과 같음), DATE 컬럼의 ISO 날짜는 datetime"""
+        assert _restore_column([1.0, 2.0], False).dtype == 'int64'
+        assert _restore_column([1234.0, 2.5], False).tolist() == [1234, 2.5]
+        assert _restore_column([1234.0], True).tolist() == ['1234']
+        s = _restore_column(['2026-01-05', None], False, 'DATE')
+        assert s.dtype == 'datetime64[ns]' and s[0] == pd.Timestamp(2026, 1, 5)
+        assert _restore_column(['2026-01-05'], False).tolist() == ['2026-01-05']
+
+
+class TestResolveDataSource:
+    """데이터 소스 설정값 해석"""
+
+    def test_explicit(self):
+        assert resolve_data_source('sqlite') == SOURCE_SQLITE
+        assert resolve_data_source('excel') == SOURCE_EXCEL
+
+    def test_unknown_treated_as_excel(self):
+        assert resolve_data_source('csv') == SOURCE_EXCEL
+
+    def test_setting_used_by_default(self):
+        with patch.object(db_reader, 'DATA_SOURCE', 'sqlite'):
+            assert resolve_data_source() == SOURCE_SQLITE
+
+    def test_auto_without_db_uses_excel(self, workbook, tmp_path):
+        assert resolve_data_source('auto', tmp_path / 'none.db', workbook) == SOURCE_EXCEL
+
+    def test_auto_prefers_fresh_db(self, synced):
+        workbook, db_path = synced
+        assert resolve_data_source('auto', db_path, workbook) == SOURCE_SQLITE
+
+    def test_auto_stale_db_uses_excel(self, synced):
+        """동기화 이후 Excel이 저장되면 Excel"""
+        workbook, db_path = synced
+        future = datetime.now().timestamp() + 3600
+        os.utime(workbook, (future, future))
+        assert resolve_data_source('auto', db_path, workbook) == SOURCE_EXCEL
+
+    def test_auto_after_partial_sync_uses_db(self, synced):
+        """한 시트만 바뀐 재동기화 후에도 DB (건너뛴 시트의 동기화 시각도 갱신)"""
+        workbook, db_path = synced
+        wb = openpyxl.load_workbook(workbook)
+        wb['SO_국내']['C2'] = '고객A2'
+        wb.save(workbook)
+        summary = SyncEngine(excel_path=workbook, db_path=db_path).sync_all()
+        assert summary.total_errors == 0
+        skipped = [r.sheet_name for r in summary.results if r.unchanged_skipped]
+        assert skipped and 'SO_국내' not in skipped
+        assert resolve_data_source('auto', db_path, workbook) == SOURCE_SQLITE
+
+    def test_auto_unreadable_excel_uses_db(self, synced, tmp_path):
+        _, db_path = synced
+        assert resolve_data_source('auto', db_path, tmp_path / 'locked.xlsx') == SOURCE_SQLITE
+
+
+class TestDbReader:
+    """DbReader 조회"""
+
+    def test_read_sheet_filters_and_keeps_order(self, synced):
+        _, db_path = synced
+        with DbReader(db_path) as db:
+            df = db.read_sheet('SO_국내', {'SO_ID': ['SOD-0001']})
+        assert df['Line item'].tolist() == [1, 2]
+        assert df['Model'].tolist() == ['NA-100', '00123']
+        assert '_sync_updated_at' not in df.columns
+
+    def test_missing_table_raises(self, synced):
+        _, db_path = synced
+        with DbReader(db_path) as db:
+            with pytest.raises(ValueError):
+                db.select('no_such_table')
+
+    def test_missing_db_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            DbReader(tmp_path / 'none.db').columns('so_domestic')
+
+
+class TestFinderServiceParity:
+    """FinderService — Excel 소스와 DB 소스가 같은 결과를 반환"""
+
+    @pytest.mark.parametrize('order_no', ['ND-0001', 'ND-0002', 'NO-0001'])
+    def test_find_po(self, finders, order_no):
+        excel, db = finders
+        _assert_same(excel.find_po(order_no), db.find_po(order_no))
+
+    @pytest.mark.parametrize('dn_id', ['DND-0001', 'DND-0002'])
+    def test_find_dn(self, finders, dn_id):
+        excel, db = finders
+        _assert_same(excel.find_dn(dn_id), db.find_dn(dn_id))
+
+    def test_find_pmt(self, finders):
+        excel, db = finders
+        _assert_same(excel.find_pmt('ADV-0001'), db.find_pmt('ADV-0001'))
+
+    def test_find_so_for_advance(self, finders):
+        excel, db = finders
+        (excel_pmt, excel_items), (db_pmt, db_items) = (
+            excel.find_so_for_advance('ADV-0001'), db.find_so_for_advance('ADV-0001'),
+        )
+        pd.testing.assert_series_equal(
+            _nulls_as_none(db_pmt), _nulls_as_none(excel_pmt), check_names=False,
+        )
+        _assert_same(excel_items, db_items)
+
+    @pytest.mark.parametrize('so_id', ['SOO-0001', 'SOO-0002'])
+    def test_find_so_export(self, finders, so_id):
+        excel, db = finders
+        _assert_same(excel.find_so_export(so_id), db.find_so_export(so_id))
+        _assert_same(
+            excel.find_so_export_with_customer(so_id),
+            db.find_so_export_with_customer(so_id),
+        )
+
+    @pytest.mark.parametrize('dn_id', ['DNO-0001', 'DNO-0002'])
+    def test_find_dn_export(self, finders, dn_id):
+        excel, db = finders
+        _assert_same(excel.find_dn_export(dn_id), db.find_dn_export(dn_id))
+
+    def test_find_dn_export_by_customer_po(self, finders):
+        excel, db = finders
+        _assert_same(
+            excel.find_dn_export_by_customer_po('26KPO001'),
+            db.find_dn_export_by_customer_po('26KPO001'),
+        )
+        assert db.find_dn_export_by_customer_po('OLD-PO') is None
+
+    def test_not_found(self, finders):
+        _, db = finders
+        assert db.find_po('ND-9999') is None
+        assert db.find_dn_export('DNO-9999') is None
+
+    def test_available_ids(self, finders):
+        excel, db = finders
+        assert db.get_available_po_ids() == excel.get_available_po_ids()
+        assert db.get_available_dn_export_ids() == excel.get_available_dn_export_ids()
+
+    def test_db_source_does_not_read_excel(self, synced):
+        """DB 소스는 Excel 파일이 없어도 (잠겨 있어도) 동작"""
+        workbook, db_path = synced
+        workbook.unlink()
+        finder = FinderService(source='sqlite', db_path=db_path)
+        result = finder.find_dn_export('DNO-0001')
+        assert result.item_count == 2
+        assert result.get_value('Bill to 1') == 'Acme Street 1'
+
+
+class TestPoLineWeight:
+    """동기화 시 PO 라인 Weight 저장 + FinderService 조회"""
+
+    def test_sync_materializes_lines(self, synced):
+        """매칭/미매칭 라인 모두 po_line_weight에 저장"""
+        _, db_path = synced
+        conn = sqlite3.connect(db_path)
+        try:
+            rows = conn.execute(
+                'SELECT SO_ID, [Line item], weight, matched_code, match_tier '
+                'FROM po_line_weight ORDER BY [Line item]'
+            ).fetchall()
+        finally:
+            conn.close()
+        assert rows == [
+            ('SOO-0001', '1', 15.2, '006IM', 'option'),
+            ('SOO-0001', '2', None, None, 'unmatched'),
+        ]
+
+    def test_summary_counts(self, workbook, tmp_path):
+        summary = SyncEngine(excel_path=workbook, db_path=tmp_path / 'w.db').sync_all()
+        assert (summary.weight_lines, summary.weight_unmatched) == (2, 1)
+
+    def test_excel_and_db_lookup_match(self, finders):
+        excel, db = finders
+        from_excel = excel.find_po_line_weights(['SOO-0001', 'SOO-0002'])
+        from_db = db.find_po_line_weights(['SOO-0001', 'SOO-0002'])
+        pd.testing.assert_frame_equal(
+            from_db[['weight', 'matched_code', 'match_tier']],
+            from_excel[['weight', 'matched_code', 'match_tier']],
+        )
+        assert from_db.loc[('SOO-0001', '1'), 'weight'] == 15.2
+
+    def test_enrich_with_weight_uses_db_without_excel(self, synced):
+        """DB 소스는 Excel 없이 Weight per unit 보강"""
+        workbook, db_path = synced
+        workbook.unlink()
+        service = DocumentService(finder=FinderService(source='sqlite', db_path=db_path))
+        items = service.finder.find_dn_export('DNO-0001').items_df
+        enriched = service._enrich_with_weight(items)
+        assert enriched['Weight per unit'].iloc[0] == 15.2
+        assert pd.isna(enriched['Weight per unit'].iloc[1])
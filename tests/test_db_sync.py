@@ -0,0 +1,785 @@
+"""
+db_sync 모듈 테스트 (Excel → SQLite 동기화 엔진: upsert, 지문, 병렬 비교, prune,
+컬럼 타입, 보조 인덱스, 성능 지표, _sync_log 기록, 변경 묶음 메모리)
+
+워크북/동기화 DB fixture(workbook, synced)는 conftest.py에 있습니다.
+"""
+
+import gc
+import json
+import sqlite3
+import tracemalloc
+from dataclasses import replace
+from pathlib import Path
+from unittest.mock import patch
+
+import openpyxl
+import pandas as pd
+import pytest
+
+from po_generator.db_reader import DbReader
+from po_generator.db_schema import (
+    COL_DATE, COL_INTEGER, COL_REAL, COL_TEXT, SYNC_SHEETS, IndexSpec,
+    coerce_value, ensure_indexes, ensure_sync_log_tables,
+)
+from po_generator.db_sync import (
+    CHANGE_SAMPLE_LIMIT, SyncEngine, SyncLogWriter, _ChangeSpill, _diff_sheet,
+)
+
+
+class TestRowBlockTracking:
+    """동기화 시 행 블록 해시 저장 + 지난 동기화 대비 바뀐 행 범위 보고"""
+
+    @staticmethod
+    def _changed(summary, sheet_name):
+        return next(r.changed_rows for r in summary.results if r.sheet_name == sheet_name)
+
+    def test_first_sync_reports_full_range(self, workbook, tmp_path):
+        summary = SyncEngine(excel_path=workbook, db_path=tmp_path / 'b.db').sync_all()
+        assert self._changed(summary, 'PO_국내') == [(1, 256)]
+
+    def test_resync_without_edits_reports_nothing(self, synced):
+        workbook, db_path = synced
+        summary = SyncEngine(excel_path=workbook, db_path=db_path).sync_all()
+        assert all(r.changed_rows == [] for r in summary.results if r.success)
+
+    def test_edit_reports_only_edited_sheet(self, synced):
+        workbook, db_path = synced
+        wb = openpyxl.load_workbook(workbook)
+        wb['PO_국내']['E3'] = 5
+        wb.save(workbook)
+
+        summary = SyncEngine(excel_path=workbook, db_path=db_path).sync_all()
+        assert self._changed(summary, 'PO_국내') == [(1, 256)]
+        assert self._changed(summary, 'SO_국내') == []
+
+    def test_dry_run_does_not_store_hashes(self, workbook, tmp_path):
+        db_path = tmp_path / 'b.db'
+        SyncEngine(excel_path=workbook, db_path=db_path).sync_all(dry_run=True)
+        summary = SyncEngine(excel_path=workbook, db_path=db_path).sync_all()
+        assert self._changed(summary, 'PO_국내') == [(1, 256)]
+
+
+class TestBulkUpsert:
+    """_sync_sheet 일괄 upsert — 기존 행 맵 비교 + executemany 반영"""
+
+    CONFIG = next(c for c in SYNC_SHEETS if c.sheet_name == 'PO_국내')
+
+    @staticmethod
+    def _frame(rows):
+        return pd.DataFrame(rows, columns=['PO_ID', 'Line item', 'Model', 'Item qty'], dtype=object)
+
+    def _sync(self, conn, df, config=None, log=False, batch_rows=500, spill=False):
+        """한 시트 동기화 — log=True면 _sync_log 스트리밍 기록 (sync_all과 같은 트랜잭션),
+        spill=True면 워커 경로 (임시 파일로 넘긴 변경 묶음을 writer가 반영)"""
+        engine = SyncEngine(excel_path=Path('unused.xlsx'), db_path=Path(':memory:'))
+        config = config or self.CONFIG
+        conn.execute('BEGIN')
+        if log:
+            ensure_sync_log_tables(conn)
+            engine._log = SyncLogWriter(conn, '2026-01-01 00:00:00', batch_rows=batch_rows)
+        if spill:
+            sink = _ChangeSpill(conn, config)
+            diff = _diff_sheet(conn, config, iter([df]), sink)
+            diff.spill_path = sink.close()
+            result = engine._apply_changes(conn, config, diff)
+            assert not Path(diff.spill_path).exists()
+        else:
+            result = engine._sync_sheet(conn, None, config, df)
+        if log:
+            engine._log.finish()
+        conn.commit()
+        return result
+
+    @staticmethod
+    def _log_rows(conn, change_type):
+        return conn.execute(
+            "SELECT pk_display, changes_json, row_snapshot_json FROM _sync_log "
+            "WHERE change_type = ? ORDER BY id", (change_type,)
+        ).fetchall()
+
+    def test_insert_update_unchanged_prune(self):
+        conn = sqlite3.connect(':memory:', isolation_level=None)
+        self._sync(conn, self._frame([
+            ['ND-1', '1', 'A', '1'], ['ND-1', '2', 'B', '2'], ['ND-2', '1', 'C', '3'],
+        ]))
+        result = self._sync(conn, self._frame([
+            ['ND-1', '1', 'A', '1'], ['ND-1', '2', 'B', '5'], ['ND-3', '1', 'D', None],
+        ]), log=True)
+
+        assert (result.inserted, result.updated, result.unchanged, result.pruned) == (1, 1, 1, 1)
+        assert result.updated_details == [
+            {'pk': ('ND-1', 2, 1), 'changes': {'Item qty': (2.0, 5.0)}},
+        ]
+        assert result.inserted_details == [
+            {'pk': ('ND-3', 1, 1),
+             'values': {'PO_ID': 'ND-3', 'Line item': 1, 'Model': 'D', '_row_seq': 1}},
+        ]
+        assert result.pruned_pks == [('ND-2', '1', '1')]
+        assert self._log_rows(conn, '수정') == [
+            ('ND-1 | 2 | 1', '{"Item qty":{"old":"2","new":"5"}}', None),
+        ]
+        assert self._log_rows(conn, '신규') == [
+            ('ND-3 | 1 | 1', '{"PO_ID":"ND-3","Line item":"1","Model":"D","_row_seq":"1"}', None),
+        ]
+        [(pk, changes, snapshot)] = self._log_rows(conn, '삭제')
+        assert (pk, changes) == ('ND-2 | 1 | 1', None)
+        assert json.loads(snapshot)['Model'] == 'C'
+        rows = conn.execute(
+            'SELECT PO_ID, [Item qty] FROM po_domestic ORDER BY PO_ID, [Line item]'
+        ).fetchall()
+        assert rows == [('ND-1', 1.0), ('ND-1', 5.0), ('ND-3', None)]
+
+    def test_bad_row_fails_alone(self):
+        """일괄 실행이 실패하면 행 단위로 재실행하여 문제 행만 에러 처리"""
+        conn = sqlite3.connect(':memory:', isolation_level=None)
+        result = self._sync(conn, self._frame([
+            ['ND-1', '1', 'A', '1'], ['ND-1', '2', {'bad': 1}, '2'], ['ND-2', '1', 'C', '3'],
+        ]))
+
+        assert (result.inserted, result.errors) == (2, 1)
+        assert [d['pk'] for d in result.inserted_details] == [('ND-1', 1, 1), ('ND-2', 1, 1)]
+        assert conn.execute('SELECT COUNT(*) FROM po_domestic').fetchone() == (2,)
+
+
+class TestRowHash:
+    """행 내용 해시(_row_hash) — 동일 행은 기존 값 조회 없이 건너뜀"""
+
+    CONFIG = TestBulkUpsert.CONFIG
+    ROWS = [['ND-1', '1', 'A', '1'], ['ND-1', '2', 'B', '2']]
+
+    _frame = staticmethod(TestBulkUpsert._frame)
+    _sync = TestBulkUpsert._sync
+
+    def test_unchanged_rows_skip_value_lookup(self):
+        conn = sqlite3.connect(':memory:', isolation_level=None)
+        self._sync(conn, self._frame(self.ROWS))
+        with patch('po_generator.db_sync._row_values', side_effect=AssertionError):
+            result = self._sync(conn, self._frame(self.ROWS))
+        assert (result.unchanged, result.updated, result.inserted) == (2, 0, 0)
+
+    def test_hash_excludes_empty_columns(self):
+        """빈 컬럼이 새로 생겨도 기존 행 해시는 그대로"""
+        conn = sqlite3.connect(':memory:', isolation_level=None)
+        self._sync(conn, self._frame(self.ROWS))
+        df = self._frame(self.ROWS)
+        df['Remark'] = None
+        with patch('po_generator.db_sync._row_values', side_effect=AssertionError):
+            result = self._sync(conn, df)
+        assert result.unchanged == 2
+
+    def test_legacy_rows_get_hash_without_update(self):
+        """해시 없는 이전 버전 행 → 컬럼 비교 후 동일이면 해시만 채움 (수정 시각 유지)"""
+        conn = sqlite3.connect(':memory:', isolation_level=None)
+        self._sync(conn, self._frame(self.ROWS))
+        conn.execute("UPDATE po_domestic SET _row_hash = NULL, _sync_updated_at = 'old'")
+
+        result = self._sync(conn, self._frame(self.ROWS))
+        assert (result.unchanged, result.updated) == (2, 0)
+        rows = conn.execute('SELECT _row_hash, _sync_updated_at FROM po_domestic').fetchall()
+        assert all(h is not None and ts == 'old' for h, ts in rows)
+
+    def test_db_reader_hides_hash_column(self, synced):
+        _, db_path = synced
+        assert '_row_hash' not in DbReader(db_path).columns('po_domestic')
+
+
+class TestSheetFingerprint:
+    """시트 지문이 같은 시트는 동기화 건너뜀 (_sync_meta.fingerprint)"""
+
+    @staticmethod
+    def _skipped(summary):
+        return {r.sheet_name for r in summary.results if r.unchanged_skipped}
+
+    def test_resync_skips_all_sheets(self, synced):
+        workbook, db_path = synced
+        summary = SyncEngine(excel_path=workbook, db_path=db_path).sync_all()
+        assert self._skipped(summary) == {c.sheet_name for c in SYNC_SHEETS}
+        assert summary.total_errors == 0
+
+    def test_edited_sheet_is_synced(self, synced):
+        workbook, db_path = synced
+        wb = openpyxl.load_workbook(workbook)
+        wb['PO_국내']['E3'] = 5
+        wb.save(workbook)
+
+        summary = SyncEngine(excel_path=workbook, db_path=db_path).sync_all()
+        assert 'PO_국내' not in self._skipped(summary)
+        assert 'SO_국내' in self._skipped(summary)
+        po = next(r for r in summary.results if r.sheet_name == 'PO_국내')
+        assert po.updated == 1
+
+    def test_full_syncs_everything(self, synced):
+        workbook, db_path = synced
+        summary = SyncEngine(excel_path=workbook, db_path=db_path).sync_all(full=True)
+        assert self._skipped(summary) == set()
+        assert summary.total_inserted == summary.total_updated == summary.total_pruned == 0
+
+    def test_dropped_table_is_resynced(self, synced):
+        workbook, db_path = synced
+        conn = sqlite3.connect(db_path)
+        conn.execute('DROP TABLE so_domestic')
+        conn.commit()
+        conn.close()
+
+        summary = SyncEngine(excel_path=workbook, db_path=db_path).sync_all()
+        assert 'SO_국내' not in self._skipped(summary)
+        assert DbReader(db_path).read_sheet('SO_국내').shape[0] == 3
+
+    def test_pk_change_invalidates(self, synced):
+        """SheetConfig(PK)가 바뀐 시트는 내용이 같아도 다시 동기화"""
+        workbook, db_path = synced
+        changed = [
+            replace(c, pk_columns=(*c.pk_columns, '_row_seq'), needs_row_seq=True,
+                    row_seq_group=c.pk_columns) if c.sheet_name == 'SO_국내' else c
+            for c in SYNC_SHEETS
+        ]
+        with patch('po_generator.db_sync.SYNC_SHEETS', changed):
+            summary = SyncEngine(excel_path=workbook, db_path=db_path).sync_all()
+        assert self._skipped(summary) == {c.sheet_name for c in SYNC_SHEETS} - {'SO_국내'}
+        so = next(r for r in summary.results if r.sheet_name == 'SO_국내')
+        assert so.inserted == 3
+
+
+class TestPoLineWeightRefresh:
+    """po_line_weight — PO_해외 행이나 Weight 시트 지문이 바뀐 경우에만 재계산"""
+
+    @staticmethod
+    def _weights(db_path):
+        conn = sqlite3.connect(db_path)
+        try:
+            return conn.execute(
+                'SELECT SO_ID, [Line item], weight, match_tier FROM po_line_weight '
+                'ORDER BY [Line item]'
+            ).fetchall()
+        finally:
+            conn.close()
+
+    def test_unchanged_workbook_skips_rebuild(self, synced):
+        workbook, db_path = synced
+        before = self._weights(db_path)
+        summary = SyncEngine(excel_path=workbook, db_path=db_path).sync_all()
+        assert 'weight' not in summary.phase_seconds
+        assert summary.weight_lines == 0
+        assert self._weights(db_path) == before
+
+    def test_other_sheet_edit_skips_rebuild(self, synced):
+        workbook, db_path = synced
+        wb = openpyxl.load_workbook(workbook)
+        wb['PO_국내']['E3'] = 5
+        wb.save(workbook)
+        summary = SyncEngine(excel_path=workbook, db_path=db_path).sync_all()
+        assert summary.total_updated == 1
+        assert 'weight' not in summary.phase_seconds
+
+    def test_weight_sheet_edit_rebuilds(self, synced):
+        workbook, db_path = synced
+        wb = openpyxl.load_workbook(workbook)
+        wb['Weight']['B3'] = 16.0
+        wb.save(workbook)
+        summary = SyncEngine(excel_path=workbook, db_path=db_path).sync_all()
+        assert summary.weight_lines == 2
+        assert self._weights(db_path)[0] == ('SOO-0001', '1', 16.0, 'option')
+
+        again = SyncEngine(excel_path=workbook, db_path=db_path).sync_all()
+        assert 'weight' not in again.phase_seconds
+
+    def test_po_export_change_rebuilds(self, synced):
+        workbook, db_path = synced
+        wb = openpyxl.load_workbook(workbook)
+        wb['PO_해외']['G2'] = None      # IMS 옵션 해제 → base 코드
+        wb.save(workbook)
+        summary = SyncEngine(excel_path=workbook, db_path=db_path).sync_all()
+        assert summary.weight_lines == 2
+        assert self._weights(db_path)[0] == ('SOO-0001', '1', 11.0, 'base')
+
+    def test_full_forces_rebuild(self, synced):
+        workbook, db_path = synced
+        summary = SyncEngine(excel_path=workbook, db_path=db_path).sync_all(full=True)
+        assert 'weight' in summary.phase_seconds
+        assert (summary.weight_lines, summary.weight_unmatched) == (2, 1)
+
+
+class TestParallelSync:
+    """워커 프로세스 파싱/비교 + 단일 writer 반영 — 순차 동기화와 같은 결과"""
+
+    @staticmethod
+    def _edit(path):
+        wb = openpyxl.load_workbook(path)
+        wb['PO_국내']['E3'] = 5                                       # 수정
+        wb['DN_국내'].delete_rows(4)                                  # 삭제
+        wb['SO_해외'].append(['SOO-0003', 1, 'Initech', 'P3', 'C002', 'NA-500'])   # 신규
+        wb.save(path)
+
+    @staticmethod
+    def _details(summary):
+        return [
+            (r.sheet_name, r.inserted_details, r.updated_details, r.pruned_pks,
+             r.unchanged, r.errors)
+            for r in summary.results
+        ]
+
+    @staticmethod
+    def _dump(db_path):
+        """테이블별 행 (동기화 시각 제외)"""
+        reader = DbReader(db_path)
+        return {
+            c.table_name: sorted(map(repr, reader.select(c.table_name).values.tolist()))
+            for c in SYNC_SHEETS
+        }
+
+    def test_parallel_matches_sequential(self, workbook, tmp_path):
+        seq_db, par_db = tmp_path / 'seq.db', tmp_path / 'par.db'
+        SyncEngine(excel_path=workbook, db_path=seq_db, workers=1).sync_all()
+        SyncEngine(excel_path=workbook, db_path=par_db, workers=2).sync_all()
+        self._edit(workbook)
+
+        seq = SyncEngine(excel_path=workbook, db_path=seq_db, workers=1).sync_all(full=True)
+        par = SyncEngine(excel_path=workbook, db_path=par_db, workers=2).sync_all(full=True)
+
+        assert self._details(par) == self._details(seq)
+        assert (par.total_inserted, par.total_updated, par.total_pruned) == (1, 1, 1)
+        assert self._dump(par_db) == self._dump(seq_db)
+
+    def test_worker_error_rolls_back(self, workbook, tmp_path):
+        """워커에서 시트 단위 실패 → 전체 ROLLBACK"""
+        wb = openpyxl.load_workbook(workbook)
+        wb['DN_국내']['A1'] = 'DN 번호'     # 필수 컬럼(DN_ID) 없음
+        wb.save(workbook)
+
+        db_path = tmp_path / 'par.db'
+        summary = SyncEngine(excel_path=workbook, db_path=db_path, workers=2).sync_all()
+        dn = next(r for r in summary.results if r.sheet_name == 'DN_국내')
+        assert dn.errors == 1 and 'DN_ID' in dn.error_messages[0]
+        conn = sqlite3.connect(db_path)
+        try:
+            tables = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+        finally:
+            conn.close()
+        assert 'so_domestic' not in tables
+
+
+class TestAntiJoinPrune:
+    """prune — 임시 키 테이블 anti-join으로 스냅샷 조회 + 삭제"""
+
+    CONFIG = TestBulkUpsert.CONFIG
+    # 타입 컬럼 도입 이전 DB (전부 TEXT — '1.0' 같은 PK가 남아 있을 수 있음)
+    LEGACY = replace(CONFIG, column_types=())
+
+    _frame = staticmethod(TestBulkUpsert._frame)
+    _sync = TestBulkUpsert._sync
+
+    def test_mass_prune(self):
+        conn = sqlite3.connect(':memory:', isolation_level=None)
+        rows = [[f'ND-{i}', '1', f'M{i}', '1'] for i in range(500)]
+        self._sync(conn, self._frame(rows))
+
+        result = self._sync(conn, self._frame(rows[:10]), log=True, batch_rows=64)
+        assert result.pruned == 490
+        assert len(result.pruned_pks) == CHANGE_SAMPLE_LIMIT
+        pruned = TestBulkUpsert._log_rows(conn, '삭제')
+        assert len(pruned) == 490
+        snap = next(json.loads(s) for pk, _, s in pruned if pk == 'ND-499 | 1 | 1')
+        assert snap['Model'] == 'M499'
+        assert conn.execute('SELECT COUNT(*) FROM po_domestic').fetchone() == (10,)
+        assert conn.execute("SELECT COUNT(*) FROM sqlite_temp_master").fetchone() == (0,)
+
+    def test_legacy_float_pk_is_updated_not_pruned(self):
+        """DB에 '1.0'으로 남은 PK는 Excel '1' 행과 짝지어져 수정됨 (삭제 아님)"""
+        conn = sqlite3.connect(':memory:', isolation_level=None)
+        self._sync(conn, self._frame([['ND-1', '1', 'A', '1'], ['ND-2', '1', 'B', '1']]),
+                   self.LEGACY)
+        conn.execute("UPDATE po_domestic SET [Line item] = '1.0', _row_hash = NULL "
+                     "WHERE PO_ID = 'ND-1'")
+
+        result = self._sync(conn, self._frame([['ND-1', '1', 'A', '1']]), self.LEGACY)
+        assert result.pruned_pks == [('ND-2', '1', '1')]
+        assert result.updated == 1
+        assert conn.execute('SELECT PO_ID, [Line item] FROM po_domestic').fetchall() == [('ND-1', '1')]
+
+    def test_unchanged_row_with_legacy_pk_is_kept(self):
+        """해시가 같아 다시 쓰지 않는 행은 DB 원본 PK 그대로 유지 대상"""
+        conn = sqlite3.connect(':memory:', isolation_level=None)
+        self._sync(conn, self._frame([['ND-1', '1', 'A', '1']]), self.LEGACY)
+        conn.execute("UPDATE po_domestic SET [Line item] = '1.0'")
+
+        result = self._sync(conn, self._frame([['ND-1', '1', 'A', '1']]), self.LEGACY)
+        assert (result.unchanged, result.pruned) == (1, 0)
+        assert conn.execute('SELECT COUNT(*) FROM po_domestic').fetchone() == (1,)
+
+
+class TestColumnTypes:
+    """타입 컬럼 (INTEGER/REAL/DATE) — 쓰기 시 정규화, 변경 감지 안정성, 기존 DB 마이그레이션"""
+
+    CONFIG = TestBulkUpsert.CONFIG
+    LEGACY = replace(CONFIG, column_types=())
+    DN = next(c for c in SYNC_SHEETS if c.sheet_name == 'DN_국내')
+
+    _frame = staticmethod(TestBulkUpsert._frame)
+    _sync = TestBulkUpsert._sync
+
+    @staticmethod
+    def _dn_frame(dates):
+        return pd.DataFrame(
+            [[f'DND-{i}', 'SOD-1', str(i), d] for i, d in enumerate(dates, 1)],
+            columns=['DN_ID', 'SO_ID', 'Line item', '출고일'], dtype=object,
+        )
+
+    @pytest.mark.parametrize('value, col_type, expected', [
+        ('1234', COL_REAL, 1234.0),
+        (' 1234.0 ', COL_INTEGER, 1234),
+        ('1.5', COL_INTEGER, 1.5),
+        ('N/A', COL_REAL, 'N/A'),
+        ('  ', COL_REAL, None),
+        ('2026-01-05 00:00:00', COL_DATE, '2026-01-05'),
+        ('2026.01.05', COL_DATE, '2026-01-05'),
+        ('2026-01-05 09:30:00', COL_DATE, '2026-01-05 09:30:00'),
+        ('미정', COL_DATE, '미정'),
+        (1234.0, COL_TEXT, '1234'),
+    ])
+    def test_coerce_value(self, value, col_type, expected):
+        assert coerce_value(value, col_type) == expected
+
+    def test_values_stored_typed(self):
+        conn = sqlite3.connect(':memory:', isolation_level=None)
+        self._sync(conn, self._frame([['ND-1', '1', 'A', '3'], ['ND-2', '2', 'B', 'TBD']]))
+
+        types = {r[1]: r[2] for r in conn.execute('PRAGMA table_info(po_domestic)')}
+        assert (types['Line item'], types['Item qty'], types['Model']) == ('INTEGER', 'REAL', 'TEXT')
+        rows = conn.execute(
+            'SELECT typeof([Line item]), [Item qty], typeof([Item qty]) FROM po_domestic ORDER BY PO_ID'
+        ).fetchall()
+        assert rows == [('integer', 3.0, 'real'), ('integer', 'TBD', 'text')]
+
+    def test_float_text_is_not_a_change(self):
+        """'1234.0'과 '1234' (엔진/셀 서식 차이)는 같은 값 — 수정도 해시 갱신도 없음"""
+        conn = sqlite3.connect(':memory:', isolation_level=None)
+        self._sync(conn, self._frame([['ND-1', '1', 'A', '1234']]))
+        result = self._sync(conn, self._frame([['ND-1', '1.0', 'A', '1234.0']]))
+        assert (result.updated, result.unchanged, result.pruned) == (0, 1, 0)
+
+    def test_dates_normalized_to_iso(self):
+        conn = sqlite3.connect(':memory:', isolation_level=None)
+        self._sync(conn, self._dn_frame(['2026-01-05 00:00:00', '2026.01.06', 'N/A']), self.DN)
+        assert [r[0] for r in conn.execute('SELECT [출고일] FROM dn_domestic ORDER BY DN_ID')] == [
+            '2026-01-05', '2026-01-06', 'N/A',
+        ]
+
+    def test_legacy_table_migrated_without_changes(self):
+        """TEXT 전용 테이블은 다음 동기화에서 타입 컬럼으로 재작성 — 값이 같으면 수정 0건"""
+        conn = sqlite3.connect(':memory:', isolation_level=None)
+        self._sync(conn, self._frame([['ND-1', '1', 'A', '3'], ['ND-2', '1', 'B', '2.5']]),
+                   self.LEGACY)
+        self._sync(conn, self._dn_frame(['2026-01-05 00:00:00']), replace(self.DN, column_types=()))
+
+        result = self._sync(conn, self._frame([['ND-1', '1', 'A', '3'], ['ND-2', '1', 'B', '2.5']]))
+        assert (result.inserted, result.updated, result.pruned, result.unchanged) == (0, 0, 0, 2)
+        assert conn.execute(
+            'SELECT [Line item], [Item qty] FROM po_domestic ORDER BY PO_ID'
+        ).fetchall() == [(1, 3.0), (1, 2.5)]
+
+        result = self._sync(conn, self._dn_frame(['2026-01-05 00:00:00']), self.DN)
+        assert (result.updated, result.unchanged) == (0, 1)
+        assert conn.execute('SELECT [출고일] FROM dn_domestic').fetchone() == ('2026-01-05',)
+        types = {r[1]: r[2] for r in conn.execute('PRAGMA table_info(dn_domestic)')}
+        assert types['출고일'] == 'DATE'
+
+
+class TestSecondaryIndexes:
+    """SheetConfig.indexes — 동기화마다 선언과 일치, 주요 조회가 인덱스 사용"""
+
+    CONFIG = TestBulkUpsert.CONFIG
+    _frame = staticmethod(TestBulkUpsert._frame)
+    _sync = TestBulkUpsert._sync
+
+    @staticmethod
+    def _indexes(conn, table):
+        return {r[0] for r in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = ? "
+            "AND name LIKE 'ix\\_%' ESCAPE '\\'", (table,)
+        )}
+
+    @staticmethod
+    def _plan(conn, sql, params=()):
+        return ' | '.join(r[3] for r in conn.execute('EXPLAIN QUERY PLAN ' + sql, params))
+
+    def test_created_on_sync_and_idempotent(self, synced):
+        workbook, db_path = synced
+        conn = sqlite3.connect(db_path)
+        assert self._indexes(conn, 'dn_domestic') == {
+            'ix_dn_domestic__SO_ID_Line_item', 'ix_dn_domestic__출고일',
+        }
+        # 시트에 없는 컬럼(DN_해외 출고일, Status 등)의 인덱스는 건너뜀
+        assert self._indexes(conn, 'dn_export') == {
+            'ix_dn_export__SO_ID_Line_item', 'ix_dn_export__선적일',
+        }
+        conn.close()
+
+        summary = SyncEngine(excel_path=workbook, db_path=db_path).sync_all(full=True)
+        assert summary.total_errors == 0
+        assert summary.total_indexes_created == 0
+
+    def test_missing_index_restored_for_unchanged_sheet(self, synced):
+        workbook, db_path = synced
+        with sqlite3.connect(db_path) as conn:
+            conn.execute('DROP INDEX [ix_so_domestic__Customer_name]')
+
+        summary = SyncEngine(excel_path=workbook, db_path=db_path).sync_all()
+        so = next(r for r in summary.results if r.sheet_name == 'SO_국내')
+        assert so.unchanged_skipped and so.indexes_created == 1
+        assert 'ix_so_domestic__Customer_name' in self._indexes(sqlite3.connect(db_path), 'so_domestic')
+
+    def test_reconciles_changed_declaration(self):
+        conn = sqlite3.connect(':memory:', isolation_level=None)
+        rows = [['ND-1', '1', 'A', '1']]
+        self._sync(conn, self._frame(rows), replace(self.CONFIG, indexes=(IndexSpec(('Model',)),)))
+        conn.execute('CREATE INDEX my_model ON po_domestic (Model)')   # 사용자 인덱스
+
+        config = replace(self.CONFIG, indexes=(
+            IndexSpec(('Model',), where='[Model] IS NOT NULL'),         # 정의 변경 → 재생성
+            IndexSpec(('Item qty', 'Model')),
+        ))
+        assert ensure_indexes(conn, config) == (
+            ['ix_po_domestic__Model', 'ix_po_domestic__Item_qty_Model'], ['ix_po_domestic__Model'],
+        )
+        assert ensure_indexes(conn, config) == ([], [])
+
+        ensure_indexes(conn, replace(config, indexes=()))
+        assert self._indexes(conn, 'po_domestic') == set()
+        assert conn.execute("SELECT COUNT(*) FROM sqlite_master WHERE name = 'my_model'").fetchone() == (1,)
+
+    def test_survives_type_migration(self):
+        """타입 마이그레이션으로 테이블을 다시 만들어도 같은 동기화에서 인덱스 재생성"""
+        conn = sqlite3.connect(':memory:', isolation_level=None)
+        config = replace(self.CONFIG, indexes=(IndexSpec(('Model',)),))
+        self._sync(conn, self._frame([['ND-1', '1', 'A', '1']]), replace(config, column_types=()))
+        assert self._indexes(conn, 'po_domestic') == {'ix_po_domestic__Model'}
+
+        result = self._sync(conn, self._frame([['ND-1', '1', 'A', '1']]), config)
+        assert result.indexes_created == 1
+        assert self._indexes(conn, 'po_domestic') == {'ix_po_domestic__Model'}
+
+    def test_expression_index_requires_name(self):
+        with pytest.raises(ValueError):
+            IndexSpec(("COALESCE([Status], '')",))
+
+    @pytest.mark.parametrize('sql, index', [
+        # 대시보드 관련 ID 조회 (SO ↔ PO ↔ DN)
+        ('SELECT SO_ID, PO_ID FROM po_domestic WHERE SO_ID IN (?) OR PO_ID IN (?)',
+         'ix_po_domestic__SO_ID'),
+        ('SELECT DN_ID, SO_ID FROM dn_export WHERE DN_ID IN (?) OR SO_ID IN (?)',
+         'ix_dn_export__SO_ID_Line_item'),
+        # DB 로더 (DbReader.select where=SO_ID)
+        ('SELECT * FROM dn_domestic WHERE [SO_ID] IN (?) ORDER BY rowid',
+         'ix_dn_domestic__SO_ID_Line_item'),
+        # Status 필터 / SO별 Open PO 상관 서브쿼리
+        ("SELECT PO_ID FROM po_domestic WHERE COALESCE(Status, '') = ?",
+         'ix_po_domestic__status_SO_ID'),
+        ("SELECT p.SO_ID, (SELECT GROUP_CONCAT(DISTINCT o.PO_ID) FROM po_domestic o "
+         "WHERE o.SO_ID = p.SO_ID AND COALESCE(o.Status, '') = ?) FROM po_domestic p GROUP BY p.SO_ID",
+         'ix_po_domestic__status_SO_ID (<expr>=? AND SO_ID=?)'),
+        # 출고일 범위, 고객별 SO ↔ DN 라인 JOIN
+        ('SELECT * FROM dn_domestic WHERE [출고일] >= ?', 'ix_dn_domestic__출고일'),
+        ('SELECT d.DN_ID FROM dn_domestic d JOIN so_domestic s '
+         'ON d.SO_ID = s.SO_ID AND d.[Line item] = s.[Line item] WHERE s.[Customer name] = ?',
+         'ix_dn_domestic__SO_ID_Line_item (SO_ID=? AND Line item=?)'),
+    ])
+    def test_key_queries_use_indexes(self, synced, sql, index):
+        _, db_path = synced
+        conn = sqlite3.connect(db_path)
+        conn.execute('ALTER TABLE po_domestic ADD COLUMN Status TEXT')
+        ensure_indexes(conn, next(c for c in SYNC_SHEETS if c.table_name == 'po_domestic'))
+        assert f'USING INDEX {index}' in self._plan(conn, sql, ('x',) * sql.count('?'))
+
+
+class TestSyncMetrics:
+    """단계별 소요 시간 / 행/초 / 쓰기 바이트 / 피크 메모리 — SyncSummary + _sync_runs"""
+
+    def test_phases_recorded(self, workbook, tmp_path):
+        summary = SyncEngine(excel_path=workbook, db_path=tmp_path / "m.db", workers=1).sync_all()
+        so = next(r for r in summary.results if r.sheet_name == 'SO_국내')
+        assert {'parse', 'diff', 'write', 'index', 'blocks'} <= set(so.phase_seconds)
+        assert so.rows_per_second > 0
+        assert {'fingerprint', 'weight', 'commit'} <= set(summary.phase_seconds)
+        totals = summary.phase_totals()
+        assert totals['parse'] == pytest.approx(sum(r.phase_seconds.get('parse', 0) for r in summary.results))
+        assert sum(totals.values()) <= summary.elapsed_seconds
+
+    def test_metrics_persisted_in_sync_runs(self, workbook, tmp_path):
+        """변경이 없어도 실행 기록 + 지표 저장, 이전 스키마 _sync_runs에는 컬럼 추가"""
+        import sync_db
+
+        db_path = tmp_path / "m.db"
+        with sqlite3.connect(db_path) as conn:
+            conn.execute(
+                "CREATE TABLE _sync_runs (sync_id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                "started_at TEXT NOT NULL, ended_at TEXT, actor TEXT, host TEXT, "
+                "dry_run INTEGER NOT NULL DEFAULT 0, total_changes INTEGER NOT NULL DEFAULT 0, note TEXT)"
+            )
+        engine = SyncEngine(excel_path=workbook, db_path=db_path, workers=1)
+        sync_db.write_sync_log_to_db(engine.sync_all(), db_path=db_path, record_empty=True)
+        sync_db.write_sync_log_to_db(engine.sync_all(), db_path=db_path, record_empty=True)
+
+        conn = sqlite3.connect(db_path)
+        rows = conn.execute(
+            "SELECT total_changes, elapsed_seconds, total_rows, rows_per_sec, phases_json "
+            "FROM _sync_runs ORDER BY sync_id"
+        ).fetchall()
+        assert len(rows) == 2
+        first, second = rows
+        assert first[0] > 0 and first[1] > 0 and first[2] == 21 and first[3] > 0
+        phases = json.loads(first[4])
+        assert phases['sheets']['SO_국내']['rows'] == 3
+        assert 'log' in phases['run']
+        # 두 번째는 전 시트 지문 동일 → 건너뜀 (행 0, 시트 단계는 인덱스 확인만)
+        assert second[0] == 0 and second[2] == 0
+
+
+class TestSyncLogStreaming:
+    """_sync_log — 반영과 같은 트랜잭션에서 묶음 기록, 결과에는 표본만"""
+
+    CONFIG = TestBulkUpsert.CONFIG
+    _frame = staticmethod(TestBulkUpsert._frame)
+    _sync = TestBulkUpsert._sync
+    _log_rows = staticmethod(TestBulkUpsert._log_rows)
+
+    def test_log_committed_with_sync(self, workbook, tmp_path):
+        db_path = tmp_path / "l.db"
+        summary = SyncEngine(excel_path=workbook, db_path=db_path, workers=1).sync_all()
+        assert summary.sync_id is not None
+        assert summary.log_rows == summary.total_inserted > 0
+
+        conn = sqlite3.connect(db_path)
+        assert conn.execute(
+            "SELECT COUNT(*) FROM _sync_log WHERE sync_id = ?", (summary.sync_id,)
+        ).fetchone() == (summary.log_rows,)
+        assert conn.execute(
+            "SELECT total_changes, ended_at IS NOT NULL FROM _sync_runs"
+        ).fetchall() == [(summary.log_rows, 1)]
+
+        # 변경 없는 재동기화는 실행 행을 만들지 않음 (record_empty는 sync_db 쪽)
+        again = SyncEngine(excel_path=workbook, db_path=db_path, workers=1).sync_all()
+        assert (again.sync_id, again.log_rows) == (None, 0)
+        assert conn.execute("SELECT COUNT(*) FROM _sync_runs").fetchone() == (1,)
+
+    def test_results_keep_capped_samples(self):
+        conn = sqlite3.connect(':memory:', isolation_level=None)
+        rows = [[f'ND-{i}', '1', f'M{i}', '1'] for i in range(100)]
+        result = self._sync(conn, self._frame(rows), log=True, batch_rows=7)
+        assert result.inserted == 100
+        assert len(result.inserted_details) == CHANGE_SAMPLE_LIMIT
+        assert len(self._log_rows(conn, '신규')) == 100
+
+        result = self._sync(conn, self._frame([r[:3] + ['2'] for r in rows]), log=True, batch_rows=7)
+        assert result.updated == 100
+        assert len(result.updated_details) == CHANGE_SAMPLE_LIMIT
+        assert len(self._log_rows(conn, '수정')) == 100
+        assert conn.execute(
+            "SELECT total_changes FROM _sync_runs ORDER BY sync_id"
+        ).fetchall() == [(100,), (100,)]
+
+    def test_prune_all_streams_snapshots(self):
+        """시트가 비면 전체 prune — 스냅샷도 _sync_log로"""
+        conn = sqlite3.connect(':memory:', isolation_level=None)
+        self._sync(conn, self._frame([[f'ND-{i}', '1', f'M{i}', '1'] for i in range(30)]))
+        result = self._sync(conn, self._frame([]), log=True, batch_rows=8)
+        assert result.pruned == 30
+        assert len(result.pruned_pks) == CHANGE_SAMPLE_LIMIT
+        pruned = self._log_rows(conn, '삭제')
+        assert len(pruned) == 30
+        assert json.loads(pruned[0][2])['Model'] == 'M0'
+
+    def test_rollback_discards_log(self, workbook, tmp_path):
+        """에러 ROLLBACK이면 로그도 취소 — sync_db는 변경 0건 실행만 기록"""
+        import sync_db
+
+        db_path = tmp_path / "r.db"
+        wb = openpyxl.load_workbook(workbook)
+        wb['DN_국내']['A1'] = 'DN 번호'     # 필수 컬럼(DN_ID) 없음
+        wb.save(workbook)
+
+        summary = SyncEngine(excel_path=workbook, db_path=db_path, workers=1).sync_all()
+        assert summary.total_errors > 0 and summary.total_inserted > 0
+        assert (summary.sync_id, summary.log_rows) == (None, 0)
+
+        sync_db.write_sync_log_to_db(summary, db_path=db_path, record_empty=True)
+        sync_db.write_sync_log_to_db(summary, db_path=db_path, note='watch', record_empty=True)
+        conn = sqlite3.connect(db_path)
+        assert conn.execute("SELECT COUNT(*) FROM _sync_log").fetchone() == (0,)
+        # 변경 없는 정상 실행(note NULL)과 구분되도록 ROLLBACK 표시
+        rollback = f"ROLLBACK (에러 {summary.total_errors}건)"
+        assert conn.execute(
+            "SELECT total_changes, note FROM _sync_runs ORDER BY sync_id"
+        ).fetchall() == [(0, rollback), (0, f"watch: {rollback}")]
+
+    def test_dry_run_writes_no_log(self, workbook, tmp_path):
+        db_path = tmp_path / "d.db"
+        summary = SyncEngine(excel_path=workbook, db_path=db_path, workers=1).sync_all(dry_run=True)
+        assert summary.total_inserted > 0 and summary.sync_id is None
+        conn = sqlite3.connect(db_path)
+        assert conn.execute(
+            "SELECT COUNT(*) FROM sqlite_master WHERE name = '_sync_log'"
+        ).fetchone() == (0,)
+
+
+class TestChangeChunks:
+    """변경 묶음 — 비교하며 묶음마다 반영(순차)하거나 임시 파일로 넘김(워커)"""
+
+    CONFIG = TestBulkUpsert.CONFIG
+    SO = next(c for c in SYNC_SHEETS if c.sheet_name == 'SO_국내')
+    ROWS = [[f'ND-{i}', '1', f'Model-{i:06d}', '1'] for i in range(2000)]
+
+    _frame = staticmethod(TestBulkUpsert._frame)
+    _sync = TestBulkUpsert._sync
+
+    @staticmethod
+    def _so_frame(rows):
+        return pd.DataFrame(rows, columns=['SO_ID', 'Line item', 'Model', 'Item qty'], dtype=object)
+
+    def _peak(self, changed, spill):
+        """ROWS 중 앞 changed행을 수정하는 재동기화의 Python 피크 메모리"""
+        conn = sqlite3.connect(':memory:', isolation_level=None)
+        self._sync(conn, self._frame(self.ROWS))
+        df = self._frame([r[:3] + ['2' if i < changed else '1'] for i, r in enumerate(self.ROWS)])
+        gc.collect()    # 앞 테스트가 남긴 free list 비움 — 측정 중 할당이 모두 새로 잡히도록
+        tracemalloc.start()
+        try:
+            result = self._sync(conn, df, log=True, batch_rows=50, spill=spill)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        assert result.updated == changed
+        return peak
+
+    @pytest.mark.parametrize('spill', [False, True], ids=['writer', 'worker'])
+    def test_peak_memory_independent_of_changes(self, spill):
+        """수정 행이 20배여도 피크는 거의 같음 (묶음 하나 + 기존 행 맵만 보관)"""
+        with patch('po_generator.db_sync.CHANGE_CHUNK_ROWS', 50):
+            few = self._peak(100, spill)
+            many = self._peak(2000, spill)
+        assert many < few * 1.1
+
+    @pytest.mark.parametrize('spill', [False, True], ids=['writer', 'worker'])
+    def test_duplicate_pk_across_chunks(self, spill):
+        """같은 PK가 다음 묶음에 다시 나오면 앞 묶음에서 정한 값과 비교"""
+        conn = sqlite3.connect(':memory:', isolation_level=None)
+        self._sync(conn, self._so_frame([
+            ['S-1', '1', 'A', '1'], ['S-2', '1', 'B', '1'], ['S-3', '1', 'C', '1'],
+        ]), self.SO)
+        with patch('po_generator.db_sync.CHANGE_CHUNK_ROWS', 2):
+            result = self._sync(conn, self._so_frame([
+                ['S-1', '1', 'A', '2'], ['S-4', '1', 'D', '1'],
+                ['S-2', '1', 'B', '1'], ['S-1', '1', 'X', '3'],
+                ['S-4', '1', 'E', '1'],
+            ]), self.SO, spill=spill)
+
+        assert (result.inserted, result.updated, result.unchanged, result.pruned) == (1, 3, 1, 1)
+        assert result.updated_details == [
+            {'pk': ('S-1', 1), 'changes': {'Item qty': (1.0, 2.0)}},
+            {'pk': ('S-1', 1), 'changes': {'Model': ('A', 'X'), 'Item qty': (2.0, 3.0)}},
+            {'pk': ('S-4', 1), 'changes': {'Model': ('D', 'E')}},
+        ]
+        assert result.pruned_pks == [('S-3', '1')]
+        assert conn.execute(
+            'SELECT SO_ID, Model, [Item qty] FROM so_domestic ORDER BY SO_ID'
+        ).fetchall() == [('S-1', 'X', 3.0), ('S-2', 'B', 1.0), ('S-4', 'E', 1.0)]
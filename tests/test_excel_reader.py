@@ -0,0 +1,438 @@
+"""
+excel_reader 모듈 테스트 (엔진 선택 + calamine/openpyxl 패리티 + 스트리밍/병렬 읽기)
+"""
+
+import sqlite3
+import zipfile
+from datetime import date, datetime, time
+from unittest.mock import patch
+
+import openpyxl
+import pandas as pd
+import pytest
+
+from po_generator import excel_reader
+from po_generator.excel_reader import (
+    ExcelReader,
+    calamine_available,
+    parse_workers,
+    read_sheets,
+    resolve_engine,
+    ENGINE_CALAMINE,
+    ENGINE_OPENPYXL,
+)
+from po_generator.utils import WorkbookCache, SHEET_DTYPES
+
+requires_calamine = pytest.mark.skipif(
+    not calamine_available(), reason="python-calamine 미설치"
+)
+
+# SyncEngine._sync_sheet가 사용하는 읽기 옵션
+SYNC_READ_KWARGS = {'dtype': str, 'keep_default_na': False, 'na_values': ['']}
+
+
+def _preserve_whitespace(path):
+    """openpyxl이 생략하는 xml:space="preserve"를 Excel처럼 추가
+
+    Excel은 앞뒤 공백이 있는 문자열에 항상 이 속성을 기록합니다.
+    속성이 없으면 calamine은 공백만 있는 문자열을 빈 값으로 읽습니다.
+    """
+    with zipfile.ZipFile(path) as src:
+        items = [(info, src.read(info.filename)) for info in src.infolist()]
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as dst:
+        for info, data in items:
+            if info.filename.startswith('xl/worksheets/'):
+                data = data.replace(b'<t>', b'<t xml:space="preserve">')
+            dst.writestr(info, data)
+
+
+@pytest.fixture
+def workbook(tmp_path):
+    """NOAH 시트 형태 + 다양한 셀 타입 워크북"""
+    path = tmp_path / "NOAH_SO_PO_DN.xlsx"
+    wb = openpyxl.Workbook()
+
+    ws = wb.active
+    ws.title = 'SO_해외'
+    ws.append(['SO_ID', 'Line item', 'Customer name', 'Model', 'Model number',
+               'Model code', 'Item qty', 'Sales Unit Price', 'PO receipt date',
+               'Delivery time', 'Remark', 'Status', 'Discount'])
+    ws.append(['SOO-2025-0001', 1, 'Acme Corp', 'NA-100', '00123', 1.5,
+               2, 1250.5, date(2025, 1, 15), time(9, 30), ' 앞뒤 공백 ', 'Open', 0.1])
+    ws.append(['SOO-2025-0001', 2, 'Acme Corp', 100, 123, 'C-01',
+               1, 3000, datetime(2025, 1, 16, 14, 5, 30), None, '  ', None, 0.25])
+    ws.append(['SOO-2025-0002', 1, '한글 고객', 'NA-200', None, None,
+               10, 0.1 + 0.2, None, None, date(2025, 3, 1), 'Cancelled', None])
+    ws.append([None] * 13)
+    ws.append(['SOO-2025-0003', 1, '=1+1', 'NA-300', 7, 7, True, '#N/A', None, None, 42, 'Open', 1])
+    ws['G6'].data_type = 'b'
+    ws['H6'].data_type = 'e'
+    ws['L6'].number_format = '0%'
+
+    ws = wb.create_sheet('PO_해외')
+    ws.append(['PO_ID', 'SO_ID', 'Line item', 'Model', 'Item qty', 'ICO Unit'])
+    ws.append(['POO-2025-0001', 'SOO-2025-0001', 1, 'NA-100', 2, 900])
+    ws.append(['POO-2025-0001', 'SOO-2025-0001', 2, 100, 1, 2500.75])
+
+    ws = wb.create_sheet('Customer_해외')
+    ws.append(['C-code by 해외', 'Customer name', 'Bill to 1', 'Payment terms'])
+    ws.append(['C001', 'Acme Corp', 'Acme Street 1', 'T/T 30 days'])
+
+    wb.save(path)
+    _preserve_whitespace(path)
+    return path
+
+
+def _table_rows(db_path, table):
+    """테이블 행 (동기화 시각 컬럼 제외, rowid 순)"""
+    with sqlite3.connect(db_path) as conn:
+        cur = conn.execute(f'SELECT * FROM {table} ORDER BY rowid')
+        cols = [d[0] for d in cur.description]
+        return [
+            {c: v for c, v in zip(cols, row) if c != '_sync_updated_at'}
+            for row in cur.fetchall()
+        ]
+
+
+def _read(path, engine, sheet, **kwargs):
+    with ExcelReader(path, engine=engine) as reader:
+        return reader.read(sheet, **kwargs)
+
+
+class TestResolveEngine:
+    """엔진 설정값 해석"""
+
+    def test_openpyxl_forced(self):
+        assert resolve_engine('openpyxl') == ENGINE_OPENPYXL
+
+    def test_calamine_missing_falls_back(self):
+        with patch.object(excel_reader, 'calamine_available', return_value=False):
+            assert resolve_engine('calamine') == ENGINE_OPENPYXL
+            assert resolve_engine('auto') == ENGINE_OPENPYXL
+
+    def test_unknown_engine_treated_as_auto(self):
+        with patch.object(excel_reader, 'calamine_available', return_value=False):
+            assert resolve_engine('xlrd') == ENGINE_OPENPYXL
+
+    def test_setting_used_by_default(self):
+        with patch.object(excel_reader, 'EXCEL_READER_ENGINE', 'openpyxl'):
+            assert ExcelReader('x.xlsx').engine == ENGINE_OPENPYXL
+
+    @requires_calamine
+    def test_auto_prefers_calamine(self):
+        assert resolve_engine('auto') == ENGINE_CALAMINE
+
+
+@requires_calamine
+class TestEngineParity:
+    """calamine과 openpyxl이 동일한 DataFrame을 반환하는지"""
+
+    @pytest.mark.parametrize('sheet', ['SO_해외', 'PO_해외', 'Customer_해외'])
+    @pytest.mark.parametrize('kwargs', [
+        {},
+        SYNC_READ_KWARGS,
+        {'nrows': 0},
+        {'nrows': 2},
+    ], ids=['default', 'sync', 'header', 'nrows'])
+    def test_sheet_parity(self, workbook, sheet, kwargs):
+        expected = _read(workbook, 'openpyxl', sheet, **kwargs)
+        actual = _read(workbook, 'calamine', sheet, **kwargs)
+        pd.testing.assert_frame_equal(actual, expected)
+
+    @pytest.mark.parametrize('sheet', ['SO_해외', 'PO_해외'])
+    def test_loader_dtype_parity(self, workbook, sheet):
+        """export 로더 dtype (Model 등 str)"""
+        dtype = SHEET_DTYPES[sheet]
+        expected = _read(workbook, 'openpyxl', sheet, dtype=dtype)
+        actual = _read(workbook, 'calamine', sheet, dtype=dtype)
+        pd.testing.assert_frame_equal(actual, expected)
+        assert actual['Model'].dropna().map(type).eq(str).all()
+
+    def test_usecols_parity(self, workbook):
+        cols = ['SO_ID', 'Customer name']
+        pd.testing.assert_frame_equal(
+            _read(workbook, 'calamine', 'SO_해외', usecols=cols),
+            _read(workbook, 'openpyxl', 'SO_해외', usecols=cols),
+        )
+
+    def test_mixed_column_cell_types(self, workbook):
+        """object 컬럼에 섞인 날짜는 두 엔진 모두 datetime (Timestamp 아님)"""
+        df = _read(workbook, 'calamine', 'SO_해외')
+        remark = df['Remark'].dropna().tolist()
+        assert remark[0] == ' 앞뒤 공백 '
+        assert remark[1] == '  '
+        assert type(remark[2]) is datetime
+
+    def test_sheet_names_parity(self, workbook):
+        with ExcelReader(workbook, 'calamine') as a, ExcelReader(workbook, 'openpyxl') as b:
+            assert a.sheet_names == b.sheet_names
+
+    def test_missing_sheet_raises_value_error(self, workbook):
+        with pytest.raises(ValueError):
+            _read(workbook, 'calamine', '없는시트')
+
+    def test_workbook_cache_parity(self, workbook):
+        """WorkbookCache(문서 생성 로더) 경로도 엔진과 무관하게 동일"""
+        frames = {}
+        for engine in ('openpyxl', 'calamine'):
+            with patch.object(excel_reader, 'EXCEL_READER_ENGINE', engine):
+                cache = WorkbookCache(disk_cache=False)
+                frames[engine] = cache.get_sheets(workbook, ['SO_해외', 'PO_해외'])
+        for sheet in ('SO_해외', 'PO_해외'):
+            pd.testing.assert_frame_equal(frames['calamine'][sheet], frames['openpyxl'][sheet])
+
+    def test_sync_parity(self, workbook, tmp_path):
+        """SyncEngine 결과 DB가 엔진과 무관하게 동일"""
+        from po_generator.db_sync import SyncEngine
+
+        rows = {}
+        for engine in ('openpyxl', 'calamine'):
+            db_path = tmp_path / f"{engine}.db"
+            with patch.object(excel_reader, 'EXCEL_READER_ENGINE', engine):
+                SyncEngine(excel_path=workbook, db_path=db_path).sync_all(
+                    sheet_filter=['PO_해외'],
+                )
+            rows[engine] = _table_rows(db_path, 'po_export')
+        assert rows['calamine'] == rows['openpyxl']
+        assert len(rows['openpyxl']) == 2
+
+
+class TestFallback:
+    """calamine 실패 시 openpyxl 재시도"""
+
+    def test_read_error_falls_back_to_openpyxl(self, workbook):
+        original = pd.read_excel
+
+        def flaky_read_excel(io, *args, **kwargs):
+            if getattr(io, 'engine', None) == ENGINE_CALAMINE:
+                raise RuntimeError("calamine 파싱 오류")
+            return original(io, *args, **kwargs)
+
+        with patch.object(excel_reader, 'calamine_available', return_value=True), \
+                patch.object(excel_reader.pd, 'read_excel', side_effect=flaky_read_excel):
+            with ExcelReader(workbook, engine='calamine') as reader:
+                df = reader.read('PO_해외')
+                assert reader.engine == ENGINE_OPENPYXL
+
+        assert list(df['PO_ID']) == ['POO-2025-0001', 'POO-2025-0001']
+
+
+class TestColumnProjection:
+    """columns= 프로젝션 — 전체 파싱 후 컬럼 선택과 동일한 결과"""
+
+    @pytest.mark.parametrize('engine', [
+        'openpyxl', pytest.param('calamine', marks=requires_calamine),
+    ])
+    @pytest.mark.parametrize('kwargs', [{}, SYNC_READ_KWARGS], ids=['default', 'sync'])
+    def test_matches_full_read(self, workbook, engine, kwargs):
+        cols = ['Customer name', 'Sales Unit Price', 'PO receipt date', 'Remark']
+        expected = _read(workbook, engine, 'SO_해외', **kwargs)[cols]
+        actual = _read(workbook, engine, 'SO_해외', columns=cols, **kwargs)
+        pd.testing.assert_frame_equal(actual, expected)
+
+    def test_keeps_sheet_column_order(self, workbook):
+        df = _read(workbook, 'openpyxl', 'SO_해외', columns=['Status', 'SO_ID', '없는 컬럼'])
+        assert list(df.columns) == ['SO_ID', 'Status']
+
+    def test_trailing_rows_outside_projection(self, tmp_path):
+        """끝쪽 행에 제외한 열의 값만 있어도 행 수는 전체 파싱과 동일"""
+        path = tmp_path / 'trailing.xlsx'
+        wb = openpyxl.Workbook()
+        ws = wb.active
+        ws.append(['SO_ID', 'Remark'])
+        ws.append(['SOO-0001', None])
+        ws.append([None, '메모만 있는 행'])
+        ws.append([None, '메모만 있는 행'])
+        wb.save(path)
+
+        expected = _read(path, 'openpyxl', 0)[['SO_ID']]
+        actual = _read(path, 'openpyxl', 0, columns=['SO_ID'])
+        assert len(actual) == 3
+        pd.testing.assert_frame_equal(actual, expected)
+
+    def test_duplicate_header_falls_back_to_full_parse(self, tmp_path):
+        """요청 컬럼명이 헤더에 중복되면 전체 파싱 후 선택"""
+        path = tmp_path / 'dup.xlsx'
+        wb = openpyxl.Workbook()
+        wb.active.append(['A', 'B', 'A'])
+        wb.active.append([1, 2, 3])
+        wb.save(path)
+
+        df = _read(path, 'openpyxl', 0, columns=['A', 'B'])
+        assert list(df.columns) == ['A', 'B']
+        assert df.iloc[0].tolist() == [1, 2]
+
+
+@pytest.fixture
+def long_workbook(tmp_path):
+    """스트리밍 테스트용 — 중간/끝 빈 행, 그룹 순번(_row_seq)이 묶음 경계를 넘는 시트"""
+    path = tmp_path / "long.xlsx"
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = 'PO_해외'
+    ws.append(['PO_ID', 'Line item', 'Model', ' Item qty ', 'ICO Unit', None, 'Model'])
+    for i in range(7):
+        ws.append([f'POO-2025-000{i // 3}', 1, f'NA-{i}', i + 1, 100.5 * i, None, 'dup'])
+    ws.append([None] * 7)
+    ws.append(['POO-2025-0009', 2, 'NA-9', 'N/A', None, 'x', None])
+    ws.append([None] * 7)
+    ws.append([None] * 7)
+
+    ws = wb.create_sheet('Customer_해외')
+    ws.append(['C-code by 해외', 'Customer name'])
+    for i in range(5):
+        ws.append(['C001' if i % 2 else 'C002', f'고객 {i}'])
+    wb.save(path)
+    return path
+
+
+def _stream(path, sheet, batch_size, **kwargs):
+    with ExcelReader(path, engine='openpyxl') as reader:
+        return list(reader.iter_batches(sheet, batch_size=batch_size, **kwargs))
+
+
+def _full(path, sheet, **kwargs):
+    df = _read(path, 'openpyxl', sheet, **kwargs)
+    df.columns = [str(c).strip() for c in df.columns]
+    return df
+
+
+class TestIterBatches:
+    """iter_batches — 묶음을 이어 붙이면 전체 읽기와 동일"""
+
+    @pytest.mark.parametrize('batch_size', [1, 3, 100])
+    def test_text_matches_full_read(self, long_workbook, batch_size):
+        batches = _stream(long_workbook, 'PO_해외', batch_size, dtype=str, keep_default_na=False)
+        expected = _full(long_workbook, 'PO_해외', **SYNC_READ_KWARGS)
+        assert all(len(b) <= batch_size for b in batches)
+        pd.testing.assert_frame_equal(pd.concat(batches), expected)
+
+    def test_typed_matches_full_read(self, long_workbook):
+        """단일 묶음이면 타입 추론도 전체 읽기와 동일"""
+        (df,) = _stream(long_workbook, 'PO_해외', 100)
+        pd.testing.assert_frame_equal(df, _full(long_workbook, 'PO_해외'))
+
+    def test_cell_types_match_full_read(self, workbook):
+        """오류 셀, 날짜/시각, 정수값 float, 공백 문자열"""
+        (df,) = _stream(workbook, 'SO_해외', 100)
+        pd.testing.assert_frame_equal(df, _full(workbook, 'SO_해외'))
+
+    def test_header_normalization(self, long_workbook):
+        """앞뒤 공백 제거, 빈 헤더 'Unnamed: i', 중복 헤더 'X.1'"""
+        (df,) = _stream(long_workbook, 'PO_해외', 100)
+        assert list(df.columns) == ['PO_ID', 'Line item', 'Model', 'Item qty',
+                                    'ICO Unit', 'Unnamed: 5', 'Model.1']
+
+    def test_blank_rows(self, long_workbook):
+        """중간 빈 행은 유지, 끝쪽 빈 행은 제외 (index는 묶음 간 연속)"""
+        batches = _stream(long_workbook, 'PO_해외', 4)
+        df = pd.concat(batches)
+        assert [len(b) for b in batches] == [4, 4, 1]
+        assert list(df.index) == list(range(9))
+        assert df.loc[7].isna().all()
+        assert df.loc[8, 'PO_ID'] == 'POO-2025-0009'
+
+    def test_columns_and_dtype(self, long_workbook):
+        batches = _stream(long_workbook, 'PO_해외', 4, columns=['PO_ID', 'Model', '없는 컬럼'],
+                          dtype={'Model': str})
+        df = pd.concat(batches)
+        assert list(df.columns) == ['PO_ID', 'Model']
+        assert df['Model'].dropna().map(type).eq(str).all()
+
+    def test_default_na_values(self, long_workbook):
+        """keep_default_na=False면 'N/A'는 문자열 유지"""
+        typed = pd.concat(_stream(long_workbook, 'PO_해외', 100))
+        text = pd.concat(_stream(long_workbook, 'PO_해외', 100, dtype=str, keep_default_na=False))
+        assert pd.isna(typed.loc[8, 'Item qty'])
+        assert text.loc[8, 'Item qty'] == 'N/A'
+
+    def test_header_only_sheet(self, tmp_path):
+        path = tmp_path / 'empty.xlsx'
+        wb = openpyxl.Workbook()
+        wb.active.append(['PO_ID', 'Model'])
+        wb.save(path)
+        (df,) = _stream(path, 0, 10)
+        assert df.empty
+        assert list(df.columns) == ['PO_ID', 'Model']
+
+    def test_invalid_batch_size(self, long_workbook):
+        with pytest.raises(ValueError):
+            _stream(long_workbook, 'PO_해외', 0)
+
+    def test_streaming_sync_matches_full_sync(self, long_workbook, tmp_path):
+        """SyncEngine(batch_size=N) 결과 DB가 전체 읽기와 동일 (_row_seq 포함)"""
+        from po_generator.db_sync import SyncEngine
+
+        rows = {}
+        for batch_size in (0, 2):
+            db_path = tmp_path / f"batch{batch_size}.db"
+            summary = SyncEngine(excel_path=long_workbook, db_path=db_path,
+                                 batch_size=batch_size).sync_all(
+                sheet_filter=['PO_해외', 'Customer_해외'],
+            )
+            assert summary.total_errors == 0
+            rows[batch_size] = {
+                table: _table_rows(db_path, table) for table in ('po_export', 'customer_export')
+            }
+        assert rows[2] == rows[0]
+        assert [r['_row_seq'] for r in rows[2]['po_export']][:7] == ['1', '2', '3', '1', '2', '3', '1']
+        assert [r['_row_seq'] for r in rows[2]['customer_export']] == ['1', '1', '2', '2', '3']
+
+
+class TestParallelRead:
+    """read_sheets — 프로세스 풀 병렬 파싱 결과는 순차 파싱과 동일"""
+
+    SHEETS = ('SO_해외', 'PO_해외', 'Customer_해외')
+
+    def _requests(self):
+        return {name: {'dtype': SHEET_DTYPES.get(name)} for name in self.SHEETS}
+
+    def test_parallel_matches_serial(self, workbook):
+        serial = read_sheets(workbook, self._requests(), engine='openpyxl', workers=1)
+        parallel = read_sheets(workbook, self._requests(), engine='openpyxl', workers=3)
+        assert list(parallel) == list(self.SHEETS)
+        for name in self.SHEETS:
+            pd.testing.assert_frame_equal(parallel[name], serial[name])
+
+    def test_columns_forwarded(self, workbook):
+        frames = read_sheets(workbook, {'SO_해외': {'columns': ['SO_ID', 'Remark']}}, workers=2)
+        assert list(frames['SO_해외'].columns) == ['SO_ID', 'Remark']
+
+    def test_sheet_error_propagates(self, workbook):
+        with pytest.raises(ValueError):
+            read_sheets(workbook, {'SO_해외': {}, '없는시트': {}}, engine='openpyxl', workers=2)
+
+    def test_pool_unavailable_falls_back_to_serial(self, workbook):
+        with patch.object(excel_reader, 'ProcessPoolExecutor', side_effect=OSError("no fork")):
+            frames = read_sheets(workbook, self._requests(), engine='openpyxl', workers=3)
+        assert list(frames) == list(self.SHEETS)
+        assert len(frames['PO_해외']) == 2
+
+    def test_parse_workers(self, workbook):
+        assert parse_workers(workbook, 7, 1) == 1
+        assert parse_workers(workbook, 2, 8) == 2
+        # 자동: 작은 파일은 순차
+        assert parse_workers(workbook, 7, 0) == 1
+        with patch.object(excel_reader, '_PARALLEL_MIN_BYTES', 0), \
+                patch.object(excel_reader.os, 'cpu_count', return_value=1):
+            assert parse_workers(workbook, 7, 0) == 1
+        with patch.object(excel_reader, '_PARALLEL_MIN_BYTES', 0), \
+                patch.object(excel_reader.os, 'cpu_count', return_value=4):
+            assert parse_workers(workbook, 7, 0) == 4
+
+    def test_parallel_sync_matches_serial(self, long_workbook, tmp_path):
+        """SyncEngine(workers=N) 결과 DB가 순차 파싱과 동일"""
+        from po_generator.db_sync import SyncEngine
+
+        rows = {}
+        for workers in (1, 2):
+            db_path = tmp_path / f"workers{workers}.db"
+            summary = SyncEngine(excel_path=long_workbook, db_path=db_path, batch_size=0,
+                                 workers=workers).sync_all(
+                sheet_filter=['PO_해외', 'Customer_해외'],
+            )
+            assert summary.total_errors == 0
+            rows[workers] = {
+                table: _table_rows(db_path, table) for table in ('po_export', 'customer_export')
+            }
+        assert rows[2] == rows[1]
@@ -0,0 +1,176 @@
+"""
+finder_service 모듈 테스트 (조회 인덱스 + 백그라운드 prewarm)
+"""
+
+import threading
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from po_generator.services import finder_service
+from po_generator.services.finder_service import FinderService, _LookupIndex
+from po_generator.utils import find_order_data, find_dn_export_data
+
+
+@pytest.fixture
+def po_df():
+    return pd.DataFrame({
+        'PO_ID': ['ND-0001', 'ND-0002', 'ND-0001', None, 'NO-0001'],
+        'Customer name': ['고객A', '고객B', '고객A', None, 'Acme'],
+        'Line item': [1, 1, 2, np.nan, 1],
+    }, index=[10, 11, 12, 13, 14])
+
+
+@pytest.fixture
+def dn_export_df():
+    return pd.DataFrame({
+        'DN_ID': ['DNO-0001', 'DNO-0001', 'DNO-0002', 'DNO-0003'],
+        'SO_ID': ['SOO-0001', 'SOO-0001', 'SOO-0002', 'SOO-0003'],
+        'Customer PO': ['26KPO001', '26KPO001', 12345, '26KPO001'],
+        'Customer name': ['Acme', 'Acme', None, 'Acme'],
+    })
+
+
+@pytest.fixture
+def finder(po_df, dn_export_df):
+    finder = FinderService(source='excel')
+    finder._po_df = po_df
+    finder._dn_export_df = dn_export_df
+    return finder
+
+
+class TestLookupIndex:
+    """_LookupIndex — 불리언 마스크와 같은 결과"""
+
+    def test_rows_match_mask(self, po_df):
+        index = _LookupIndex(po_df)
+        pd.testing.assert_frame_equal(
+            index.rows('PO_ID', 'ND-0001'), po_df[po_df['PO_ID'] == 'ND-0001'],
+        )
+        assert index.rows('PO_ID', 'ND-9999').empty
+
+    def test_numeric_key_matches_float(self, po_df):
+        """1 == 1.0 (마스크 비교와 동일)"""
+        assert len(_LookupIndex(po_df).rows('Line item', 1)) == 3
+
+    def test_as_str(self, dn_export_df):
+        rows = _LookupIndex(dn_export_df).rows('Customer PO', '12345', as_str=True)
+        assert rows['DN_ID'].tolist() == ['DNO-0002']
+
+    def test_rows_in_keeps_order(self, dn_export_df):
+        rows = _LookupIndex(dn_export_df).rows_in('SO_ID', ['SOO-0003', 'SOO-0001', 'X'])
+        assert rows.index.tolist() == [0, 1, 3]
+
+    def test_first_rows(self, po_df):
+        expected = (po_df.dropna(subset=['PO_ID'])
+                    .drop_duplicates(subset='PO_ID', keep='first').head(2))
+        pd.testing.assert_frame_equal(_LookupIndex(po_df).first_rows('PO_ID', 2), expected)
+
+    def test_map_built_once(self, po_df):
+        index = _LookupIndex(po_df)
+        index.rows('PO_ID', 'ND-0001')
+        built = index._maps[('PO_ID', False)]
+        index.rows('PO_ID', 'ND-0002')
+        assert index._maps[('PO_ID', False)] is built
+
+
+class TestFinderServiceIndex:
+    """FinderService 검색 — 인덱스 결과가 기존 find_* 함수와 동일"""
+
+    @pytest.mark.parametrize('order_no', ['ND-0001', 'ND-0002', 'ND-9999'])
+    def test_find_po(self, finder, po_df, order_no):
+        expected = find_order_data(po_df, order_no)
+        result = finder.find_po(order_no)
+        if expected is None:
+            assert result is None
+        elif isinstance(expected, pd.DataFrame):
+            pd.testing.assert_frame_equal(result.items_df, expected)
+        else:
+            pd.testing.assert_series_equal(result.first_item, expected)
+
+    def test_find_dn_export(self, finder, dn_export_df):
+        result = finder.find_dn_export('DNO-0001')
+        pd.testing.assert_frame_equal(
+            result.items_df, find_dn_export_data(dn_export_df, 'DNO-0001'),
+        )
+
+    def test_index_reused_across_lookups(self, finder):
+        finder.find_po('ND-0001')
+        index = finder._indexes['po']
+        finder.find_po('ND-0002')
+        assert finder._indexes['po'] is index
+
+    def test_find_by_customer_po(self, finder):
+        result = finder.find_dn_export_by_customer_po('26KPO001')
+        assert result.items_df['DN_ID'].tolist() == ['DNO-0001', 'DNO-0001', 'DNO-0003']
+        assert finder.find_dn_export_by_customer_po('12345').item_count == 1
+        assert finder.find_dn_export_by_customer_po('NONE') is None
+
+    def test_available_ids(self, finder):
+        assert finder.get_available_po_ids(limit=2) == [('ND-0001', '고객A'), ('ND-0002', '고객B')]
+        assert finder.get_available_dn_export_ids() == [
+            ('DNO-0001', 'Acme'), ('DNO-0002', ''), ('DNO-0003', 'Acme'),
+        ]
+
+    def test_find_so_export_rows(self, finder):
+        finder._so_export_df = pd.DataFrame({'SO_ID': ['A', 'B', 'A'], 'Line item': [1, 1, 2]})
+        assert finder.find_so_export_rows(['A']).index.tolist() == [0, 2]
+        assert finder.find_so_export_rows([]).empty
+
+
+class TestPrewarm:
+    """prewarm — 백그라운드 로드, 호출 시 완료 대기, 중복 로드 없음"""
+
+    def test_load_waits_for_prewarm(self, po_df):
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def slow_load():
+            calls.append(threading.current_thread().name)
+            started.set()
+            release.wait(5)
+            return po_df
+
+        with patch.object(finder_service, 'load_noah_po_lists', side_effect=slow_load):
+            finder = FinderService(source='excel', prewarm='po')
+            assert started.wait(5)
+            threading.Timer(0.05, release.set).start()
+            df = finder.load_po_data()
+
+        assert df is po_df
+        assert calls == ['finder-prewarm-po']
+        assert finder.find_po('ND-0002').first_item['Customer name'] == '고객B'
+
+    def test_prewarm_loads_doc_type_data(self, po_df, dn_export_df):
+        with patch.object(finder_service, 'load_dn_export_data', return_value=dn_export_df), \
+                patch.object(finder_service, 'load_so_export_data', return_value=po_df) as so, \
+                patch.object(finder_service, 'load_noah_po_lists') as po:
+            finder = FinderService(source='excel', prewarm='ci')
+            finder.wait_prewarm()
+        assert finder._dn_export_df is dn_export_df
+        assert finder._so_export_df is po_df
+        so.assert_called_once()
+        po.assert_not_called()
+
+    def test_prewarm_error_raised_on_demand(self):
+        with patch.object(finder_service, 'load_dn_data',
+                          side_effect=FileNotFoundError("없음")) as load, \
+                patch.object(finder_service, 'load_pmt_data'), \
+                patch.object(FinderService, '_load_so_domestic'):
+            finder = FinderService(source='excel', prewarm='ts')
+            finder.wait_prewarm()
+            with pytest.raises(FileNotFoundError):
+                finder.load_dn_data()
+        assert load.call_count == 2
+
+    def test_unknown_doc_type(self):
+        with pytest.raises(ValueError):
+            FinderService(source='excel', prewarm='xx')
+
+    def test_sqlite_source_skips_prewarm(self, tmp_path):
+        with patch.object(finder_service, 'resolve_data_source', return_value='sqlite'):
+            finder = FinderService(db_path=tmp_path / 'none.db', prewarm='po')
+        assert finder._prewarm_thread is None
@@ -0,0 +1,301 @@
+"""
+sheet_cache 모듈 테스트 (시트 디스크 캐시)
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from po_generator.excel_reader import ExcelReader
+from po_generator.sheet_cache import (
+    SheetCache,
+    sheet_cache_dir,
+    FORMAT_FEATHER,
+    FORMAT_PICKLE,
+)
+from po_generator.utils import WorkbookCache, read_header_columns
+from po_generator.xlsx_package import RowBlocks, XlsxPackage, format_row_ranges
+
+
+@pytest.fixture
+def workbook(tmp_path):
+    """SO_국내(빈 셀 포함) + DN_국내 워크북"""
+    path = tmp_path / "NOAH_SO_PO_DN.xlsx"
+    df_so = pd.DataFrame({
+        'SO_ID': ['SOD-0001', 'SOD-0002', 'SOD-0003'],
+        'Customer name': ['고객A', None, '고객C'],
+        'Item qty': [1, 2, 3],
+        'Sales amount KRW': [1000.5, np.nan, 3000.0],
+    })
+    df_dn = pd.DataFrame({'DN_ID': ['DND-0001'], 'SO_ID': ['SOD-0001']})
+    with pd.ExcelWriter(path) as writer:
+        df_so.to_excel(writer, sheet_name='SO_국내', index=False)
+        df_dn.to_excel(writer, sheet_name='DN_국내', index=False)
+    return path
+
+
+def _rewrite_dn(path, dn_ids):
+    """SO_국내는 그대로 두고 DN_국내만 변경하여 다시 저장"""
+    df_so = pd.read_excel(path, sheet_name='SO_국내')
+    with pd.ExcelWriter(path) as writer:
+        df_so.to_excel(writer, sheet_name='SO_국내', index=False)
+        pd.DataFrame({'DN_ID': dn_ids, 'SO_ID': ['SOD-0001'] * len(dn_ids)}).to_excel(
+            writer, sheet_name='DN_국내', index=False,
+        )
+
+
+class TestXlsxPackage:
+    """XlsxPackage — zip 파트 직접 접근"""
+
+    def test_sheet_names(self, workbook):
+        with XlsxPackage(workbook) as pkg:
+            assert pkg.sheet_names == ['SO_국내', 'DN_국내']
+
+    def test_missing_sheet_raises(self, workbook):
+        with XlsxPackage(workbook) as pkg:
+            with pytest.raises(KeyError):
+                pkg.sheet_part('없는시트')
+
+    def test_content_key_ignores_other_sheets(self, workbook):
+        """다른 시트만 바뀌면 시트 내용 해시는 유지"""
+        with XlsxPackage(workbook) as pkg:
+            so_key = pkg.content_key('SO_국내')
+            dn_key = pkg.content_key('DN_국내')
+
+        _rewrite_dn(workbook, ['DND-0001', 'DND-0002'])
+
+        with XlsxPackage(workbook) as pkg:
+            assert pkg.content_key('SO_국내') == so_key
+            assert pkg.content_key('DN_국내') != dn_key
+
+
+class TestRowBlocks:
+    """XlsxPackage.row_block_hashes + RowBlocks.changed_ranges — 행 블록 변경 감지"""
+
+    @staticmethod
+    def _write_so(path, customers):
+        pd.DataFrame({
+            'SO_ID': [f'SOD-{i:04d}' for i in range(1, len(customers) + 1)],
+            'Customer name': customers,
+        }).to_excel(path, sheet_name='SO_국내', index=False)
+
+    def _blocks(self, path, block_rows=2):
+        with XlsxPackage(path) as pkg:
+            return pkg.row_block_hashes('SO_국내', block_rows=block_rows)
+
+    def test_unchanged_after_resave(self, workbook):
+        """다른 시트만 바뀌면 바뀐 범위 없음"""
+        before = self._blocks(workbook)
+        _rewrite_dn(workbook, ['DND-0001', 'DND-0002'])
+        assert self._blocks(workbook).changed_ranges(before) == []
+
+    def test_block_count(self, workbook):
+        """헤더 포함 4행 → 2행 블록 2개"""
+        blocks = self._blocks(workbook)
+        assert blocks.block_rows == 2
+        assert len(blocks.hashes) == 2
+
+    def test_reports_changed_block_only(self, tmp_path):
+        path = tmp_path / 'so.xlsx'
+        customers = [f'고객{i}' for i in range(9)]
+        self._write_so(path, customers)
+        before = self._blocks(path)
+
+        customers[5] = '변경고객'      # Excel 7행 → 블록 3 (7~8행)
+        self._write_so(path, customers)
+        assert self._blocks(path).changed_ranges(before) == [(7, 8)]
+
+    def test_adjacent_blocks_merged(self, tmp_path):
+        path = tmp_path / 'so.xlsx'
+        customers = [f'고객{i}' for i in range(9)]
+        self._write_so(path, customers)
+        before = self._blocks(path)
+
+        customers[1] = customers[3] = 'X'   # 3행, 5행 → 블록 1, 2
+        self._write_so(path, customers)
+        assert self._blocks(path).changed_ranges(before) == [(3, 6)]
+
+    def test_appended_and_removed_rows(self, tmp_path):
+        path = tmp_path / 'so.xlsx'
+        self._write_so(path, ['A', 'B', 'C'])
+        short = self._blocks(path)
+        self._write_so(path, ['A', 'B', 'C', 'D', 'E'])
+        long = self._blocks(path)
+
+        assert long.changed_ranges(short) == [(5, 6)]
+        assert short.changed_ranges(long) == [(5, 6)]
+
+    def test_no_previous_is_full_range(self, workbook):
+        blocks = self._blocks(workbook)
+        assert blocks.changed_ranges(None) == [(1, 4)]
+
+    def test_block_size_or_base_change_is_full_range(self, workbook):
+        blocks = self._blocks(workbook)
+        assert blocks.changed_ranges(self._blocks(workbook, block_rows=3)) == [(1, 4)]
+        other = RowBlocks(blocks.block_rows, 'other', blocks.hashes)
+        assert blocks.changed_ranges(other) == [(1, 4)]
+
+    def test_invalid_block_rows(self, workbook):
+        with pytest.raises(ValueError):
+            self._blocks(workbook, block_rows=0)
+
+    def test_format_row_ranges(self):
+        assert format_row_ranges([(2, 257), (513, 768)]) == '2-257, 513-768'
+        assert format_row_ranges([]) == ''
+
+
+class TestSheetCache:
+    """SheetCache — 저장/복원/무효화"""
+
+    def test_feather_roundtrip(self, workbook):
+        """Feather 저장 후 read_excel 결과와 동일하게 복원 (NaN 포함)"""
+        expected = pd.read_excel(workbook, sheet_name='SO_국내')
+        cache = SheetCache(workbook)
+        with XlsxPackage(workbook) as pkg:
+            assert cache.store(pkg, 'SO_국내', expected) == FORMAT_FEATHER
+            loaded = cache.load(pkg, 'SO_국내')
+
+        pd.testing.assert_frame_equal(loaded, expected)
+        assert cache.cache_dir == sheet_cache_dir(workbook)
+
+    def test_mixed_types_fall_back_to_pickle(self, workbook):
+        """Arrow로 표현할 수 없는 혼합 타입 컬럼은 pickle로 저장"""
+        df = pd.DataFrame({'SO_ID': ['SOD-0001', 2, 3.5]})
+        cache = SheetCache(workbook)
+        with XlsxPackage(workbook) as pkg:
+            assert cache.store(pkg, 'SO_국내', df) == FORMAT_PICKLE
+            loaded = cache.load(pkg, 'SO_국내')
+
+        pd.testing.assert_frame_equal(loaded, df)
+
+    def test_invalidated_when_sheet_changes(self, workbook):
+        """시트 내용이 바뀌면 캐시 미적중, 다른 시트 캐시는 유지"""
+        cache = SheetCache(workbook)
+        with XlsxPackage(workbook) as pkg:
+            for sheet in ('SO_국내', 'DN_국내'):
+                cache.store(pkg, sheet, pd.read_excel(workbook, sheet_name=sheet))
+
+        _rewrite_dn(workbook, ['DND-0009'])
+
+        with XlsxPackage(workbook) as pkg:
+            assert cache.load(pkg, 'DN_국내') is None
+            assert cache.load(pkg, 'SO_국내') is not None
+
+    def test_dtype_is_part_of_key(self, workbook):
+        """다른 dtype으로 요청하면 캐시 미적중"""
+        cache = SheetCache(workbook)
+        with XlsxPackage(workbook) as pkg:
+            cache.store(pkg, 'DN_국내', pd.read_excel(workbook, sheet_name='DN_국내'))
+            assert cache.load(pkg, 'DN_국내', dtype={'DN_ID': str}) is None
+
+    def test_entries_and_purge(self, workbook):
+        cache = SheetCache(workbook)
+        with XlsxPackage(workbook) as pkg:
+            cache.store(pkg, 'DN_국내', pd.read_excel(workbook, sheet_name='DN_국내'))
+            entries = cache.entries()
+            assert [e['sheet'] for e in entries] == ['DN_국내']
+            assert cache.is_fresh(pkg, entries[0])
+
+        assert cache.purge() == 2
+        assert cache.entries() == []
+
+
+class TestWorkbookCacheDisk:
+    """WorkbookCache + 디스크 캐시 — 프로세스 간 재사용"""
+
+    def test_new_process_reads_from_disk(self, workbook):
+        """새 WorkbookCache(=새 프로세스)는 Excel 파싱 없이 디스크에서 로드"""
+        first = WorkbookCache(disk_cache=True)
+        expected = first.get_sheet(workbook, 'SO_국내')
+        assert first.stats.misses == 1
+
+        second = WorkbookCache(disk_cache=True)
+        df = second.get_sheet(workbook, 'SO_국내')
+        assert second.stats.misses == 0
+        assert second.stats.disk_hits == 1
+        pd.testing.assert_frame_equal(df, expected)
+
+    def test_disabled(self, workbook):
+        """disk_cache=False면 캐시 폴더를 만들지 않음"""
+        cache = WorkbookCache(disk_cache=False)
+        cache.get_sheet(workbook, 'SO_국내')
+        assert not sheet_cache_dir(workbook).exists()
+
+    def test_projected_load_reads_disk_columns(self, workbook):
+        """전체 시트가 디스크에 있으면 프로젝션 요청도 디스크에서 로드"""
+        expected = WorkbookCache(disk_cache=True).get_sheet(workbook, 'SO_국내')
+
+        cache = WorkbookCache(disk_cache=True)
+        df = cache.get_sheet(workbook, 'SO_국내', columns=['SO_ID', 'Sales amount KRW'])
+        assert cache.stats.disk_hits == 1
+        assert cache.stats.misses == 0
+        pd.testing.assert_frame_equal(df, expected[['SO_ID', 'Sales amount KRW']])
+
+    def test_projected_parse_not_stored(self, workbook):
+        """프로젝션 파싱 결과는 디스크 캐시에 저장하지 않음"""
+        cache = WorkbookCache(disk_cache=True)
+        cache.get_sheet(workbook, 'SO_국내', columns=['SO_ID'])
+        assert cache.stats.projected == 1
+        assert SheetCache(workbook).entries() == []
+
+
+
+class TestHeaderProbe:
+    """헤더 컬럼명 조회 — 시트 XML 첫 행 + 디스크 저장"""
+
+    @pytest.fixture
+    def po_workbook(self, tmp_path):
+        """빈 헤더 칸, 중복 컬럼명, 공백 포함 컬럼명이 있는 PO 시트"""
+        path = tmp_path / "NOAH_SO_PO_DN.xlsx"
+        df = pd.DataFrame(
+            [['POD-0001', 1, 'x', 'A', 'B', ' 옵션 ']],
+            columns=['PO_ID', 'Qty', '', 'Model', 'Model', ' 옵션 '],
+        )
+        with pd.ExcelWriter(path) as writer:
+            df.to_excel(writer, sheet_name='PO_국내', index=False)
+        return path
+
+    def test_matches_read_excel_header(self, po_workbook):
+        expected = list(pd.read_excel(po_workbook, sheet_name='PO_국내', nrows=0).columns)
+        with ExcelReader(po_workbook) as reader:
+            assert reader.read_header('PO_국내') == expected
+            assert reader.read_header(0) == expected
+
+    def test_persisted_header_skips_parsing(self, po_workbook, monkeypatch):
+        """저장된 헤더가 있으면 워크북을 파싱하지 않음"""
+        first = read_header_columns(po_workbook, 'PO_국내')
+        assert (sheet_cache_dir(po_workbook) / 'PO_국내.header.json').exists()
+
+        def fail(*args, **kwargs):
+            raise AssertionError("헤더를 다시 읽음")
+
+        monkeypatch.setattr(ExcelReader, 'read_header', fail)
+        monkeypatch.setattr(ExcelReader, 'read', fail)
+        assert read_header_columns(po_workbook, 'PO_국내') == first
+
+    def test_resaved_workbook_reuses_header(self, po_workbook):
+        """mtime만 바뀌고 시트 내용이 같으면 저장된 헤더 재사용"""
+        cache = SheetCache(po_workbook)
+        columns = read_header_columns(po_workbook, 'PO_국내')
+        st = po_workbook.stat()
+        os.utime(po_workbook, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+        assert cache.load_header('PO_국내') == columns
+
+    def test_invalidated_when_header_changes(self, po_workbook):
+        read_header_columns(po_workbook, 'PO_국내')
+        with pd.ExcelWriter(po_workbook) as writer:
+            pd.DataFrame({'PO_ID': ['POD-0001'], '신규': [1]}).to_excel(
+                writer, sheet_name='PO_국내', index=False,
+            )
+
+        assert SheetCache(po_workbook).load_header('PO_국내') is None
+        assert read_header_columns(po_workbook, 'PO_국내') == ['PO_ID', '신규']
+
+    def test_header_files_not_listed_as_entries(self, po_workbook):
+        read_header_columns(po_workbook, 'PO_국내')
+        cache = SheetCache(po_workbook)
+        assert cache.entries() == []
+        assert cache.purge() == 1
@@ -0,0 +1,108 @@
+"""
+sync_metrics 모듈 테스트 (동기화 단계 시간 / 자원 측정)
+"""
+
+import sys
+
+import pytest
+
+from po_generator import sync_metrics
+from po_generator.sync_metrics import (
+    RunPeakRss,
+    io_write_bytes,
+    is_slowdown,
+    peak_rss_bytes,
+    phase_timer,
+    reset_peak_rss,
+    phase_totals,
+    rows_per_second,
+)
+
+
+class TestPhaseTimer:
+    """단계 시간 누적"""
+
+    def test_accumulates_per_phase(self):
+        phases = {}
+        for _ in range(2):
+            with phase_timer(phases, 'parse'):
+                pass
+        with phase_timer(phases, 'write'):
+            pass
+        assert set(phases) == {'parse', 'write'}
+        assert all(v >= 0 for v in phases.values())
+
+    def test_records_on_exception(self):
+        phases = {}
+        with pytest.raises(ValueError):
+            with phase_timer(phases, 'diff'):
+                raise ValueError
+        assert 'diff' in phases
+
+
+class TestRunSummary:
+    """_sync_runs 지표 해석"""
+
+    def test_phase_totals(self):
+        data = ('{"run":{"commit":0.25},"sheets":{"A":{"parse":1.0,"rows":3},'
+                '"B":{"parse":0.5,"write":2.0,"rows":4}}}')
+        assert phase_totals(data) == {'commit': 0.25, 'parse': 1.5, 'write': 2.0}
+        assert phase_totals(None) == {}
+
+    @pytest.mark.parametrize('rate, earlier, expected', [
+        (100.0, [300.0, 320.0, 310.0], True),
+        (250.0, [300.0, 320.0, 310.0], False),
+        (100.0, [300.0, 320.0], False),        # 비교할 이력 부족
+        (None, [300.0, 320.0, 310.0], False),
+    ])
+    def test_is_slowdown(self, rate, earlier, expected):
+        assert is_slowdown(rate, earlier) is expected
+
+    def test_rows_per_second(self):
+        assert rows_per_second(100, 0.5) == 200
+        assert rows_per_second(100, 0) == 0
+
+
+@pytest.mark.skipif(not sys.platform.startswith('linux'), reason='Linux /proc, resource 전용 확인')
+class TestResourceCounters:
+    """프로세스 쓰기 바이트 / 피크 메모리"""
+
+    def test_write_bytes_increase(self, tmp_path):
+        before = io_write_bytes()
+        (tmp_path / 'x.bin').write_bytes(b'0' * 65536)
+        assert io_write_bytes() - before >= 65536
+
+    def test_peak_rss_positive(self):
+        assert peak_rss_bytes() > 0
+
+    def test_reset_peak_rss_starts_per_run_peak(self):
+        """재설정 후 피크는 이전에 잡은 큰 메모리와 무관"""
+        block = bytearray(64 * 1024 * 1024)
+        before = peak_rss_bytes()
+        del block
+        if not reset_peak_rss():
+            pytest.skip('clear_refs 쓰기 불가')
+        assert peak_rss_bytes() < before
+
+
+class TestRunPeakRss:
+    """실행 단위 피크 — 카운터를 재설정할 수 없으면 이번 실행에 갱신된 피크만"""
+
+    def _tracker(self, monkeypatch, reset, peaks):
+        values = iter(peaks)
+        monkeypatch.setattr(sync_metrics, 'reset_peak_rss', lambda: reset)
+        monkeypatch.setattr(sync_metrics, 'peak_rss_bytes', lambda: next(values))
+        return RunPeakRss()
+
+    def test_reset_counter_reports_peak(self, monkeypatch):
+        assert self._tracker(monkeypatch, True, [300]).peak() == 300
+
+    def test_peak_raised_during_run(self, monkeypatch):
+        assert self._tracker(monkeypatch, False, [200, 300]).peak() == 300
+
+    def test_earlier_run_peak_is_not_reported(self, monkeypatch):
+        """이전 실행(같은 프로세스)의 피크를 넘지 않았으면 알 수 없음"""
+        assert self._tracker(monkeypatch, False, [300, 300]).peak() is None
+
+    def test_unsupported_platform(self, monkeypatch):
+        assert self._tracker(monkeypatch, False, [None, None]).peak() is None
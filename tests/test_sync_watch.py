@@ -0,0 +1,148 @@
+"""
+sync_watch 모듈 테스트 (워크북 폴링 감시)
+"""
+
+import os
+import zipfile
+
+import pytest
+
+from po_generator.sync_watch import (
+    FileState,
+    WorkbookWatcher,
+    file_state,
+    is_readable_workbook,
+)
+
+
+class FakeClock:
+    """poll() 사이 시간 진행을 직접 제어하는 시계"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+def _save(path, content, mtime_ns):
+    """content를 담은 xlsx(zip) 저장 후 mtime 고정"""
+    with zipfile.ZipFile(path, 'w') as zf:
+        zf.writestr('xl/workbook.xml', content)
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+@pytest.fixture
+def workbook(tmp_path):
+    path = tmp_path / "NOAH_SO_PO_DN.xlsx"
+    _save(path, 'v1', 1_000_000_000)
+    return path
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+class TestFileState:
+    """파일 상태 / 읽기 가능 여부"""
+
+    def test_state_of_missing_file_is_none(self, tmp_path):
+        assert file_state(tmp_path / "missing.xlsx") is None
+
+    def test_state_changes_with_size_and_mtime(self, workbook):
+        before = file_state(workbook)
+        _save(workbook, 'v2-longer', 2_000_000_000)
+        after = file_state(workbook)
+        assert before != after
+        assert after == FileState(2_000_000_000, workbook.stat().st_size)
+
+    def test_truncated_zip_is_not_readable(self, workbook):
+        """저장 중 (중앙 디렉터리 미기록) 파일은 읽기 불가"""
+        data = workbook.read_bytes()
+        workbook.write_bytes(data[:len(data) // 2])
+        assert not is_readable_workbook(workbook)
+
+    def test_complete_zip_is_readable(self, workbook):
+        assert is_readable_workbook(workbook)
+
+
+class TestWorkbookWatcher:
+    """변경 감지 + debounce"""
+
+    def test_triggers_after_debounce(self, workbook, clock):
+        watcher = WorkbookWatcher(workbook, poll_interval=1, debounce=3, clock=clock)
+        assert watcher.poll() is None          # 첫 관찰 → 대기 시작
+        clock.advance(2)
+        assert watcher.poll() is None          # 아직 안정 대기 중
+        clock.advance(1)
+        assert watcher.poll() == file_state(workbook)
+
+    def test_burst_of_saves_resets_debounce(self, workbook, clock):
+        watcher = WorkbookWatcher(workbook, poll_interval=1, debounce=3, clock=clock)
+        watcher.poll()
+        for i in range(5):
+            clock.advance(2)
+            _save(workbook, f'v{i + 2}', 2_000_000_000 + i)
+            assert watcher.poll() is None
+        clock.advance(3)
+        assert watcher.poll() == file_state(workbook)
+
+    def test_mark_synced_suppresses_same_state(self, workbook, clock):
+        watcher = WorkbookWatcher(workbook, poll_interval=1, debounce=0, clock=clock)
+        watcher.poll()
+        state = watcher.poll()
+        assert state is not None
+        watcher.mark_synced(state)
+        for _ in range(3):
+            clock.advance(10)
+            assert watcher.poll() is None
+
+        _save(workbook, 'v2', 2_000_000_000)
+        watcher.poll()
+        assert watcher.poll() == file_state(workbook)
+
+    def test_missing_or_mid_save_file_waits(self, workbook, clock):
+        watcher = WorkbookWatcher(workbook, poll_interval=1, debounce=0, clock=clock)
+        data = workbook.read_bytes()
+        workbook.unlink()
+        assert watcher.poll() is None
+        assert watcher.poll() is None
+
+        workbook.write_bytes(data[:len(data) // 2])
+        watcher.poll()
+        assert watcher.poll() is None          # 안정됐지만 zip 미완성
+
+        workbook.write_bytes(data)
+        watcher.poll()
+        assert watcher.poll() == file_state(workbook)
+
+    def test_retry_later_restarts_debounce(self, workbook, clock):
+        watcher = WorkbookWatcher(workbook, poll_interval=1, debounce=3, clock=clock)
+        watcher.poll()
+        clock.advance(3)
+        assert watcher.poll() is not None
+        watcher.retry_later()                  # 동기화 실패 (잠김)
+        assert watcher.poll() is None
+        clock.advance(3)
+        assert watcher.poll() == file_state(workbook)
+
+    def test_wait_sleeps_between_polls(self, workbook, clock):
+        slept = []
+
+        def sleep(seconds):
+            slept.append(seconds)
+            clock.advance(seconds)
+
+        watcher = WorkbookWatcher(workbook, poll_interval=0.5, debounce=2, clock=clock, sleep=sleep)
+        assert watcher.wait() == file_state(workbook)
+        assert slept == [0.5] * 4
+
+    def test_invalid_settings(self, workbook):
+        with pytest.raises(ValueError):
+            WorkbookWatcher(workbook, poll_interval=0)
+        with pytest.raises(ValueError):
+            WorkbookWatcher(workbook, debounce=-1)
@@ -13,11 +13,20 @@ from po_generator.utils import (
     format_currency,
     load_noah_po_lists,
     find_order_data,
+    compile_records,
     escape_excel_formula,
+    get_value,
     normalize_line_item,
+    line_keys,
+    resolve_column,
     resolve_weight_code,
+    resolve_po_line_weights,
     _po_base_code,
+    load_dn_data,
+    load_pmt_data,
+    WorkbookCache,
 )
+from po_generator import utils
 
 
 class TestGetSafeValue:
@@ -76,6 +85,97 @@ class TestGetSafeValue:
         assert result == 0
 
 
+class TestResolveColumn:
+    """resolve_column — 컬럼 구성별 해석 테이블 (LRU)"""
+
+    def test_alias_and_case_insensitive(self):
+        columns = pd.Index(['SO_ID', 'customer NAME', 'Item qty'])
+        assert resolve_column(columns, 'SO_ID') == 'SO_ID'
+        assert resolve_column(columns, 'item_qty') == 'Item qty'
+        assert resolve_column(columns, 'Customer name') == 'customer NAME'
+        assert resolve_column(columns, 'missing') is None
+
+    def test_same_columns_share_schema(self):
+        """같은 컬럼 구성이면 다른 DataFrame/list여도 해석 테이블 공유"""
+        a = pd.DataFrame(columns=['SO_ID', 'Item qty'])
+        b = pd.DataFrame(columns=['SO_ID', 'Item qty'])
+        assert utils._column_schema(a.columns) is utils._column_schema(b.columns)
+        assert utils._column_schema(['SO_ID', 'Item qty']) is utils._column_schema(a.columns)
+
+    def test_no_stale_result_for_new_frame(self):
+        """id가 재사용되어도 다른 컬럼 구성의 결과를 돌려주지 않음"""
+        for i in range(50):
+            columns = pd.Index([f'col{i}', 'Item qty'])
+            assert resolve_column(columns, f'col{i}') == f'col{i}'
+            del columns
+
+    def test_mutated_list_resolved_again(self):
+        columns = ['SO_ID']
+        assert resolve_column(columns, 'item_qty') is None
+        columns.append('Item qty')
+        assert resolve_column(columns, 'item_qty') == 'Item qty'
+
+    def test_registry_bounded(self):
+        with patch.object(utils, '_SCHEMA_CACHE_SIZE', 5):
+            for i in range(20):
+                resolve_column(pd.Index([f'bounded{i}']), 'x')
+            assert len(utils._schemas) <= 5
+
+    def test_index_entries_released(self):
+        import gc
+        columns = pd.Index(['released_col'])
+        resolve_column(columns, 'released_col')
+        index_id = id(columns)
+        assert index_id in utils._index_schemas
+        del columns
+        gc.collect()
+        assert index_id not in utils._index_schemas
+
+    def test_get_value_uses_alias(self):
+        row = pd.DataFrame([{'Item qty': 3, 'Remark': float('nan')}]).iloc[0]
+        assert get_value(row, 'item_qty') == 3
+        assert get_value(row, 'Remark', 'x') == 'x'
+
+
+class TestCompileRecords:
+    """compile_records — ItemRecord.get은 iterrows + get_value와 같은 결과"""
+
+    KEYS = ['item_qty', 'sales_unit_price', 'item_name', 'Model', 'model',
+            'PO receipt date', 'missing', 'remark']
+
+    @pytest.fixture
+    def items_df(self):
+        return pd.DataFrame({
+            'Item qty': [1, None, 3],
+            'Sales Unit Price': [1250.5, 0, float('nan')],
+            'Item name': ['Actuator', 'nan', None],
+            'Model': ['NA-100', ' NaN ', '006'],
+            'PO receipt date': pd.to_datetime(['2025-01-15', None, '2025-03-01']),
+            'Remark': ['', '메모', pd.NA],
+        })
+
+    def test_matches_get_value(self, items_df):
+        records = compile_records(items_df)
+        assert len(records) == len(items_df)
+        for (_, row), record in zip(items_df.iterrows(), records):
+            for key in self.KEYS:
+                assert get_value(record, key, 'D') == get_value(row, key, 'D'), key
+                assert record.get(key, 'D') == get_value(row, key, 'D'), key
+
+    def test_default_per_call(self, items_df):
+        record = compile_records(items_df)[1]
+        assert record.get('item_qty', 1) == 1
+        assert record.get('item_qty') == ''
+        assert record.get('item_name', None) is None
+
+    def test_empty_frame(self):
+        assert compile_records(pd.DataFrame(columns=['Item qty'])) == []
+
+    def test_duplicate_column_uses_first(self):
+        df = pd.DataFrame([[1, 2]], columns=['Item qty', 'Item qty'])
+        assert compile_records(df)[0].get('item_qty') == 1
+
+
 class TestFormatCurrency:
     """format_currency 함수 테스트"""
 
@@ -446,3 +546,240 @@ class TestResolveWeightCode:
         """Model명 'L' 내장 + 옵션 LCU 단독 → base '005L' (005LL 아님)"""
         wmap = {'005L': 3.8, '005LL': 777.0}
         assert resolve_weight_code('SA005L', ['LCU'], wmap) == (3.8, '005L')
+
+
+class TestResolvePoLineWeights:
+    """resolve_po_line_weights — PO 라인 전체 벡터 해결"""
+
+    WMAP = {
+        '006': 11.0, '006IM': 15.2, '006LP': 11.5, '006L': 14.0,
+        '005L': 3.8, '005LP': 4.1, '005LLP': 999.0, 'MS01': 1.5, 'NAX1': 2.0,
+    }
+
+    def _po(self, rows):
+        columns = ['SO_ID', 'Line item', 'Model', 'IMS', 'LCU', 'PCU+PIU', 'ALS']
+        return pd.DataFrame(rows, columns=columns)
+
+    def test_matches_scalar_resolution(self):
+        """행마다 resolve_weight_code()를 호출한 결과와 같은 weight/코드"""
+        rows = [
+            ['SOO-1', 1, 'NA006', None, None, None, None],
+            ['SOO-1', 2.0, 'NA006', 'Y', None, None, 'Y'],
+            ['SOO-1', 3, 'NA006', None, 'y', ' Y ', None],
+            ['SOO-2', 1, 'SA005L', None, 'Y', 'Y', None],
+            ['SOO-2', 2, 'SA005L', None, 'Y', None, None],
+            ['SOO-2', 3, 'ms01', 'Y', None, None, None],
+            ['SOO-3', 1, 'NA999', 'Y', None, None, None],
+        ]
+        lines = resolve_po_line_weights(self._po(rows), self.WMAP)
+
+        assert lines['Line item'].tolist() == ['1', '2', '3', '1', '2', '3', '1']
+        for row, line in zip(rows, lines.itertuples(index=False)):
+            y_opts = [c for c, v in zip(['IMS', 'LCU', 'PCU+PIU', 'ALS'], row[3:])
+                      if str(v).strip().upper() == 'Y']
+            weight, code = resolve_weight_code(row[2], y_opts, self.WMAP)
+            if weight is None:
+                assert pd.isna(line.weight) and pd.isna(line.matched_code)
+            else:
+                assert (line.weight, line.matched_code) == (weight, code)
+
+    def test_match_tiers(self):
+        rows = [
+            ['SOO-1', 1, 'NA006', None, 'Y', 'Y', None],
+            ['SOO-1', 2, 'NA006', 'Y', None, None, None],
+            ['SOO-1', 3, 'NA006', None, None, None, None],
+            ['SOO-1', 4, 'NAX1', None, None, None, None],
+        ]
+        lines = resolve_po_line_weights(self._po(rows), self.WMAP)
+        assert lines['match_tier'].tolist() == ['combined', 'option', 'base', 'model']
+
+    def test_unmatched_lines_kept(self):
+        """미매칭 라인도 weight NaN / match_tier 'unmatched'로 남음"""
+        rows = [['SOO-9', 1, 'SCP-SET-SA', None, None, None, None]]
+        lines = resolve_po_line_weights(self._po(rows), self.WMAP)
+        assert len(lines) == 1
+        assert pd.isna(lines.loc[0, 'weight'])
+        assert pd.isna(lines.loc[0, 'matched_code'])
+        assert lines.loc[0, 'match_tier'] == 'unmatched'
+
+    def test_skips_blank_rows_and_keeps_first_duplicate(self):
+        rows = [
+            ['SOO-1', 1, 'NA006', 'Y', None, None, None],
+            ['SOO-1', 1.0, 'NA006', None, None, None, None],
+            ['SOO-1', 2, None, None, None, None, None],
+            ['SOO-1', 3, '  ', None, None, None, None],
+            [None, 4, 'NA006', None, None, None, None],
+        ]
+        lines = resolve_po_line_weights(self._po(rows), self.WMAP)
+        assert lines[['SO_ID', 'Line item', 'weight']].values.tolist() == [['SOO-1', '1', 15.2]]
+
+    def test_duplicate_prefers_matched_row(self):
+        """중복 키의 첫 행이 미매칭이면 뒤의 매칭 행 사용 (build_po_line_weight_map 기존 동작)"""
+        rows = [
+            ['SOO-1', 1, 'NA999', None, None, None, None],
+            ['SOO-1', 2, 'NA006', None, None, None, None],
+            ['SOO-1', 1.0, 'NA006', 'Y', None, None, None],
+            ['SOO-2', 1, 'NA999', None, None, None, None],
+            ['SOO-2', 1, 'NA998', None, None, None, None],
+        ]
+        lines = resolve_po_line_weights(self._po(rows), self.WMAP)
+        assert lines[['SO_ID', 'Line item', 'Model', 'match_tier']].values.tolist() == [
+            ['SOO-1', '2', 'NA006', 'base'],
+            ['SOO-1', '1', 'NA006', 'option'],
+            ['SOO-2', '1', 'NA999', 'unmatched'],
+        ]
+        assert lines['weight'].tolist()[:2] == [11.0, 15.2]
+
+    def test_missing_columns_returns_empty(self):
+        lines = resolve_po_line_weights(pd.DataFrame({'SO_ID': ['SOO-1']}), self.WMAP)
+        assert lines.empty
+        assert 'match_tier' in lines.columns
+
+
+class TestJoinLayer:
+    """line_keys / _join_so / JOIN 뷰 메모이즈"""
+
+    def test_line_keys_normalized(self):
+        df = pd.DataFrame({'SO_ID': [' SOO-1', 'SOO-1', None], 'Line item': [1, 2.0, '3 ']})
+        assert list(line_keys(df)) == [('SOO-1', '1'), ('SOO-1', '2'), ('', '3')]
+        assert line_keys(df).names == ['SO_ID', 'Line item']
+
+    def test_join_so_matches_mixed_line_types(self):
+        """Line item이 시트마다 int/float/문자열이어도 같은 라인끼리 병합, left 값 유지"""
+        left = pd.DataFrame({'DN_ID': ['D1', 'D1', 'D2'], 'SO_ID': ['S1', 'S1', 'S2'],
+                             'Line item': [1.0, 2.0, None]})
+        so = pd.DataFrame({'SO_ID': ['S1', 'S1', 'S2'], 'Line item': ['2', 1, 1],
+                           'Item name': ['B', 'A', 'C']})
+        merged = utils._join_so(left, so)
+        assert list(merged.columns) == ['DN_ID', 'SO_ID', 'Line item', 'Item name']
+        assert merged['Item name'].tolist()[:2] == ['A', 'B']
+        assert pd.isna(merged.loc[2, 'Item name'])
+        assert merged['Line item'].tolist()[:2] == [1.0, 2.0]
+
+    def test_join_so_without_line_uses_first_so_row(self):
+        left = pd.DataFrame({'선수금_ID': ['A1'], 'SO_ID': ['S1']})
+        so = pd.DataFrame({'SO_ID': ['S1', 'S1'], 'Line item': [1, 2], 'Customer name': ['첫', '둘']})
+        merged = utils._join_so(left, so, by_line=False)
+        assert merged[['선수금_ID', 'Customer name']].values.tolist() == [['A1', '첫']]
+        assert 'Line item' in merged.columns  # SO 컬럼은 그대로 병합
+
+    @pytest.fixture
+    def workbook(self, tmp_path):
+        path = tmp_path / "NOAH_SO_PO_DN.xlsx"
+        with pd.ExcelWriter(path) as writer:
+            pd.DataFrame({'SO_ID': ['SOD-0001'], 'Line item': [1], 'Customer name': ['고객A']}).to_excel(
+                writer, sheet_name='SO_국내', index=False)
+            pd.DataFrame({'DN_ID': ['DND-0001'], 'SO_ID': ['SOD-0001'], 'Line item': [1]}).to_excel(
+                writer, sheet_name='DN_국내', index=False)
+        return path
+
+    def test_view_built_once_per_workbook_version(self, workbook):
+        cache = WorkbookCache(disk_cache=False)
+        with patch('po_generator.utils._workbook_cache', cache), \
+                patch('po_generator.utils.NOAH_SO_PO_DN_FILE', workbook):
+            first = load_dn_data()
+            first.loc[0, 'Customer name'] = '변경'
+            second = load_dn_data()
+            assert second.loc[0, 'Customer name'] == '고객A'
+            assert (cache.stats.view_builds, cache.stats.view_hits) == (1, 1)
+
+            with pd.ExcelWriter(workbook) as writer:
+                pd.DataFrame({'SO_ID': ['SOD-0001'], 'Line item': [1], 'Customer name': ['고객B']}).to_excel(
+                    writer, sheet_name='SO_국내', index=False)
+                pd.DataFrame({'DN_ID': ['DND-0001'], 'SO_ID': ['SOD-0001'], 'Line item': [1]}).to_excel(
+                    writer, sheet_name='DN_국내', index=False)
+            assert load_dn_data().loc[0, 'Customer name'] == '고객B'
+            assert cache.stats.view_builds == 2
+
+
+class TestWorkbookCache:
+    """WorkbookCache — 시트별 1회 파싱 + mtime/size 무효화"""
+
+    @pytest.fixture
+    def workbook(self, tmp_path):
+        test_file = tmp_path / "NOAH_SO_PO_DN.xlsx"
+        df_so = pd.DataFrame({
+            'SO_ID': ['SOD-0001', 'SOD-0002'],
+            'Line item': [1, 1],
+            'Customer name': ['고객A', '고객B'],
+            'Item qty': [1, 2],
+        })
+        df_dn = pd.DataFrame({
+            'DN_ID': ['DND-0001'],
+            'SO_ID': ['SOD-0001'],
+            'Line item': [1],
+        })
+        df_pmt = pd.DataFrame({
+            '선수금_ID': ['ADV-0001'],
+            'SO_ID': ['SOD-0002'],
+        })
+        with pd.ExcelWriter(test_file) as writer:
+            df_so.to_excel(writer, sheet_name='SO_국내', index=False)
+            df_dn.to_excel(writer, sheet_name='DN_국내', index=False)
+            df_pmt.to_excel(writer, sheet_name='PMT_국내', index=False)
+        return test_file
+
+    def test_sheet_parsed_once_across_loaders(self, workbook):
+        """DN/PMT 로더가 SO_국내를 공유 — 두 번째 요청은 캐시 적중"""
+        cache = WorkbookCache()
+        with patch('po_generator.utils._workbook_cache', cache), \
+                patch('po_generator.utils.NOAH_SO_PO_DN_FILE', workbook):
+            df_dn = load_dn_data()
+            df_pmt = load_pmt_data()
+
+        assert len(df_dn) == 1
+        assert df_pmt.iloc[0]['Customer name'] == '고객B'
+        # DN_국내, SO_국내, PMT_국내 각 1회 파싱 / SO_국내 1회 적중
+        assert cache.stats.misses == 3
+        assert cache.stats.hits == 1
+
+    def test_returns_independent_copies(self, workbook):
+        """반환된 DataFrame을 수정해도 캐시는 오염되지 않음"""
+        cache = WorkbookCache()
+        df1 = cache.get_sheet(workbook, 'SO_국내')
+        df1.loc[0, 'Customer name'] = '변경'
+        df2 = cache.get_sheet(workbook, 'SO_국내')
+        assert df2.loc[0, 'Customer name'] == '고객A'
+
+    def test_invalidates_when_file_changes(self, workbook):
+        """파일이 바뀌면 (mtime/size) 다시 파싱"""
+        cache = WorkbookCache()
+        cache.get_sheet(workbook, 'SO_국내')
+
+        with pd.ExcelWriter(workbook) as writer:
+            pd.DataFrame({'SO_ID': ['SOD-0009'], 'Customer name': ['고객Z']}).to_excel(
+                writer, sheet_name='SO_국내', index=False,
+            )
+
+        df = cache.get_sheet(workbook, 'SO_국내')
+        assert list(df['SO_ID']) == ['SOD-0009']
+        assert cache.stats.invalidations == 1
+        assert cache.stats.misses == 2
+
+    def test_manifest_parses_only_listed_columns(self, workbook):
+        """매니페스트(내부 키 포함)로 요청하면 해당 컬럼만 파싱"""
+        cache = WorkbookCache(disk_cache=False)
+        df = cache.get_sheet(workbook, 'SO_국내', columns=['so_id', 'customer_name'])
+        assert list(df.columns) == ['SO_ID', 'Customer name']
+        assert cache.stats.projected == 1
+
+        # 부분집합 요청은 적중
+        cache.get_sheet(workbook, 'SO_국내', columns=['SO_ID'])
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+
+    def test_wider_request_reparses_union(self, workbook):
+        """캐시보다 넓은 요청은 다시 파싱, 이후 전체 요청도 동일 결과"""
+        cache = WorkbookCache(disk_cache=False)
+        cache.get_sheet(workbook, 'SO_국내', columns=['SO_ID'])
+        df = cache.get_sheet(workbook, 'SO_국내', columns=['Item qty'])
+        assert list(df.columns) == ['Item qty']
+        assert cache.stats.misses == 2
+
+        full = cache.get_sheet(workbook, 'SO_국내')
+        assert cache.stats.misses == 3
+        pd.testing.assert_frame_equal(full, pd.read_excel(workbook, sheet_name='SO_국내'))
+        # 전체 캐시 이후 프로젝션 요청은 적중
+        cache.get_sheet(workbook, 'SO_국내', columns=['SO_ID', 'Item qty'])
+        assert cache.stats.misses == 3
+